@@ -28,10 +28,10 @@ Module for defining and manipulating complete or partial BCV Bibles.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-09' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BCVBible"
 ProgName = "BCV Bible handler"
-ProgVersion = '0.22'
+ProgVersion = '0.23'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -70,7 +70,7 @@ def exp( messageString ):
 
 
 
-def BCVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def BCVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for BCV Bible files or folders in the folder and in the next level down.
 
@@ -86,24 +86,26 @@ def BCVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( exp("BCVBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( exp("BCVBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " BCVBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             ignore = False
@@ -135,15 +137,15 @@ def BCVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("BCVBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    BCVBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 ignore = False
@@ -28,10 +28,10 @@ Module handling BibleBookOrder systems.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBookOrders"
 ProgName = "Bible Book Order Systems handler"
-ProgVersion = '0.90'
+ProgVersion = '0.91'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -100,11 +100,10 @@ class BibleBookOrderSystems:
                         or pickle9 <= os.stat( XMLfilepath ).st_ctime: # The pickle file is older
                             picklesGood = False; break
             if picklesGood:
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDicts = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
-                    self.__DataLists = pickle.load( pickleFile )
+                    self.__DataDicts = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each system is only unpickled when first used
+                    self.__DataLists = BibleOrgSysGlobals.unpickleTables( pickleFile )
             else: # We have to load the XML (much slower)
                 from BibleBookOrdersConverter import BibleBookOrdersConverter
                 if XMLFolder is not None: logging.warning( _("Bible book orders are already loaded -- your given folder of {!r} was ignored").format(XMLFolder) )
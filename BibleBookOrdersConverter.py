@@ -28,10 +28,10 @@ Module handling BibleBookOrder_*.xml files and to export to pickle, JSON, C, and
 
 from gettext import gettext as _
 
-LastModifiedDate = '2017-12-09' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBookOrderSystemsConverter"
 ProgName = "Bible Book Order Systems converter"
-ProgVersion = '0.84'
+ProgVersion = '0.85'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -311,8 +311,6 @@ class BibleBookOrdersConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self._XMLSystems
         self.importDataToPython()
         assert self.__DataDicts and self.__DataLists
@@ -323,8 +321,8 @@ class BibleBookOrdersConverter:
             filepath = os.path.join( folder, self.__filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as pickleFile:
-            pickle.dump( self.__DataDicts, pickleFile )
-            pickle.dump( self.__DataLists, pickleFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataDicts, pickleFile ) # So each system can be loaded separately
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataLists, pickleFile )
     # end of pickle
 
     def exportDataToPython( self, filepath=None ):
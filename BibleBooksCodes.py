@@ -28,10 +28,10 @@ Module handling BibleBooksCodes functions.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBooksCodes"
 ProgName = "Bible Books Codes handler"
-ProgVersion = '0.81'
+ProgVersion = '0.82'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -74,10 +74,9 @@ class BibleBooksCodes:
             and os.access( standardPickleFilepath, os.R_OK ) \
             and os.stat(standardPickleFilepath).st_mtime > os.stat(standardXMLFilepath).st_mtime \
             and os.stat(standardPickleFilepath).st_ctime > os.stat(standardXMLFilepath).st_ctime: # There's a newer pickle file
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDicts = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self.__DataDicts = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each dictionary is only unpickled when first used
             else: # We have to load the XML (much slower)
                 from BibleBooksCodesConverter import BibleBooksCodesConverter
                 if XMLFilepath is not None: logging.warning( _("Bible books codes are already loaded -- your given filepath of {!r} was ignored").format(XMLFilepath) )
@@ -28,10 +28,10 @@ Module handling BibleBooksCodes.xml and to export to JSON, C, and Python data ta
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-12-02' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBooksCodesConverter"
 ProgName = "Bible Books Codes converter"
-ProgVersion = '0.79'
+ProgVersion = '0.80'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -621,8 +621,6 @@ class BibleBooksCodesConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
@@ -633,7 +631,7 @@ class BibleBooksCodesConverter:
             filepath = os.path.join( folder, self._filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
-            pickle.dump( self.__DataDicts, myFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataDicts, myFile ) # So each dictionary can be loaded separately
     # end of BibleBooksCodesConverter.pickle
 
 
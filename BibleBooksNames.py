@@ -28,10 +28,10 @@ Module handling BibleBooksNames.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBooksNames"
 ProgName = "Bible Books Names Systems handler"
-ProgVersion = '0.40'
+ProgVersion = '0.41'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -237,10 +237,9 @@ class BibleBooksNamesSystems:
                         or pickle9 <= os.stat( XMLfilepath ).st_ctime: # The pickle file is older
                             picklesGood = False; break
             if picklesGood:
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDicts = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self.__DataDicts = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each system is only unpickled when first used
                     #self.__ExpandedDicts = pickle.load( pickleFile )
             else: # We have to load the XML (much slower)
                 from BibleBooksNamesConverter import BibleBooksNamesConverter
@@ -28,10 +28,10 @@ Module handling BibleBooksNames_*.xml to produce pickle, JSON, C and Python data
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleBooksNamesConverter"
 ProgName = "Bible Books Names Systems converter"
-ProgVersion = '0.36'
+ProgVersion = '0.37'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -372,8 +372,6 @@ class BibleBooksNamesConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self.__XMLSystems
         self.importDataToPython()
         assert self.__BookNamesSystemsDict
@@ -384,7 +382,7 @@ class BibleBooksNamesConverter:
             filepath = os.path.join( folder, self.__filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
-            pickle.dump( self.__BookNamesSystemsDict, myFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__BookNamesSystemsDict, myFile ) # So each system can be loaded separately
             #pickle.dump( self.__expandedInputSystems, myFile )
     # end of pickle
 
@@ -44,6 +44,7 @@ Contains functions:
 
     backupAnyExistingFile( filenameOrFilepath, numBackups=1 )
     peekIntoFile( filenameOrFilepath, folderName=None, numLines=1 )
+    class FolderSnapshot
 
     totalSize( obj, handlers={} )
 
@@ -65,6 +66,8 @@ Contains functions:
 
     pickleObject( theObject, filename, folderName=None )
     unpickleObject( filename, folderName=None )
+    pickleDictPartially( theDict, pickleOutputFile )
+    unpickleTables( pickleInputFile )
 
     setup( ProgName, ProgVersion, loggingFolder=None )
 
@@ -82,10 +85,10 @@ Contains functions:
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BOSGlobals"
 ProgName = "BibleOrgSys Globals"
-ProgVersion = '0.81'
+ProgVersion = '0.84'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -97,6 +100,7 @@ import sys, logging, os.path, pickle
 from datetime import datetime
 import unicodedata
 from argparse import ArgumentParser
+from collections.abc import Mapping
 try: import pwd
 except ImportError:
     pwd = None
@@ -117,12 +121,16 @@ commandLineArguments = None
 strictCheckingFlag = debugFlag = False
 maxProcesses = 1
 alreadyMultiprocessing = False # Not used in this module, but set to prevent multiple levels of multiprocessing (illegal)
+useBookCache = True # Not used in this module, but allows processed books to be cached in DEFAULT_BOOK_CACHE_FOLDER (see InternalBibleBook)
 verbosityLevel = None
 verbosityString = 'Normal'
 
 
 DEFAULT_LOG_FOLDER = 'Logs/' # Relative path
 DEFAULT_CACHE_FOLDER = 'ObjectCache/' # Relative path
+DEFAULT_USER_CACHE_FOLDER = os.path.join( os.environ.get( 'XDG_CACHE_HOME' ) or os.path.join( os.path.expanduser( '~' ), '.cache' ),
+                                'BibleOrgSys/' ) # Per-user (not relative to the current folder) for caches that should persist
+DEFAULT_BOOK_CACHE_FOLDER = os.path.join( DEFAULT_USER_CACHE_FOLDER, 'ProcessedBooks/' )
 DEFAULT_OUTPUT_FOLDER = 'OutputFiles/' # Relative path
 COMMONLY_IGNORED_FOLDERS = '.hg/', '.git/', '__MACOSX' # Used when searching for Bibles
 if debuggingThisModule:
@@ -536,6 +544,105 @@ def peekIntoFile( filenameOrFilepath, folderName=None, numLines=1, encoding=None
 # end of BibleOrgSysGlobals.peekIntoFile
 
 
+class FolderSnapshot:
+    """
+    Caches the folder listings, file/folder tests, access checks and file peeks
+        made while searching a folder (and its subfolders) for Bibles.
+
+    One of these can be shared between all of the *FileCheck format detectors
+        (see UnknownBible.search) so that each folder is only listed once
+        and the first lines of each file only read once,
+        however many detectors (or strict/unstrict rechecks) look at them.
+
+    The methods take the same parameters as the os and BibleOrgSysGlobals
+        functions that they replace.
+    NOTE: The results are never refreshed, so only keep these for as long as the search.
+    """
+    def __init__( self ):
+        """
+        Creates an empty snapshot which fills itself in as it's queried.
+        """
+        self.folderEntries = {} # Keys are normalised folder paths, values are {name:(isDir,isFile)} dicts or an OSError
+        self.pathTypes = {} # Keys are normalised paths, values are (isDir,isFile) for paths outside any listed folder
+        self.accessResults = {} # Keys are (normalised path, mode) 2-tuples
+        self.peekResults = {} # Keys are (filepath, numLines, encoding) 3-tuples
+    # end of FolderSnapshot.__init__
+
+    def __str__( self ):
+        return "FolderSnapshot: {} folders listed, {} files peeked".format( len(self.folderEntries), len(self.peekResults) )
+    # end of FolderSnapshot.__str__
+
+
+    def _scanFolder( self, normalisedPath ):
+        """
+        Lists the folder once (with the entry types that os.scandir gives us for free)
+            and returns the {name:(isDir,isFile)} dict
+            or raises the same OSError as os.listdir would have.
+        """
+        try: entries = self.folderEntries[normalisedPath]
+        except KeyError:
+            try:
+                entries = {}
+                with os.scandir( normalisedPath ) as folderIterator:
+                    for entry in folderIterator:
+                        try: entries[entry.name] = (entry.is_dir(), entry.is_file())
+                        except OSError: entries[entry.name] = (False, False)
+            except OSError as err: entries = err
+            self.folderEntries[normalisedPath] = entries
+        if isinstance( entries, OSError ): raise entries
+        return entries
+    # end of FolderSnapshot._scanFolder
+
+    def listdir( self, folderPath ):
+        """
+        Returns a new list of the names in the folder (like os.listdir).
+        """
+        return list( self._scanFolder( os.path.normpath( folderPath ) ) )
+    # end of FolderSnapshot.listdir
+
+    def _getTypes( self, somePath ):
+        """
+        Returns an (isDir,isFile) 2-tuple for the path,
+            preferably from the listing of its parent folder.
+        """
+        normalisedPath = os.path.normpath( somePath )
+        parentPath, name = os.path.split( normalisedPath )
+        parentEntries = self.folderEntries.get( parentPath or os.curdir )
+        if isinstance( parentEntries, dict ) and name in parentEntries:
+            return parentEntries[name]
+        try: return self.pathTypes[normalisedPath]
+        except KeyError:
+            result = self.pathTypes[normalisedPath] = (os.path.isdir( normalisedPath ), os.path.isfile( normalisedPath ))
+            return result
+    # end of FolderSnapshot._getTypes
+
+    def isdir( self, somePath ): return self._getTypes( somePath )[0]
+    def isfile( self, somePath ): return self._getTypes( somePath )[1]
+
+    def access( self, somePath, mode ):
+        """
+        Like os.access except the result is remembered.
+        """
+        key = os.path.normpath( somePath ), mode
+        try: return self.accessResults[key]
+        except KeyError:
+            result = self.accessResults[key] = os.access( somePath, mode )
+            return result
+    # end of FolderSnapshot.access
+
+    def peekIntoFile( self, filenameOrFilepath, folderName=None, numLines=1, encoding=None ):
+        """
+        Like BibleOrgSysGlobals.peekIntoFile except the result is remembered.
+        """
+        filepath = os.path.join( folderName, filenameOrFilepath ) if folderName else filenameOrFilepath
+        key = os.path.normpath( filepath ), numLines, encoding
+        try: result = self.peekResults[key]
+        except KeyError: result = self.peekResults[key] = peekIntoFile( filepath, numLines=numLines, encoding=encoding )
+        return list( result ) if isinstance( result, list ) else result # Callers might alter a list of lines
+    # end of FolderSnapshot.peekIntoFile
+# end of class FolderSnapshot
+
+
 ##########################################################################################################
 #
 # For debugging, etc.
@@ -1143,6 +1250,88 @@ def unpickleObject( filename, folderName=None ):
 # end of BibleOrgSysGlobals.unpickleObject
 
 
+#
+# Reference data tables that can be partially loaded
+#
+
+PARTIAL_PICKLE_SIGNATURE = 'BibleOrgSys partial dict pickle v1'
+
+
+def pickleDictPartially( theDict, pickleOutputFile ):
+    """
+    Writes the dictionary to the open binary file
+        so that each entry can later be unpickled by itself.
+
+    The file gets our signature, then an index of key:(offset,length) and the data length,
+        then each value pickled separately.
+    Several of these can be written one after the other into the same file.
+
+    Use unpickleTables() to read it back.
+    """
+    index, pickledValues, dataLength = {}, [], 0
+    for key,value in theDict.items():
+        pickledValue = pickle.dumps( value, pickle.HIGHEST_PROTOCOL )
+        index[key] = (dataLength, len(pickledValue))
+        pickledValues.append( pickledValue )
+        dataLength += len(pickledValue)
+    pickle.dump( PARTIAL_PICKLE_SIGNATURE, pickleOutputFile, pickle.HIGHEST_PROTOCOL )
+    pickle.dump( (index,dataLength), pickleOutputFile, pickle.HIGHEST_PROTOCOL )
+    for pickledValue in pickledValues: pickleOutputFile.write( pickledValue )
+# end of BibleOrgSysGlobals.pickleDictPartially
+
+
+class PartiallyLoadedDict( Mapping ):
+    """
+    A read-only dictionary whose values are only unpickled from the file
+        the first time that they are accessed.
+    """
+    def __init__( self, filepath, dataStart, index ):
+        """
+        index is a dict of key:(offset,length) relative to dataStart.
+        """
+        self.filepath, self.dataStart, self.index = filepath, dataStart, index
+        self.loadedValues = {}
+    # end of PartiallyLoadedDict.__init__
+
+    def __getitem__( self, key ):
+        try: return self.loadedValues[key]
+        except KeyError: offset, length = self.index[key] # Raises KeyError if it's not there at all
+        if debuggingThisModule: print( "PartiallyLoadedDict: Loading {!r} from {}…".format( key, self.filepath ) )
+        with open( self.filepath, 'rb' ) as pickleInputFile:
+            pickleInputFile.seek( self.dataStart + offset )
+            value = pickle.loads( pickleInputFile.read( length ) )
+        self.loadedValues[key] = value
+        return value
+    # end of PartiallyLoadedDict.__getitem__
+
+    def __contains__( self, key ): return key in self.index
+    def __iter__( self ): return iter( self.index )
+    def __len__( self ): return len( self.index )
+
+    def __str__( self ):
+        return "PartiallyLoadedDict: {} entries ({} loaded) from {}".format( len(self.index), len(self.loadedValues), self.filepath )
+    # end of PartiallyLoadedDict.__str__
+# end of class PartiallyLoadedDict
+
+
+def unpickleTables( pickleInputFile ):
+    """
+    Reads the next object from the open binary file.
+
+    If it was written by pickleDictPartially, returns a PartiallyLoadedDict
+        and leaves the file positioned after its data.
+    Otherwise (an older, whole pickle) returns the fully loaded object.
+    """
+    theObject = pickle.load( pickleInputFile ) # The protocol version used is detected automatically, so we do not have to specify it
+    if not isinstance( theObject, str ) or theObject != PARTIAL_PICKLE_SIGNATURE:
+        return theObject
+    index, dataLength = pickle.load( pickleInputFile )
+    dataStart = pickleInputFile.tell()
+    pickleInputFile.seek( dataStart + dataLength )
+    return PartiallyLoadedDict( os.path.abspath( pickleInputFile.name ), dataStart, index )
+# end of BibleOrgSysGlobals.unpickleTables
+
+
 ##########################################################################################################
 #
 # Default program setup routine
@@ -1248,9 +1437,6 @@ def setStrictCheckingFlag( newValue=True ):
 # end of BibleOrgSysGlobals.setStrictCheckingFlag
 
 
-# Some global variables
-BibleBooksCodes = USFM2Markers = USFMParagraphMarkers = internal_SFMs_to_remove = None
-
 def addStandardOptionsAndProcess( parserObject, exportAvailable=False ):
     """
     Adds our standardOptions to the command line parser.
@@ -1296,35 +1482,43 @@ def addStandardOptionsAndProcess( parserObject, exportAvailable=False ):
         maxProcesses = 1 # Limit to one process
         print( "commandLineArguments: {}".format( commandLineArguments ) )
 
-    # Load Bible data sets that are globally useful
-    global BibleBooksCodes, USFMMarkers, USFMParagraphMarkers, internal_SFMs_to_remove
-    from BibleBooksCodes import BibleBooksCodes
-    BibleBooksCodes = BibleBooksCodes().loadData()
-    #from USFM2Markers import USFM2Markers
-    #USFM2Markers = USFM2Markers().loadData()
-    #USFM2ParagraphMarkers = USFM2Markers.getNewlineMarkersList( 'CanonicalText' )
-    #USFM2ParagraphMarkers.remove( 'qa' ) # This is actually a heading marker
-    #print( len(USFM2ParagraphMarkers), sorted(USFM2ParagraphMarkers) )
-    #for marker in ( ):
-        #print( marker )
-        #USFM2ParagraphMarkers.remove( marker )
-    # was 30 ['cls', 'li1', 'li2', 'li3', 'li4', 'm', 'mi', 'p', 'pc', 'ph1', 'ph2', 'ph3', 'ph4',
-    #    'pi1', 'pi2', 'pi3', 'pi4', 'pm', 'pmc', 'pmo', 'pmr', 'pr', 'q1', 'q2', 'q3', 'q4',
-    #    'qm1', 'qm2', 'qm3', 'qm4']
-    # now 33 ['cls', 'li1', 'li2', 'li3', 'li4', 'm', 'mi', 'nb', 'p', 'pc', 'ph1', 'ph2', 'ph3', 'ph4',
-    #    'pi1', 'pi2', 'pi3', 'pi4', 'pm', 'pmc', 'pmo', 'pmr', 'pr', 'q1', 'q2', 'q3', 'q4', 'qc',
-    #    'qm1', 'qm2', 'qm3', 'qm4', 'qr'] without 'qa'
-    #print( len(USFM2ParagraphMarkers), sorted(USFM2ParagraphMarkers) ); halt
-    from USFM3Markers import USFM3Markers
-    USFMMarkers = USFM3Markers().loadData()
-    USFMParagraphMarkers = USFMMarkers.getNewlineMarkersList( 'CanonicalText' )
-    USFMParagraphMarkers.remove( 'qa' ) # This is actually a heading marker
-    internal_SFMs_to_remove = USFMMarkers.getCharacterMarkersList( includeBackslash=True, includeNestedMarkers=True, includeEndMarkers=True )
-    internal_SFMd_to_remove = sorted( internal_SFMs_to_remove, key=len, reverse=True ) # List longest first
-
+    # NOTE: The Bible data sets that are globally useful (BibleBooksCodes, USFMMarkers, etc.)
+    #   are only loaded (by __getattr__ below) the first time that they're used
 # end of BibleOrgSysGlobals.addStandardOptionsAndProcess
 
 
+# Bible data sets that are globally useful -- these are only loaded when first accessed
+LAZY_GLOBAL_NAMES = 'BibleBooksCodes', 'USFMMarkers', 'USFMParagraphMarkers', 'internal_SFMs_to_remove'
+
+def __getattr__( name ):
+    """
+    Called (see PEP 562) only if name isn't (yet) a global in this module,
+        so we use it to load our Bible data sets on first access, e.g., BibleOrgSysGlobals.BibleBooksCodes.
+
+    Once loaded, they're saved as normal module globals so this isn't called again.
+    """
+    if name not in LAZY_GLOBAL_NAMES:
+        raise AttributeError( "module {!r} has no attribute {!r}".format( __name__, name ) )
+    if debuggingThisModule: print( "BibleOrgSysGlobals: Loading {}…".format( name ) )
+    theGlobals = globals()
+    if name == 'BibleBooksCodes':
+        from BibleBooksCodes import BibleBooksCodes
+        theGlobals['BibleBooksCodes'] = BibleBooksCodes().loadData()
+    elif name == 'USFMMarkers':
+        from USFM3Markers import USFM3Markers
+        theGlobals['USFMMarkers'] = USFM3Markers().loadData()
+    elif name == 'USFMParagraphMarkers':
+        if 'USFMMarkers' not in theGlobals: __getattr__( 'USFMMarkers' )
+        USFMParagraphMarkers = theGlobals['USFMMarkers'].getNewlineMarkersList( 'CanonicalText' )
+        USFMParagraphMarkers.remove( 'qa' ) # This is actually a heading marker
+        theGlobals['USFMParagraphMarkers'] = USFMParagraphMarkers
+    elif name == 'internal_SFMs_to_remove':
+        if 'USFMMarkers' not in theGlobals: __getattr__( 'USFMMarkers' )
+        theGlobals['internal_SFMs_to_remove'] = theGlobals['USFMMarkers'].getCharacterMarkersList( includeBackslash=True, includeNestedMarkers=True, includeEndMarkers=True )
+    return theGlobals[name]
+# end of BibleOrgSysGlobals.__getattr__
+
+
 def printAllGlobals( indent=None ):
     """
     Print all global variables (for debugging usually).
@@ -28,10 +28,10 @@ Module handling BiblePunctuation_*.xml and to export to JSON, C, and Python data
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BiblePunctuationSystems"
 ProgName = "Bible Punctuation Systems handler"
-ProgVersion = '0.44'
+ProgVersion = '0.45'
 ProgNameVersion = '{} v{}'.format( ProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -76,10 +76,9 @@ class BiblePunctuationSystems:
                         or pickle9 <= os.stat( XMLfilepath ).st_ctime: # The pickle file is older
                             picklesGood = False; break
             if picklesGood:
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self.__DataDict = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each system is only unpickled when first used
             else: # We have to load the XML (much slower)
                 from BiblePunctuationSystemsConverter import BiblePunctuationSystemsConverter
                 if XMLFolder is not None: logging.warning( _("Bible punctuation systems are already loaded -- your given folder of {!r} was ignored").format(XMLFolder) )
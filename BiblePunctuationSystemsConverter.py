@@ -28,10 +28,10 @@ Module handling BiblePunctuation_*.xml and to export to JSON, C, and Python data
 
 from gettext import gettext as _
 
-LastModifiedDate = '2017-12-07' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BiblePunctuationSystemsConverter"
 ProgName = "Bible Punctuation Systems handler"
-ProgVersion = '0.44'
+ProgVersion = '0.45'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -286,8 +286,6 @@ class BiblePunctuationSystemsConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self._XMLSystems
         self.importDataToPython()
         assert self._DataDict
@@ -298,7 +296,7 @@ class BiblePunctuationSystemsConverter:
             filepath = os.path.join( folder, self.__filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
-            pickle.dump( self._DataDict, myFile )
+            BibleOrgSysGlobals.pickleDictPartially( self._DataDict, myFile ) # So each system can be loaded separately
     # end of pickle
 
     def exportDataToPython( self, filepath=None ):
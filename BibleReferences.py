@@ -78,21 +78,24 @@ Technical note: Our Bible reference parsers use state machines rather than regul
     Although this is longer and harder to debug, I believe it's able to give more informative error messages.
     Also, I think it's easier to make it more generic/international this way.
     If I'm wrong, please show me.
+    However, BibleReferenceList first tries a fast parser for correctly formatted references
+        (and remembers the results) and only uses the state machine if that fails.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-12-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleReferences"
 ProgName = "Bible References handler"
-ProgVersion = '0.35'
+ProgVersion = '0.36'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
 debuggingThisModule = False
 
 
-import logging
+import logging, re
+from collections import OrderedDict
 
 import BibleOrgSysGlobals
 from BibleOrganisationalSystems import BibleOrganisationalSystem
@@ -101,6 +104,13 @@ from BibleOrganisationalSystems import BibleOrganisationalSystem
 # This is a hack because it's language dependant :-(
 ignoredSuffixes = (' (LXX)',) # A hack to cope with these suffixes in cross-references and footnotes :(
 
+DEFAULT_PARSE_CACHE_SIZE = 2000 # Number of successfully parsed reference strings to remember
+
+OSIS_PUNCTUATION_DICT = {'booknameCase': 'M', 'booknameLength': 'M', 'spaceAllowedAfterBCS': 'N', 'punctuationAfterBookAbbreviation': '', 'chapterVerseSeparator': '.', 'bookChapterSeparator': '.', 'chapterSeparator': ';', 'bookBridgeCharacter': '-', 'chapterBridgeCharacter': '-', 'verseBridgeCharacter': '-', 'bookSeparator': ';', 'verseSeparator': ',', 'allowedVerseSuffixes': ''}
+
+fastBookRE = re.compile( r'[1-9]?[^\W\d_]+' ) # Used by BibleReferenceList fast parser
+fastNumberRE = re.compile( '[0-9]+' )
+
 
 
 class BibleReferenceBase:
@@ -636,6 +646,7 @@ class BibleReferenceList( BibleReferenceBase ):
     __str__ gives a brief prose description of the object
     makeReferenceString makes a reference string out of a tuple
     parseReferenceString makes a tuple out of a reference string
+        (using a fast parser and a cache for correctly formatted strings)
     parseOSISReferenceString makes a tuple out of an OSIS reference string
     getReferenceList returns our internal reference list of tuples, optionally expanded across ranges
     getOSISRefList converts our internal reference list of tuples to an OSIS reference string
@@ -659,6 +670,8 @@ class BibleReferenceList( BibleReferenceBase ):
         self.objectNameString = 'Bible reference list object'
         self.objectTypeString = 'BibleReferenceList'
         self.referenceList = []
+        self.parseCacheSize = DEFAULT_PARSE_CACHE_SIZE
+        self.__fastParserSettings = {} # With the id of the punctuation dict as the key
     # end of BibleReferenceList.__init__
 
     def __str__( self ):
@@ -703,6 +716,205 @@ class BibleReferenceList( BibleReferenceBase ):
     # end of BibleReferenceList.makeReferenceString
 
     def parseReferenceString( self, referenceString, location=None ):
+        """
+        Returns a tuple with True/False result, haveWarnings, list of (BBB, C, V, S) tuples.
+            A range is expressed as a tuple containing a pair of (BBB, C, V, S) tuples.
+
+        All parsed references are checked for validity against the versification system.
+        The optional location is a string that helps in error/warning messages.
+
+        Correctly formatted references are parsed by our fast parser
+            and the results are remembered in case we get the same string again.
+        Anything else goes through the state machine which gives precise error messages.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleReferences.parseReferenceString {!r} from {}".format( referenceString, location ) )
+        assert referenceString and isinstance( referenceString, str )
+
+        settings = self.__getFastParserSettings()
+        if settings is None: # Our punctuation system doesn't suit the fast parser
+            return self.__parseReferenceStringSlowly( referenceString, location )
+        parseCache = settings['parseCache']
+        try: # See if we've already done this one
+            referenceList = parseCache[referenceString]
+            parseCache.move_to_end( referenceString )
+        except KeyError: # not cached
+            referenceList = self.__parseReferenceStringFast( referenceString, settings )
+            if referenceList is None: # Have to do it the slow way
+                return self.__parseReferenceStringSlowly( referenceString, location )
+            parseCache[referenceString] = referenceList
+            if len(parseCache) > self.parseCacheSize:
+                parseCache.popitem( last=False ) # Discard the least recently used entry
+        self.referenceList = list( referenceList ) # Copy it so the caller can't change our cached entry
+        return True, False, self.referenceList
+    # end of BibleReferenceList.parseReferenceString
+
+
+    def __getFastParserSettings( self ):
+        """
+        Returns a dictionary of character sets (and our cache of parsed reference strings)
+            for our current punctuation system
+            or None if the fast parser can't be used with it
+            (because the separators aren't all distinct, etc.)
+        """
+        try: return self.__fastParserSettings[id(self.punctuationDict)][1]
+        except KeyError: pass # We haven't used this punctuation system yet
+
+        settings = None
+        try:
+            punctuationStrings = [self.punctuationDict[key] for key in ('punctuationAfterBookAbbreviation','chapterVerseSeparator',
+                        'verseSeparator','bookSeparator','verseBridgeCharacter','bookChapterSeparator','allowedVerseSuffixes',
+                        'chapterSeparator','chapterBridgeCharacter','bookBridgeCharacter','spaceAllowedAfterBCS')]
+        except KeyError: punctuationStrings = None
+        if punctuationStrings and all( isinstance( punctuationString, str ) for punctuationString in punctuationStrings ):
+            PAB, CVS, VS, BS, Bridge, BCS, suffixes, CS, CB, BB, spaceAllowed = punctuationStrings
+            separatorSets = [set(PAB), set(CVS), set(VS), set(BS), set(Bridge), set(BCS+'_')-{' '}]
+            allSeparators = set().union( *separatorSets )
+            if spaceAllowed=='E' and ' ' in BCS and CS==BS and Bridge==CB==BB \
+            and CVS and VS and BS and Bridge \
+            and len(allSeparators) == sum( len(separatorSet) for separatorSet in separatorSets ) \
+            and not any( char.isalnum() or char.isspace() for char in allSeparators ) \
+            and all( char.isalpha() for char in suffixes ):
+                settings = { 'PAB':set(PAB), 'CVS':set(CVS), 'VS':set(VS), 'BS':set(BS), 'Bridge':set(Bridge), 'suffixes':set(suffixes),
+                            'verseRE':re.compile( '([0-9]+)([{}]?)'.format( re.escape( suffixes ) ) if suffixes else '([0-9]+)()' ),
+                            'parseCache':OrderedDict() }
+        self.__fastParserSettings[id(self.punctuationDict)] = self.punctuationDict, settings # Keep the dict so the id can't be reused
+        return settings
+    # end of BibleReferenceList.__getFastParserSettings
+
+
+    def __parseReferenceStringFast( self, referenceString, settings ):
+        """
+        A fast parser that only handles correctly formatted reference strings
+            e.g., 'Mat. 7:3,7; 8:17-9:2; Heb 2:2-4; Jde 7'
+            that wouldn't give any errors or warnings.
+
+        Returns the list of (BBB, C, V, S) tuples and ranges (exactly as the state machine would),
+            or None if the string needs to be parsed by the state machine.
+        """
+        for value in ignoredSuffixes:
+            if value in referenceString: return
+        PAB, CVS, VS, BS, Bridge, suffixes = settings['PAB'], settings['CVS'], settings['VS'], settings['BS'], settings['Bridge'], settings['suffixes']
+        fastVerseRE = settings['verseRE']
+        BOS = self._BibleOrganisationalSystem
+
+        def getBBB( bookNameOrAbbreviation ):
+            """ Returns the book code (or None). """
+            try: return self.getBBBFromText( bookNameOrAbbreviation )
+            except KeyError: return None # The state machine can fail on this one
+        # end of getBBB
+
+        def isValid( refTuple ):
+            """ Checks the reference (the same as isValidBCVRef does but without any error messages). """
+            BBB, C, V, S = refTuple
+            if BBB not in BOS: return False # in the book order system
+            try: return 0 < int(V) <= BOS.getNumVerses( BBB, C ) and not BOS.isOmittedVerse( refTuple )
+            except KeyError: return False
+        # end of isValid
+
+        refList, totalVerseList = [], []
+        def saveReference( refTuple ):
+            """ Returns False if the reference isn't valid or is a repeat. """
+            if refTuple in refList or not isValid( refTuple ): return False
+            refList.append( refTuple )
+            totalVerseList.append( refTuple )
+            return True
+        # end of saveReference
+
+        def saveReferenceRange( startTuple, finishTuple ):
+            """ Returns False if the range isn't valid, is out of order, or is a repeat. """
+            rangeTuple = (startTuple, finishTuple,)
+            if rangeTuple in refList or not isValid( startTuple ) or not isValid( finishTuple ): return False
+            C1int, C2int = int(startTuple[1]), int(finishTuple[1])
+            if C1int > C2int or (C1int==C2int and int(startTuple[2]) >= int(finishTuple[2])): return False
+            refList.append( rangeTuple )
+            totalVerseList.extend( BOS.expandCVRange( startTuple, finishTuple, referenceString, BOS ) )
+            return True
+        # end of saveReferenceRange
+
+        endIndex, index, status = len(referenceString), 0, 'book'
+        BBB = C = V = S = None
+        while True:
+            if status == 'book': # Get the book name, the book/chapter separator, and the chapter number
+                match = fastBookRE.match( referenceString, index )
+                if match is None or not match.group().lstrip( '123456789' ).isalpha(): return
+                bookNameOrAbbreviation, index = match.group(), match.end()
+                if index >= endIndex: return
+                BBB = getBBB( bookNameOrAbbreviation )
+                if BBB is None: return
+                if referenceString[index] in PAB:
+                    try:
+                        if self.getBookNameFunction( BBB ) == bookNameOrAbbreviation: return # Didn't expect the punctuation
+                    except KeyError: return # Let the state machine handle it
+                    index += 1
+                if index >= endIndex or referenceString[index] != ' ': return
+                match = fastNumberRE.match( referenceString, index+1 )
+                if match is None: return
+                C, index = match.group(), match.end()
+                if index < endIndex and referenceString[index] in CVS:
+                    index += 1
+                    status = 'verse'
+                    continue
+                # else it can only be the verse number of a single chapter book
+                try:
+                    if not BOS.isSingleChapterBook( BBB ): return
+                except KeyError: return
+                C, V, S = '1', C, ''
+                if index < endIndex and referenceString[index] in suffixes:
+                    S = referenceString[index]
+                    index += 1
+                if index < endIndex and referenceString[index] in BS: return # The state machine doesn't handle this one
+                status = 'singleChapterVerse'
+            elif status == 'chapter': # Get the chapter number after a chapter separator
+                match = fastNumberRE.match( referenceString, index )
+                if match is None or match.end() >= endIndex or referenceString[match.end()] not in CVS: return
+                C, index = match.group(), match.end() + 1
+                status = 'verse'
+                continue
+            else: # Get the verse number and suffix
+                assert status == 'verse'
+                match = fastVerseRE.match( referenceString, index )
+                if match is None: return
+                V, S, index = match.group(1), match.group(2), match.end()
+
+            # Now we have a verse -- see what follows it
+            if index >= endIndex:
+                if not saveReference( (BBB,C,V,S) ): return
+                break
+            char = referenceString[index]
+            index += 1
+            if char in Bridge:
+                startTuple = (BBB, C, V, S)
+                if status == 'singleChapterVerse': # The state machine goes straight to the final verse number
+                    match = fastVerseRE.match( referenceString, index )
+                    if match is None: return
+                    V, S, index = match.group(1), match.group(2), match.end()
+                else:
+                    match = fastNumberRE.match( referenceString, index )
+                    if match is None: return
+                    V, S, index = match.group(), '', match.end()
+                    if index < endIndex and referenceString[index] in CVS: # It was a chapter number
+                        match = fastVerseRE.match( referenceString, index+1 )
+                        if match is None: return
+                        C, V, S, index = V, match.group(1), match.group(2), match.end()
+                if not saveReferenceRange( startTuple, (BBB,C,V,S) ): return
+                if index >= endIndex: break
+                char = referenceString[index]
+                index += 1
+            else:
+                if char in BS and S: return # The state machine would carry the suffix over to the next reference
+                if not saveReference( (BBB,C,V,S) ): return
+            if char in VS: status = 'verse'
+            elif char in BS:
+                if index < endIndex and referenceString[index] == ' ': index += 1
+                status = 'book' if fastBookRE.match( referenceString, index ) else 'chapter'
+            else: return
+        if len( set( totalVerseList ) ) < len( totalVerseList ): return # Overlapping references give a warning
+        return refList
+    # end of BibleReferenceList.__parseReferenceStringFast
+
+
+    def __parseReferenceStringSlowly( self, referenceString, location=None ):
         """
         A complex state machine that
         returns a tuple with True/False result, haveWarnings, list of (BBB, C, V, S) tuples.
@@ -1225,7 +1437,7 @@ class BibleReferenceList( BibleReferenceBase ):
                     logging.warning( _("Have duplicate or overlapping range at {} in Bible references {!r}").format( self.makeReferenceString(entry), referenceString ) )
             haveWarnings = True
         return status==9 and not haveErrors, haveWarnings, self.referenceList
-    # end of BibleReferenceList.parseReferenceString
+    # end of BibleReferenceList.__parseReferenceStringSlowly
 
 
     def getFirstReference( self, referenceString, location=None ):
@@ -1254,7 +1466,7 @@ class BibleReferenceList( BibleReferenceBase ):
         Assumes that the book names and punctuation are OSIS standard.
         """
         # Set things up for OSIS system e.g., 1Cor.3.5-1Cor.3.9
-        self.punctuationDict = {'booknameCase': 'M', 'booknameLength': 'M', 'spaceAllowedAfterBCS': 'N', 'punctuationAfterBookAbbreviation': '', 'chapterVerseSeparator': '.', 'bookChapterSeparator': '.', 'chapterSeparator': ';', 'bookBridgeCharacter': '-', 'chapterBridgeCharacter': '-', 'verseBridgeCharacter': '-', 'bookSeparator': ';', 'verseSeparator': ',', 'allowedVerseSuffixes': ''}
+        self.punctuationDict = OSIS_PUNCTUATION_DICT
         OSISList = BibleOrgSysGlobals.BibleBooksCodes.getAllOSISBooksCodes()
         #self.getBBBFromText = lambda s: BibleOrgSysGlobals.BibleBooksCodes.getBBBFromOSISAbbreviation(s)
         self.getBBBFromText = BibleOrgSysGlobals.BibleBooksCodes.getBBBFromOSISAbbreviation
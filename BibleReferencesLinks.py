@@ -24,14 +24,17 @@
 
 """
 Module handling BibleReferencesLinks functions.
+
+The (large) data file is memory-mapped for the lifetime of the object
+    and recently decoded entries are kept in a small LRU cache.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleReferencesLinks"
 ProgName = "Bible References Links handler"
-ProgVersion = '0.40'
+ProgVersion = '0.41'
 ProgNameVersion = '{} v{}'.format( ProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -40,7 +43,8 @@ debuggingThisModule = False
 
 import os #, logging
 import pickle
-#from collections import OrderedDict
+import mmap
+from collections import OrderedDict
 
 from singleton import singleton
 import BibleOrgSysGlobals
@@ -63,6 +67,10 @@ def exp( messageString ):
 
 
 
+DEFAULT_ENTRY_CACHE_SIZE = 1000 # Number of decoded entries to keep in our LRU cache
+
+
+
 @singleton # Can only ever have one instance
 class BibleReferencesLinks:
     """
@@ -78,6 +86,10 @@ class BibleReferencesLinks:
         Constructor:
         """
         self.__Index = None # We'll import into this in loadData
+        self.__chapterIndex = None # Built from the index the first time it's needed
+        self.__dataFile = self.__dataMap = None # Opened the first time an entry is needed
+        self.__entryCache = OrderedDict() # Decoded entries -- most recently used at the end
+        self.entryCacheSize = DEFAULT_ENTRY_CACHE_SIZE
     # end of BibleReferencesLinks.__init__
 
 
@@ -128,17 +140,50 @@ class BibleReferencesLinks:
             #yield BBB
 
 
+    def __openDataFile( self ):
+        """
+        Open and memory-map the data file (which then stays open for the lifetime of this object).
+        """
+        self.__dataFile = open( self.dataPickleFilepath, 'rb' )
+        self.__dataMap = mmap.mmap( self.__dataFile.fileno(), 0, access=mmap.ACCESS_READ )
+    # end of BibleReferencesLinks.__openDataFile
+
+
+    def close( self ):
+        """
+        Close the memory-mapped data file and empty the cache.
+
+        (It will be automatically reopened if another entry is requested.)
+        """
+        if self.__dataMap is not None:
+            self.__dataMap.close()
+            self.__dataMap = None
+        if self.__dataFile is not None:
+            self.__dataFile.close()
+            self.__dataFile = None
+        self.__entryCache.clear()
+    # end of BibleReferencesLinks.close
+
+
     def __getEntry( self, verseKey ):
         """
+        Return the decoded entry for the verse key,
+            from our LRU cache if possible, else from the memory-mapped data file.
         """
-        filePosition, segmentLength = self.__Index[verseKey]
-        with open( self.dataPickleFilepath, 'rb') as pickleFile:
-            pickleFile.seek( filePosition )
-            pickleEntry = pickleFile.read( segmentLength )
-            #print( "pe", pickleEntry )
-            entry = pickle.loads( pickleEntry )
-            #print( "e", entry )
+        try:
+            entry = self.__entryCache[verseKey]
+            self.__entryCache.move_to_end( verseKey )
             return entry
+        except KeyError: pass # not cached
+
+        filePosition, segmentLength = self.__Index[verseKey]
+        if self.__dataMap is None: self.__openDataFile()
+        entry = pickle.loads( self.__dataMap[filePosition:filePosition+segmentLength] )
+        #print( "e", entry )
+        self.__entryCache[verseKey] = entry
+        if len(self.__entryCache) > self.entryCacheSize:
+            self.__entryCache.popitem( last=False ) # Discard the least recently used entry
+        return entry
     # end of BibleReferencesLinks.__getEntry
 
 
@@ -164,20 +209,64 @@ class BibleReferencesLinks:
             1: Link FlexibleVersesKey object
         """
         if verseKey in self.__Index:
-            relatedPassageList = self.__getEntry( verseKey )
-            if relatedPassageList:
-                resultList = []
-                for relatedPassage in relatedPassageList:
-                    #print( ' ', relatedPassage )
-                    sourceReference,sourceComponent,parsedSourceReference,actualLinksList = relatedPassage
-                    #print( ' ', sourceReference )
-                    for actualLink in actualLinksList:
-                        #print( '    ', actualLink )
-                        targetReference,targetComponent,parsedTargetReference,linkType = actualLink
-                        #print( '    ', linkType, targetReference )
-                        resultList.append( (linkType,parsedTargetReference) )
-                return resultList
+            return self.__makeRelatedPassagesList( self.__getEntry( verseKey ) )
     # end of BibleReferencesLinks.getRelatedPassagesList
+
+
+    def __makeRelatedPassagesList( self, relatedPassageList ):
+        """
+        Convert an entry (a full related passages list) to the shorter list of 2-tuples.
+        """
+        if relatedPassageList:
+            resultList = []
+            for relatedPassage in relatedPassageList:
+                #print( ' ', relatedPassage )
+                sourceReference,sourceComponent,parsedSourceReference,actualLinksList = relatedPassage
+                #print( ' ', sourceReference )
+                for actualLink in actualLinksList:
+                    #print( '    ', actualLink )
+                    targetReference,targetComponent,parsedTargetReference,linkType = actualLink
+                    #print( '    ', linkType, targetReference )
+                    resultList.append( (linkType,parsedTargetReference) )
+            return resultList
+    # end of BibleReferencesLinks.__makeRelatedPassagesList
+
+
+    def getRelatedPassagesDict( self, verseKeys ):
+        """
+        Given an iterable of verse keys, return an OrderedDict
+            with the verse keys which have links as keys
+            and the getRelatedPassagesList results as values.
+
+        The entries are read in data file order
+            so that a whole chapter (say) is read in a single pass through the memory map.
+        """
+        foundKeys = sorted( (verseKey for verseKey in set(verseKeys) if verseKey in self.__Index),
+                                                key=lambda verseKey: self.__Index[verseKey][0] )
+        resultDict = OrderedDict()
+        for verseKey in foundKeys:
+            resultDict[verseKey] = self.__makeRelatedPassagesList( self.__getEntry( verseKey ) )
+        return resultDict
+    # end of BibleReferencesLinks.getRelatedPassagesDict
+
+
+    def getChapterRelatedPassagesDict( self, BBB, C ):
+        """
+        Given a book code and chapter number (string),
+            return an OrderedDict (sorted by verse number) with the verse keys as keys
+            and the getRelatedPassagesList results as values.
+        """
+        if self.__chapterIndex is None: # Build it once
+            self.__chapterIndex = {}
+            for verseKey in self.__Index:
+                BCkey = verseKey.getBBB(), verseKey.getChapterNumberStr()
+                try: self.__chapterIndex[BCkey].append( verseKey )
+                except KeyError: self.__chapterIndex[BCkey] = [ verseKey ]
+        try: chapterVerseKeys = self.__chapterIndex[(BBB,str(C))]
+        except KeyError: return OrderedDict()
+        resultDict = self.getRelatedPassagesDict( chapterVerseKeys )
+        return OrderedDict( sorted( resultDict.items(), key=lambda item: item[0].getVerseNumberInt() or 0 ) )
+    # end of BibleReferencesLinks.getChapterRelatedPassagesDict
 # end of BibleReferencesLinks class
 
 
@@ -340,6 +429,11 @@ def demo():
     for verseReferenceString in testKeys:
         svk = SimpleVerseKey( verseReferenceString )
         print( svk.getVerseKeyText(), brl.getRelatedPassagesList( svk ) )
+
+    print( "\nTest chapter passages…" )
+    for BBB,C in ( ('MAT','1'), ('ISA','7'), ):
+        for svk,relatedPassageList in brl.getChapterRelatedPassagesDict( BBB, C ).items():
+            print( svk.getVerseKeyText(), relatedPassageList )
 # end of demo
 
 
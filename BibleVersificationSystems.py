@@ -27,8 +27,17 @@ Module to load, use, determine, and compare various Bible versification systems.
     Note that this doesn't just find the maximum verse number in each chapter --
         it also checks for combined, omitted, and reordered verses.
 
-NOTE: We still lack a REFERENCE Bible versification system
-        with back-and-forth mappings. This is a MAJOR outstanding deficiency.
+NOTE: The BibMaxRef system (which contains the most books/chapters/verses) is used as
+        the REFERENCE Bible versification system, but we still lack mapping data
+        so references are currently only aligned by matching book/chapter/verse numbers
+        (unless explicit mapping rules are given). This is a MAJOR outstanding deficiency.
+
+Each BibleVersificationSystem also builds (on first use) compact integer tables
+    of verse counts and cumulative verse offsets for every chapter,
+    plus a flag for each omitted verse,
+    so that validity checks, ordinal lookups and range expansions don't need to
+    walk the string-keyed dictionaries or the omitted verse lists.
+    The tables are shared between all objects for the same versification system.
 
 BibleVersificationSystems class:
     __init__( self ) # We can't give this parameters because of the singleton
@@ -58,17 +67,30 @@ BibleVersificationSystem class:
     isOmittedVerse( self, referenceTuple )
     getAuxilliaryVerseList( self, listName )
     isValidBCVRef( self, referenceTuple, referenceString=None, extended=False )
+    areValidBCVRefs( self, referenceTuples, extended=False )
+    getNumVerseOrdinals( self )
+    getVerseOrdinal( self, referenceTuple )
+    getReferenceFromOrdinal( self, ordinal )
     expandCVRange( self, startRef, endRef, referenceString=None, bookOrderSystem=None )
     convertToReferenceVersification( self, BBB, C, V, S=None )
     convertFromReferenceVersification( self, refBBB, refC, refV, refS=None )
+
+BibleVersificationMapping class:
+    __init__( self, fromSystem, toSystem, mappingRules=None )
+    __str__( self )
+    convertReference( self, referenceTuple, reverse=False )
+    convertReferences( self, referenceTuples, reverse=False )
+    convertBook( self, BBB, reverse=False )
+
+getVersificationMapping( fromSystemName, toSystemName )
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleVersificationSystems"
 ProgName = "Bible Versification Systems handler"
-ProgVersion = '0.60'
+ProgVersion = '0.63'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -76,11 +98,19 @@ debuggingThisModule = False
 
 
 import os, logging
+from array import array
+from bisect import bisect_right
 #from singleton import singleton
 
 import BibleOrgSysGlobals
 
 
+REFERENCE_VERSIFICATION_SYSTEM_NAME = 'BibMaxRef'
+
+verseTablesDict = {} # Compact verse tables for each versification system name (built when first needed)
+versificationMappingsDict = {} # Default BibleVersificationMapping objects for each (fromSystemName,toSystemName)
+
+
 
 #@singleton # Can only ever have one instance (but doesn't work for multiprocessing)
 class BibleVersificationSystems:
@@ -121,10 +151,9 @@ class BibleVersificationSystems:
                         or pickle9 <= os.stat( XMLfilepath ).st_ctime: # The pickle file is older
                             picklesGood = False; break
             if picklesGood:
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self.__DataDict = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each system is only unpickled when first used
             else: # We have to load the XML (much slower)
                 from BibleVersificationSystemsConverter import BibleVersificationSystemsConverter
                 if XMLFolder is not None: logging.warning( _("Bible versification systems are already loaded -- your given folder of {!r} was ignored").format(XMLFolder) )
@@ -560,9 +589,71 @@ class BibleVersificationSystem:
         if result is not None:
             self.__chapterDataDict, self.__omittedVersesDict, self.__combinedVersesDict, self.__reorderedVersesDict = result['CV'], result['omitted'], result['combined'], result['reordered']
             # no longer true: assert len(self.__chapterDataDict) == len(self.__omittedVersesDict) == len(self.__combinedVersesDict) == len(self.__reorderedVersesDict)
+        self.__verseTables = None # Built in __getVerseTables when first needed
     # end of BibleVersificationSystem.__init__
 
 
+    def __getVerseTables( self ):
+        """
+        Returns a dictionary of compact integer tables for this versification system.
+
+        Every chapter of every book gets a chapter index (books in the order of the system,
+            chapters in numerical order) and every verse gets an absolute verse ordinal (from zero).
+        The tables contain:
+            'bookList': the BBBs in order, and 'bookIndexDict': BBB -> index into bookList
+            'chapterIndexDicts': BBB -> dict of C (string) -> chapter index
+            'bookFirstChapterIndexes': first chapter index of each book (plus a final entry)
+            'chapterNumbers', 'numVerses': for each chapter index
+            'verseOffsets': the ordinal of verse one of each chapter (plus a final entry for the total)
+            'omittedFlags': a byte for each verse ordinal, set if that verse is omitted in this system
+            'chapterStrings', 'verseStrings': string versions of the numbers for building references
+        The tables are only built once for each versification system name.
+        """
+        if self.__verseTables is not None: return self.__verseTables
+        if self._systemName in verseTablesDict: # Another object for this system has already built them
+            self.__verseTables = verseTablesDict[self._systemName]
+            return self.__verseTables
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleVersificationSystem.__getVerseTables() building tables for {}…".format( self._systemName ) )
+
+        bookList, bookIndexDict, chapterIndexDicts = [], {}, {}
+        bookFirstChapterIndexes, chapterNumbers, numVersesArray, verseOffsets = array( 'L' ), array( 'H' ), array( 'H' ), array( 'L' )
+        chapterStrings = []
+        totalVerses = maxVerses = 0
+        for BBB,bookData in self.__chapterDataDict.items():
+            bookIndexDict[BBB] = len( bookList )
+            bookList.append( BBB )
+            bookFirstChapterIndexes.append( len(chapterNumbers) )
+            chapterIndexDict = chapterIndexDicts[BBB] = {}
+            for C in sorted( (key for key in bookData if key!='numChapters'), key=int ):
+                numVerses = int( bookData[C] )
+                chapterIndexDict[C] = len( chapterNumbers )
+                chapterNumbers.append( int(C) )
+                chapterStrings.append( C )
+                numVersesArray.append( numVerses )
+                verseOffsets.append( totalVerses )
+                totalVerses += numVerses
+                if numVerses > maxVerses: maxVerses = numVerses
+        bookFirstChapterIndexes.append( len(chapterNumbers) )
+        verseOffsets.append( totalVerses )
+
+        omittedFlags = bytearray( totalVerses )
+        for BBB,omittedList in self.__omittedVersesDict.items():
+            if BBB not in chapterIndexDicts: continue
+            for C,V in omittedList:
+                chapterIndex = chapterIndexDicts[BBB].get( C )
+                if chapterIndex is not None and 0 < int(V) <= numVersesArray[chapterIndex]:
+                    omittedFlags[verseOffsets[chapterIndex]+int(V)-1] = 1
+
+        self.__verseTables = verseTablesDict[self._systemName] = { 'bookList':bookList, 'bookIndexDict':bookIndexDict,
+                    'chapterIndexDicts':chapterIndexDicts, 'bookFirstChapterIndexes':bookFirstChapterIndexes,
+                    'chapterNumbers':chapterNumbers, 'numVerses':numVersesArray, 'verseOffsets':verseOffsets,
+                    'omittedFlags':omittedFlags, 'chapterStrings':chapterStrings,
+                    'verseStrings':[str(V) for V in range( maxVerses+1 )] }
+        return self.__verseTables
+    # end of BibleVersificationSystem.__getVerseTables
+
+
     def __str__( self ):
         """
         This method returns the string representation of a Bible versification system.
@@ -678,7 +769,8 @@ class BibleVersificationSystem:
         if isinstance( C, int ): # Just double-check the parameter
             logging.debug( _("BibleVersificationSystem.getNumVerses was passed an integer chapter instead of a string with {} {}").format( BBB, C ) )
             C = str( C )
-        try: return int( self.__chapterDataDict[BBB][C] )
+        verseTables = self.__verseTables or self.__getVerseTables()
+        try: return verseTables['numVerses'][verseTables['chapterIndexDicts'][BBB][C]]
         except KeyError: return 0
     # end of BibleVersificationSystem.getNumVerses
 
@@ -702,10 +794,10 @@ class BibleVersificationSystem:
         Returns an integer indicating the total number of verses in the book.
         """
         assert len(BBB) == 3
-        verseCount = 0
-        for x in self.__chapterDataDict[BBB].keys():
-            if x!='numChapters': verseCount += int( self.__chapterDataDict[BBB][x] )
-        return verseCount
+        verseTables = self.__verseTables or self.__getVerseTables()
+        bookIndex = verseTables['bookIndexDict'][BBB]
+        bookFirstChapterIndexes, verseOffsets = verseTables['bookFirstChapterIndexes'], verseTables['verseOffsets']
+        return verseOffsets[bookFirstChapterIndexes[bookIndex+1]] - verseOffsets[bookFirstChapterIndexes[bookIndex]]
     # end of BibleVersificationSystem.getTotalNumVerses
 
 
@@ -731,7 +823,9 @@ class BibleVersificationSystem:
             logging.debug( _("BibleVersificationSystem.isOmittedVerse was passed an integer verse instead of a string with {} {}:{}").format(BBB,C,V) )
             V = str( V )
         if BBB not in self.__omittedVersesDict: return False
-        return (C,V) in self.__omittedVersesDict[BBB]
+        ordinal = self.getVerseOrdinal( referenceTuple )
+        if ordinal is not None: return bool( self.__verseTables['omittedFlags'][ordinal] )
+        return (C,V) in self.__omittedVersesDict[BBB] # Only for strange references outside the chapter
     # end of BibleVersificationSystem.isOmittedVerse
 
 
@@ -763,13 +857,16 @@ class BibleVersificationSystem:
         assert not S or len(S)==1 and S.isalpha() # Suffix should be only one lower-case letter if anything
         myReferenceString = " (from {!r})".format(referenceString) if referenceString is not None else ''
 
+        verseTables = self.__verseTables or self.__getVerseTables()
         if BBB in self.__chapterDataDict:
             if extended and C=='-1': return 0 <= int(V) <= 199 # Don't check the verse number range accurately
-            if C in self.__chapterDataDict[BBB]:
+            chapterIndex = verseTables['chapterIndexDicts'][BBB].get( C )
+            if chapterIndex is not None:
                 if not V: return True # NOTE: This allows blank verse numbers (as a reference can refer to an entire chapter)
                 if extended and V=='0': return True
-                if 0 < int(V) <= int(self.__chapterDataDict[BBB][C]):
-                    if not self.isOmittedVerse( referenceTuple ):
+                Vint = int( V )
+                if 0 < Vint <= verseTables['numVerses'][chapterIndex]:
+                    if not verseTables['omittedFlags'][verseTables['verseOffsets'][chapterIndex]+Vint-1]:
                         return True
                     logging.error( _("{} {}:{} is omitted in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
                 logging.error( _("{} {}:{} is invalid verse in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
@@ -779,6 +876,110 @@ class BibleVersificationSystem:
     # end of BibleVersificationSystem.isValidBCVRef
 
 
+    def areValidBCVRefs( self, referenceTuples, extended=False ):
+        """
+        Given an iterable of (BBB,C,V) or (BBB,C,V,S) references,
+            returns a list of True/False values indicating if each one is valid in this system.
+
+        Uses the same rules as isValidBCVRef but doesn't log anything
+            so is suitable for checking large numbers of references.
+        """
+        verseTables = self.__verseTables or self.__getVerseTables()
+        chapterIndexDicts, numVersesArray = verseTables['chapterIndexDicts'], verseTables['numVerses']
+        verseOffsets, omittedFlags = verseTables['verseOffsets'], verseTables['omittedFlags']
+
+        results = []
+        for referenceTuple in referenceTuples:
+            BBB, C, V = referenceTuple[:3]
+            isValid = False
+            if BBB in chapterIndexDicts:
+                if extended and C=='-1': isValid = 0 <= int(V) <= 199
+                else:
+                    chapterIndex = chapterIndexDicts[BBB].get( C )
+                    if chapterIndex is not None:
+                        if not V or (extended and V=='0'): isValid = True
+                        else:
+                            Vint = int( V )
+                            isValid = 0 < Vint <= numVersesArray[chapterIndex] \
+                                        and not omittedFlags[verseOffsets[chapterIndex]+Vint-1]
+            results.append( isValid )
+        return results
+    # end of BibleVersificationSystem.areValidBCVRefs
+
+
+    def getNumVerseOrdinals( self ):
+        """
+        Returns the total number of verses (including omitted ones) in this versification system,
+            i.e., one more than the largest verse ordinal.
+        """
+        return (self.__verseTables or self.__getVerseTables())['verseOffsets'][-1]
+    # end of BibleVersificationSystem.getNumVerseOrdinals
+
+
+    def getVerseOrdinal( self, referenceTuple ):
+        """
+        Given a (BBB,C,V) or (BBB,C,V,S) reference (with C and V as strings),
+            returns the absolute verse ordinal (int, from zero) in this versification system.
+
+        Omitted verses still have an ordinal.
+        Returns None if the book, chapter, or verse isn't in this system.
+        """
+        BBB, C, V = referenceTuple[:3]
+        verseTables = self.__verseTables or self.__getVerseTables()
+        try: chapterIndex = verseTables['chapterIndexDicts'][BBB][C]
+        except KeyError: return None
+        try: Vint = int( V )
+        except ValueError: return None
+        if 0 < Vint <= verseTables['numVerses'][chapterIndex]:
+            return verseTables['verseOffsets'][chapterIndex] + Vint - 1
+        # else return None
+    # end of BibleVersificationSystem.getVerseOrdinal
+
+
+    def getReferenceFromOrdinal( self, ordinal ):
+        """
+        Given an absolute verse ordinal (int, from zero) in this versification system,
+            returns the (BBB,C,V,S) reference with S blank.
+
+        Returns None if the ordinal is out of range.
+        """
+        verseTables = self.__verseTables or self.__getVerseTables()
+        verseOffsets = verseTables['verseOffsets']
+        if not 0 <= ordinal < verseOffsets[-1]: return None
+        chapterIndex = bisect_right( verseOffsets, ordinal ) - 1 # Any empty chapters have the same offset as the next one
+        bookIndex = bisect_right( verseTables['bookFirstChapterIndexes'], chapterIndex ) - 1
+        return verseTables['bookList'][bookIndex], verseTables['chapterStrings'][chapterIndex], \
+                    verseTables['verseStrings'][ordinal-verseOffsets[chapterIndex]+1], ''
+    # end of BibleVersificationSystem.getReferenceFromOrdinal
+
+
+    def __getOrdinalRangeReferences( self, firstOrdinal, lastOrdinal ):
+        """
+        Returns a list of (BBB,C,V,S) references (with S blank)
+            for the given inclusive range of verse ordinals.
+        """
+        verseTables = self.__verseTables
+        bookList, bookFirstChapterIndexes = verseTables['bookList'], verseTables['bookFirstChapterIndexes']
+        numVersesArray, verseOffsets = verseTables['numVerses'], verseTables['verseOffsets']
+        chapterStrings, verseStrings = verseTables['chapterStrings'], verseTables['verseStrings']
+
+        resultList = []
+        if firstOrdinal > lastOrdinal: return resultList
+        chapterIndex = bisect_right( verseOffsets, firstOrdinal ) - 1
+        bookIndex = bisect_right( bookFirstChapterIndexes, chapterIndex ) - 1
+        ordinal = firstOrdinal
+        while ordinal <= lastOrdinal:
+            while bookFirstChapterIndexes[bookIndex+1] <= chapterIndex: bookIndex += 1
+            BBB, C, chapterOffset = bookList[bookIndex], chapterStrings[chapterIndex], verseOffsets[chapterIndex]
+            endOrdinal = min( lastOrdinal, chapterOffset + numVersesArray[chapterIndex] - 1 )
+            for Vint in range( ordinal-chapterOffset+1, endOrdinal-chapterOffset+2 ):
+                resultList.append( (BBB, C, verseStrings[Vint], '',) )
+            ordinal = endOrdinal + 1
+            chapterIndex += 1
+        return resultList
+    # end of BibleVersificationSystem.__getOrdinalRangeReferences
+
+
     def expandCVRange( self, startRef, endRef, referenceString=None, bookOrderSystem=None ):
         """ Returns a list containing all valid references (inclusive) between the given values. """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
@@ -824,59 +1025,30 @@ class BibleVersificationSystem:
             haveErrors = True
         if haveErrors: return None
 
-        resultList = []
+        verseTables = self.__verseTables
+        chapterIndexDicts, bookIndexDict = verseTables['chapterIndexDicts'], verseTables['bookIndexDict']
+        bookFirstChapterIndexes, verseOffsets = verseTables['bookFirstChapterIndexes'], verseTables['verseOffsets']
+        firstOrdinal = verseOffsets[chapterIndexDicts[BBB1][C1]] + V1int - 1
+        lastOrdinal = verseOffsets[chapterIndexDicts[BBB2][C2]] + V2int - 1
         if BBB1 == BBB2: # It's a chapter or verse range within the same book
-            for Cint in range( C1int, C2int+1 ):
-                if Cint==C1int and Cint==C2int: # We're on the only chapter
-                    startVint = V1int
-                    endVint = V2int
-                elif Cint==C1int: # We're on the first chapter
-                    startVint = V1int
-                    endVint = self.getNumVerses( BBB1, str(Cint) )
-                elif Cint==C2int: # We're on the final chapter
-                    startVint = 1
-                    endVint = V2int
-                else: # Must be an inbetween chapter
-                    startVint = 1
-                    endVint = self.getNumVerses( BBB1, str(Cint) )
-                for Vint in range( startVint, endVint+1 ):
-                    if Cint==C1int and Vint==V1int: S = S1
-                    elif Cint==C2int and Vint==V2int: S = S2
-                    else: S = ''
-                    resultList.append( (BBB1, str(Cint), str(Vint), S,) )
+            resultList = self.__getOrdinalRangeReferences( firstOrdinal, lastOrdinal )
         else: # it's a range that spans multiple books
-            BBB, Cfirst, Vfirst = BBB1, C1int, V1int
-            #print( "  here1 in expandCVRange:", BBB, Cfirst, Vfirst )
+            resultList, BBB, startOrdinal = [], BBB1, firstOrdinal
+            #print( "  here1 in expandCVRange:", BBB, startOrdinal )
             while BBB != BBB2: # Go to the end of this book
-                Clast = self.getNumChapters( BBB )
-                if Clast is None: # This book didn't have any chapter info in the versification scheme  :(
+                if BBB not in bookIndexDict: # This book didn't have any chapter info in the versification scheme  :(
                     logging.critical( "Book {} didn't have chapter information for expanding range {} to {}".format( BBB, startRef, endRef ) )
                     break
-                #print( "    here2 in expandCVRange:", BBB, Cfirst, Clast )
-                for Cint in range( Cfirst, Clast+1 ):
-                    Vlast = self.getNumVerses( BBB, str(Cint) )
-                    if Cint==Cfirst: # We're on the first chapter
-                        startVint = V1int
-                        endVint = Vlast
-                    else: # It's not the first chapter
-                        startVint = 1
-                        endVint = Vlast
-                    for Vint in range( startVint, endVint+1 ):
-                        if Cint==C1int and Vint==V1int: S = S1
-                        else: S = ''
-                        resultList.append( (BBB, str(Cint), str(Vint), S,) )
-                BBB, Cfirst, Vfirst = bookOrderSystem.getNextBookCode( BBB ), 1, 1
-            for Cint in range( 1, C2int+1 ): # Now finish the last book
-                if Cint==C2int: # We're on the final chapter
-                    startVint = 1
-                    endVint = V2int
-                else: # Must be an inbetween chapter
-                    startVint = 1
-                    endVint = self.getNumVerses( BBB2, str(Cint) )
-                for Vint in range( startVint, endVint+1 ):
-                    if Cint==C2int and Vint==V2int: S = S2
-                    else: S = ''
-                    resultList.append( (BBB2, str(Cint), str(Vint), S,) )
+                bookIndex = bookIndexDict[BBB]
+                if startOrdinal is None: startOrdinal = verseOffsets[bookFirstChapterIndexes[bookIndex]]
+                resultList.extend( self.__getOrdinalRangeReferences( startOrdinal, verseOffsets[bookFirstChapterIndexes[bookIndex+1]]-1 ) )
+                BBB, startOrdinal = bookOrderSystem.getNextBookCode( BBB ), None
+            # Now finish the last book
+            resultList.extend( self.__getOrdinalRangeReferences( verseOffsets[bookFirstChapterIndexes[bookIndexDict[BBB2]]], lastOrdinal ) )
+        if resultList and S1 and resultList[0][:3]==(BBB1,C1,str(V1int)):
+            resultList[0] = resultList[0][:3] + (S1,)
+        if resultList and S2 and resultList[-1][:3]==(BBB2,C2,str(V2int)):
+            resultList[-1] = resultList[-1][:3] + (S2,)
 
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule: print( startRef, endRef, resultList, haveErrors, haveWarnings )
         return resultList #, haveErrors, haveWarnings
@@ -888,11 +1060,15 @@ class BibleVersificationSystem:
         Convert the given reference (in this versification system)
             to the reference versification.
 
-        Returns a new BBB, C, V, S.
+        Returns a new BBB, C, V, S
+            or four Nones if there's no matching verse in the reference versification.
         """
-        logging.debug( "convertToReferenceVersification does nothing yet!" )
-        refBBB, refC, refV, refS = BBB, C, V, S
-        return refBBB, refC, refV, refS
+        result = getVersificationMapping( self._systemName, REFERENCE_VERSIFICATION_SYSTEM_NAME ) \
+                            .convertReference( (BBB, C, V, S) )
+        if result is None:
+            logging.warning( _("{} {}:{} in {} versification system has no equivalent in the reference versification").format( BBB, C, V, self._systemName ) )
+            return None, None, None, None
+        return result
     # end of BibleVersificationSystem.convertToReferenceVersification
 
 
@@ -901,16 +1077,170 @@ class BibleVersificationSystem:
         Convert the given reference in the reference versification system
             to this versification.
 
-        Returns a new BBB, C, V, S.
+        Returns a new BBB, C, V, S
+            or four Nones if there's no matching verse in this versification.
         """
-        logging.debug( "convertFromReferenceVersification does nothing yet!" )
-        BBB, C, V, S = refBBB, refC, refV, refS
-        return BBB, C, V, S
+        result = getVersificationMapping( self._systemName, REFERENCE_VERSIFICATION_SYSTEM_NAME ) \
+                            .convertReference( (refBBB, refC, refV, refS), reverse=True )
+        if result is None:
+            logging.warning( _("{} {}:{} in the reference versification has no equivalent in {} versification system").format( refBBB, refC, refV, self._systemName ) )
+            return None, None, None, None
+        return result
     # end of BibleVersificationSystem.convertFromReferenceVersification
 # end of BibleVersificationSystem class
 
 
 
+class BibleVersificationMapping:
+    """
+    Class for converting references between two Bible versification systems.
+
+    The mapping is held as two arrays of verse ordinals (one for each direction)
+        so that each conversion is only a couple of lookups.
+    By default, verses with the same book/chapter/verse numbers in both systems are matched
+        (except where the verse is omitted in either system).
+    mappingRules is an optional list of (fromReference, toReference) pairs
+        (each a (BBB,C,V) tuple, with toReference possibly None for no equivalent)
+        which override the default matching.
+    """
+
+    def __init__( self, fromSystem, toSystem, mappingRules=None ):
+        """
+        Constructor: the systems can be BibleVersificationSystem objects or system names.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleVersificationMapping.__init__( {}, {}, {} )".format( fromSystem, toSystem, mappingRules ) )
+        self.fromSystem = BibleVersificationSystem( fromSystem ) if isinstance( fromSystem, str ) else fromSystem
+        self.toSystem = BibleVersificationSystem( toSystem ) if isinstance( toSystem, str ) else toSystem
+        self.fromSystemName, self.toSystemName = self.fromSystem.getVersificationSystemName(), self.toSystem.getVersificationSystemName()
+
+        numFromOrdinals, numToOrdinals = self.fromSystem.getNumVerseOrdinals(), self.toSystem.getNumVerseOrdinals() # Also makes sure the tables are built
+        fromTables, toTables = verseTablesDict[self.fromSystemName], verseTablesDict[self.toSystemName]
+        self.forwardOrdinals, self.reverseOrdinals = array( 'l', [-1] ) * numFromOrdinals, array( 'l', [-1] ) * numToOrdinals
+
+        # Match the same BCVs in both systems
+        fromChapterIndexDicts, toChapterIndexDicts = fromTables['chapterIndexDicts'], toTables['chapterIndexDicts']
+        fromNumVerses, toNumVerses = fromTables['numVerses'], toTables['numVerses']
+        fromVerseOffsets, toVerseOffsets = fromTables['verseOffsets'], toTables['verseOffsets']
+        for BBB,fromChapterIndexDict in fromChapterIndexDicts.items():
+            if BBB not in toChapterIndexDicts: continue
+            toChapterIndexDict = toChapterIndexDicts[BBB]
+            for C,fromChapterIndex in fromChapterIndexDict.items():
+                if C not in toChapterIndexDict: continue
+                toChapterIndex = toChapterIndexDict[C]
+                numVerses = min( fromNumVerses[fromChapterIndex], toNumVerses[toChapterIndex] )
+                fromOffset, toOffset = fromVerseOffsets[fromChapterIndex], toVerseOffsets[toChapterIndex]
+                self.forwardOrdinals[fromOffset:fromOffset+numVerses] = array( 'l', range( toOffset, toOffset+numVerses ) )
+                self.reverseOrdinals[toOffset:toOffset+numVerses] = array( 'l', range( fromOffset, fromOffset+numVerses ) )
+        # Omitted verses don't have an equivalent
+        for fromOrdinal in (ordinal for ordinal,flag in enumerate( fromTables['omittedFlags'] ) if flag):
+            toOrdinal = self.forwardOrdinals[fromOrdinal]
+            self.forwardOrdinals[fromOrdinal] = -1
+            if toOrdinal >= 0: self.reverseOrdinals[toOrdinal] = -1
+        for toOrdinal in (ordinal for ordinal,flag in enumerate( toTables['omittedFlags'] ) if flag):
+            fromOrdinal = self.reverseOrdinals[toOrdinal]
+            self.reverseOrdinals[toOrdinal] = -1
+            if fromOrdinal >= 0: self.forwardOrdinals[fromOrdinal] = -1
+
+        if mappingRules:
+            for fromReference,toReference in mappingRules:
+                fromOrdinal = self.fromSystem.getVerseOrdinal( fromReference )
+                toOrdinal = self.toSystem.getVerseOrdinal( toReference ) if toReference else None
+                if fromOrdinal is None or (toReference and toOrdinal is None):
+                    logging.error( _("BibleVersificationMapping: invalid mapping rule {} -> {} for {} to {}").format( fromReference, toReference, self.fromSystemName, self.toSystemName ) )
+                    continue
+                oldToOrdinal = self.forwardOrdinals[fromOrdinal]
+                if oldToOrdinal >= 0 and self.reverseOrdinals[oldToOrdinal] == fromOrdinal:
+                    self.reverseOrdinals[oldToOrdinal] = -1
+                if toOrdinal is None: self.forwardOrdinals[fromOrdinal] = -1
+                else:
+                    self.forwardOrdinals[fromOrdinal] = toOrdinal
+                    self.reverseOrdinals[toOrdinal] = fromOrdinal
+    # end of BibleVersificationMapping.__init__
+
+
+    def __str__( self ):
+        """
+        This method returns the string representation of a Bible versification mapping.
+
+        @return: the name of a Bible object formatted as a string
+        @rtype: string
+        """
+        result = "BibleVersificationMapping object for {} to {}".format( self.fromSystemName, self.toSystemName )
+        if BibleOrgSysGlobals.verbosityLevel > 2:
+            result += ('\n' if result else '') + "  " + _("{:,} of {:,} verses mapped forwards, {:,} of {:,} mapped back") \
+                        .format( sum( 1 for ordinal in self.forwardOrdinals if ordinal >= 0 ), len(self.forwardOrdinals),
+                                sum( 1 for ordinal in self.reverseOrdinals if ordinal >= 0 ), len(self.reverseOrdinals) )
+        return result
+    # end of BibleVersificationMapping.__str__
+
+
+    def convertReference( self, referenceTuple, reverse=False ):
+        """
+        Given a (BBB,C,V) or (BBB,C,V,S) reference in the from system
+            (or in the to system if reverse is set),
+            returns the equivalent (BBB,C,V,S) reference in the other system.
+
+        A blank V converts the start of the chapter and returns a blank V.
+        Returns None if there's no equivalent verse.
+        """
+        BBB, C, V = referenceTuple[:3]
+        S = referenceTuple[3] if len(referenceTuple) > 3 else ''
+        sourceSystem, destinationSystem, ordinals = (self.toSystem, self.fromSystem, self.reverseOrdinals) if reverse \
+                                            else (self.fromSystem, self.toSystem, self.forwardOrdinals)
+        ordinal = sourceSystem.getVerseOrdinal( (BBB, C, V or '1') )
+        if ordinal is None or ordinals[ordinal] < 0: return None
+        newBBB, newC, newV = destinationSystem.getReferenceFromOrdinal( ordinals[ordinal] )[:3]
+        return newBBB, newC, newV if V else '', S
+    # end of BibleVersificationMapping.convertReference
+
+
+    def convertReferences( self, referenceTuples, reverse=False ):
+        """
+        Given an iterable of (BBB,C,V) or (BBB,C,V,S) references,
+            returns a list of converted references (with None where there's no equivalent).
+        """
+        convertReference = self.convertReference
+        return [convertReference( referenceTuple, reverse ) for referenceTuple in referenceTuples]
+    # end of BibleVersificationMapping.convertReferences
+
+
+    def convertBook( self, BBB, reverse=False ):
+        """
+        Returns a list of (reference, convertedReference) pairs
+            for every verse of the given book in the from system (or in the to system if reverse is set),
+            with convertedReference None where there's no equivalent.
+        """
+        sourceSystem, destinationSystem, ordinals = (self.toSystem, self.fromSystem, self.reverseOrdinals) if reverse \
+                                            else (self.fromSystem, self.toSystem, self.forwardOrdinals)
+        sourceTables = verseTablesDict[sourceSystem.getVersificationSystemName()]
+        if BBB not in sourceTables['bookIndexDict']: return []
+        bookIndex = sourceTables['bookIndexDict'][BBB]
+        bookFirstChapterIndexes, verseOffsets = sourceTables['bookFirstChapterIndexes'], sourceTables['verseOffsets']
+        getSourceReference, getDestinationReference = sourceSystem.getReferenceFromOrdinal, destinationSystem.getReferenceFromOrdinal
+        resultList = []
+        for ordinal in range( verseOffsets[bookFirstChapterIndexes[bookIndex]], verseOffsets[bookFirstChapterIndexes[bookIndex+1]] ):
+            resultList.append( (getSourceReference( ordinal ),
+                                getDestinationReference( ordinals[ordinal] ) if ordinals[ordinal] >= 0 else None) )
+        return resultList
+    # end of BibleVersificationMapping.convertBook
+# end of BibleVersificationMapping class
+
+
+
+def getVersificationMapping( fromSystemName, toSystemName ):
+    """
+    Returns a BibleVersificationMapping object for the two systems.
+
+    These default mappings (without any extra mapping rules) are only built once.
+    """
+    if (fromSystemName,toSystemName) not in versificationMappingsDict:
+        versificationMappingsDict[(fromSystemName,toSystemName)] = BibleVersificationMapping( fromSystemName, toSystemName )
+    return versificationMappingsDict[(fromSystemName,toSystemName)]
+# end of getVersificationMapping
+
+
+
 def demo():
     """
     Main program to handle command line parameters and then run what they want.
@@ -956,6 +1286,16 @@ def demo():
         print( "Omitted verses in {} are: {}".format(BBB,bvs.getOmittedVerseList(BBB)) )
         for myRange in ((('MAT','2','1',''),('MAT','2','5','')), (('MAT','3','2','b'),('MAT','3','6','a')), (('MAT','3','15',''),('MAT','4','2','')), (('MAT','3','16','b'),('MAT','4','3','a')), (('MAT','3','2',''),('MAT','2','6',''))):
             print( "Expanding {} gives {}".format( myRange, bvs.expandCVRange( myRange[0],myRange[1]) ) )
+        ordinal = bvs.getVerseOrdinal( ('MAT','1','1','') )
+        print( "MAT 1:1 has verse ordinal {} (of {}) which converts back to {}".format( ordinal, bvs.getNumVerseOrdinals(), bvs.getReferenceFromOrdinal( ordinal ) ) )
+        print( "Checking several references at once gives {}".format( bvs.areValidBCVRefs( [('MAT','17','21'),('MAT','17','22'),('MAT','29','1')] ) ) )
+        print( "MAT 17:21 in the reference versification is {}".format( bvs.convertToReferenceVersification( 'MAT', '17', '21' ) ) )
+
+    # Demo a BibleVersificationMapping object
+    bvm = getVersificationMapping( 'GNT92', 'KJV' )
+    print( bvm )
+    print( "Converting GNT92 references to KJV gives {}".format( bvm.convertReferences( [('MAT','17','21'),('MAT','17','22'),('ACT','8','37','a')] ) ) )
+    print( "Converting KJV references to GNT92 gives {}".format( bvm.convertReferences( [('MAT','17','21'),('MAT','17','22'),('ACT','8','37','a')], reverse=True ) ) )
 # end of demo
 
 
@@ -31,10 +31,10 @@ NOTE: We still lack a REFERENCE Bible versification system
 
 from gettext import gettext as _
 
-LastModifiedDate = '2017-12-09' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleVersificationSystemsConverter"
 ProgName = "Bible Versification Systems converter"
-ProgVersion = '0.51'
+ProgVersion = '0.52'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -398,8 +398,6 @@ class BibleVersificationSystemsConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self.__XMLSystems
         self.importDataToPython()
         assert self.__DataDict
@@ -410,7 +408,7 @@ class BibleVersificationSystemsConverter:
             filepath = os.path.join( folder, self.__filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as pickleFile:
-            pickle.dump( self.__DataDict, pickleFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataDict, pickleFile ) # So each system can be loaded separately
     # end of BibleVersificationSystemsConverter.pickle
 
 
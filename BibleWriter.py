@@ -67,8 +67,9 @@ Contains functions:
     toPhotoBible( outputFolder=None )
     toODF( outputFolder=None ) for LibreOffice/OpenOffice exports
     toTeX( outputFolder=None ) and thence to PDF
-    doAllExports( givenOutputFolderName=None, wantPhotoBible=False, wantODFs=False, wantPDFs=False )
-        (doAllExports supports multiprocessing -- it shares the exports out amongst available processes)
+    doAllExports( givenOutputFolderName=None, wantPhotoBible=False, wantODFs=False, wantPDFs=False, wantFormats=None )
+        (doAllExports supports multiprocessing -- it shares the exports out amongst available processes
+            scheduling the slowest exports first using the timings saved from previous runs)
 
 Note that not all exports export all books.
     Some formats only handle subsets of books (or markers/fields),
@@ -77,10 +78,10 @@ Note that not all exports export all books.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-07' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleWriter"
 ProgName = "Bible writer"
-ProgVersion = '0.96'
+ProgVersion = '0.99'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -90,7 +91,7 @@ OSISNameSpace = 'http://www.bibletechnologies.net/2003/OSIS/namespace'
 OSISSchemaLocation = 'http://www.bibletechnologies.net/osisCore.2.1.1.xsd'
 
 
-import sys, os, shutil, logging
+import sys, os, shutil, logging, time
 from datetime import datetime
 from collections import OrderedDict
 import re, json, pickle
@@ -170,6 +171,122 @@ def killLibreOfficeServiceManager():
 # end of killLibreOfficeServiceManager
 
 
+# The names of the exports that doAllExports can do, in the order that their results are reported
+#   (doAllExports maps each name to its BibleWriter method and output subfolder)
+DO_ALL_EXPORTS_NAMES = ( 'PickledBibleExport', 'listOutput', 'BCVOutput',
+                'pseudoUSFMExport', 'USFM2Export', 'USFM3Export', 'ESFMExport',
+                'textExport', 'VPLExport', 'markdownExport', 'htmlExport',
+                'BibleDoorExport', 'EasyWorshipBibleExport',
+                'USX2Export', 'USX3Export', 'USFXExport', 'OSISExport',
+                'ZefExport', 'HagExport', 'OSExport',
+                'swExport', 'tWExport', 'MySwExport', 'ESwExport', 'MyBExport',
+                'SwSExport', 'DrExport',
+                'PhotoBibleExport', 'ODFExport', 'TeXExport', )
+# Only done if explicitly requested (because they are so processor intensive)
+#   in the same order as the wantPhotoBible, wantODFs, wantPDFs parameters of doAllExports
+EXPLICIT_EXPORT_NAMES = ( 'PhotoBibleExport', 'ODFExport', 'TeXExport', )
+
+# Estimated seconds per book for the exports (used to schedule the slowest exports first
+#   until we have some actual timings saved from previous runs)
+DEFAULT_EXPORT_SECONDS_PER_BOOK = { 'PhotoBibleExport':27.0, 'ODFExport':60.0, 'TeXExport':1.8, }
+DEFAULT_OTHER_EXPORT_SECONDS_PER_BOOK = 0.5
+EXPORT_TIMINGS_FILENAME = 'BibleWriterExportTimings.json' # Saved in BibleOrgSysGlobals.DEFAULT_CACHE_FOLDER
+
+
+def loadExportTimings():
+    """
+    Load the average seconds per book for each export from previous runs (if any).
+
+    Returns a dictionary with exportName keys.
+    """
+    timingsFilepath = os.path.join( BibleOrgSysGlobals.DEFAULT_CACHE_FOLDER, EXPORT_TIMINGS_FILENAME )
+    try:
+        with open( timingsFilepath, 'rt', encoding='utf-8' ) as timingsFile:
+            return json.load( timingsFile )
+    except (OSError, ValueError): return {} # No (usable) timings yet
+# end of loadExportTimings
+
+
+def saveExportTimings( exportTimings, numBooks ):
+    """
+    Update the saved timings with the given (exportName: elapsedSeconds) dictionary
+        for the export of a Bible with numBooks books.
+
+    The new timings are averaged with any previous ones
+        so that one unusual Bible doesn't upset the scheduling too much.
+    """
+    if not exportTimings or not numBooks: return
+    savedTimings = loadExportTimings()
+    for exportName, elapsedSeconds in exportTimings.items():
+        secondsPerBook = elapsedSeconds / numBooks
+        savedTimings[exportName] = secondsPerBook if exportName not in savedTimings \
+                                    else (savedTimings[exportName] + secondsPerBook) / 2
+    try:
+        if not os.access( BibleOrgSysGlobals.DEFAULT_CACHE_FOLDER, os.F_OK ):
+            os.makedirs( BibleOrgSysGlobals.DEFAULT_CACHE_FOLDER )
+        with open( os.path.join( BibleOrgSysGlobals.DEFAULT_CACHE_FOLDER, EXPORT_TIMINGS_FILENAME ), 'wt', encoding='utf-8' ) as timingsFile:
+            json.dump( savedTimings, timingsFile, indent=2, sort_keys=True )
+    except OSError as err:
+        logging.warning( "saveExportTimings: Unable to save export timings: {}".format( err ) )
+# end of saveExportTimings
+
+
+def getExportScheduleOrder( exportNames, exportTimings=None ):
+    """
+    Given a list of exportNames, return a new list sorted with the slowest first
+        (so that they start first to help us get finished quicker on multiCPU systems).
+
+    Uses the timings from previous runs if available, else our default estimates.
+    """
+    if exportTimings is None: exportTimings = loadExportTimings()
+    def estimatedSecondsPerBook( exportName ):
+        try: return exportTimings[exportName]
+        except KeyError: return DEFAULT_EXPORT_SECONDS_PER_BOOK.get( exportName, DEFAULT_OTHER_EXPORT_SECONDS_PER_BOOK )
+    return sorted( exportNames, key=estimatedSecondsPerBook, reverse=True )
+# end of getExportScheduleOrder
+
+
+def _runExport( exportName, function, folder ):
+    """
+    Run the given export function and time it.
+
+    Returns a 3-tuple: exportName, result, elapsedSeconds
+    """
+    if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter._runExport( {}, {} )".format( exportName, folder ) )
+    startTime = time.time()
+    try: result = function( folder )
+    except Exception as err: # Got to catch and report the exceptions here
+        print( "BibleWriter.doAllExports.{} Unexpected error using {}:".format( function.__name__, folder ), sys.exc_info()[0], err )
+        logging.error( "BibleWriter.doAllExports.{}: Oops, failed!".format( function.__name__ ) )
+        if function.__name__ == 'toODF': killLibreOfficeServiceManager()
+        result = False
+    return exportName, result, time.time() - startTime
+# end of _runExport
+
+
+_forkedExportBible = None # The Bible being exported (inherited by forked worker processes)
+
+def _doForkedExport( parameters ):
+    """
+    Only used in doAllExports for multiprocessing when the worker processes are forked.
+
+    The workers inherit the already loaded Bible object
+        so only the export name, method name, and output folder are sent for each task.
+    """
+    exportName, functionName, folder = parameters
+    return _runExport( exportName, getattr( _forkedExportBible, functionName ), folder )
+# end of _doForkedExport
+
+def _doPickledExport( parameters ):
+    """
+    Only used in doAllExports for multiprocessing when the worker processes aren't forked
+        (so the bound method, and hence the Bible object, has to be pickled for each task).
+    """
+    exportName, function, folder = parameters
+    return _runExport( exportName, function, folder )
+# end of _doPickledExport
+
+
 class BibleWriter( InternalBible ):
     """
     Class to export Bibles.
@@ -2528,7 +2645,7 @@ class BibleWriter( InternalBible ):
             if BibleOrgSysGlobals.verbosityLevel > 1: print( _("    Creating HTML5 home/index page…") )
             xw = MLWriter( 'index.html', WEBoutputFolder, 'HTML' )
             xw.setHumanReadable()
-            xw.start( noAutoXML=True )
+            xw.start( noAutoXML=True, binaryOutput=True )
             xw.writeLineText( '<!DOCTYPE html>', noTextCheck=True )
             xw.writeLineOpen( 'html' )
             writeHeader( xw, 'home' )
@@ -2542,7 +2659,7 @@ class BibleWriter( InternalBible ):
             if BibleOrgSysGlobals.verbosityLevel > 1: print( _("    Creating HTML5 about page…") )
             xw = MLWriter( 'about.html', WEBoutputFolder, 'HTML' )
             xw.setHumanReadable()
-            xw.start( noAutoXML=True )
+            xw.start( noAutoXML=True, binaryOutput=True )
             xw.writeLineText( '<!DOCTYPE html>', noTextCheck=True )
             xw.writeLineOpen( 'html' )
             writeHeader( xw, 'about' )
@@ -2794,7 +2911,7 @@ class BibleWriter( InternalBible ):
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( _("    Exporting {} to HTML5 format…").format( BBB ) )
                 xw = MLWriter( filenameDict[BBB], WEBoutputFolder, 'HTML' )
                 xw.setHumanReadable()
-                xw.start( noAutoXML=True )
+                xw.start( noAutoXML=True, binaryOutput=True )
                 xw.writeLineText( '<!DOCTYPE html>', noTextCheck=True )
                 xw.writeLineOpen( 'html' )
                 if BibleOrgSysGlobals.debugFlag: writeHTML5Book( xw, BBB, bookData, html5Globals ) # Halts on errors
@@ -6278,7 +6395,7 @@ class BibleWriter( InternalBible ):
                 except KeyError: fn = 'Book-{}.osis'.format( BBB )
                 xw = MLWriter( BibleOrgSysGlobals.makeSafeFilename( fn ), outputFolder )
                 xw.setHumanReadable( 'All' ) # Can be set to 'All', 'Header', or 'None' -- one output file went from None/Header=4.7MB to All=5.7MB
-                xw.start()
+                xw.start( binaryOutput=True )
                 xw.writeLineOpen( 'osis', [('xmlns',OSISNameSpace), ('xmlns:xsi',"http://www.w3.org/2001/XMLSchema-instance"), ('xsi:schemaLocation',OSISNameSpace+' '+OSISSchemaLocation)] )
                 try: xlg = controlDict['xmlLanguage']
                 except KeyError: xlg = 'eng'
@@ -6307,7 +6424,7 @@ class BibleWriter( InternalBible ):
             filename = BibleOrgSysGlobals.makeSafeFilename( controlDict['osisOutputFilename'] )
             xw = MLWriter( filename, outputFolder )
             xw.setHumanReadable( 'All' ) # Can be set to 'All', 'Header', or 'None' -- one output file went from None/Header=4.7MB to All=5.7MB
-            xw.start()
+            xw.start( binaryOutput=True )
             xw.writeLineOpen( 'osis', [('xmlns',OSISNameSpace), ('xmlns:xsi',"http://www.w3.org/2001/XMLSchema-instance"), ('xsi:schemaLocation',OSISNameSpace+' '+OSISSchemaLocation)] )
             xw.writeLineOpen( 'osisText', [('osisRefWork',"Bible" ), ('xml:lang',controlDict['xmlLanguage']), ('osisIDWork',controlDict['osisIDWork'])] )
             xw.setSectionName( 'Header' )
@@ -7752,7 +7869,7 @@ class BibleWriter( InternalBible ):
         xwNT = MLWriter( 'nt', lgFolder )
         xwOT.setHumanReadable( 'NLSpace', indentSize=5 ) # Can be set to 'All', 'Header', or 'None'
         xwNT.setHumanReadable( 'NLSpace', indentSize=5 ) # Can be set to 'All', 'Header', or 'None'
-        xwOT.start( noAutoXML=True ); xwNT.start( noAutoXML=True )
+        xwOT.start( noAutoXML=True, binaryOutput=True ); xwNT.start( noAutoXML=True, binaryOutput=True ) # so getFilePosition gives byte offsets
         toSwordGlobals['length'] = xwOT.writeLineOpenSelfclose( 'milestone', [('type',"x-importer"), ('subtype',"x-BibleWriter.py"), ('n',"${} $".format(ProgVersion))] )
         toSwordGlobals['length'] = xwNT.writeLineOpenSelfclose( 'milestone', [('type',"x-importer"), ('subtype',"x-BibleWriter.py"), ('n',"${} $".format(ProgVersion))] )
         xwOT.setSectionName( 'Main' ); xwNT.setSectionName( 'Main' )
@@ -10481,16 +10598,27 @@ class BibleWriter( InternalBible ):
     # end of BibleWriter.doExportHelper
 
 
-    def doAllExports( self, givenOutputFolderName=None, wantPhotoBible=None, wantODFs=None, wantPDFs=None ):
+    def doAllExports( self, givenOutputFolderName=None, wantPhotoBible=None, wantODFs=None, wantPDFs=None, wantFormats=None ):
         """
         If the output folder is specified, it is expected that it's already created.
         Otherwise a new subfolder is created in the current folder.
 
         The three very processor intensive exports require explicit inclusion.
 
+        If wantFormats is given, it's a list of export names (from DO_ALL_EXPORTS_NAMES)
+            and only those exports are done (and the want... flags are ignored).
+
+        When multiprocessing, the exports are scheduled slowest first (using the timings
+            saved from previous runs) and the timings from this run are then saved.
+
         Returns a dictionary of result flags.
         """
-        allWord = _("all") if wantPhotoBible and wantODFs and wantPDFs else _("most")
+        if wantFormats is not None:
+            for exportName in wantFormats:
+                if exportName not in DO_ALL_EXPORTS_NAMES:
+                    logging.error( "BibleWriter.doAllExports: " + _("Unknown {!r} export format ignored").format( exportName ) )
+            wantPhotoBible, wantODFs, wantPDFs = (exportName in wantFormats for exportName in EXPLICIT_EXPORT_NAMES)
+        allWord = _("all") if wantPhotoBible and wantODFs and wantPDFs and wantFormats is None else _("most")
         if BibleOrgSysGlobals.verbosityLevel > 1:
             print( "BibleWriterV{}.doAllExports: ".format(ProgVersion) + _("Exporting {} ({}) to {} formats… {}").format( self.name, self.objectTypeString, allWord, datetime.now().strftime('%H:%M') ) )
 
@@ -10506,415 +10634,156 @@ class BibleWriter( InternalBible ):
             logging.critical( "BibleWriter.doAllExports: " + _("Given {!r} folder is unwritable" ).format( givenOutputFolderName ) )
             return False
 
-        # Define our various output folders
+        # Define our various exports and their output folders
         pickleOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Bible_Object_Pickle/' )
-        pickledBibleOutputFolder = os.path.join( givenOutputFolderName, 'BOS_PickledBible_Export/' )
-        listOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Lists/' )
-        BCVOutputFolder = os.path.join( givenOutputFolderName, 'BOS_BCV_Export/' )
-        pseudoUSFMOutputFolder = os.path.join( givenOutputFolderName, 'BOS_PseudoUSFM_Export/' )
-        USFM2OutputFolder = os.path.join( givenOutputFolderName, 'BOS_USFM2_' + ('Reexport/' if self.objectTypeString in ('USFM2','PTX7') else 'Export/' ) )
-        USFM3OutputFolder = os.path.join( givenOutputFolderName, 'BOS_USFM3_' + ('Reexport/' if self.objectTypeString=='USFM3' else 'Export/' ) )
-        ESFMOutputFolder = os.path.join( givenOutputFolderName, 'BOS_ESFM_' + ('Reexport/' if self.objectTypeString=='ESFM' else 'Export/' ) )
-        textOutputFolder = os.path.join( givenOutputFolderName, 'BOS_PlainText_' + ('Reexport/' if self.objectTypeString=='Text' else 'Export/' ) )
-        VPLOutputFolder = os.path.join( givenOutputFolderName, 'BOS_VersePerLine_' + ('Reexport/' if self.objectTypeString=='VPL' else 'Export/' ) )
-        markdownOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Markdown_Export/' )
-        #D43OutputFolder = os.path.join( givenOutputFolderName, 'BOS_Door43_' + ('Reexport/' if self.objectTypeString=='Door43' else 'Export/' ) )
-        htmlOutputFolder = os.path.join( givenOutputFolderName, 'BOS_HTML5_Export/' )
-        BDOutputFolder = os.path.join( givenOutputFolderName, 'BOS_BibleDoor_' + 'Export/' )
-        EWBOutputFolder = os.path.join( givenOutputFolderName, 'BOS_EasyWorshipBible_' + 'Export/' )
-        USX2OutputFolder = os.path.join( givenOutputFolderName, 'BOS_USX2_' + ('Reexport/' if self.objectTypeString=='USX' else 'Export/' ) )
-        USX3OutputFolder = os.path.join( givenOutputFolderName, 'BOS_USX3_' + ('Reexport/' if self.objectTypeString=='USX3' else 'Export/' ) )
-        USFXOutputFolder = os.path.join( givenOutputFolderName, 'BOS_USFX_' + ('Reexport/' if self.objectTypeString=='USFX' else 'Export/' ) )
-        OSISOutputFolder = os.path.join( givenOutputFolderName, 'BOS_OSIS_' + ('Reexport/' if self.objectTypeString=='OSIS' else 'Export/' ) )
-        zefOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Zefania_' + ('Reexport/' if self.objectTypeString=='Zefania' else 'Export/' ) )
-        hagOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Haggai_' + ('Reexport/' if self.objectTypeString=='Haggia' else 'Export/' ) )
-        OSOutputFolder = os.path.join( givenOutputFolderName, 'BOS_OpenSong_' + ('Reexport/' if self.objectTypeString=='OpenSong' else 'Export/' ) )
-        swOutputFolder = os.path.join( givenOutputFolderName, 'BOS_Sword_' + ('Reexport/' if self.objectTypeString in ('Sword','CrosswireSword') else 'Export/' ) )
-        tWOutputFolder = os.path.join( givenOutputFolderName, 'BOS_theWord_' + ('Reexport/' if self.objectTypeString=='theWord' else 'Export/' ) )
-        MySwOutputFolder = os.path.join( givenOutputFolderName, 'BOS_MySword_' + ('Reexport/' if self.objectTypeString=='MySword' else 'Export/' ) )
-        ESwOutputFolder = os.path.join( givenOutputFolderName, 'BOS_e-Sword_' + ('Reexport/' if self.objectTypeString=='e-Sword-Bible' else 'Export/' ) )
-        MyBOutputFolder = os.path.join( givenOutputFolderName, 'BOS_MyBible_' + ('Reexport/' if self.objectTypeString=='MyBible' else 'Export/' ) )
-        SwSOutputFolder = os.path.join( givenOutputFolderName, 'BOS_SwordSearcher_Export/' )
-        DrOutputFolder = os.path.join( givenOutputFolderName, 'BOS_DrupalBible_' + ('Reexport/' if self.objectTypeString=='DrupalBible' else 'Export/' ) )
-        photoOutputFolder = os.path.join( givenOutputFolderName, 'BOS_PhotoBible_Export/' )
-        ODFOutputFolder = os.path.join( givenOutputFolderName, 'BOS_ODF_Export/' )
-        TeXOutputFolder = os.path.join( givenOutputFolderName, 'BOS_TeX_Export/' )
-
-        if not wantPhotoBible:
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: " + _("Skipping PhotoBible export") )
-            PhotoBibleExportResult = None
-        if not wantODFs:
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: " + _("Skipping ODF export") )
-            ODFExportResult = None
-        if not wantPDFs:
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: " + _("Skipping TeX/PDF export") )
-            TeXExportResult = None
+        exportDict = OrderedDict( (
+            ('PickledBibleExport', (self.toPickledBible, 'BOS_PickledBible_Export/')),
+            ('listOutput', (self.makeLists, 'BOS_Lists/')),
+            ('BCVOutput', (self.toBOSBCV, 'BOS_BCV_Export/')),
+            ('pseudoUSFMExport', (self.toPseudoUSFM, 'BOS_PseudoUSFM_Export/')),
+            ('USFM2Export', (self.toUSFM2, 'BOS_USFM2_' + ('Reexport/' if self.objectTypeString in ('USFM2','PTX7') else 'Export/' ))),
+            ('USFM3Export', (self.toUSFM3, 'BOS_USFM3_' + ('Reexport/' if self.objectTypeString=='USFM3' else 'Export/' ))),
+            ('ESFMExport', (self.toESFM, 'BOS_ESFM_' + ('Reexport/' if self.objectTypeString=='ESFM' else 'Export/' ))),
+            ('textExport', (self.toText, 'BOS_PlainText_' + ('Reexport/' if self.objectTypeString=='Text' else 'Export/' ))),
+            ('VPLExport', (self.toVPL, 'BOS_VersePerLine_' + ('Reexport/' if self.objectTypeString=='VPL' else 'Export/' ))),
+            ('markdownExport', (self.toMarkdown, 'BOS_Markdown_Export/')),
+            #('D43Export', (self.toDoor43, 'BOS_Door43_' + ('Reexport/' if self.objectTypeString=='Door43' else 'Export/' ))),
+            ('htmlExport', (self.toHTML5, 'BOS_HTML5_Export/')),
+            ('BibleDoorExport', (self.toBibleDoor, 'BOS_BibleDoor_' + 'Export/')),
+            ('EasyWorshipBibleExport', (self.toEasyWorshipBible, 'BOS_EasyWorshipBible_' + 'Export/')),
+            ('USX2Export', (self.toUSX2XML, 'BOS_USX2_' + ('Reexport/' if self.objectTypeString=='USX' else 'Export/' ))),
+            ('USX3Export', (self.toUSX3XML, 'BOS_USX3_' + ('Reexport/' if self.objectTypeString=='USX3' else 'Export/' ))),
+            ('USFXExport', (self.toUSFXXML, 'BOS_USFX_' + ('Reexport/' if self.objectTypeString=='USFX' else 'Export/' ))),
+            ('OSISExport', (self.toOSISXML, 'BOS_OSIS_' + ('Reexport/' if self.objectTypeString=='OSIS' else 'Export/' ))),
+            ('ZefExport', (self.toZefaniaXML, 'BOS_Zefania_' + ('Reexport/' if self.objectTypeString=='Zefania' else 'Export/' ))),
+            ('HagExport', (self.toHaggaiXML, 'BOS_Haggai_' + ('Reexport/' if self.objectTypeString=='Haggia' else 'Export/' ))),
+            ('OSExport', (self.toOpenSongXML, 'BOS_OpenSong_' + ('Reexport/' if self.objectTypeString=='OpenSong' else 'Export/' ))),
+            ('swExport', (self.toSwordModule, 'BOS_Sword_' + ('Reexport/' if self.objectTypeString in ('Sword','CrosswireSword') else 'Export/' ))),
+            ('tWExport', (self.totheWord, 'BOS_theWord_' + ('Reexport/' if self.objectTypeString=='theWord' else 'Export/' ))),
+            ('MySwExport', (self.toMySword, 'BOS_MySword_' + ('Reexport/' if self.objectTypeString=='MySword' else 'Export/' ))),
+            ('ESwExport', (self.toESword, 'BOS_e-Sword_' + ('Reexport/' if self.objectTypeString=='e-Sword-Bible' else 'Export/' ))),
+            ('MyBExport', (self.toMyBible, 'BOS_MyBible_' + ('Reexport/' if self.objectTypeString=='MyBible' else 'Export/' ))),
+            ('SwSExport', (self.toSwordSearcher, 'BOS_SwordSearcher_Export/')),
+            ('DrExport', (self.toDrupalBible, 'BOS_DrupalBible_' + ('Reexport/' if self.objectTypeString=='DrupalBible' else 'Export/' ))),
+            ('PhotoBibleExport', (self.toPhotoBible, 'BOS_PhotoBible_Export/')),
+            ('ODFExport', (self.toODF, 'BOS_ODF_Export/')),
+            ('TeXExport', (self.toTeX, 'BOS_TeX_Export/')),
+            ) )
+        if debuggingThisModule or BibleOrgSysGlobals.debugFlag: assert tuple(exportDict.keys()) == DO_ALL_EXPORTS_NAMES
+
+        # Decide which exports we're doing
+        explicitExportWanted = dict( zip( EXPLICIT_EXPORT_NAMES, (wantPhotoBible, wantODFs, wantPDFs) ) )
+        wantedExportNames = []
+        for exportName in DO_ALL_EXPORTS_NAMES:
+            if wantFormats is not None:
+                if exportName in wantFormats: wantedExportNames.append( exportName )
+            elif exportName in EXPLICIT_EXPORT_NAMES and not explicitExportWanted[exportName]:
+                if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: " + _("Skipping {} export").format( exportName ) )
+            else: wantedExportNames.append( exportName )
+        exportResults = OrderedDict( (exportName,None) for exportName in DO_ALL_EXPORTS_NAMES )
+        exportTimings = {}
 
         # Pickle this Bible object
         # NOTE: This must be done before self.__setupWriter is called
         #       because the BRL object has a recursive pointer to self and the pickle fails
-        if BibleOrgSysGlobals.debugFlag: pickleResult = self.toPickleObject( pickleOutputFolder ) # halts if fails
-        else:
-            try: pickleResult = self.toPickleObject( pickleOutputFolder )
-            except (IOError,TypeError):
-                pickleResult = False
-                print( "BibleWriter.doAllExports: pickle( {} ) failed.".format( pickleOutputFolder ) )
+        pickleResult = None
+        if wantFormats is None:
+            if BibleOrgSysGlobals.debugFlag: pickleResult = self.toPickleObject( pickleOutputFolder ) # halts if fails
+            else:
+                try: pickleResult = self.toPickleObject( pickleOutputFolder )
+                except (IOError,TypeError):
+                    pickleResult = False
+                    print( "BibleWriter.doAllExports: pickle( {} ) failed.".format( pickleOutputFolder ) )
         if not self.doneSetupGeneric: self.__setupWriter()
         if 'discoveryResults' not in dir(self): self.discover()
 
+        # NOTE: We can't pickle sqlite3.Cursor objects, so if we can't fork (to inherit the loaded Bible),
+        #           we can not use multiprocessing here for e-Sword Bibles or commentaries, etc.
+        canFork = multiprocessing.get_start_method() == 'fork'
         if debuggingThisModule or BibleOrgSysGlobals.debugFlag:
             # no try/except calls so it halts on errors rather than continuing
-            pickledBibleOutputResult = self.toPickledBible( pickledBibleOutputFolder )
-            listOutputResult = self.makeLists( listOutputFolder )
-            BCVExportResult = self.toBOSBCV( BCVOutputFolder )
-            pseudoUSFMExportResult = self.toPseudoUSFM( pseudoUSFMOutputFolder )
-            USFM2ExportResult = self.toUSFM2( USFM2OutputFolder )
-            USFM3ExportResult = self.toUSFM3( USFM3OutputFolder )
-            ESFMExportResult = self.toESFM( ESFMOutputFolder )
-            textExportResult = self.toText( textOutputFolder )
-            VPLExportResult = self.toVPL( VPLOutputFolder )
-            markdownExportResult = self.toMarkdown( markdownOutputFolder )
-            #D43ExportResult = self.toDoor43( D43OutputFolder )
-            htmlExportResult = self.toHTML5( htmlOutputFolder )
-            BDExportResult = self.toBibleDoor( BDOutputFolder )
-            EWBExportResult = self.toEasyWorshipBible( EWBOutputFolder )
-            USX2ExportResult = self.toUSX2XML( USX2OutputFolder )
-            USX3ExportResult = self.toUSX3XML( USX3OutputFolder )
-            USFXExportResult = self.toUSFXXML( USFXOutputFolder )
-            OSISExportResult = self.toOSISXML( OSISOutputFolder )
-            ZefExportResult = self.toZefaniaXML( zefOutputFolder )
-            HagExportResult = self.toHaggaiXML( hagOutputFolder )
-            OSExportResult = self.toOpenSongXML( OSOutputFolder )
-            swExportResult = self.toSwordModule( swOutputFolder )
-            tWExportResult = self.totheWord( tWOutputFolder )
-            MySwExportResult = self.toMySword( MySwOutputFolder )
-            ESwExportResult = self.toESword( ESwOutputFolder )
-            MyBExportResult = self.toMyBible( MyBOutputFolder )
-            SwSExportResult = self.toSwordSearcher( SwSOutputFolder )
-            DrExportResult = self.toDrupalBible( DrOutputFolder )
-            if wantPhotoBible: PhotoBibleExportResult = self.toPhotoBible( photoOutputFolder )
-            if wantODFs: ODFExportResult = self.toODF( ODFOutputFolder )
-            if wantPDFs: TeXExportResult = self.toTeX( TeXOutputFolder ) # Put this last since it's slowest
-
-        # NOTE: We can't pickle sqlite3.Cursor objects so can not use multiprocessing here for e-Sword Bibles or commentaries
-        elif self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible') \
+            for exportName in wantedExportNames:
+                function, subfolderName = exportDict[exportName]
+                startTime = time.time()
+                exportResults[exportName] = function( os.path.join( givenOutputFolderName, subfolderName ) )
+                exportTimings[exportName] = time.time() - startTime
+
+        elif (canFork or self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible')) \
         and BibleOrgSysGlobals.maxProcesses > 1 \
         and not BibleOrgSysGlobals.alreadyMultiprocessing: # Process all the exports with different threads
-            # We move the three longest processes to the top here,
-            #   so they start first to help us get finished quicker on multiCPU systems.
-            self.__outputProcesses = [self.toPhotoBible if wantPhotoBible else None,
-                                    #self.toODF if wantODFs else None,
-                                    self.toTeX if wantPDFs else None,
-                                    self.toPickledBible, self.makeLists,
-                                    self.toBOSBCV, self.toPseudoUSFM,
-                                    self.toUSFM2, self.toUSFM3, self.toESFM, self.toText, self.toVPL,
-                                    self.toMarkdown, #self.toDoor43,
-                                    self.toHTML5,
-                                    self.toBibleDoor, self.toEasyWorshipBible,
-                                    self.toUSX2XML, self.toUSX3XML, self.toUSFXXML, self.toOSISXML,
-                                    self.toZefaniaXML, self.toHaggaiXML, self.toOpenSongXML,
-                                    self.toSwordModule, self.totheWord, self.toMySword, self.toESword, self.toMyBible,
-                                    self.toSwordSearcher, self.toDrupalBible, ]
-            self.__outputFolders = [photoOutputFolder, #ODFOutputFolder,
-                                    TeXOutputFolder,
-                                    pickledBibleOutputFolder, listOutputFolder,
-                                    BCVOutputFolder, pseudoUSFMOutputFolder,
-                                    USFM2OutputFolder, USFM3OutputFolder, ESFMOutputFolder,
-                                    textOutputFolder, VPLOutputFolder,
-                                    markdownOutputFolder, #D43OutputFolder,
-                                    htmlOutputFolder, BDOutputFolder, EWBOutputFolder,
-                                    USX2OutputFolder, USX3OutputFolder, USFXOutputFolder, OSISOutputFolder,
-                                    zefOutputFolder, hagOutputFolder, OSOutputFolder,
-                                    swOutputFolder, tWOutputFolder, MySwOutputFolder, ESwOutputFolder, MyBOutputFolder,
-                                    SwSOutputFolder, DrOutputFolder, ]
-            assert len(self.__outputFolders) == len(self.__outputProcesses)
+            # ODF is done separately (coz it's so much longer, plus often locks up)
+            # The others are ordered so the longest processes start first
+            #   to help us get finished quicker on multiCPU systems.
+            scheduledExportNames = getExportScheduleOrder( [exportName for exportName in wantedExportNames if exportName!='ODFExport'] )
+            if canFork: # The worker processes inherit this (already loaded) Bible so we only need to send names
+                global _forkedExportBible
+                self._dropSQLiteCursor()
+                _forkedExportBible = self
+                exportFunction = _doForkedExport
+                exportTasks = [(exportName, exportDict[exportName][0].__name__, os.path.join( givenOutputFolderName, exportDict[exportName][1] ))
+                                                    for exportName in scheduledExportNames]
+            else: # Each task must be pickled (including the Bible object)
+                exportFunction = _doPickledExport
+                exportTasks = [(exportName, exportDict[exportName][0], os.path.join( givenOutputFolderName, exportDict[exportName][1] ))
+                                                    for exportName in scheduledExportNames]
             if BibleOrgSysGlobals.verbosityLevel > 0:
-                print( "BibleWriter.doAllExports: Running {} exports on {} CPUs".format( len(self.__outputProcesses), BibleOrgSysGlobals.maxProcesses ) )
+                print( "BibleWriter.doAllExports: Running {} exports on {} CPUs".format( len(exportTasks), BibleOrgSysGlobals.maxProcesses ) )
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     print( "  NOTE: Outputs (including error and warning messages) from various exports may be interspersed." )
             BibleOrgSysGlobals.alreadyMultiprocessing = True
-            # With no timeout safeguard
-            #with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-                #results = pool.map( self.doExportHelper, zip(self.__outputProcesses,self.__outputFolders) ) # have the pool do our loads
-                #if BibleOrgSysGlobals.verbosityLevel > 0: print( "BibleWriter.doAllExports: Got {} results".format( len(results) ) )
-                #assert len(results) == len(self.__outputFolders)
-                #PhotoBibleExportResult, ODFExportResult, TeXExportResult, \
-                    #listOutputResult, BCVExportResult, pseudoUSFMExportResult, \
-                    #USFM2ExportResult, ESFMExportResult, textExportResult, \
-                    #markdownExportResult, D43ExportResult, htmlExportResult, BDExportResult, EWBExportResult, \
-                    #USX2ExportResult, USX3ExportResult, USFXExportResult, OSISExportResult, ZefExportResult, HagExportResult, OSExportResult, \
-                    #swExportResult, tWExportResult, MySwExportResult, ESwExportResult, MyBExportResult, SwSExportResult, DrExportResult, \
-                        #= results
-            # With safety timeout -- more complex
+            # With safety timeout
             # timeoutFactors are average seconds per book
             timeoutFactor = 6 # Quicker exports -- 2 minutes for 68 books -- factor of 5 would allow almost 6 minutes
-            if wantPhotoBible: timeoutFactor +=  40 # 30 minutes for 68 books (Feb2018) = 27
-            #if wantODFs: timeoutFactor = max( timeoutFactor, 100 ) # Over a minute for longer books with LO v5.4 on my system
-            if wantPDFs: timeoutFactor += 12 # seems about 2 minutes for 68 books
+            if 'PhotoBibleExport' in scheduledExportNames: timeoutFactor +=  40 # 30 minutes for 68 books (Feb2018) = 27
+            if 'TeXExport' in scheduledExportNames: timeoutFactor += 12 # seems about 2 minutes for 68 books
             processorFactor = 1.0 # Make bigger for a slower CPU, or can make smaller for a fast one
             timeoutSeconds = max( 60, int(timeoutFactor*len(self.books)*processorFactor) ) # (was 1200s=20m but failed for projects with > 66 books)
             pool = multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses )
-            asyncResultObject = pool.map_async( self.doExportHelper, zip(self.__outputProcesses,self.__outputFolders) ) # have the pool do our loads
-            #print( "async results1 are", asyncResultObject )
+            asyncResultObject = pool.map_async( exportFunction, exportTasks, chunksize=1 ) # have the pool do our loads
             pool.close() # Can't add more workers to the pool now
             asyncResultObject.wait( timeoutSeconds ) # Wait for every worker to finish
             # Once the timeout has finished we can try to get the results
             if asyncResultObject.ready():
-                results = asyncResultObject.get()
+                for exportName, result, elapsedSeconds in asyncResultObject.get():
+                    exportResults[exportName] = result
+                    exportTimings[exportName] = elapsedSeconds
             else:
                 print( "BibleWriter.doAllExports: Got a timeout after {} seconds".format( timeoutSeconds ) )
                 pool.terminate() # No results available now
-                #pool.join()
-                #results = asyncResultObject.get() # Should work now
-                result = timeoutSeconds # Will count as True yet be different
-                results = [result if wantPhotoBible else None, # Just have to assume everything worked
-                                    #result if wantODFs else None,
-                                    result if wantPDFs else None,
-                                    result, result, result, result, result, result, result, result, result, result, result, result,
-                                    result, result, result, result, result, result, result, result, result, result, result, ]
-            #print( "async results2 are", results )
+                for exportName in scheduledExportNames:
+                    exportResults[exportName] = timeoutSeconds # Will count as True yet be different -- just have to assume everything worked
+            _forkedExportBible = None
             BibleOrgSysGlobals.alreadyMultiprocessing = False
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: Multiprocessing got {} results".format( len(results) ) )
-            assert len(results) == len(self.__outputFolders)
-            ( PhotoBibleExportResult, #ODFExportResult,
-                TeXExportResult,
-                pickledBibleOutputResult, listOutputResult, BCVExportResult, pseudoUSFMExportResult,
-                USFM2ExportResult, USFM3ExportResult, ESFMExportResult, textExportResult, VPLExportResult,
-                markdownExportResult, #D43ExportResult,
-                htmlExportResult, BDExportResult, EWBExportResult,
-                USX2ExportResult, USX3ExportResult, USFXExportResult, OSISExportResult, ZefExportResult, HagExportResult, OSExportResult,
-                swExportResult, tWExportResult, MySwExportResult, ESwExportResult, MyBExportResult, SwSExportResult,
-                DrExportResult ) = results
-            if wantODFs: # Do this one separately (coz it's so much longer, plus often locks up)
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "BibleWriter.doAllExports: Multiprocessing got {} results".format( len(exportTasks) ) )
+            if 'ODFExport' in wantedExportNames: # Do this one separately (coz it's so much longer, plus often locks up)
                 # Timeout is now done per book inside the toODF function
-                #if BibleOrgSysGlobals.alreadyMultiprocessing or 'win' in sys.platform: # SIGALRM doesn't work
-                try: ODFExportResult = self.toODF( ODFOutputFolder )
-                except Exception as err:
-                    ODFExportResult = False
-                    print("BibleWriter.doAllExports.toODF Unexpected error:", sys.exc_info()[0], err)
-                    killLibreOfficeServiceManager()
-                    logging.error( "BibleWriter.doAllExports.toODF: Oops, failed!" )
-                #else: # *nix system hopefully
-                    #timeoutSeconds = int(60*len(self.books)*processorFactor) # (was 1200s=20m but failed for projects with > 66 books)
-                    #def TimeoutHandler( signum, frame ):
-                        #logging.critical( _("A task went too long!") )
-                        #raise Exception( "Timed out" )
-
-                    #signal.signal( signal.SIGALRM, TimeoutHandler )
-                    #signal.alarm( timeoutSeconds )
-                    #try: ODFExportResult = self.toODF( ODFOutputFolder )
-                    #except Exception as err:
-                        #ODFExportResult = False
-                        #print("BibleWriter.doAllExports.toODF Unexpected error:", sys.exc_info()[0], err)
-                        #killLibreOfficeServiceManager()
-                        #logging.error( "BibleWriter.doAllExports.toODF: Oops, failed!" )
+                function, subfolderName = exportDict['ODFExport']
+                _exportName, exportResults['ODFExport'], exportTimings['ODFExport'] \
+                        = _runExport( 'ODFExport', function, os.path.join( givenOutputFolderName, subfolderName ) )
 
         else: # Just single threaded and not debugging
-            try: pickledBibleOutputResult = self.toPickledBible( pickledBibleOutputFolder )
-            except Exception as err:
-                pickledBibleOutputResult = False
-                print("BibleWriter.doAllExports.toPickledBible Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toPickledBible: Oops, failed!" )
-            try: listOutputResult = self.makeLists( listOutputFolder )
-            except Exception as err:
-                listOutputResult = False
-                print("BibleWriter.doAllExports.makeLists Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.makeLists: Oops, failed!" )
-            try: BCVExportResult = self.toBOSBCV( BCVOutputFolder )
-            except Exception as err:
-                BCVExportResult = False
-                print("BibleWriter.doAllExports.toBOSBCV Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toBOSBCV: Oops, failed!" )
-            try: pseudoUSFMExportResult = self.toPseudoUSFM( pseudoUSFMOutputFolder )
-            except Exception as err:
-                pseudoUSFMExportResult = False
-                print("BibleWriter.doAllExports.toPseudoUSFM Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toPseudoUSFM: Oops, failed!" )
-            try: USFM2ExportResult = self.toUSFM2( USFM2OutputFolder )
-            except Exception as err:
-                USFM2ExportResult = False
-                print("BibleWriter.doAllExports.toUSFM2 Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toUSFM2: Oops, failed!" )
-            try: USFM3ExportResult = self.toUSFM3( USFM3OutputFolder )
-            except Exception as err:
-                USFM3ExportResult = False
-                print("BibleWriter.doAllExports.toUSFM3 Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toUSFM3: Oops, failed!" )
-            try: ESFMExportResult = self.toESFM( ESFMOutputFolder )
-            except Exception as err:
-                ESFMExportResult = False
-                print("BibleWriter.doAllExports.toESFM Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toESFM: Oops, failed!" )
-            try: textExportResult = self.toText( textOutputFolder )
-            except Exception as err:
-                textExportResult = False
-                print("BibleWriter.doAllExports.toText Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toText: Oops, failed!" )
-            try: VPLExportResult = self.toVPL( VPLOutputFolder )
-            except Exception as err:
-                VPLExportResult = False
-                print("BibleWriter.doAllExports.toVPL Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toVPL: Oops, failed!" )
-            try: markdownExportResult = self.toMarkdown( markdownOutputFolder )
-            except Exception as err:
-                markdownExportResult = False
-                print("BibleWriter.doAllExports.toMarkdown Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toMarkdown: Oops, failed!" )
-            #try: D43ExportResult = self.toDoor43( D43OutputFolder )
-            #except Exception as err:
-                #D43ExportResult = False
-                #print("BibleWriter.doAllExports.toDoor43 Unexpected error:", sys.exc_info()[0], err)
-                #logging.error( "BibleWriter.doAllExports.toDoor43: Oops, failed!" )
-            try: htmlExportResult = self.toHTML5( htmlOutputFolder )
-            except Exception as err:
-                htmlExportResult = False
-                print("BibleWriter.doAllExports.toHTML5 Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toHTML5: Oops, failed!" )
-            try: BDExportResult = self.toBibleDoor( BDOutputFolder )
-            except Exception as err:
-                BDExportResult = False
-                print("BibleWriter.doAllExports.toBibleDoor Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toBibleDoor: Oops, failed!" )
-            try: EWBExportResult = self.toEasyWorshipBible( EWBOutputFolder )
-            except Exception as err:
-                EWBExportResult = False
-                print("BibleWriter.doAllExports.toEasyWorshipBible Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toEasyWorshipBible: Oops, failed!" )
-            try: USX2ExportResult = self.toUSX2XML( USX2OutputFolder )
-            except Exception as err:
-                USX2ExportResult = False
-                print("BibleWriter.doAllExports.toUSX2XML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toUSX2XML: Oops, failed!" )
-            try: USX3ExportResult = self.toUSX3XML( USX3OutputFolder )
-            except Exception as err:
-                USX3ExportResult = False
-                print("BibleWriter.doAllExports.toUSX3XML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toUSX3XML: Oops, failed!" )
-            try: USFXExportResult = self.toUSFXXML( USFXOutputFolder )
-            except Exception as err:
-                USFXExportResult = False
-                print("BibleWriter.doAllExports.toUSFXXML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toUSFXXML: Oops, failed!" )
-            try: OSISExportResult = self.toOSISXML( OSISOutputFolder )
-            except Exception as err:
-                OSISExportResult = False
-                print("BibleWriter.doAllExports.toOSISXML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toOSISXML: Oops, failed!" )
-            try: ZefExportResult = self.toZefaniaXML( zefOutputFolder )
-            except Exception as err:
-                ZefExportResult = False
-                print("BibleWriter.doAllExports.toZefaniaXML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toZefaniaXML: Oops, failed!" )
-            try: HagExportResult = self.toHaggaiXML( hagOutputFolder )
-            except Exception as err:
-                HagExportResult = False
-                print("BibleWriter.doAllExports.toHaggaiXML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toHaggaiXML: Oops, failed!" )
-            try: OSExportResult = self.toOpenSongXML( OSOutputFolder )
-            except Exception as err:
-                OSExportResult = False
-                print("BibleWriter.doAllExports.toOpenSongXML Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toOpenSongXML: Oops, failed!" )
-            try: swExportResult = self.toSwordModule( swOutputFolder )
-            except Exception as err:
-                swExportResult = False
-                print("BibleWriter.doAllExports.toSwordModule Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toSwordModule: Oops, failed!" )
-            try: tWExportResult = self.totheWord( tWOutputFolder )
-            except Exception as err:
-                tWExportResult = False
-                print("BibleWriter.doAllExports.totheWord Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.totheWord: Oops, failed!" )
-            try: MySwExportResult = self.toMySword( MySwOutputFolder )
-            except Exception as err:
-                MySwExportResult = False
-                print("BibleWriter.doAllExports.toMySword Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toMySword: Oops, failed!" )
-            try: ESwExportResult = self.toESword( ESwOutputFolder )
-            except Exception as err:
-                ESwExportResult = False
-                print("BibleWriter.doAllExports.toESword Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toESword: Oops, failed!" )
-            try: MyBExportResult = self.toMyBible( MyBOutputFolder )
-            except Exception as err:
-                MyBExportResult = False
-                print("BibleWriter.doAllExports.toMyBible Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toMyBible: Oops, failed!" )
-            try: SwSExportResult = self.toSwordSearcher( SwSOutputFolder )
-            except Exception as err:
-                SwSExportResult = False
-                print("BibleWriter.doAllExports.toSwordSearcher Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toSwordSearcher: Oops, failed!" )
-            try: DrExportResult = self.toDrupalBible( DrOutputFolder )
-            except Exception as err:
-                DrExportResult = False
-                print("BibleWriter.doAllExports.toDrupalBible Unexpected error:", sys.exc_info()[0], err)
-                logging.error( "BibleWriter.doAllExports.toDrupalBible: Oops, failed!" )
-            if wantPhotoBible:
-                try: PhotoBibleExportResult = self.toPhotoBible( photoOutputFolder )
-                except Exception as err:
-                    PhotoBibleExportResult = False
-                    print("BibleWriter.doAllExports.toPhotoBible Unexpected error:", sys.exc_info()[0], err)
-                    logging.error( "BibleWriter.doAllExports.toPhotoBible: Oops, failed!" )
-            if wantODFs:
-                try: ODFExportResult = self.toODF( ODFOutputFolder )
-                except Exception as err:
-                    ODFExportResult = False
-                    print("BibleWriter.doAllExports.toODF Unexpected error:", sys.exc_info()[0], err)
-                    killLibreOfficeServiceManager()
-                    logging.error( "BibleWriter.doAllExports.toODF: Oops, failed!" )
-            if wantPDFs: # Do TeX export last because it's slowest
-                try: TeXExportResult = self.toTeX( TeXOutputFolder )
-                except Exception as err:
-                    TeXExportResult = False
-                    print("BibleWriter.doAllExports.toTeX Unexpected error:", sys.exc_info()[0], err)
-                    logging.error( "BibleWriter.doAllExports.toTeX: Oops, failed!" )
+            for exportName in wantedExportNames: # Do TeX export last because it's slowest
+                function, subfolderName = exportDict[exportName]
+                _exportName, exportResults[exportName], exportTimings[exportName] \
+                        = _runExport( exportName, function, os.path.join( givenOutputFolderName, subfolderName ) )
+
+        saveExportTimings( exportTimings, len(self.books) )
 
         if BibleOrgSysGlobals.verbosityLevel > 1:
-            finishString = "BibleWriter.doAllExports finished:  Pck={}  Lst={}  BCV={} PsUSFM={} USFM2={} USFM3={} ESFM={} Tx={} VPL={}  md={}  " \
+            finishString = "BibleWriter.doAllExports finished:  Pck={}  PBib={} Lst={}  BCV={} PsUSFM={} USFM2={} USFM3={} ESFM={} Tx={} VPL={}  md={}  " \
                             "HTML={} BD={} EWB={}  USX2={} USX3={}  USFX={} OSIS={}  Zef={} Hag={} OS={}  Sw={}  " \
                             "tW={} MySw={} eSw={} MyB={}  SwS={} Dr={}  PB={} ODF={} TeX={} {}" \
-                .format( pickleResult, listOutputResult, BCVExportResult,
-                    pseudoUSFMExportResult, USFM2ExportResult, USFM3ExportResult, ESFMExportResult,
-                    textExportResult, VPLExportResult,
-                    markdownExportResult, #D43ExportResult,
-                    htmlExportResult,
-                    BDExportResult, EWBExportResult,
-                    USX2ExportResult, USX3ExportResult, USFXExportResult, OSISExportResult,
-                    ZefExportResult, HagExportResult, OSExportResult,
-                    swExportResult, tWExportResult, MySwExportResult, ESwExportResult, MyBExportResult,
-                    SwSExportResult, DrExportResult,
-                    PhotoBibleExportResult, ODFExportResult, TeXExportResult,
-                    datetime.now().strftime('%H:%M') )
+                .format( pickleResult, *exportResults.values(), datetime.now().strftime('%H:%M') )
             trueCount  = finishString.count( 'True' )
             falseCount = finishString.count( 'False' )
             noneCount  = finishString.count( 'None' )
-
-            #if pickleResult and listOutputResult and BCVExportResult \
-            #and pseudoUSFMExportResult and USFM2ExportResult and ESFMExportResult and textExportResult \
-            #and VPLExportResult and markdownExportResult and D43ExportResult and htmlExportResult \
-            #and BDExportResult and EWBExportResult \
-            #and USX2ExportResult and USX3ExportResult and USFXExportResult and OSISExportResult \
-            #and ZefExportResult and HagExportResult and OSExportResult \
-            #and swExportResult and tWExportResult and MySwExportResult and ESwExportResult and MyBExportResult \
-            #and SwSExportResult and DrExportResult \
-            #and (PhotoBibleExportResult or not wantPhotoBible) and (ODFExportResult or not wantODFs) and (TeXExportResult or not wantPDFs):
             if falseCount == 0:
-                print( "BibleWriter.doAllExports finished all requested (which was {}/30) exports successfully!".format( trueCount ) )
+                print( "BibleWriter.doAllExports finished all requested (which was {}/{}) exports successfully!".format( trueCount, len(DO_ALL_EXPORTS_NAMES)+1 ) )
             else:
                 print( "{} ({} True, {} False, {} None)".format( finishString, trueCount, falseCount, noneCount ) )
-        return { 'Pickle':pickleResult, 'listOutput':listOutputResult, 'BCVOutput':BCVExportResult,
-                'pseudoUSFMExport':pseudoUSFMExportResult, 'USFM2Export':USFM2ExportResult, 'USFM3Export':USFM3ExportResult, 'ESFMExport':ESFMExportResult,
-                'textExport':textExportResult, 'VPLExport':VPLExportResult,
-                'markdownExport':markdownExportResult, #'D43Export':D43ExportResult,
-                'htmlExport':htmlExportResult,
-                'BibleDoorExport':BDExportResult, 'EasyWorshipBibleExport':EWBExportResult,
-                'USX2Export':USX2ExportResult, 'USX3Export':USX3ExportResult, 'USFXExport':USFXExportResult, 'OSISExport':OSISExportResult,
-                'ZefExport':ZefExportResult, 'HagExport':HagExportResult, 'OSExport':OSExportResult,
-                'swExport':swExportResult,
-                'tWExport':tWExportResult, 'MySwExport':MySwExportResult, 'ESwExport':ESwExportResult, 'MyBExport':MyBExportResult,
-                'SwSExport':SwSExportResult, 'DrExport':DrExportResult,
-                'PhotoBibleExport':PhotoBibleExportResult, 'ODFExport':ODFExportResult, 'TeXExport':TeXExportResult, }
+        resultDict = OrderedDict( (('Pickle',pickleResult),) )
+        resultDict.update( exportResults )
+        return resultDict
     # end of BibleWriter.doAllExports
 # end of class BibleWriter
 
@@ -38,10 +38,10 @@ e.g.,
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "CSVBible"
 ProgName = "CSV Bible format handler"
-ProgVersion = '0.32'
+ProgVersion = '0.33'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -61,7 +61,7 @@ extensionsToIgnore = ('ZIP', 'BAK', 'BAK2', 'BAK3', 'BAK4', 'LOG', 'HTM','HTML',
 
 
 
-def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for CSV Bible files or folders in the folder and in the next level down.
 
@@ -77,24 +77,26 @@ def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("CSVBibleFileCheck: Given {} folder is unreadable").format( repr(givenFolderName) ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("CSVBibleFileCheck: Given {} path is not a folder").format( repr(givenFolderName) ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " CSVBibleFileCheck: Looking for files in given {}".format( repr(givenFolderName) ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             ignore = False
@@ -112,7 +114,7 @@ def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
         if thisFilename in ('book_names.txt','Readme.txt' ): looksHopeful = True
         elif thisFilename.endswith( '.txt' ):
             if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-                firstLine = BibleOrgSysGlobals.peekIntoFile( thisFilename, givenFolderName )
+                firstLine = folderSnapshot.peekIntoFile( thisFilename, givenFolderName )
                 if firstLine is None: continue # seems we couldn't decode the file
                 if not firstLine.startswith( '"Book","Chapter","Verse",' ) and not firstLine.startswith( '"1","1","1",') \
                 and not firstLine.startswith( 'Book,Chapter,Verse,' ) and not firstLine.startswith( '1,1,1,'):
@@ -134,15 +136,15 @@ def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("CSVBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    CSVBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 ignore = False
@@ -156,7 +158,7 @@ def CSVBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
         for thisFilename in sorted( foundSubfiles ):
             if thisFilename.endswith( '.txt' ):
                 if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-                    firstLine = BibleOrgSysGlobals.peekIntoFile( thisFilename, tryFolderName )
+                    firstLine = folderSnapshot.peekIntoFile( thisFilename, tryFolderName )
                     if firstLine is None: continue # seems we couldn't decode the file
                     if not firstLine.startswith( "Ge 1:1 " ):
                         if BibleOrgSysGlobals.verbosityLevel > 3: print( "CSVBibleFileCheck: (unexpected) first line was {!r} in {}".format( firstLine, thisFilename ) )
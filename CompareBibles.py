@@ -48,6 +48,7 @@ Includes:
                         illegalCompleteLineRegexes2=DEFAULT_ILLEGAL_COMPLETE_LINE_REGEXES_BACK_TRANSLATION, # For book2
                         breakOnOne=False )
     _doCompare( parameters ) # for multiprocessing
+    _doSegmentize( parameters ) # for multiprocessing
     segmentizeLine( line, segmentEndPunctuation='.?!;' )
     segmentizeBooks( book1, book2 )
     analyzeWords( segmentList, dict12=None, dict21=None )
@@ -77,10 +78,10 @@ REGEX stuff:
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-12-02' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "CompareBibles"
 ProgName = "Bible compare analyzer"
-ProgVersion = '0.25'
+ProgVersion = '0.26'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -637,9 +638,52 @@ def compareBooksPedantic( book1, book2,
     return bcResults
 # end of compareBooksPedantic
 
+class _CompareBook:
+    """
+    A minimal stand-in for an InternalBibleBook containing only what the book compare functions need.
+
+    This can be cheaply pickled and sent to a worker process
+        (whereas a real book object would drag its entire container Bible along with it).
+    """
+    def __init__( self, bookObject ):
+        self.BBB, self.workName = bookObject.BBB, bookObject.workName
+        self._processedLines = bookObject._processedLines
+    def __len__( self ): return len( self._processedLines )
+# end of class _CompareBook
+
+
+_forkedBibles = None # The two Bibles being compared (inherited by forked worker processes)
+
+def _makeCompareTasks( Bible1, Bible2, commonBooks ):
+    """
+    Returns a list of (BBB,books) 2-tuples ready to be sent to the worker processes.
+
+    If the worker processes are forked, they inherit the already loaded Bibles
+        so only BBB is sent (and books is None).
+    Otherwise books is a 2-tuple containing only the two needed books (as _CompareBook objects).
+
+    NOTE: This must be called before the multiprocessing pool is created.
+    """
+    global _forkedBibles
+    if multiprocessing.get_start_method() == 'fork':
+        _forkedBibles = Bible1, Bible2
+        return [(BBB,None) for BBB in commonBooks]
+    _forkedBibles = None
+    return [(BBB,(_CompareBook(Bible1[BBB]),_CompareBook(Bible2[BBB]))) for BBB in commonBooks]
+# end of _makeCompareTasks
+
+def _getCompareBooks( BBB, books ):
+    """
+    Returns the two book objects for the given task.
+    """
+    return (_forkedBibles[0][BBB], _forkedBibles[1][BBB]) if books is None else books
+# end of _getCompareBooks
+
 def _doCompare( parameters ): # for multiprocessing
-    BBB, Bible1, Bible2 = parameters
-    return compareBooksPedantic( Bible1[BBB], Bible2[BBB] )
+    BBB, books, compareOptions = parameters
+    book1, book2 = _getCompareBooks( BBB, books )
+    return BBB, compareBooksPedantic( book1, book2, **compareOptions )
+# end of _doCompare
 
 
 def segmentizeLine( line, segmentEndPunctuation='.?!;:' ):
@@ -798,6 +842,12 @@ def segmentizeBooks( book1, book2 ):
     return segmentList, abResults
 # end of segmentizeBooks
 
+def _doSegmentize( parameters ): # for multiprocessing
+    BBB, books = parameters
+    book1, book2 = _getCompareBooks( BBB, books )
+    return BBB, segmentizeBooks( book1, book2 )
+# end of _doSegmentize
+
 
 
 def analyzeWordsInSegment( reference, segmentAList, segmentBList, dictAB, resultsList ):
@@ -968,11 +1018,14 @@ def analyzeBibles( Bible1, Bible2 ):
             print( exp("Comparing {} books using {} processes…").format( numBooks, BibleOrgSysGlobals.maxProcesses ) )
             print( "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
         BibleOrgSysGlobals.alreadyMultiprocessing = True
+        global _forkedBibles
+        compareTasks = _makeCompareTasks( Bible1, Bible2, commonBooks )
         with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-            results = pool.map( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
-            assert len(results) == numBooks
-            for j,BBB in enumerate( commonBooks ):
-                bResults[BBB] = results[j] # Saves them in the correct order
+            results = dict( pool.imap_unordered( _doSegmentize, compareTasks ) ) # have the pool do our loads
+        _forkedBibles = None
+        assert len(results) == numBooks
+        for BBB in commonBooks: # Save them in the correct order
+            bSegmentList[BBB], bResults[BBB] = results[BBB]
         BibleOrgSysGlobals.alreadyMultiprocessing = False
     else: # Just single threaded
         for BBB in commonBooks: # Do individual book prechecks
@@ -1017,29 +1070,32 @@ def compareBibles( Bible1, Bible2,
     numBooks = len( commonBooks )
 
     if BibleOrgSysGlobals.verbosityLevel > 2: print( exp("Running compareBooksPedantic on both Bibles…") )
+    compareOptions = { 'compareQuotes':compareQuotes, 'comparePunctuation':comparePunctuation, 'compareDigits':compareDigits,
+                        'illegalCleanTextOnlyStrings1':illegalCleanTextOnlyStrings1, 'illegalCleanTextOnlyStrings2':illegalCleanTextOnlyStrings2,
+                        'illegalCompleteLineStrings1':illegalCompleteLineStrings1, 'illegalCompleteLineStrings2':illegalCompleteLineStrings2,
+                        'legalPairs1':legalPairs1, 'legalPairs2':legalPairs2,
+                        'matchingPairs':matchingPairs,
+                        'illegalCompleteLineRegexes1':illegalCompleteLineRegexes1, 'illegalCompleteLineRegexes2':illegalCompleteLineRegexes2,
+                        'breakOnOne':breakOnOne }
     bResults = OrderedDict()
     if BibleOrgSysGlobals.maxProcesses > 1: # Check all the books as quickly as possible
         if BibleOrgSysGlobals.verbosityLevel > 1:
             print( exp("Comparing {} books using {} processes…").format( numBooks, BibleOrgSysGlobals.maxProcesses ) )
             print( "  NOTE: Outputs (including error and warning messages) from scanning various books may be interspersed." )
         BibleOrgSysGlobals.alreadyMultiprocessing = True
+        global _forkedBibles
+        compareTasks = [(BBB,books,compareOptions) for BBB,books in _makeCompareTasks( Bible1, Bible2, commonBooks )]
         with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
-            results = pool.map( _doCompare, [(BBB,Bible1,Bible2) for BBB in commonBooks] ) # have the pool do our loads
-            assert len(results) == numBooks
-            for j,BBB in enumerate( commonBooks ):
-                bResults[BBB] = results[j] # Saves them in the correct order
+            results = dict( pool.imap_unordered( _doCompare, compareTasks ) ) # have the pool do our loads
+        _forkedBibles = None
+        assert len(results) == numBooks
+        for BBB in commonBooks: # Save them in the correct order
+            bResults[BBB] = results[BBB]
         BibleOrgSysGlobals.alreadyMultiprocessing = False
     else: # Just single threaded
         for BBB in commonBooks: # Do individual book prechecks
             if BibleOrgSysGlobals.verbosityLevel > 3: print( "  " + exp("Comparing {}…").format( BBB ) )
-            bResults[BBB] = compareBooksPedantic( Bible1[BBB], Bible2[BBB], compareQuotes=compareQuotes,
-                                                comparePunctuation=comparePunctuation, compareDigits=compareDigits,
-                                                illegalCleanTextOnlyStrings1=illegalCleanTextOnlyStrings1, illegalCleanTextOnlyStrings2=illegalCleanTextOnlyStrings2,
-                                                illegalCompleteLineStrings1=illegalCompleteLineStrings1, illegalCompleteLineStrings2=illegalCompleteLineStrings2,
-                                                legalPairs1=legalPairs1, legalPairs2=legalPairs2,
-                                                matchingPairs=matchingPairs,
-                                                illegalCompleteLineRegexes1=illegalCompleteLineRegexes1, illegalCompleteLineRegexes2=illegalCompleteLineRegexes2,
-                                                breakOnOne=breakOnOne )
+            bResults[BBB] = compareBooksPedantic( Bible1[BBB], Bible2[BBB], **compareOptions )
     return bResults
 # end of compareBibles
 
@@ -37,10 +37,10 @@ There seems to be some incomplete documentation at http://digitalbiblelibrary.or
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "DigitalBibleLibrary"
 ProgName = "Digital Bible Library (DBL) XML Bible handler"
-ProgVersion = '0.28'
+ProgVersion = '0.29'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -77,7 +77,7 @@ def t( messageString ):
 
 
 
-def DBLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def DBLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for DBL Bible bundles in the folder and in the next level down.
 
@@ -93,24 +93,26 @@ def DBLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("DBLBibleFileCheck: Given '{}' folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("DBLBibleFileCheck: Given '{}' path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " DBLBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ): foundFiles.append( something )
+        elif folderSnapshot.isfile( somepath ): foundFiles.append( something )
 
     # See if the compulsory files and folder are here in this given folder
     numFound = numFilesFound = numFoldersFound = 0
@@ -145,15 +147,15 @@ def DBLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLo
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("DBLBibleFileCheck: '{}' subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    DBLBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ): foundSubfiles.append( something )
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ): foundSubfiles.append( something )
 
         # See if the compulsory files and folder are here in this given folder
         numFilesFound = numFoldersFound = 0
@@ -59,15 +59,21 @@ In this module, we use:
 
 We currently use version 2 of the DBP.
 
+DBPBible fetches a whole chapter at a time (and prefetches the adjacent chapters
+    in background threads) using keep-alive HTTP connections from a shared pool.
+The JSON responses are also saved in an on-disk cache (in a subfolder of
+    BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER) which is revalidated (using the ETag)
+    once the response has expired.
+
 More details are available from https://www.digitalbibleplatform.com/docs.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-03-17' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "DigitalBiblePlatform"
 ProgName = "Digital Bible Platform online handler"
-ProgVersion = '0.21'
+ProgVersion = '0.22'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -76,11 +82,15 @@ debuggingThisModule = False
 
 from singleton import singleton
 import os, logging
-import urllib.request, json
+import urllib.request, urllib.parse, http.client, json
+import hashlib, threading, time
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 
 import BibleOrgSysGlobals
 from GenericOnlineBible import GenericOnlineBible
+from VerseReferences import SimpleVerseKey
 
 
 URL_BASE = 'http://dbt.io/'
@@ -88,6 +98,14 @@ DBP_VERSION = '2'
 KEY_FILENAME = "DBPKey.txt"
 KEY_SEARCH_PATHS = ( KEY_FILENAME, os.path.join( "../BibleOrgSys/DataFiles", KEY_FILENAME ) )
 
+ONLINE_CACHE_SUBFOLDER = 'DBPOnline/' # Inside BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER
+DEFAULT_CACHE_EXPIRY_SECONDS = 7 * 24 * 60 * 60 # If the server doesn't tell us otherwise
+MAX_CONNECTIONS_PER_HOST = 4 # Also the number of prefetch threads
+MAX_PENDING_CHAPTERS = 8 # Prefetched chapters held (per Bible) which haven't been used yet
+HTTP_TIMEOUT_SECONDS = 30
+
+useDiskCache = True # Can be set False to always fetch from the server
+
 
 
 def getSecurityKey():
@@ -107,6 +125,187 @@ def getSecurityKey():
 
 
 
+class HTTPConnectionPool:
+    """
+    A (thread-safe) pool of keep-alive HTTP(S) connections
+        so that each request doesn't have to set up a new TCP (and TLS) connection.
+    """
+    def __init__( self, maxIdlePerHost=MAX_CONNECTIONS_PER_HOST, timeout=HTTP_TIMEOUT_SECONDS ):
+        """
+        Create an empty pool.
+        """
+        self.maxIdlePerHost, self.timeout = maxIdlePerHost, timeout
+        self.__idleConnections = {} # (scheme,netloc) -> list of connections
+        self.__lock = threading.Lock()
+        self.connectionsMade = self.requestsMade = 0
+    # end of HTTPConnectionPool.__init__
+
+
+    def __str__( self ):
+        """
+        Return a short description of the pool and its statistics.
+        """
+        return "HTTPConnectionPool: {} idle connection(s), {:,} connection(s) made for {:,} request(s)" \
+                    .format( sum( len(connections) for connections in self.__idleConnections.values() ), self.connectionsMade, self.requestsMade )
+    # end of HTTPConnectionPool.__str__
+
+
+    def request( self, URL, headers=None ):
+        """
+        Does an HTTP GET of the URL using a pooled connection if there is one.
+
+        Returns a 3-tuple: (status, headerDict (with lower-case names), bodyBytes).
+        Raises OSError (or an http.client.HTTPException) if the request fails.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "HTTPConnectionPool.request( {!r}, {} )".format( URL, headers ) )
+
+        parsedURL = urllib.parse.urlsplit( URL )
+        hostKey = (parsedURL.scheme, parsedURL.netloc)
+        path = parsedURL.path or '/'
+        if parsedURL.query: path += '?' + parsedURL.query
+        with self.__lock:
+            self.requestsMade += 1
+            connection = self.__idleConnections[hostKey].pop() if self.__idleConnections.get( hostKey ) else None
+        for attempt in range( 2 ):
+            wasReused = connection is not None
+            if connection is None:
+                connectionClass = http.client.HTTPSConnection if parsedURL.scheme=='https' else http.client.HTTPConnection
+                connection = connectionClass( parsedURL.netloc, timeout=self.timeout )
+                with self.__lock: self.connectionsMade += 1
+            try:
+                connection.request( 'GET', path, headers=headers or {} )
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                connection = None
+                if not wasReused: raise
+                # otherwise the server probably closed our idle connection so try again with a new one
+        if response.will_close: connection.close()
+        else:
+            with self.__lock:
+                idleConnections = self.__idleConnections.setdefault( hostKey, [] )
+                keepIt = len(idleConnections) < self.maxIdlePerHost
+                if keepIt: idleConnections.append( connection )
+            if not keepIt: connection.close() # Already have enough idle ones
+        return response.status, { name.lower():value for name,value in response.getheaders() }, body
+    # end of HTTPConnectionPool.request
+
+
+    def closeAll( self ):
+        """
+        Close all of the idle connections.
+        """
+        with self.__lock:
+            for idleConnections in self.__idleConnections.values():
+                for connection in idleConnections: connection.close()
+            self.__idleConnections = {}
+    # end of HTTPConnectionPool.closeAll
+# end of class HTTPConnectionPool
+
+sharedConnectionPool = HTTPConnectionPool() # Shared by all DBPBible objects
+
+
+
+def getExpiryTime( headerDict ):
+    """
+    Given the (lower-case) HTTP response headers,
+        work out when the response should be considered stale.
+
+    Returns a time.time() value.
+    """
+    now = time.time()
+    cacheControl = headerDict.get( 'cache-control', '' ).lower()
+    for directive in cacheControl.split( ',' ):
+        directive = directive.strip()
+        if directive in ('no-cache','no-store') or directive.startswith( 'must-revalidate' ) and 'max-age' not in cacheControl:
+            return now # Needs revalidating every time
+        if directive.startswith( 'max-age=' ):
+            try: return now + int( directive[8:] )
+            except ValueError: break
+    if 'expires' in headerDict:
+        try: return parsedate_to_datetime( headerDict['expires'] ).timestamp()
+        except (TypeError, ValueError, IndexError): return now # An invalid date means already expired
+    return now + DEFAULT_CACHE_EXPIRY_SECONDS
+# end of getExpiryTime
+
+
+def getCachedJSON( cacheKey, URL, headers=None ):
+    """
+    Does an HTTP GET of the URL (which must return JSON)
+        using the on-disk cache entry for the cacheKey if it's still fresh.
+
+    An expired entry is revalidated with If-None-Match if we have its ETag.
+    If the server can't be reached, any expired cached data is returned anyway.
+
+    Returns the loaded JSON data, or None if the data cannot be fetched.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( "getCachedJSON( {!r}, {!r} )".format( cacheKey, URL ) )
+
+    cacheFolder = os.path.join( BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER, ONLINE_CACHE_SUBFOLDER )
+    cacheFilepath = os.path.join( cacheFolder, hashlib.sha1( cacheKey.encode( 'utf-8' ) ).hexdigest() + '.json' )
+    cacheEntry = None
+    if useDiskCache:
+        try:
+            with open( cacheFilepath, 'rt', encoding='utf-8' ) as cacheFile: cacheEntry = json.load( cacheFile )
+        except (OSError, ValueError): pass # Not cached (or corrupted) so just fetch it
+        if cacheEntry is not None:
+            if cacheEntry.get( 'key' ) != cacheKey: cacheEntry = None # Very unlikely hash collision
+            elif cacheEntry['expires'] > time.time(): return cacheEntry['data'] # Still fresh
+
+    requestHeaders = dict( headers ) if headers else {}
+    if cacheEntry is not None and cacheEntry.get( 'ETag' ): requestHeaders['If-None-Match'] = cacheEntry['ETag']
+    try: status, headerDict, body = sharedConnectionPool.request( URL, requestHeaders )
+    except (http.client.HTTPException, OSError) as err:
+        if cacheEntry is not None:
+            logging.warning( "DBP couldn't fetch {!r} ({}) so using expired cached data".format( cacheKey, err ) )
+            return cacheEntry['data']
+        if BibleOrgSysGlobals.debugFlag: logging.critical( "getCachedJSON: error fetching {!r}: {}".format( cacheKey, err ) )
+        return None
+    if status == 304 and cacheEntry is not None: # Not modified
+        data = cacheEntry['data']
+    elif status == 200:
+        contentType = headerDict.get( 'content-type', '' )
+        charset = contentType.split( 'charset=' )[1].split( ';' )[0].strip() if 'charset=' in contentType else 'utf-8'
+        try: data = json.loads( body.decode( charset ) )
+        except ValueError:
+            logging.error( "DBP returned invalid JSON for {!r}".format( cacheKey ) )
+            return None
+        cacheEntry = { 'key':cacheKey, 'ETag':headerDict.get( 'etag' ), 'data':data }
+    else:
+        if BibleOrgSysGlobals.debugFlag: logging.critical( "getCachedJSON: HTTP status {} fetching {!r}".format( status, cacheKey ) )
+        return None
+
+    if useDiskCache and 'no-store' not in headerDict.get( 'cache-control', '' ).lower():
+        cacheEntry['expires'] = getExpiryTime( headerDict )
+        if status == 304 and headerDict.get( 'etag' ): cacheEntry['ETag'] = headerDict['etag']
+        try: # Write it to a temporary file first so that other threads/processes never see a partial file
+            os.makedirs( cacheFolder, exist_ok=True )
+            temporaryFilepath = '{}.{}.{}.tmp'.format( cacheFilepath, os.getpid(), threading.get_ident() )
+            with open( temporaryFilepath, 'wt', encoding='utf-8' ) as cacheFile: json.dump( cacheEntry, cacheFile, ensure_ascii=False )
+            os.replace( temporaryFilepath, cacheFilepath )
+        except OSError as err: logging.warning( "DBP unable to save cache file {!r}: {}".format( cacheFilepath, err ) )
+    return data
+# end of getCachedJSON
+
+
+prefetchExecutor = None # Created when first needed
+
+def getPrefetchExecutor():
+    """
+    Returns the (shared) thread pool used for fetching chapters.
+    """
+    global prefetchExecutor
+    if prefetchExecutor is None:
+        prefetchExecutor = ThreadPoolExecutor( max_workers=MAX_CONNECTIONS_PER_HOST, thread_name_prefix='DBPFetch' )
+    return prefetchExecutor
+# end of getPrefetchExecutor
+
+
+
 @singleton # Can only ever have one instance
 class DBPBibles:
     """
@@ -499,11 +698,12 @@ class DBPBible( GenericOnlineBible ):
         self.damRoot = damRoot
         self.key = getSecurityKey() # Our personal key
         self.URLFixedData = '?v={}&key={}'.format( DBP_VERSION, self.key )
+        self.chapterFutures = OrderedDict() # (BBB,C) -> Future for chapters which have been requested but not yet used
 
         # See if the site is online by making a small call to get the API version
         self.URLTest = 'api/apiversion'
         self.onlineVersion = None
-        result = self.getOnlineData( self.URLTest )
+        result = self.getOnlineData( self.URLTest, useCache=False )
         if result:
             if 'Version' in result: self.onlineVersion = result['Version']
         else:
@@ -550,15 +750,17 @@ class DBPBible( GenericOnlineBible ):
     # end of DBPBible.__str__
 
 
-    def getOnlineData( self, fieldREST, additionalParameters=None ):
+    def getOnlineData( self, fieldREST, additionalParameters=None, useCache=True ):
         """
         Given a string, e.g., "api/apiversion"
-            Does an HTTP GET to our site.
+            Does an HTTP GET to our site (using a pooled keep-alive connection).
             Receives the JSON result (hopefully)
-            Converts the JSON bytes to a JSON string
-            Loads the JSON string into a dictionary
-            Returns the dictionary.
+            Loads the JSON into a Python container
+            Returns the container.
+        Unless useCache is False, the on-disk cache is used if the result is still fresh.
         Returns None if the data cannot be fetched.
+
+        Can be called from the prefetch threads.
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             print( _("DBPBible.getOnlineData( {!r} {!r} )").format( fieldREST, additionalParameters ) )
@@ -566,18 +768,61 @@ class DBPBible( GenericOnlineBible ):
         if BibleOrgSysGlobals.verbosityLevel > 2: print( "Requesting data from {} for {}…".format( URL_BASE, self.damRoot ) )
         requestString = "{}{}{}{}".format( URL_BASE, fieldREST, self.URLFixedData, '&'+additionalParameters if additionalParameters else '' )
         #print( "Request string is", repr(requestString) )
-        try: responseJSON = urllib.request.urlopen( requestString )
-        except urllib.error.URLError:
+        if useCache: # NOTE: The cache key deliberately excludes our personal key
+            return getCachedJSON( '{}{}?v={}&{}'.format( URL_BASE, fieldREST, DBP_VERSION, additionalParameters or '' ), requestString )
+        try: status, _headerDict, body = sharedConnectionPool.request( requestString )
+        except (http.client.HTTPException, OSError):
             if BibleOrgSysGlobals.debugFlag: logging.critical( "DBPBible.getOnlineData: error fetching {!r} {!r}".format( fieldREST, additionalParameters ) )
             return None
-        responseSTR = responseJSON.read().decode('utf-8')
-        return json.loads( responseSTR )
+        if status != 200: return None
+        return json.loads( body.decode('utf-8') )
     # end of DBPBible.getOnlineData
 
 
+    def requestChapter( self, BBB, C ):
+        """
+        Starts fetching the raw data for the chapter (in a background thread)
+            unless it's already been requested.
+
+        Returns the Future.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( _("DBPBible.requestChapter( {}, {} ) for {!r}").format( BBB, C, self.damRoot ) )
+
+        chapterKey = (BBB,C)
+        try: return self.chapterFutures[chapterKey]
+        except KeyError: pass
+        info = self.books[BBB]
+        future = getPrefetchExecutor().submit( self.getOnlineData, 'text/verse',
+                        'dam_id={}&book_id={}&chapter_id={}'.format( info['dam_id']+'2ET', info['book_id'], C ) )
+        self.chapterFutures[chapterKey] = future
+        while len(self.chapterFutures) > MAX_PENDING_CHAPTERS: # Forget the oldest prefetches (they're still in the disk cache)
+            self.chapterFutures.popitem( last=False )[1].cancel()
+        return future
+    # end of DBPBible.requestChapter
+
+
+    def prefetchAdjacentChapters( self, BBB, C ):
+        """
+        Start fetching the previous and next chapters (if they're not already cached)
+            because they're likely to be wanted soon.
+        """
+        try: intC = int( C )
+        except ValueError: return
+        numChapters = BibleOrgSysGlobals.BibleBooksCodes.getMaxChapters( BBB )
+        for adjacentC in (intC+1, intC-1):
+            if adjacentC < 1 or (numChapters > 0 and adjacentC > numChapters): continue
+            if GenericOnlineBible.getCachedVerseDataList( self, SimpleVerseKey( BBB, str(adjacentC), '1' ) ) is None:
+                self.requestChapter( BBB, str(adjacentC) )
+    # end of DBPBible.prefetchAdjacentChapters
+
+
     def getVerseDataList( self, key ):
         """
         Equivalent to the one in InternalBible, except we may have to fetch the data.
+
+        The whole chapter is fetched (and cached) at once
+            and the adjacent chapters are prefetched.
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             print( _("DBPBible.getVerseDataList( {!r} ) for {!r}").format( key, self.damRoot ) )
@@ -587,18 +832,23 @@ class DBPBible( GenericOnlineBible ):
 
         BBB = key.getBBB()
         if BBB in self.books:
-            info = self.books[BBB]
-            rawData = self.getOnlineData( 'text/verse', 'dam_id={}&book_id={}&chapter_id={}&verse_start={}'.format( info['dam_id']+'2ET', info['book_id'], key.getChapterNumber(), key.getVerseNumber() ) )
+            C, V = key.getChapterNumber(), key.getVerseNumber()
+            future = self.requestChapter( BBB, C )
+            self.prefetchAdjacentChapters( BBB, C )
+            rawData = future.result()
+            self.chapterFutures.pop( (BBB,C), None )
             resultList = []
-            if isinstance( rawData, list ) and len(rawData)==1:
-                rawDataDict = rawData[0]
-                #print( len(rawDataDict), rawDataDict )
-                assert len(rawDataDict)==8 and isinstance( rawDataDict, dict )
-                resultList.append( ('p#','p#',rawDataDict['paragraph_number'],rawDataDict['paragraph_number'],[]) ) # Must be first for Biblelator
-                if key.getVerseNumber()=='1': resultList.append( ('c#','c#',rawDataDict['chapter_id'],rawDataDict['chapter_id'],[]) )
-                resultList.append( ('v','v',rawDataDict['verse_id'],rawDataDict['verse_id'],[]) )
-                resultList.append( ('v~','v~',rawDataDict['verse_text'].strip(),rawDataDict['verse_text'].strip(),[]) )
-                GenericOnlineBible.cacheVerse( self, key, resultList )
+            if isinstance( rawData, list ):
+                for rawDataDict in rawData:
+                    #print( len(rawDataDict), rawDataDict )
+                    assert len(rawDataDict)==8 and isinstance( rawDataDict, dict )
+                    verseDataList = [('p#','p#',rawDataDict['paragraph_number'],rawDataDict['paragraph_number'],[])] # Must be first for Biblelator
+                    if str(rawDataDict['verse_id'])=='1': verseDataList.append( ('c#','c#',rawDataDict['chapter_id'],rawDataDict['chapter_id'],[]) )
+                    verseDataList.append( ('v','v',rawDataDict['verse_id'],rawDataDict['verse_id'],[]) )
+                    verseDataList.append( ('v~','v~',rawDataDict['verse_text'].strip(),rawDataDict['verse_text'].strip(),[]) )
+                    if str(rawDataDict['verse_id']) == V: resultList = verseDataList
+                    else: GenericOnlineBible.cacheVerse( self, SimpleVerseKey( BBB, C, str(rawDataDict['verse_id']) ), verseDataList )
+                if resultList: GenericOnlineBible.cacheVerse( self, key, resultList ) # Last so it's the most recently used
             return resultList
         else: # This version doesn't have this book
             if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
@@ -33,14 +33,20 @@ We currently use version 1.4.1 of the DCS.
 
 More details are available from https://api-info.readthedocs.io/en/latest/dcs.html
                             and https://git.door43.org/api/swagger.
+
+Downloaded books and repos are kept as a local mirror
+    (in BibleOrgSysGlobals.DOWNLOADED_RESOURCES_FOLDER) and later downloads use
+    conditional requests (ETag/Last-Modified) so that unchanged files aren't downloaded again.
+The catalogue of available Bibles is also cached (in BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER)
+    and only the recently updated repos are fetched when it's refreshed.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-02' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "Door43ContentService"
 ProgName = "Door43 Content Service online handler"
-ProgVersion = '0.03'
+ProgVersion = '0.04'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -48,11 +54,13 @@ debuggingThisModule = False
 
 
 from singleton import singleton
-import os, logging
+import os, logging, threading
 import urllib.request
 import json
-import tempfile, zipfile
-from datetime import datetime
+import tempfile, zipfile, shutil
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 import BibleOrgSysGlobals
 from USFMBible import USFMBible
@@ -62,6 +70,189 @@ URL_BASE = 'https://git.door43.org/api/' # API endpoint
 DCS_API_VERSION = '1'
 URL_FULL_BASE = f'{URL_BASE}/v{DCS_API_VERSION}/'
 
+DCS_SEARCH_TEXTS = ('Bible', 'ULT', 'UST',) # 'ULB', 'UDB'): # 7,227 if these are all included!!!
+CATALOGUE_FILENAME = 'DCSCatalogue.json' # Inside BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER
+CATALOGUE_FULL_REFRESH_DAYS = 7 # so that deleted repos eventually disappear from the catalogue
+DOWNLOAD_INFO_SUBFOLDER = 'DCSDownloads/' # Inside BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER
+MAX_PARALLEL_DOWNLOADS = 4
+
+
+
+def parseDCSDatetime( datetimeString ):
+    """
+    Convert a DCS timestamp, e.g., '2019-04-29T09:38:47Z' or '2019-04-29T09:38:47+00:00'
+        to an (aware) datetime object.
+    """
+    if datetimeString.endswith( 'Z' ): datetimeString = datetimeString[:-1] + '+00:00'
+    result = datetime.fromisoformat( datetimeString )
+    if result.tzinfo is None: result = result.replace( tzinfo=timezone.utc )
+    return result
+# end of parseDCSDatetime
+
+
+def writeJSONFile( filepath, data ):
+    """
+    Write the data to a temporary file first and then rename it,
+        so that other threads/processes never see a partially written file.
+    """
+    folder = os.path.dirname( filepath )
+    if folder: os.makedirs( folder, exist_ok=True )
+    temporaryFilepath = f'{filepath}.{os.getpid()}.{threading.get_ident()}.tmp' # mirrorRepos writes from several threads
+    with open( temporaryFilepath, 'wt', encoding='utf-8' ) as jsonFile:
+        json.dump( data, jsonFile, ensure_ascii=False )
+    os.replace( temporaryFilepath, filepath )
+# end of writeJSONFile
+
+
+def loadDownloadInfo( adjustedRepoName ):
+    """
+    Returns a dictionary of the (ETag and Last-Modified) validators
+        for each previously downloaded file from the repo.
+    """
+    downloadInfoFilepath = os.path.join( BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER, DOWNLOAD_INFO_SUBFOLDER, f'{adjustedRepoName}.json' )
+    try:
+        with open( downloadInfoFilepath, 'rt', encoding='utf-8' ) as downloadInfoFile: return json.load( downloadInfoFile )
+    except (OSError, ValueError): return {}
+# end of loadDownloadInfo
+
+def saveDownloadInfo( adjustedRepoName, downloadInfo ):
+    """
+    Save the validators for the downloaded files from the repo.
+    """
+    downloadInfoFilepath = os.path.join( BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER, DOWNLOAD_INFO_SUBFOLDER, f'{adjustedRepoName}.json' )
+    try: writeJSONFile( downloadInfoFilepath, downloadInfo )
+    except OSError as err: logging.warning( f"DCS unable to save download info to '{downloadInfoFilepath}': {err}" )
+# end of saveDownloadInfo
+
+
+def conditionalDownload( URL, validators=None ):
+    """
+    Does an HTTP GET of the URL,
+        but if validators are given (from a previous download of the same URL)
+        asks the server to only send the data if it has changed.
+
+    Returns a 4-tuple: (status, contentType, downloadedData, newValidators)
+        where status is 200 if downloaded, 304 if not modified, or None if the download failed.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( f"conditionalDownload( '{URL}', {validators} )…" )
+
+    request = urllib.request.Request( URL )
+    if validators:
+        if validators.get( 'ETag' ): request.add_header( 'If-None-Match', validators['ETag'] )
+        if validators.get( 'Last-Modified' ): request.add_header( 'If-Modified-Since', validators['Last-Modified'] )
+    try: HTTPResponseObject = urllib.request.urlopen( request )
+    except urllib.error.HTTPError as err:
+        if err.code == 304: return 304, None, None, validators # Not modified
+        logging.critical( "DCS HTTPError '{}' from {}".format( err, URL ) )
+        return None, None, None, None
+    except urllib.error.URLError as err:
+        logging.critical( "DCS URLError '{}' from {}".format( err, URL ) )
+        return None, None, None, None
+    contentType = HTTPResponseObject.info().get( 'content-type' )
+    downloadedData = HTTPResponseObject.read()
+    newValidators = {}
+    for headerName in ('ETag', 'Last-Modified'):
+        headerValue = HTTPResponseObject.info().get( headerName )
+        if headerValue: newValidators[headerName] = headerValue
+    return HTTPResponseObject.status, contentType, downloadedData, newValidators
+# end of conditionalDownload
+
+
+def mirrorRepo( resourceDict ):
+    """
+    Make sure that we have an up-to-date local copy of the entire repo
+        (containing all the USFM files, README.md, LICENSE.md, manifest.yaml, etc.)
+
+    Returns the path of the folder that it was unzipped into
+        (or None if it couldn't be downloaded).
+
+    Can be called from several threads at once (for different repos).
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( f"mirrorRepo( {resourceDict['full_name']} )…" )
+
+    adjustedRepoName = resourceDict['full_name'].replace( '/', '--' )
+    unzippedFolderPath = os.path.join( BibleOrgSysGlobals.DOWNLOADED_RESOURCES_FOLDER,
+                            'Door43ContentServiceOnline/', f"{adjustedRepoName}/" )
+
+    # See if files already exist and are current (so don't download again)
+    alreadyDownloadedFlag = False
+    if os.path.isdir( unzippedFolderPath ):
+        #print( f"Issued: {resourceDict['issued']}" )
+        updatedDatetime = datetime.strptime( resourceDict['updated_at'], '%Y-%m-%dT%H:%M:%SZ' )
+        #print( f"updatedDatetime: {updatedDatetime}" )
+        #print( f"folder: {os.stat(unzippedFolderPath).st_mtime}" )
+        folderModifiedDatetime = datetime.fromtimestamp(os.stat(unzippedFolderPath).st_mtime)
+        #print( f"folderModifiedDatetime: {folderModifiedDatetime}" )
+        alreadyDownloadedFlag = folderModifiedDatetime > updatedDatetime
+        #print( f"alreadyDownloadedFlag: {alreadyDownloadedFlag}" )
+
+    if alreadyDownloadedFlag:
+        if BibleOrgSysGlobals.verbosityLevel > 1:
+            print( "Skipping download because folder '{}' already exists.".format( unzippedFolderPath ) )
+        return unzippedFolderPath
+
+    # Download the zip file (unless the server tells us that it hasn't changed)
+    # TODO: Change to .tar.gz instead of zip
+    zipURL = resourceDict['html_url'] + '/archive/master.zip' # '/archive/master.tar.gz'
+    downloadInfo = loadDownloadInfo( adjustedRepoName )
+    if BibleOrgSysGlobals.verbosityLevel > 1:
+        print( "Downloading entire repo from '{}'…".format( zipURL ) )
+    status, contentType, downloadedData, newValidators = conditionalDownload( zipURL,
+                            downloadInfo.get( 'master.zip' ) if os.path.isdir( unzippedFolderPath ) else None )
+    if status is None: return None
+    if status == 304:
+        if BibleOrgSysGlobals.verbosityLevel > 1:
+            print( f"  '{zipURL}' hasn't changed since it was downloaded" )
+        os.utime( unzippedFolderPath ) # So we don't need to ask again until the repo is updated
+        return unzippedFolderPath
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( "    contentType", repr(contentType) )
+    if contentType == 'application/octet-stream':
+        if BibleOrgSysGlobals.verbosityLevel > 0:
+            print( f"  Downloaded {len(downloadedData):,} bytes from '{zipURL}'" )
+        # Unzip into a new folder first so that a failed download doesn't leave a mixture of old and new files
+        newFolderPath = unzippedFolderPath.rstrip( '/' ) + '.new/'
+        shutil.rmtree( newFolderPath, ignore_errors=True )
+        os.makedirs( newFolderPath )
+        # Bug in Python up to 3.7 makes this not work for large aligned Bibles (3+ MB)
+        # myTempFile = tempfile.SpooledTemporaryFile()
+        myTempFile = tempfile.TemporaryFile()
+        myTempFile.write( downloadedData )
+        with zipfile.ZipFile( myTempFile ) as myzip:
+            # NOTE: Could be a security risk here
+            myzip.extractall( newFolderPath )
+        myTempFile.close() # Automatically deletes the file
+        shutil.rmtree( unzippedFolderPath, ignore_errors=True )
+        os.rename( newFolderPath, unzippedFolderPath )
+    else:
+        print( "    contentType", repr(contentType) )
+        halt # unknown content type
+    downloadInfo['master.zip'] = newValidators
+    saveDownloadInfo( adjustedRepoName, downloadInfo )
+    return unzippedFolderPath
+# end of mirrorRepo
+
+
+def mirrorRepos( resourceDicts, maxWorkers=MAX_PARALLEL_DOWNLOADS ):
+    """
+    Make sure that we have up-to-date local copies of all of the given repos,
+        downloading up to maxWorkers of them at once.
+
+    Returns a dictionary with the repo full names as keys
+        and the unzipped folder paths (or None if the download failed) as values.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( f"mirrorRepos( {len(resourceDicts)}, {maxWorkers} )…" )
+
+    uniqueResourceDicts = {}
+    for resourceDict in resourceDicts: # The catalogue can list a repo more than once
+        uniqueResourceDicts[resourceDict['full_name']] = resourceDict
+    with ThreadPoolExecutor( max_workers=maxWorkers ) as executor:
+        return dict( zip( uniqueResourceDicts, executor.map( mirrorRepo, uniqueResourceDicts.values() ) ) )
+# end of mirrorRepos
+
 
 
 @singleton # Can only ever have one instance
@@ -134,39 +325,105 @@ class DCSBibles:
     # end of DCSBibles.getOnlineData
 
 
-    def fetchAllBibles( self ):
+    def fetchAllBibles( self, fullRefresh=False ):
         """
         Download the Bible lists from DCS.
 
-        This can be quite slow.
+        The lists are cached on disk and (unless fullRefresh is set or the cache is old)
+            only the repos that have been updated since are downloaded.
+        If DCS isn't online, the cached lists are used.
 
+        The first download can be quite slow.
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
-            print( "DCSBibles.fetchAllBibles()…" )
+            print( f"DCSBibles.fetchAllBibles( {fullRefresh} )…" )
 
-        if BibleOrgSysGlobals.verbosityLevel > 1:
-            print( _("Downloading list of available Bibles from DCS…") )
+        catalogueFilepath = os.path.join( BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER, CATALOGUE_FILENAME )
+        try:
+            with open( catalogueFilepath, 'rt', encoding='utf-8' ) as catalogueFile: catalogue = json.load( catalogueFile )
+        except (OSError, ValueError): catalogue = None
+        if catalogue is None or catalogue.get( 'searchTexts' ) != list( DCS_SEARCH_TEXTS ) \
+        or time.time() - catalogue['fullRefreshTime'] > CATALOGUE_FULL_REFRESH_DAYS * 24 * 60 * 60:
+            fullRefresh = True
 
         if self.onlineVersion: # Get a list of available data sets
-            self.BibleList = []
+            if BibleOrgSysGlobals.verbosityLevel > 1:
+                print( _("Downloading list of available Bibles from DCS…") if fullRefresh else _("Updating list of available Bibles from DCS…") )
+            if fullRefresh: catalogue = { 'searchTexts':list( DCS_SEARCH_TEXTS ), 'fullRefreshTime':time.time(), 'BibleLists':{} }
             # Does a case-insensitive search
-            for searchText in ('Bible', 'ULT', 'UST',): # 'ULB', 'UDB'): # 7,227 if these are all included!!!
-                pageNumber = 1
-                while True:
-                    if BibleOrgSysGlobals.verbosityLevel > 1:
-                        print( f"  Getting '{searchText}' page {pageNumber}…" )
-                    resultDict = self.getOnlineData( f'repos/search?q={searchText}&page={pageNumber}&limit=50' )
-                    #print( f"  Result = {resultDict}" )
-                    assert resultDict and isinstance( resultDict, dict) and  len(resultDict) == 2 \
-                                    and resultDict['ok']==True
-                    if not resultDict['data']: break # no more data
-                    self.BibleList.extend( resultDict['data'] )
-                    pageNumber += 1
-            if BibleOrgSysGlobals.debugFlag: print( "  BibleList", len(self.BibleList) , self.BibleList )
+            for searchText in DCS_SEARCH_TEXTS:
+                if fullRefresh: catalogue['BibleLists'][searchText] = self.fetchRepoSearchResults( searchText )
+                else: # Only get the repos updated since the newest one that we already have
+                    BibleList = catalogue['BibleLists'][searchText]
+                    latestUpdate = max( (parseDCSDatetime( entryDict['updated_at'] ) for entryDict in BibleList), default=None )
+                    updatedEntries = self.fetchRepoSearchResults( searchText, latestUpdate )
+                    entryIndexes = { entryDict['id']:j for j,entryDict in enumerate( BibleList ) }
+                    for entryDict in reversed( updatedEntries ): # Oldest first so that new repos are appended in order
+                        if entryDict['id'] in entryIndexes: BibleList[entryIndexes[entryDict['id']]] = entryDict
+                        else:
+                            entryIndexes[entryDict['id']] = len(BibleList)
+                            BibleList.append( entryDict )
+                    if BibleOrgSysGlobals.verbosityLevel > 2:
+                        print( f"  Got {len(updatedEntries)} updated '{searchText}' repos" )
+            try: writeJSONFile( catalogueFilepath, catalogue )
+            except OSError as err: logging.warning( f"DCS unable to save catalogue to '{catalogueFilepath}': {err}" )
+        elif catalogue is not None:
+            logging.warning( "DCS is offline so using the previously downloaded list of available Bibles" )
+
+        self.BibleList = []
+        if catalogue is not None:
+            for searchText in DCS_SEARCH_TEXTS: self.BibleList.extend( catalogue['BibleLists'][searchText] )
+        if BibleOrgSysGlobals.debugFlag: print( "  BibleList", len(self.BibleList) , self.BibleList )
         return self.BibleList
     # end of DCSBibles.fetchAllBibles
 
 
+    def fetchRepoSearchResults( self, searchText, updatedSince=None ):
+        """
+        Get all the pages of results for searching the repos for searchText.
+
+        If updatedSince (a datetime) is given, the results are sorted by most recently updated
+            and only the repos updated since then (or at the same time) are returned.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( f"DCSBibles.fetchRepoSearchResults( '{searchText}', {updatedSince} )…" )
+
+        sortParameters = '' if updatedSince is None else '&sort=updated&order=desc'
+        resultsList = []
+        pageNumber = 1
+        while True:
+            if BibleOrgSysGlobals.verbosityLevel > 1:
+                print( f"  Getting '{searchText}' page {pageNumber}…" )
+            resultDict = self.getOnlineData( f'repos/search?q={searchText}{sortParameters}&page={pageNumber}&limit=50' )
+            #print( f"  Result = {resultDict}" )
+            assert resultDict and isinstance( resultDict, dict) and  len(resultDict) == 2 \
+                            and resultDict['ok']==True
+            if not resultDict['data']: break # no more data
+            if updatedSince is None: resultsList.extend( resultDict['data'] )
+            else:
+                for entryDict in resultDict['data']:
+                    if parseDCSDatetime( entryDict['updated_at'] ) < updatedSince: return resultsList # We already have all the rest
+                    resultsList.append( entryDict )
+            pageNumber += 1
+        return resultsList
+    # end of DCSBibles.fetchRepoSearchResults
+
+
+    def mirrorAllBibles( self, maxWorkers=MAX_PARALLEL_DOWNLOADS ):
+        """
+        Make sure that we have up-to-date local copies of all the repos in the BibleList
+            (downloading up to maxWorkers of them at once).
+
+        Returns a dictionary with the repo full names as keys
+            and the unzipped folder paths (or None if the download failed) as values.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( f"DCSBibles.mirrorAllBibles( {maxWorkers} )…" )
+
+        return mirrorRepos( self.BibleList, maxWorkers )
+    # end of DCSBibles.mirrorAllBibles
+
+
     #def fetchAllVersions( self ):
         #"""
         #Download the version lists from unfoldingWord.
@@ -295,60 +552,14 @@ class DCSBible( USFMBible ):
 
         self.baseURL = resourceDict['html_url']
         #print( 'self.baseURL', self.baseURL )
-        adjustedRepoName = resourceDict['full_name'].replace( '/', '--' )
-        #print( 'adjustedRepoName', adjustedRepoName )
-        desiredFolderName = BibleOrgSysGlobals.makeSafeFilename( adjustedRepoName )
+        self.adjustedRepoName = resourceDict['full_name'].replace( '/', '--' )
+        #print( 'adjustedRepoName', self.adjustedRepoName )
         unzippedFolderPath = os.path.join( BibleOrgSysGlobals.DOWNLOADED_RESOURCES_FOLDER,
-                                'Door43ContentServiceOnline/', f"{adjustedRepoName}/" )
+                                'Door43ContentServiceOnline/', f"{self.adjustedRepoName}/" )
 
         if downloadAllBooks:
-            # See if files already exist and are current (so don't download again)
-            alreadyDownloadedFlag = False
-            if os.path.isdir( unzippedFolderPath ):
-                #print( f"Issued: {resourceDict['issued']}" )
-                updatedDatetime = datetime.strptime( resourceDict['updated_at'], '%Y-%m-%dT%H:%M:%SZ' )
-                #print( f"updatedDatetime: {updatedDatetime}" )
-                #print( f"folder: {os.stat(unzippedFolderPath).st_mtime}" )
-                folderModifiedDatetime = datetime.fromtimestamp(os.stat(unzippedFolderPath).st_mtime)
-                #print( f"folderModifiedDatetime: {folderModifiedDatetime}" )
-                alreadyDownloadedFlag = folderModifiedDatetime > updatedDatetime
-                #print( f"alreadyDownloadedFlag: {alreadyDownloadedFlag}" )
-
-            if alreadyDownloadedFlag:
-                if BibleOrgSysGlobals.verbosityLevel > 1:
-                    print( "Skipping download because folder '{}' already exists.".format( unzippedFolderPath ) )
-            else: # Download the zip file (containing all the USFM files, README.md, LICENSE.md, manifest.yaml, etc.)
-                # TODO: Change to .tar.gz instead of zip
-                zipURL = self.baseURL + '/archive/master.zip' # '/archive/master.tar.gz'
-                if BibleOrgSysGlobals.verbosityLevel > 1:
-                    print( "Downloading entire repo from '{}'…".format( zipURL ) )
-                try: HTTPResponseObject = urllib.request.urlopen( zipURL )
-                except urllib.error.URLError as err:
-                    #errorClass, exceptionInstance, traceback = sys.exc_info()
-                    #print( '{!r}  {!r}  {!r}'.format( errorClass, exceptionInstance, traceback ) )
-                    logging.critical( "DCS URLError '{}' from {}".format( err, zipURL ) )
-                    return
-                # print( "  HTTPResponseObject", HTTPResponseObject )
-                contentType = HTTPResponseObject.info().get( 'content-type' )
-                if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
-                    print( "    contentType", repr(contentType) )
-                if contentType == 'application/octet-stream':
-                    try: os.makedirs( unzippedFolderPath )
-                    except FileExistsError: pass
-                    downloadedData = HTTPResponseObject.read()
-                    if BibleOrgSysGlobals.verbosityLevel > 0:
-                        print( f"  Downloaded {len(downloadedData):,} bytes from '{zipURL}'" )
-                    # Bug in Python up to 3.7 makes this not work for large aligned Bibles (3+ MB)
-                    # myTempFile = tempfile.SpooledTemporaryFile()
-                    myTempFile = tempfile.TemporaryFile()
-                    myTempFile.write( downloadedData )
-                    with zipfile.ZipFile( myTempFile ) as myzip:
-                        # NOTE: Could be a security risk here
-                        myzip.extractall( unzippedFolderPath )
-                    myTempFile.close() # Automatically deletes the file
-                else:
-                    print( "    contentType", repr(contentType) )
-                    halt # unknown content type
+            unzippedFolderPath = mirrorRepo( resourceDict )
+            if unzippedFolderPath is None: return
             self.downloadedAllBooks = True
 
             # There's probably a folder inside this folder
@@ -362,6 +573,7 @@ class DCSBible( USFMBible ):
         else:
             self.downloadedAllBooks = False
             self.attemptedDownload = {}
+            self.downloadInfo = loadDownloadInfo( self.adjustedRepoName )
             try: os.makedirs( unzippedFolderPath )
             except FileExistsError: pass
             USFMBible.__init__( self, unzippedFolderPath, givenName=resourceDict['name'] )
@@ -373,8 +585,8 @@ class DCSBible( USFMBible ):
         """
         Download the book if necessary.
 
-        TODO: This function doesn't check if the USFM book was downloaded by a previous run
-                (and is still up-to-date)
+        If the USFM book was downloaded by a previous run,
+            the server is asked to only send it again if it has changed.
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             print( f"DCSBible.loadBookIfNecessary( {BBB} )…" )
@@ -388,33 +600,32 @@ class DCSBible( USFMBible ):
                 if nn > 39: nn += 1 # DSC uses #41 for MAT (not 39)
                 uBBB = BibleOrgSysGlobals.BibleBooksCodes.getUSFMAbbreviation( BBB ).upper()
                 USFMfilename = f'{nn:02}-{uBBB}.usfm'
+                USFMfilepath = os.path.join( self.sourceFolder, USFMfilename )
                 zipURL = f'{self.baseURL}/raw/branch/master/{USFMfilename}'
+                previouslyDownloadedFlag = os.path.isfile( USFMfilepath )
                 if BibleOrgSysGlobals.verbosityLevel > 1:
                     print( "Downloading {} file from '{}'…".format( BBB, zipURL ) )
-                try: HTTPResponseObject = urllib.request.urlopen( zipURL )
-                except urllib.error.HTTPError as err:
-                    #errorClass, exceptionInstance, traceback = sys.exc_info()
-                    #print( '{!r}  {!r}  {!r}'.format( errorClass, exceptionInstance, traceback ) )
-                    logging.critical( "DCS HTTPError '{}' from {}".format( err, zipURL ) )
-                    return
-                except urllib.error.URLError as err:
-                    #errorClass, exceptionInstance, traceback = sys.exc_info()
-                    #print( '{!r}  {!r}  {!r}'.format( errorClass, exceptionInstance, traceback ) )
-                    logging.critical( "DCS URLError '{}' from {}".format( err, zipURL ) )
-                    return
-                # print( "  HTTPResponseObject", HTTPResponseObject )
-                contentType = HTTPResponseObject.info().get( 'content-type' )
-                if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
-                    print( "    contentType", repr(contentType) )
-                if contentType == 'text/plain; charset=utf-8':
-                    downloadedData = HTTPResponseObject.read()
-                    if BibleOrgSysGlobals.verbosityLevel > 0:
-                        print( f"  Downloaded {len(downloadedData):,} bytes from '{zipURL}'" )
-                    with open( os.path.join( self.sourceFolder, USFMfilename ), 'wt' ) as ourUSFMfile:
-                        ourUSFMfile.write( downloadedData.decode( 'utf-8' ) )
+                status, contentType, downloadedData, newValidators = conditionalDownload( zipURL,
+                                        self.downloadInfo.get( USFMfilename ) if previouslyDownloadedFlag else None )
+                if status is None: # Download failed
+                    if not previouslyDownloadedFlag: return
+                    logging.warning( f"DCS using previously downloaded {BBB} file '{USFMfilepath}'" )
+                elif status == 304:
+                    if BibleOrgSysGlobals.verbosityLevel > 1:
+                        print( f"  {BBB} file hasn't changed since it was downloaded" )
                 else:
-                    print( "    contentType", repr(contentType) )
-                    halt # unknown content type
+                    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+                        print( "    contentType", repr(contentType) )
+                    if contentType == 'text/plain; charset=utf-8':
+                        if BibleOrgSysGlobals.verbosityLevel > 0:
+                            print( f"  Downloaded {len(downloadedData):,} bytes from '{zipURL}'" )
+                        with open( USFMfilepath, 'wt' ) as ourUSFMfile:
+                            ourUSFMfile.write( downloadedData.decode( 'utf-8' ) )
+                    else:
+                        print( "    contentType", repr(contentType) )
+                        halt # unknown content type
+                    self.downloadInfo[USFMfilename] = newValidators
+                    saveDownloadInfo( self.adjustedRepoName, self.downloadInfo )
                 if not self.preloadDone:
                     self.preload()
             else:
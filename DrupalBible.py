@@ -74,10 +74,10 @@ Limitations:
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "DrupalBible"
 ProgName = "DrupalBible Bible format handler"
-ProgVersion = '0.13'
+ProgVersion = '0.14'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -95,7 +95,7 @@ filenameEndingsToAccept = ('.BC',) # Must be UPPERCASE
 
 
 
-def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for DrupalBible Bible files or folders in the folder and in the next level down.
 
@@ -111,24 +111,26 @@ def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("DrupalBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("DrupalBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " DrupalBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             if somethingUpperExt in filenameEndingsToAccept:
@@ -140,7 +142,7 @@ def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
     for thisFilename in sorted( foundFiles ):
         if thisFilename.endswith( '.bc' ):
             if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-                firstLine = BibleOrgSysGlobals.peekIntoFile( thisFilename, givenFolderName )
+                firstLine = folderSnapshot.peekIntoFile( thisFilename, givenFolderName )
                 if firstLine is None: continue # seems we couldn't decode the file
                 if ( not firstLine.startswith( '\ufeff*Bible' ) ) and ( not firstLine.startswith( "*Bible" ) ):
                     if BibleOrgSysGlobals.verbosityLevel > 3: print( "DrupalBible (unexpected) first line was {!r} in {}".format( firstLine, thisFilename ) )
@@ -160,15 +162,15 @@ def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("DrupalBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    DrupalBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 if somethingUpperExt in filenameEndingsToAccept:
@@ -178,7 +180,7 @@ def DrupalBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
         for thisFilename in sorted( foundSubfiles ):
             if thisFilename.endswith( '.bc' ):
                 if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-                    firstLine = BibleOrgSysGlobals.peekIntoFile( thisFilename, tryFolderName )
+                    firstLine = folderSnapshot.peekIntoFile( thisFilename, tryFolderName )
                     if firstLine is None: continue # seems we couldn't decode the file
                     if ( not firstLine.startswith( '\ufeff*Bible' ) ) and ( not firstLine.startswith( "*Bible" ) ):
                         if BibleOrgSysGlobals.verbosityLevel > 3: print( "DrupalBible (unexpected) first line was {!r} in {}".format( firstLine, thisFilename ) ); halt
@@ -35,10 +35,10 @@ Creates a semantic dictionary with keys:
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "ESFMBible"
 ProgName = "ESFM Bible handler"
-ProgVersion = '0.61'
+ProgVersion = '0.62'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -90,7 +90,7 @@ def t( messageString ):
 ## end of removeUnwantedTupleExtensions
 
 
-def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for ESFM Bible files or folders in the folder and in the next level down.
 
@@ -108,25 +108,27 @@ def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
         assert givenFolderName and isinstance( givenFolderName, str )
         assert autoLoad in (True,False,) and autoLoadBooks in (True,False)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("ESFMBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("ESFMBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Check that there's a USFM Bible here first
     from USFMBible import USFMBibleFileCheck
-    if not USFMBibleFileCheck( givenFolderName, strictCheck, discountSSF=False ): # no autoloads
+    if not USFMBibleFileCheck( givenFolderName, strictCheck, discountSSF=False, folderSnapshot=folderSnapshot ): # no autoloads
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " ESFMBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS: continue # don't visit these directories
             foundFolders.append( something )
         #elif os.path.isfile( somepath ):
@@ -152,7 +154,7 @@ def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
 
     # See if there's an ESFMBible project here in this given folder
     numFound = 0
-    UFns = USFMFilenames( givenFolderName ) # Assuming they have standard Paratext style filenames
+    UFns = USFMFilenames( givenFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
     if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
     filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
     for BBB,fn in filenameTuples[:]: # Only accept our specific file extensions
@@ -181,7 +183,7 @@ def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("ESFMBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         #if BibleOrgSysGlobals.verbosityLevel > 3: print( "    ESFMBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
@@ -211,7 +213,7 @@ def ESFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
                 #foundSubfiles.append( something )
 
         # See if there's an ESFM Bible here in this folder
-        UFns = USFMFilenames( tryFolderName ) # Assuming they have standard Paratext style filenames
+        UFns = USFMFilenames( tryFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
         if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
         filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
         for BBB,fn in filenameTuples[:]: # Only accept our specific file extensions
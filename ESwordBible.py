@@ -48,10 +48,10 @@ e.g.,
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "e-SwordBible"
 ProgName = "e-Sword Bible format handler"
-ProgVersion = '0.40'
+ProgVersion = '0.42'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -61,6 +61,9 @@ debuggingThisModule = False
 import logging, os, re
 import sqlite3
 import multiprocessing
+from collections import OrderedDict
+from itertools import groupby
+from operator import itemgetter
 
 import BibleOrgSysGlobals
 from Bible import Bible, BibleBook
@@ -89,7 +92,7 @@ def exp( messageString ):
 
 
 
-def ESwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def ESwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for e-Sword Bible files or folders in the folder and in the next level down.
 
@@ -105,24 +108,26 @@ def ESwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("ESwordBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("ESwordBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " ESwordBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             #ignore = False
@@ -156,15 +161,15 @@ def ESwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, aut
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("ESwordBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    ESwordBibleFileCheck: Looking for files in {!r}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 #ignore = False
@@ -938,17 +943,16 @@ class ESwordBible( Bible ):
             #logging.critical( "{} is encrypted: level {}".format( self.sourceFilename, self.suppliedMetadata['e-Sword-Bible']['encryption'] ) )
 
 
-        # Just get some information from the file
-# NOTE: Isn't this a highly inefficient way to find the number of rows in the database???
-        self.cursor.execute( 'select * from Bible' )
-        rows = self.cursor.fetchall()
-        numRows = len(rows)
+        # Get all the verse lines out of the database with one ordered query
+        #   rather than doing a separate query for each verse in the versification
+        self.cursor.execute( 'select count(*) from Bible' )
+        numRows = self.cursor.fetchone()[0]
+        bookVerseDicts = self.getAllBooksVerseDicts()
         if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel>2: print( '{} rows found'.format( numRows ) )
-        BBBn1 = rows[0][0]
+        BBBn1 = next( iter( bookVerseDicts ) ) if bookVerseDicts else 0
         if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel>2: print( 'First book number is {}'.format( BBBn1 ) )
-        del rows
         BBB1 = None
-        if BBBn1 <= 66: BBB1 = BibleOrgSysGlobals.BibleBooksCodes.getBBBFromReferenceNumber( BBBn1 )
+        if 1 <= BBBn1 <= 66: BBB1 = BibleOrgSysGlobals.BibleBooksCodes.getBBBFromReferenceNumber( BBBn1 )
 
 
         testament = BBB = None
@@ -974,16 +978,6 @@ class ESwordBible( Bible ):
         if not BBB:
             logging.critical( "e-Sword settings encoding error -- no testament set: {}".format( self.suppliedMetadata['e-Sword-Bible'] ) )
             loadErrors.append( "e-Sword settings encoding error -- no testament set: {}".format( self.suppliedMetadata['e-Sword-Bible'] ) )
-            #if 0:
-                #self.cursor.execute( 'select * from Bible' )
-                #rows = self.cursor.fetchall()
-                #print( "rows", len(rows) )
-                #for row in rows:
-                    #assert len(row) == 4
-                    #BBBn, C, V, text = row # First three are integers, the last is a string
-                    #print( BBBn, C, V, repr(text) )
-                    #if C==2: break
-                #del rows # Takes a lot of memory
         if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel>2:
             print( "Testament={} BBB={} BBB1={}, bE={}, tLCE={} nR={}".format( testament, BBB, BBB1, booksExpected, textLineCountExpected, numRows ) )
         if BBB1 != BBB:
@@ -995,96 +989,132 @@ class ESwordBible( Bible ):
             loadErrors.append( "Row count for {} seems wrong: {} instead of {}".format( self.sourceFilename, numRows, textLineCountExpected ) )
         #halt
 
-        #BOS = BibleOrganisationalSystem( 'GENERIC-KJV-66-ENG' )
+        bookCount = 0
+        while BBB:
+            nBBB = BibleOrgSysGlobals.BibleBooksCodes.getReferenceNumber( BBB )
+            verseDict = bookVerseDicts.pop( nBBB, {} )
+            thisBook, haveLines, finished = self.__loadBookFromVerseDict( BBB, verseDict, loadErrors )
+            if not finished: break # Probably an encrypted module
+            if haveLines:
+                if BibleOrgSysGlobals.verbosityLevel > 3: print( "  e-Sword saving", BBB, bookCount+1 )
+                self.stashBook( thisBook )
+            #else: print( "Not saving", BBB )
+            bookCount += 1 # Not the number saved but the number we attempted to process
+            if bookCount >= booksExpected: break
+            BBB = self.BibleOrganisationalSystem.getNextBookCode( BBB )
+
+        for BBBn,verseDict in bookVerseDicts.items(): # These books weren't expected by the versification
+            if verseDict:
+                logging.error( "ESwordBible.load: {} contains {} unexpected verse line(s) for book number {}".format( self.name, len(verseDict), BBBn ) )
+                loadErrors.append( "Contains {} unexpected verse line(s) for book number {}".format( len(verseDict), BBBn ) )
+        self.cursor.close()
+        del self.cursor
+        if loadErrors: self.errorDictionary['Load Errors'] = loadErrors
+        self.applySuppliedMetadata( 'e-Sword-Bible' ) # Copy some to self.settingsDict
+        self.doPostLoadProcessing()
+    # end of ESwordBible.load
+
+
+    def __makeVerseDict( self, BBBn, rows ):
+        """
+        Make a dict with (intC,intV) keys and the (possibly None) Scripture lines as values
+            out of the given (Chapter, Verse, Scripture) rows.
+
+        If a C:V occurs more than once, the first one (in rowid order) is kept
+            and the others are logged.
+        """
+        verseDict = {}
+        for C,V,line in rows:
+            CV = (int(C), int(V))
+            if CV in verseDict:
+                logging.error( "ESwordBible.load: {} has duplicate entries for book number {} {}:{} -- ignored {!r}".format( self.name, BBBn, C, V, line ) )
+            else: verseDict[CV] = line
+        return verseDict
+    # end of ESwordBible.__makeVerseDict
+
+
+    def getBookVerseDict( self, BBBn ):
+        """
+        Fetch all the verse lines for the given book number with one ordered SQL query.
+
+        Returns a dict with (intC,intV) keys and the (possibly None) Scripture lines as values.
+        """
+        self.cursor.execute( 'select Chapter, Verse, Scripture from Bible where Book=? order by Chapter, Verse, rowid', (BBBn,) )
+        return self.__makeVerseDict( BBBn, self.cursor.fetchall() )
+    # end of ESwordBible.getBookVerseDict
+
 
-        # Create the first book
+    def getAllBooksVerseDicts( self ):
+        """
+        Fetch all the verse lines for the entire module with one ordered SQL query.
+
+        Returns an ordered dict with the book numbers as keys
+            and the same (intC,intV) verse dicts as getBookVerseDict as values.
+        """
+        bookVerseDicts = OrderedDict()
+        self.cursor.execute( 'select Book, Chapter, Verse, Scripture from Bible order by Book, Chapter, Verse, rowid' )
+        for BBBn, rows in groupby( self.cursor, key=itemgetter(0) ):
+            bookVerseDicts[BBBn] = self.__makeVerseDict( BBBn, (row[1:] for row in rows) )
+        return bookVerseDicts
+    # end of ESwordBible.getAllBooksVerseDicts
+
+
+    def __loadBookFromVerseDict( self, BBB, verseDict, loadErrors ):
+        """
+        Walk the versification for the given book, taking the verse lines out of verseDict
+            (as returned by getBookVerseDict) and feeding them to handleESwordLine.
+
+        Any entries still left in verseDict aren't covered by the versification system
+            and so are logged and appended to loadErrors.
+
+        Returns the book object, a flag saying if we found any lines,
+            and a flag which is False if we had to abort (e.g., for an encrypted module).
+        """
         thisBook = BibleBook( self, BBB )
         thisBook.objectNameString = 'e-Sword Bible Book object'
         thisBook.objectTypeString = 'e-Sword-Bible'
 
         verseList = self.BibleOrganisationalSystem.getNumVersesList( BBB )
-        numC, numV = len(verseList), verseList[0]
-        nBBB = BibleOrgSysGlobals.BibleBooksCodes.getReferenceNumber( BBB )
-        C = V = 1
-
-        bookCount = 0
         ourGlobals = {}
-        continued = ourGlobals['haveParagraph'] = False
+        ourGlobals['haveParagraph'] = False
         haveLines = False
-        while True:
-            self.cursor.execute('select Scripture from Bible where Book=? and Chapter=? and Verse=?', (nBBB,C,V) )
-            try:
-                row = self.cursor.fetchone()
-                line = row[0]
-            except TypeError: # This reference is missing (row is None)
-                #print( "something wrong at", BBB, C, V )
-                #if BibleOrgSysGlobals.debugFlag: halt
-                #print( row )
-                line = None
-            #print ( nBBB, BBB, C, V, 'e-Sw file line is "' + line + '"' )
-            if line is None: logging.warning( "ESwordBible.load: Have missing verse line at {} {}:{}".format( BBB, C, V ) )
-            else: # line is not None
-                if not isinstance( line, str ):
-                    if 'encryption' in self.suppliedMetadata['e-Sword-Bible']:
-                        logging.critical( "ESwordBible.load: Unable to decrypt verse line at {} {}:{} {!r}".format( BBB, C, V, line ) )
-                        break
+        for C,numV in enumerate( verseList, start=1 ):
+            for V in range( 1, numV+1 ):
+                line = verseDict.pop( (C,V), None )
+                #print ( BBB, C, V, 'e-Sw file line is "' + line + '"' )
+                if line is None: logging.warning( "ESwordBible.load: Have missing verse line at {} {}:{}".format( BBB, C, V ) )
+                else: # line is not None
+                    if not isinstance( line, str ):
+                        if 'encryption' in self.suppliedMetadata['e-Sword-Bible']:
+                            logging.critical( "ESwordBible.load: Unable to decrypt verse line at {} {}:{} {!r}".format( BBB, C, V, line ) )
+                        else:
+                            logging.critical( "ESwordBible.load: Probably encrypted module: Unable to decode verse line at {} {}:{} {!r} {}".format( BBB, C, V, line, self.suppliedMetadata['e-Sword-Bible'] ) )
+                        return thisBook, haveLines, False
+                    elif not line: logging.warning( "ESwordBible.load: Found blank verse line at {} {}:{}".format( BBB, C, V ) )
                     else:
-                        logging.critical( "ESwordBible.load: Probably encrypted module: Unable to decode verse line at {} {}:{} {!r} {}".format( BBB, C, V, line, self.suppliedMetadata['e-Sword-Bible'] ) )
-                        break
-                elif not line: logging.warning( "ESwordBible.load: Found blank verse line at {} {}:{}".format( BBB, C, V ) )
-                else:
-                    haveLines = True
+                        haveLines = True
 
-                    # Some modules end lines with \r\n or have it in the middle!
-                    #   (We just ignore these for now)
-                    if '\r' in line or '\n' in line:
-                        if BibleOrgSysGlobals.debugFlag:
-                            logging.warning( "ESwordBible.load: Found CR or LF characters in verse line at {} {}:{}".format( BBB, C, V ) )
-                        #print( repr(line) )
-                    while line and line[-1] in '\r\n': line = line[:-1] # Remove CR/LFs from the end
-                    line = line.replace( '\r\n', ' ' ).replace( '\r', ' ' ).replace( '\n', ' ' ) # Replace CR/LFs in the middle
-
-            #print( "e-Sword.load", BBB, C, V, repr(line) )
-            handleESwordLine( self, self.name, BBB, C, V, line, thisBook, ourGlobals )
-            V += 1
-            if V > numV:
-                C += 1
-                if C > numC: # Save this book now
-                    if haveLines:
-                        if BibleOrgSysGlobals.verbosityLevel > 3: print( "  e-Sword saving", BBB, bookCount+1 )
-                        self.stashBook( thisBook )
-                    #else: print( "Not saving", BBB )
-                    bookCount += 1 # Not the number saved but the number we attempted to process
-                    if bookCount >= booksExpected: break
-                    BBB = self.BibleOrganisationalSystem.getNextBookCode( BBB )
-                    # Create the next book
-                    thisBook = BibleBook( self, BBB )
-                    thisBook.objectNameString = 'e-Sword Bible Book object'
-                    thisBook.objectTypeString = 'e-Sword-Bible'
-                    haveLines = False
-
-                    verseList = self.BibleOrganisationalSystem.getNumVersesList( BBB )
-                    numC, numV = len(verseList), verseList[0]
-                    nBBB = BibleOrgSysGlobals.BibleBooksCodes.getReferenceNumber( BBB )
-                    C = V = 1
-                    #thisBook.addLine( 'c', str(C) )
-                else: # next chapter only
-                    #thisBook.addLine( 'c', str(C) )
-                    numV = verseList[C-1]
-                    V = 1
-
-            if ourGlobals['haveParagraph']:
-                thisBook.addLine( 'p', '' )
-                ourGlobals['haveParagraph'] = False
-
-        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag:
-            self.checkForExtraMaterial( self.cursor, self.BibleOrganisationalSystem )
-        self.cursor.close()
-        del self.cursor
-        if loadErrors: self.errorDictionary['Load Errors'] = loadErrors
-        self.applySuppliedMetadata( 'e-Sword-Bible' ) # Copy some to self.settingsDict
-        self.doPostLoadProcessing()
-    # end of ESwordBible.load
+                        # Some modules end lines with \r\n or have it in the middle!
+                        #   (We just ignore these for now)
+                        if '\r' in line or '\n' in line:
+                            if BibleOrgSysGlobals.debugFlag:
+                                logging.warning( "ESwordBible.load: Found CR or LF characters in verse line at {} {}:{}".format( BBB, C, V ) )
+                            #print( repr(line) )
+                        while line and line[-1] in '\r\n': line = line[:-1] # Remove CR/LFs from the end
+                        line = line.replace( '\r\n', ' ' ).replace( '\r', ' ' ).replace( '\n', ' ' ) # Replace CR/LFs in the middle
+
+                #print( "e-Sword.load", BBB, C, V, repr(line) )
+                handleESwordLine( self, self.name, BBB, C, V, line, thisBook, ourGlobals )
+
+                if ourGlobals['haveParagraph']:
+                    thisBook.addLine( 'p', '' )
+                    ourGlobals['haveParagraph'] = False
+
+        for (C,V),line in verseDict.items(): # Anything left over isn't in our versification system
+            logging.error( "ESwordBible.load: {} contains {} {}:{} {!r} which is outside the versification system".format( self.name, BBB, C, V, line ) )
+            loadErrors.append( "{} {}:{} is outside the versification system".format( BBB, C, V ) )
+        return thisBook, haveLines, True
+    # end of ESwordBible.__loadBookFromVerseDict
 
 
     def loadBook( self, BBB ):
@@ -1105,71 +1135,15 @@ class ESwordBible( Bible ):
         if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading {} from {}…").format( BBB, self.sourceFilepath ) )
         loadErrors = []
 
-        # Create the book
-        thisBook = BibleBook( self, BBB )
-        thisBook.objectNameString = 'e-Sword Bible Book object'
-        thisBook.objectTypeString = 'e-Sword-Bible'
-
-        verseList = self.BibleOrganisationalSystem.getNumVersesList( BBB )
-        numC, numV = len(verseList), verseList[0]
         nBBB = BibleOrgSysGlobals.BibleBooksCodes.getReferenceNumber( BBB )
-        C = V = 1
-
-        ourGlobals = {}
-        continued = ourGlobals['haveParagraph'] = False
-        haveLines = False
-        while True:
-            self.cursor.execute('select Scripture from Bible where Book=? and Chapter=? and Verse=?', (nBBB,C,V) )
-            try:
-                row = self.cursor.fetchone()
-                line = row[0]
-            except TypeError: # This reference is missing (row is None)
-                #print( "something wrong at", BBB, C, V )
-                #if BibleOrgSysGlobals.debugFlag: halt
-                #print( row )
-                line = None
-            #print ( nBBB, BBB, C, V, 'e-Sw file line is "' + line + '"' )
-            if line is None: logging.warning( "ESwordBible.load: Have missing verse line at {} {}:{}".format( BBB, C, V ) )
-            else: # line is not None
-                if not isinstance( line, str ):
-                    if 'encryption' in self.suppliedMetadata['e-Sword-Bible']:
-                        logging.critical( "ESwordBible.load: Unable to decrypt verse line at {} {}:{} {!r}".format( BBB, C, V, line ) )
-                        break
-                    else:
-                        logging.critical( "ESwordBible.load: Probably encrypted module: Unable to decode verse line at {} {}:{} {!r} {}".format( BBB, C, V, line, self.suppliedMetadata['e-Sword-Bible'] ) )
-                        break
-                elif not line: logging.warning( "ESwordBible.load: Found blank verse line at {} {}:{}".format( BBB, C, V ) )
-                else:
-                    haveLines = True
-
-                    # Some modules end lines with \r\n or have it in the middle!
-                    #   (We just ignore these for now)
-                    if '\r' in line or '\n' in line:
-                        if BibleOrgSysGlobals.debugFlag:
-                            logging.warning( "ESwordBible.load: Found CR or LF characters in verse line at {} {}:{}".format( BBB, C, V ) )
-                        #print( repr(line) )
-                    while line and line[-1] in '\r\n': line = line[:-1] # Remove CR/LFs from the end
-                    line = line.replace( '\r\n', ' ' ).replace( '\r', ' ' ).replace( '\n', ' ' ) # Replace CR/LFs in the middle
-
-            #print( "e-Sword.load", BBB, C, V, repr(line) )
-            handleESwordLine( self, self.name, BBB, C, V, line, thisBook, ourGlobals )
-            V += 1
-            if V > numV:
-                C += 1
-                if C <= numC: # next chapter only
-                    #thisBook.addLine( 'c', str(C) )
-                    numV = verseList[C-1]
-                    V = 1
-                else: # Save this book now
-                    if haveLines:
-                        if BibleOrgSysGlobals.verbosityLevel > 3: print( "  ESwordBible saving", BBB )
-                        self.stashBook( thisBook )
-                    #else: print( "Not saving", BBB )
-                    break
-
-            if ourGlobals['haveParagraph']:
-                thisBook.addLine( 'p', '' )
-                ourGlobals['haveParagraph'] = False
+        thisBook, haveLines, finished = self.__loadBookFromVerseDict( BBB, self.getBookVerseDict( nBBB ), loadErrors )
+        if finished and haveLines:
+            if BibleOrgSysGlobals.verbosityLevel > 3: print( "  ESwordBible saving", BBB )
+            self.stashBook( thisBook )
+        #else: print( "Not saving", BBB )
+        if loadErrors:
+            if 'Load Errors' not in self.errorDictionary: self.errorDictionary['Load Errors'] = []
+            self.errorDictionary['Load Errors'].extend( loadErrors )
     # end of ESwordBible.loadBook
 # end of ESwordBible class
 
@@ -27,10 +27,10 @@
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-03-17' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "GenericOnlineBible"
 ProgName = "Generic online Bible handler"
-ProgVersion = '0.02'
+ProgVersion = '0.03'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -45,7 +45,7 @@ from collections import OrderedDict
 import BibleOrgSysGlobals
 
 
-MAX_CACHED_VERSES = 100 # Per Bible version in use
+MAX_CACHED_VERSES = 1000 # Per Bible version in use (enough for several whole chapters)
 
 
 
@@ -143,6 +143,8 @@ class GenericOnlineBible:
     def cacheVerse( self, key, verseData ):
         """
         Given a BCV key, add the data to the cache.
+
+        The least recently used verses are discarded once there's more than MAX_CACHED_VERSES.
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             print( f"GenericOnlineBible.cacheVerse( {key}, {verseData} )" )
@@ -156,6 +158,8 @@ class GenericOnlineBible:
 
         # Not found in the cache
         self.cache[str(key)] = verseData
+        while len(self.cache) > MAX_CACHED_VERSES:
+            self.cache.popitem( last=False ) # Discard the least recently used one
     # end of GenericOnlineBible.cacheVerse
 
 
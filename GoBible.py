@@ -31,10 +31,10 @@ and https://github.com/DavidHaslam/GoBibleCore.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-14' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "GoBible"
 ProgName = "Go Bible format handler"
-ProgVersion = '0.04'
+ProgVersion = '0.05'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -54,7 +54,7 @@ from BibleOrganisationalSystems import BibleOrganisationalSystem
 GOBIBLE_FILENAME_END = '.jar'
 
 
-def GoBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def GoBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for GoBible files or folders in the folder and in the next level down.
     Or if given a zip filename, check that.
@@ -72,8 +72,10 @@ def GoBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadB
     if BibleOrgSysGlobals.debugFlag: assert givenPathname and isinstance( givenPathname, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given path is readable
-    if not os.access( givenPathname, os.R_OK ):
+    if not folderSnapshot.access( givenPathname, os.R_OK ):
         logging.critical( _("GoBibleFileCheck: Given {!r} path is unreadable").format( givenPathname ) )
         return False
 
@@ -87,20 +89,20 @@ def GoBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadB
 
     # Must have been given a folder
     givenFolderName = givenPathname
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("GoBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " GoBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             #somethingUpper = something.upper()
             if something.endswith( GOBIBLE_FILENAME_END ):
                 foundFiles.append( something )
@@ -122,15 +124,15 @@ def GoBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadB
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("GoBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    GoBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 #somethingUpper = something.upper()
                 if something.endswith( GOBIBLE_FILENAME_END ):
                     foundSubfiles.append( something )
@@ -24,14 +24,18 @@
 
 """
 Module handling ISO_639_3_Languages.
+
+Language names are searched using a prebuilt index
+    (saved as iso_639_3_Languages_NameIndex.pickle alongside the tables pickle)
+    which allows fast prefix and substring matching, ignoring case and accents.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "ISOLanguages"
 ProgName = "ISO 639_3_Languages handler"
-ProgVersion = '0.85'
+ProgVersion = '0.86'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -39,11 +43,66 @@ debuggingThisModule = False
 
 
 import os
+import unicodedata, heapq
+from bisect import bisect_left
 
 from singleton import singleton
 import BibleOrgSysGlobals
 
 
+NAME_INDEX_VERSION = 1 # Increment this if the structure of the name index changes
+NAME_INDEX_NGRAM_LENGTH = 3 # All n-grams up to this length are indexed
+NAME_WORD_BREAK_CHARS = ' ,-()/' # Any character following one of these starts a new word
+
+
+
+def normaliseLanguageName( name ):
+    """
+    Returns an UPPERCASE version of the name with any accents (combining characters) removed
+        (so that searching is case and accent insensitive).
+    """
+    return ''.join( char for char in unicodedata.normalize( 'NFKD', name ) if not unicodedata.combining( char ) ).upper()
+# end of normaliseLanguageName
+
+
+def makeNameSearchIndex( NameDict ):
+    """
+    Given the dictionary of UPPERCASE names (as made by the ISO_639_3_LanguagesConverter),
+        makes and returns a dictionary containing:
+            'UCNames': a tuple of the UPPERCASE names (indexed by name number)
+            'normalisedNames': a tuple of the normalised names (in the same order)
+            'prefixKeys' and 'prefixNameNumbers': sorted tuples of the normalised names
+                and the normalised words (with the rest of the name) inside them,
+                and the corresponding name numbers (for finding prefixes with a binary search)
+            'prefixIsWordFlags': a tuple of the same length (True if the key starts at a later word)
+            'nameSortOrder': a tuple giving the position of each name when sorted by length (then alphabetically)
+            'ngramPostings': a dictionary of n-grams (up to NAME_INDEX_NGRAM_LENGTH characters)
+                mapped to tuples of the numbers of the names which contain them
+    """
+    UCNames = tuple( NameDict )
+    normalisedNames = tuple( normaliseLanguageName( UCName ) for UCName in UCNames )
+    prefixEntries, ngramPostings = [], {}
+    for nameNumber,normalisedName in enumerate( normalisedNames ):
+        prefixEntries.append( (normalisedName, nameNumber, False) )
+        for ix in range( 1, len(normalisedName) ):
+            if normalisedName[ix-1] in NAME_WORD_BREAK_CHARS and normalisedName[ix] not in NAME_WORD_BREAK_CHARS:
+                prefixEntries.append( (normalisedName[ix:], nameNumber, True) )
+        for ngram in { normalisedName[ix:ix+n] for n in range( 1, NAME_INDEX_NGRAM_LENGTH+1 ) for ix in range( len(normalisedName)-n+1 ) }:
+            ngramPostings.setdefault( ngram, [] ).append( nameNumber )
+    prefixEntries.sort()
+    nameSortOrder = [0] * len(normalisedNames)
+    for position,nameNumber in enumerate( sorted( range( len(normalisedNames) ), key=lambda nameNumber: (len(normalisedNames[nameNumber]), normalisedNames[nameNumber]) ) ):
+        nameSortOrder[nameNumber] = position
+    return { 'version':NAME_INDEX_VERSION, 'UCNames':UCNames, 'normalisedNames':normalisedNames,
+            'prefixKeys':tuple( entry[0] for entry in prefixEntries ),
+            'prefixNameNumbers':tuple( entry[1] for entry in prefixEntries ),
+            'prefixIsWordFlags':tuple( entry[2] for entry in prefixEntries ),
+            'nameSortOrder':tuple( nameSortOrder ),
+            'ngramPostings':{ ngram:tuple(nameNumbers) for ngram,nameNumbers in ngramPostings.items() } }
+# end of makeNameSearchIndex
+
+
+
 @singleton # Can only ever have one instance
 class ISO_639_3_Languages:
     """
@@ -59,6 +118,8 @@ class ISO_639_3_Languages:
         Constructor:
         """
         self.__IDDict, self.__NameDict = None, None # We'll import into this in loadData
+        self.__NameIndex = None # Loaded (or made) in loadData
+        self.__IndexedNames = None # The mixed case names in the same order as in the name index
     # end of ISO_639_3_Languages.__init__
 
     def __str__( self ):
@@ -81,6 +142,7 @@ class ISO_639_3_Languages:
             dataFilepath = os.path.join( os.path.dirname(__file__), "DataFiles/" )
             standardXMLFilepath = os.path.join( dataFilepath, "iso_639_3.xml" )
             standardPickleFilepath = os.path.join( dataFilepath, "DerivedFiles", "iso_639_3_Languages_Tables.pickle" )
+            standardIndexPickleFilepath = os.path.join( dataFilepath, "DerivedFiles", "iso_639_3_Languages_NameIndex.pickle" )
             if XMLFilepath is None \
             and os.access( standardPickleFilepath, os.R_OK ) \
             and os.stat(standardPickleFilepath).st_mtime > os.stat(standardXMLFilepath).st_mtime \
@@ -89,12 +151,22 @@ class ISO_639_3_Languages:
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
                     self.__IDDict, self.__NameDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                if os.access( standardIndexPickleFilepath, os.R_OK ) \
+                and os.stat(standardIndexPickleFilepath).st_mtime > os.stat(standardXMLFilepath).st_mtime: # There's a newer index pickle file
+                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardIndexPickleFilepath ) )
+                    with open( standardIndexPickleFilepath, 'rb') as pickleFile:
+                        self.__NameIndex = pickle.load( pickleFile )
+                    if self.__NameIndex.get( 'version' ) != NAME_INDEX_VERSION \
+                    or self.__NameIndex['UCNames'] != tuple( self.__NameDict ): self.__NameIndex = None # Out of date
             else: # We have to load the XML
                 from ISO_639_3_LanguagesConverter import ISO_639_3_LanguagesConverter
                 self._lgC = ISO_639_3_LanguagesConverter()
                 self._lgC.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
                 self.__IDDict, self.__NameDict = self._lgC.importDataToPython() # Get the various dictionaries organised for quick lookup
                 del self._lgC # Now the converter class (that handles the XML) is no longer needed
+            if self.__NameIndex is None: # Couldn't load it so make it now (only takes a moment)
+                self.__NameIndex = makeNameSearchIndex( self.__NameDict )
+            self.__IndexedNames = tuple( self.__IDDict[self.__NameDict[UCName]][0] for UCName in self.__NameIndex['UCNames'] )
         return self
     # end of ISO_639_3_Languages.loadData
 
@@ -141,17 +213,64 @@ class ISO_639_3_Languages:
         UCName = name.upper() # Convert to UPPERCASE for searching
         if UCName in self.__NameDict: return self.__NameDict[UCName]
 
-    def getNameMatches( self, namePortion ):
-        """ Return a list of matching names for the given part of a name.
-            This is slow because it is a brute-force search.
+    def getNameMatches( self, namePortion, prefixOnly=False, maxResults=None ):
+        """ Return a list of matching (mixed case) names for the given part of a name
+                (ignoring case and accents).
+
+            The results are ranked: an exact match first,
+                then names which start with namePortion,
+                then names containing a word which starts with namePortion,
+                then (unless prefixOnly is set) names which contain namePortion elsewhere.
+            Within each rank, shorter names come first.
+
+            If maxResults is given, no more than that number of names are returned.
+
+            An empty namePortion matches every name (shortest first).
         """
-        UCNamePortion = namePortion.upper()
-        results = []
-        for UCName in self.__NameDict:
-            if UCNamePortion in UCName:
-                ccc = self.__NameDict[UCName]
-                results.append( self.__IDDict[ccc][0] ) # Get the mixed case language name
-        return results
+        normalisedPortion = normaliseLanguageName( namePortion )
+        normalisedNames, nameSortOrder = self.__NameIndex['normalisedNames'], self.__NameIndex['nameSortOrder']
+        numNames = len(normalisedNames)
+        if not normalisedPortion: # Every name contains (and starts with) an empty string
+            sortedNameNumbers = sorted( range(numNames), key=nameSortOrder.__getitem__ )[:maxResults]
+            return [self.__IndexedNames[nameNumber] for nameNumber in sortedNameNumbers]
+
+        sortKeys = {} # name number -> rank * numNames + position in nameSortOrder
+        prefixKeys = self.__NameIndex['prefixKeys']
+        ix = bisect_left( prefixKeys, normalisedPortion )
+        while ix < len(prefixKeys) and prefixKeys[ix].startswith( normalisedPortion ):
+            nameNumber = self.__NameIndex['prefixNameNumbers'][ix]
+            if self.__NameIndex['prefixIsWordFlags'][ix]: rank = 2
+            else: rank = 0 if prefixKeys[ix] == normalisedPortion else 1
+            sortKey = rank * numNames + nameSortOrder[nameNumber]
+            if sortKey < sortKeys.get( nameNumber, numNames * 3 ): sortKeys[nameNumber] = sortKey
+            ix += 1
+
+        if not prefixOnly:
+            substringKeyBase = 3 * numNames
+            ngramPostings = self.__NameIndex['ngramPostings']
+            if len(normalisedPortion) <= NAME_INDEX_NGRAM_LENGTH: # The postings give us the exact answer
+                for nameNumber in ngramPostings.get( normalisedPortion, () ):
+                    if nameNumber not in sortKeys: sortKeys[nameNumber] = substringKeyBase + nameSortOrder[nameNumber]
+            else: # Only need to check names which contain all of our n-grams
+                postingsLists = []
+                for ix in range( len(normalisedPortion)-NAME_INDEX_NGRAM_LENGTH+1 ):
+                    postings = ngramPostings.get( normalisedPortion[ix:ix+NAME_INDEX_NGRAM_LENGTH] )
+                    if not postings: break # Can't be any matches
+                    postingsLists.append( postings )
+                else:
+                    postingsLists.sort( key=len )
+                    candidates = set( postingsLists[0] )
+                    for postings in postingsLists[1:]:
+                        candidates.intersection_update( postings )
+                        if not candidates: break
+                    for nameNumber in candidates:
+                        if nameNumber not in sortKeys and normalisedPortion in normalisedNames[nameNumber]:
+                            sortKeys[nameNumber] = substringKeyBase + nameSortOrder[nameNumber]
+
+        if maxResults is None: sortedNameNumbers = sorted( sortKeys, key=sortKeys.__getitem__ )
+        else: sortedNameNumbers = heapq.nsmallest( maxResults, sortKeys, key=sortKeys.__getitem__ )
+        return [self.__IndexedNames[nameNumber] for nameNumber in sortedNameNumbers] # Get the mixed case language names
+    # end of ISO_639_3_Languages.getNameMatches
 # end of ISO_639_3_Languages class
 
 
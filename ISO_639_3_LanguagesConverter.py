@@ -28,10 +28,10 @@ Module handling ISO_639_3_Languages.xml and to export to JSON, C, and Python dat
 
 from gettext import gettext as _
 
-LastModifiedDate = '2016-04-23' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "ISOLanguagesConverter"
 ProgName = "ISO 639_3_Languages handler"
-ProgVersion = "0.84"
+ProgVersion = "0.85"
 ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
 
 
@@ -214,6 +214,8 @@ class ISO_639_3_LanguagesConverter:
     def pickle( self, filepath=None ):
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
+
+        Also writes the name search index to a second .pickle file in the same folder.
         """
         import pickle
 
@@ -228,6 +230,12 @@ class ISO_639_3_LanguagesConverter:
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
             pickle.dump( self.__DataDicts, myFile )
+
+        from ISO_639_3_Languages import makeNameSearchIndex
+        indexFilepath = os.path.join( os.path.dirname( filepath ), self._filenameBase + "_Languages_NameIndex.pickle" )
+        if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( indexFilepath ) )
+        with open( indexFilepath, 'wb' ) as myFile:
+            pickle.dump( makeNameSearchIndex( self.__DataDicts[1] ), myFile )
     # end of pickle
 
     def exportDataToPython( self, filepath=None ):
@@ -56,10 +56,10 @@ The calling class then fills
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-24' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "InternalBible"
 ProgName = "Internal Bible handler"
-ProgVersion = '0.83'
+ProgVersion = '0.87'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -74,6 +74,7 @@ import BibleOrgSysGlobals
 from InternalBibleInternals import InternalBibleEntryList, BOS_EXTRA_TYPES, BOS_EXTRA_MARKERS
 from InternalBibleBook import BCV_VERSION
 from VerseReferences import SimpleVerseKey
+from InternalBibleSearchIndex import InternalBibleSearchIndex, loadSearchIndex
 
 
 OT39_BOOKLIST = ( 'GEN', 'EXO', 'LEV', 'NUM', 'DEU', 'JOS', 'JDG', 'RUT', 'SA1', 'SA2', 'KI1', 'KI2', 'CH1', 'CH2', \
@@ -88,6 +89,20 @@ assert len(NT27_BOOKLIST) == 27
 
 InternalBibleProperties = {} # Used for diagnostic reasons
 
+
+_forkedCheckBible = None # The Bible being checked (inherited by forked worker processes)
+
+def _checkForkedBookMP( parameters ):
+    """
+    Only used in InternalBible.check for multiprocessing when the worker processes are forked.
+
+    The workers inherit the already loaded Bible object
+        so only the book code (and added units data and check names) are sent for each task.
+    """
+    return _forkedCheckBible._checkBookMP( parameters )
+# end of _checkForkedBookMP
+
+
 class InternalBible:
     """
     Class to define and manipulate InternalBibles.
@@ -122,6 +137,7 @@ class InternalBible:
         self.divisions = OrderedDict()
         self.errorDictionary = OrderedDict()
         self.errorDictionary['Priority Errors'] = [] # Put this one first in the ordered dictionary
+        self.__searchIndex = None # Made when first needed by findText
     # end of InternalBible.__init__
 
 
@@ -884,6 +900,7 @@ class InternalBible:
                 logging.critical( _("stashBook: stashing already stashed {} book!").format( BBB ) )
         self.books[BBB] = bookData
         self.availableBBBs.add( BBB )
+        self.__searchIndex = None # It will need to be remade
 
         # Make up our book name dictionaries while we're at it
         assumedBookNames = bookData.getAssumedBookNames()
@@ -1165,6 +1182,9 @@ class InternalBible:
                 if BibleOrgSysGlobals.verbosityLevel > 3: print( "  " + _("Prechecking {}…").format( BBB ) )
                 self.discoveryResults[BBB] = self.books[BBB]._discover()
 
+        for BBB,bookObject in self.books.items(): # Remember the results for books that are cached
+            bookObject.saveDiscoveryResultsToCache( self.discoveryResults[BBB] )
+
         if self.objectTypeString == 'PTX8':
             self.discoverPTX8()
 
@@ -1363,7 +1383,7 @@ class InternalBible:
     # end of InternalBible.__aggregateDiscoveryResults
 
 
-    def check( self, givenBookList=None ):
+    def check( self, givenBookList=None, checkNames=None ):
         """
         Runs self.discover() first if necessary.
 
@@ -1371,6 +1391,7 @@ class InternalBible:
             and then a number of overall checks on the entire Bible.
 
         If a book list is given, only checks those books.
+        If a list of check names (from InternalBibleBook.BOOK_CHECK_NAMES) is given, only runs those book checks.
 
         getErrors() must be called to request the results.
         """
@@ -1395,15 +1416,77 @@ class InternalBible:
         if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Running checks on {}…").format( self.name ) )
         if givenBookList is None:
             givenBookList = self.books # this is an OrderedDict
-        for BBB in givenBookList: # Do individual book checks
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "  " + _("Checking {}…").format( BBB ) )
-            self.books[BBB].check( self.discoveryResults['ALL'], typicalAddedUnitData )
+        givenBookList = [BBB for BBB in givenBookList]
+        # NOTE: We can't pickle sqlite3.Cursor or Sword library objects, so if we can't fork (to inherit the loaded Bible),
+        #           we can not use multiprocessing here for e-Sword Bibles or commentaries, etc.
+        canFork = multiprocessing.get_start_method() == 'fork'
+        if (canFork or self.objectTypeString not in ('CrosswireSword','e-Sword-Bible','e-Sword-Commentary','MyBible')) \
+        and len(givenBookList) > 1 and BibleOrgSysGlobals.maxProcesses > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing: # Check all the books as quickly as possible
+            if BibleOrgSysGlobals.verbosityLevel > 1:
+                print( _("Checking {} books using {} processes…").format( len(givenBookList), BibleOrgSysGlobals.maxProcesses ) )
+                print( "  NOTE: Outputs (including error and warning messages) from checking various books may be interspersed." )
+            droppedCursor = self._dropSQLiteCursor() # Each worker reopens the database if it needs it
+            checkTasks = [(BBB, typicalAddedUnitData, checkNames) for BBB in givenBookList]
+            BibleOrgSysGlobals.alreadyMultiprocessing = True
+            if canFork: # The worker processes inherit this (already loaded) Bible so we only need to send book codes
+                global _forkedCheckBible
+                _forkedCheckBible = self
+                checkFunction = _checkForkedBookMP
+            else: checkFunction = self._checkBookMP # The Bible object has to be pickled
+            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+                results = pool.map( checkFunction, checkTasks ) # have the pool do our checks
+                assert len(results) == len(givenBookList)
+                for BBB,errorDictionary in zip( givenBookList, results ):
+                    self.books[BBB].errorDictionary = errorDictionary # Merge the worker's results back in
+            _forkedCheckBible = None
+            BibleOrgSysGlobals.alreadyMultiprocessing = False
+            if droppedCursor: self.preload() # Reopen our database
+        else: # Just single threaded
+            for BBB in givenBookList: # Do individual book checks
+                if BibleOrgSysGlobals.verbosityLevel > 2: print( "  " + _("Checking {}…").format( BBB ) )
+                self.books[BBB].check( self.discoveryResults['ALL'], typicalAddedUnitData, checkNames )
 
         # Do overall Bible checks here
         # xxxxxxxxxxxxxxxxx …
     # end of InternalBible.check
 
 
+    def _checkBookMP( self, parameters ):
+        """
+        Only used in check for multiprocessing.
+
+        Checks the given book in this worker process
+            and returns the book's error dictionary (so it can be merged back into the parent's book).
+        """
+        BBB, typicalAddedUnitData, checkNames = parameters
+        if 'preloaded' in self.__dict__ and not self.preloaded: # Our SQLite cursor was dropped
+            self.preload() # so reopen the database in this worker
+        self.books[BBB].check( self.discoveryResults['ALL'], typicalAddedUnitData, checkNames )
+        return self.books[BBB].errorDictionary
+    # end of InternalBible._checkBookMP
+
+
+    def _dropSQLiteCursor( self ):
+        """
+        SQLite cursors (and connections) can't be pickled or safely shared with forked processes,
+            so close and remove any that we have before doing multiprocessing.
+
+        (Bibles that support preloading will then preload again if necessary.)
+
+        Returns True if a cursor was dropped.
+        """
+        if 'cursor' in self.__dict__:
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "InternalBible: Dropping SQLite cursor for {} before multiprocessing".format( self.getAName() ) )
+            try: self.cursor.close()
+            except Exception as err: logging.warning( "InternalBible: Unable to close cursor: {}".format( err ) )
+            del self.cursor
+            if 'preloaded' in self.__dict__: self.preloaded = False
+            return True
+        return False
+    # end of InternalBible._dropSQLiteCursor
+
+
     def doExtensiveChecks( self, givenOutputFolderName=None, ntFinished=None, otFinished=None, dcFinished=None, allFinished=None ):
         """
         If the output folder is specified, it is expected that it's already created.
@@ -2196,6 +2279,45 @@ class InternalBible:
     # end of InternalBible.getVerseText
 
 
+    def getSearchIndexFilepath( self ):
+        """
+        Returns the filepath where the search index should be saved (and loaded from)
+            or None if it shouldn't be saved.
+
+        This base class returns None, but e.g., PickledBible can override this.
+        """
+        return None
+    # end of InternalBible.getSearchIndexFilepath
+
+
+    def getSearchIndex( self ):
+        """
+        Returns the InternalBibleSearchIndex for the loaded books,
+            loading or making it first if necessary.
+        """
+        if self.__searchIndex is None or not self.__searchIndex.isCurrent( self ):
+            self.__searchIndex = None
+            searchIndexFilepath = self.getSearchIndexFilepath()
+            if searchIndexFilepath and os.path.isfile( searchIndexFilepath ):
+                searchIndex = loadSearchIndex( searchIndexFilepath )
+                if searchIndex is not None and searchIndex.isCurrent( self, checkContents=True ):
+                    self.__searchIndex = searchIndex
+            if self.__searchIndex is None:
+                self.__searchIndex = InternalBibleSearchIndex()
+                self.__searchIndex.makeIndex( self )
+                self.__searchIndex.filepath = searchIndexFilepath # So it's saved after the tokens are indexed
+        return self.__searchIndex
+    # end of InternalBible.getSearchIndex
+
+
+    def clearSearchIndex( self ):
+        """
+        Discard the search index, e.g., after editing the text of a book.
+        """
+        self.__searchIndex = None
+    # end of InternalBible.clearSearchIndex
+
+
     def findText( self, optionsDict ):
         """
         Search the internal Bible for the given text which is contained in a dictionary of options.
@@ -2217,6 +2339,11 @@ class InternalBible:
             SimpleVerseKey, marker (none if v~), contextBefore, foundWordForm, contextAfter
 
         NOTE: ignoreDiacriticsFlag uses BibleOrgSysGlobals.removeAccents() which might not be general enough for all languages.
+
+        If useSearchIndexFlag is set, the (inverted) search index is used to find the lines to be searched.
+            This takes some time and memory to make for the first search
+                but makes following searches (e.g., search-as-you-type) much faster.
+            The results are identical either way. (The index isn't used for regex searches.)
         """
         if BibleOrgSysGlobals.debugFlag:
             if debuggingThisModule:
@@ -2227,7 +2354,7 @@ class InternalBible:
                 'findText', 'findHistoryList', 'wordMode', 'caselessFlag', 'ignoreDiacriticsFlag',
                 'includeIntroFlag', 'includeMainTextFlag', 'includeMarkerTextFlag', 'includeExtrasFlag',
                 'contextLength', 'bookList', 'chapterList', 'markerList', 'regexFlag',
-                'currentBCV', )
+                'currentBCV', 'useSearchIndexFlag', )
         for someKey in optionsDict:
             if someKey not in optionsList:
                 print( "findText warning: unexpected {!r} option = {!r}".format( someKey, optionsDict[someKey] ) )
@@ -2247,6 +2374,7 @@ class InternalBible:
         if 'bookList' not in optionsDict: optionsDict['bookList'] = 'ALL' # or BBB or a list
         if 'chapterList' not in optionsDict: optionsDict['chapterList'] = None
         if 'markerList' not in optionsDict: optionsDict['markerList'] = None
+        if 'useSearchIndexFlag' not in optionsDict: optionsDict['useSearchIndexFlag'] = False
         optionsDict['regexFlag'] = False
 
         if BibleOrgSysGlobals.debugFlag:
@@ -2286,14 +2414,117 @@ class InternalBible:
         # Now do the actual search
         resultSummaryDict = { 'searchedBookList':[], 'foundBookList':[], }
         resultList = [] # Contains 4-tuples or 5-tuples -- first entry is the SimpleVerseKey
+
+        def searchLine( BBB, C, V, marker, lastParagraphMarker, lineEntry ):
+            """
+            Search the given line (with the given C:V reference) and append any results to resultList.
+            """
+            cleanText = lineEntry.getCleanText()
+            if ourMarkerList:
+                if marker not in ourMarkerList and not (marker in ('v~','p~') and lastParagraphMarker in ourMarkerList):
+                    return
+            elif C=='-1' and not optionsDict['includeIntroFlag']: return
+            #print( "Searching in {} {}:{} {} = {}".format( BBB, C, V, marker, cleanText ) )
+
+            if optionsDict['chapterList'] is None \
+            or C in optionsDict['chapterList'] \
+            or int(C) in optionsDict['chapterList']:
+                #if optionsDict['chapterList'] and V=='0':
+                    #print( _("  findText: will search {} chapter {}").format( BBB, C ) )
+
+                # Get our text to search
+                origTextToBeSearched = lineEntry.getFullText() if optionsDict['includeExtrasFlag'] else cleanText
+                if C != '0' and not optionsDict['includeMainTextFlag']:
+                    #print( "Got {!r} but  don't include main text".format( origTextToBeSearched ) )
+                    if marker in ('v~','p~') or marker in BibleOrgSysGlobals.USFMParagraphMarkers:
+                        origTextToBeSearched = ''
+                        if origTextToBeSearched != cleanText: # we must have extras -- we need to remove the main text
+                            #print( "  Got extras" )
+                            assert optionsDict['includeExtrasFlag']
+                            origTextToBeSearched = ''
+                            for extra in lineEntry.getExtras():
+                                #print( "extra", extra )
+                                extraStart = ''
+                                if optionsDict['includeMarkerTextFlag']:
+                                    eTypeIndex = BOS_EXTRA_TYPES.index( extra.getType() )
+                                    extraStart = '\\{} '.format( BOS_EXTRA_MARKERS[eTypeIndex] )
+                                origTextToBeSearched += ' ' if origTextToBeSearched else '' + extraStart + extra.getText()
+                            #print( "  Now", repr(origTextToBeSearched) )
+                if optionsDict['includeMarkerTextFlag']:
+                    origTextToBeSearched = '\\{} {}'.format( marker, origTextToBeSearched )
+                if not origTextToBeSearched: return
+                textToBeSearched = origTextToBeSearched
+                if optionsDict['ignoreDiacriticsFlag']: textToBeSearched = BibleOrgSysGlobals.removeAccents( textToBeSearched )
+                if optionsDict['caselessFlag']: textToBeSearched = textToBeSearched.lower()
+                textLen = len( textToBeSearched )
+
+                ixHyphen = V.find( '-' )
+                if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
+                if optionsDict['regexFlag']: # ignores wordMode flag
+                    for match in compiledFindText.finditer( textToBeSearched ):
+                        ix, ixAfter = match.span()
+
+                        if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
+                            contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
+                            contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
+                        else: contextBefore = contextAfter = None
+
+                        resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
+                                                            origTextToBeSearched[ix:ixAfter], contextAfter, ) \
+                                    if optionsDict['caselessFlag'] else \
+                                        (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
+                        resultList.append( resultTuple )
+                        if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+                else: # not regExp
+                    ix = -1
+                    while True:
+                        ix = textToBeSearched.find( ourFindText, ix+1 )
+                        if ix == -1: break
+                        ixAfter = ix + searchLen
+                        if optionsDict['wordMode'] == 'Whole':
+                            #print( "BF", repr(textToBeSearched[ix-1]) )
+                            #print( "AF", repr(textToBeSearched[ixAfter]) )
+                            if ix>0 and textToBeSearched[ix-1].isalpha(): continue
+                            if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
+                        elif optionsDict['wordMode'] == 'Begins':
+                            if ix>0 and textToBeSearched[ix-1].isalpha(): continue
+                        elif optionsDict['wordMode'] == 'EndsWord':
+                            if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
+                        elif optionsDict['wordMode'] == 'EndsLine':
+                            if ixAfter<textLen: continue
+
+                        if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
+                            contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
+                            contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
+                        else: contextBefore = contextAfter = None
+
+                        #adjMarker = None if marker=='v~' else marker # most markers are v~ -- ignore them (for space)
+                        resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
+                                                            origTextToBeSearched[ix:ixAfter], contextAfter, ) \
+                                    if optionsDict['caselessFlag'] else \
+                                        (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
+                        resultList.append( resultTuple )
+                        if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+        # end of findText.searchLine
+
+        candidateLinesDict = None # None means that we have to search every line
+        if optionsDict['useSearchIndexFlag'] and not optionsDict['regexFlag']:
+            searchIndex = self.getSearchIndex()
+            candidateLinesDict = searchIndex.getCandidateLines( ourFindText, optionsDict['ignoreDiacriticsFlag'], self )
         for BBB,bookObject in self.books.items():
             #print( _("  findText: got book {}").format( BBB ) )
             if optionsDict['bookList'] is None or optionsDict['bookList']=='ALL' or BBB in optionsDict['bookList']:
                 #print( _("  findText: will search book {}").format( BBB ) )
                 #self.loadBookIfNecessary( BBB )
                 resultSummaryDict['searchedBookList'].append( BBB )
+                if candidateLinesDict is not None: # Only need to search the lines that the index gave us
+                    for lineIndex in candidateLinesDict[BBB]:
+                        lineEntry = bookObject._processedLines[lineIndex]
+                        C, V, lastParagraphMarker = searchIndex.getLineInfo( BBB, lineIndex )
+                        searchLine( BBB, C, V, lineEntry.getMarker(), lastParagraphMarker, lineEntry )
+                    continue
                 C, V = '-1', '-1' # So first/id line starts at -1:0
-                marker = None
+                marker = lastParagraphMarker = None
                 for lineEntry in bookObject:
                     if marker in BibleOrgSysGlobals.USFMParagraphMarkers:
                         lastParagraphMarker = marker
@@ -2304,93 +2535,7 @@ class InternalBible:
                     if marker == 'c': C, V = cleanText, '0'
                     elif marker == 'v': V = cleanText
                     elif C == '-1' and marker!='intro': V = str( int(V) + 1 )
-                    if ourMarkerList:
-                        if marker not in ourMarkerList and not (marker in ('v~','p~') and lastParagraphMarker in ourMarkerList):
-                            continue
-                    elif C=='-1' and not optionsDict['includeIntroFlag']: continue
-                    #print( "Searching in {} {}:{} {} = {}".format( BBB, C, V, marker, cleanText ) )
-
-                    if optionsDict['chapterList'] is None \
-                    or C in optionsDict['chapterList'] \
-                    or int(C) in optionsDict['chapterList']:
-                        #if optionsDict['chapterList'] and V=='0':
-                            #print( _("  findText: will search {} chapter {}").format( BBB, C ) )
-
-                        # Get our text to search
-                        origTextToBeSearched = lineEntry.getFullText() if optionsDict['includeExtrasFlag'] else cleanText
-                        if C != '0' and not optionsDict['includeMainTextFlag']:
-                            #print( "Got {!r} but  don't include main text".format( origTextToBeSearched ) )
-                            if marker in ('v~','p~') or marker in BibleOrgSysGlobals.USFMParagraphMarkers:
-                                origTextToBeSearched = ''
-                                if origTextToBeSearched != cleanText: # we must have extras -- we need to remove the main text
-                                    #print( "  Got extras" )
-                                    assert optionsDict['includeExtrasFlag']
-                                    origTextToBeSearched = ''
-                                    for extra in lineEntry.getExtras():
-                                        #print( "extra", extra )
-                                        extraStart = ''
-                                        if optionsDict['includeMarkerTextFlag']:
-                                            eTypeIndex = BOS_EXTRA_TYPES.index( extra.getType() )
-                                            extraStart = '\\{} '.format( BOS_EXTRA_MARKERS[eTypeIndex] )
-                                        origTextToBeSearched += ' ' if origTextToBeSearched else '' + extraStart + extra.getText()
-                                    #print( "  Now", repr(origTextToBeSearched) )
-                        if optionsDict['includeMarkerTextFlag']:
-                            origTextToBeSearched = '\\{} {}'.format( marker, origTextToBeSearched )
-                        if not origTextToBeSearched: continue
-                        textToBeSearched = origTextToBeSearched
-                        if optionsDict['ignoreDiacriticsFlag']: textToBeSearched = BibleOrgSysGlobals.removeAccents( textToBeSearched )
-                        if optionsDict['caselessFlag']: textToBeSearched = textToBeSearched.lower()
-                        textLen = len( textToBeSearched )
-
-                        if optionsDict['regexFlag']: # ignores wordMode flag
-                            for match in compiledFindText.finditer( textToBeSearched ):
-                                ix, ixAfter = match.span()
-
-                                if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
-                                    contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
-                                    contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
-                                else: contextBefore = contextAfter = None
-
-                                ixHyphen = V.find( '-' )
-                                if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
-                                resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
-                                                                    origTextToBeSearched[ix:ixAfter], contextAfter, ) \
-                                            if optionsDict['caselessFlag'] else \
-                                                (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
-                                resultList.append( resultTuple )
-                                if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
-                        else: # not regExp
-                            ix = -1
-                            while True:
-                                ix = textToBeSearched.find( ourFindText, ix+1 )
-                                if ix == -1: break
-                                ixAfter = ix + searchLen
-                                if optionsDict['wordMode'] == 'Whole':
-                                    #print( "BF", repr(textToBeSearched[ix-1]) )
-                                    #print( "AF", repr(textToBeSearched[ixAfter]) )
-                                    if ix>0 and textToBeSearched[ix-1].isalpha(): continue
-                                    if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'Begins':
-                                    if ix>0 and textToBeSearched[ix-1].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'EndsWord':
-                                    if ixAfter<textLen and textToBeSearched[ixAfter].isalpha(): continue
-                                elif optionsDict['wordMode'] == 'EndsLine':
-                                    if ixAfter<textLen: continue
-
-                                if optionsDict['contextLength']: # Find the context in the original (fully-cased) string
-                                    contextBefore = origTextToBeSearched[max(0,ix-optionsDict['contextLength']):ix]
-                                    contextAfter = origTextToBeSearched[ixAfter:ixAfter+optionsDict['contextLength']]
-                                else: contextBefore = contextAfter = None
-
-                                ixHyphen = V.find( '-' )
-                                if ixHyphen != -1: V = V[:ixHyphen] # Remove verse bridges
-                                #adjMarker = None if marker=='v~' else marker # most markers are v~ -- ignore them (for space)
-                                resultTuple = (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore,
-                                                                    origTextToBeSearched[ix:ixAfter], contextAfter, ) \
-                                            if optionsDict['caselessFlag'] else \
-                                                (SimpleVerseKey(BBB, C, V, ix), lineEntry.getOriginalMarker(), contextBefore, contextAfter, )
-                                resultList.append( resultTuple )
-                                if BBB not in resultSummaryDict['foundBookList']: resultSummaryDict['foundBookList'].append( BBB )
+                    searchLine( BBB, C, V, marker, lastParagraphMarker, lineEntry )
 
         #print( _("findText: returning {}").format( resultList ) )
         return optionsDict, resultSummaryDict, resultList
@@ -46,14 +46,21 @@ To use the InternalBibleBook class,
         removes footnotes and other additional info
         and places the processed Bible info into _processedLines.
     Finally, call makeCVIndex() to index _processedLines by CV.
+
+    Alternatively, a loader can pass a generator of (marker,text) 2-tuples
+        straight to processLines( rawLines ) so that _rawLines is never filled.
+
+    Loaders that read one source file per book can call loadFromCache( sourceFilepath ) first,
+        and saveToCache( sourceFilepath ) after processing (and validating) the book,
+        so that unchanged books don't need to be processed again next time.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-26' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "InternalBibleBook"
 ProgName = "Internal Bible book handler"
-ProgVersion = '0.97'
+ProgVersion = '1.00'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -63,11 +70,19 @@ debuggingThisModule = False
 MAX_NONCRITICAL_ERRORS_PER_BOOK_NORMAL = 3
 MAX_NONCRITICAL_ERRORS_PER_BOOK_VERBOSE = 5
 
+BOOK_CACHE_VERSION = 2 # Increment this if the cached book format changes
+# Changes to any of these modules or data files (relative to this module) can change the processed books
+BOOK_CACHE_DEPENDENCY_MODULES = ( 'BibleOrgSysGlobals', 'InternalBibleInternals', 'BibleReferences', 'BibleBooksCodes', 'USFM2Markers', 'USFM3Markers', )
+BOOK_CACHE_DEPENDENCY_DATAFILES = ( 'DataFiles/BibleBooksCodes.xml', 'DataFiles/USFM2Markers.xml', 'DataFiles/USFM3Markers.xml', )
+UNCACHED_BOOK_ATTRIBUTES = ( 'containerBibleObject', 'workName', '_rawLines', '_bookCacheSourceFilepath', '_bookCacheEncoding', '_cachedDiscoveryResults', '_priorityErrorBuffer' )
+BOOK_CHECK_NAMES = ( 'SFMs', 'Characters', 'SpeechMarks', 'Words', 'Headings', 'Introduction', 'Notes', 'AddedUnits', ) # In the order that check runs them
+
 
 import os, logging
 from collections import OrderedDict
 import re
 import unicodedata
+import sys, hashlib, pickle
 
 import BibleOrgSysGlobals
 from USFM3Markers import USFM_ALL_INTRODUCTION_MARKERS, USFM_BIBLE_PARAGRAPH_MARKERS, \
@@ -97,6 +112,54 @@ def exp( messageString ):
 # end of exp
 
 
+def splitWordTokens( segment, wordSplitCache=None ):
+    """
+    Breaks the text segment into words (treating em-dash and en-dash as word break characters)
+        and removes any internal SFMs from each word.
+
+    If a wordSplitCache dictionary is given, it's used to save (and reuse) the results
+        so that repeated segments only get split once.
+
+    Returns a tuple of 2-tuples: (rawWord, wordWithoutInternalSFMs).
+    """
+    if wordSplitCache is not None and segment in wordSplitCache: return wordSplitCache[segment]
+    wordTokens = []
+    for rawWord in segment.replace('—',' ').replace('–',' ').split():
+        word = rawWord
+        for internalMarker in BibleOrgSysGlobals.internal_SFMs_to_remove: word = word.replace( internalMarker, '' )
+        wordTokens.append( (rawWord,word) )
+    wordTokens = tuple( wordTokens )
+    if wordSplitCache is not None: wordSplitCache[segment] = wordTokens
+    return wordTokens
+# end of splitWordTokens
+
+
+bookCacheCodeSignatures = {} # Loader module name -> signature (only worked out once per run)
+
+def getBookCacheCodeSignature( loaderModuleName ):
+    """
+    Returns a hash of the source code of this module, the given loader module,
+        the other modules that processLines depends on (BOOK_CACHE_DEPENDENCY_MODULES)
+        and their data files (BOOK_CACHE_DEPENDENCY_DATAFILES)
+        so that cached books are never used after any of these have been edited.
+    """
+    try: return bookCacheCodeSignatures[loaderModuleName]
+    except KeyError: pass
+    hasher = hashlib.md5()
+    ourFolder = os.path.dirname( os.path.abspath( __file__ ) )
+    filepaths = [getattr( sys.modules.get( moduleName ), '__file__', None ) or os.path.join( ourFolder, moduleName+'.py' )
+                                for moduleName in (__name__, loaderModuleName) + BOOK_CACHE_DEPENDENCY_MODULES]
+    filepaths.extend( os.path.join( ourFolder, dataFilename ) for dataFilename in BOOK_CACHE_DEPENDENCY_DATAFILES )
+    for filepath in filepaths:
+        hasher.update( os.path.basename( filepath ).encode( 'utf-8' ) )
+        try:
+            with open( filepath, 'rb' ) as sourceFile: hasher.update( sourceFile.read() )
+        except OSError: hasher.update( b'missing' )
+    bookCacheCodeSignatures[loaderModuleName] = hasher.hexdigest()
+    return bookCacheCodeSignatures[loaderModuleName]
+# end of getBookCacheCodeSignature
+
+
 
 def hasClosingPeriod( text ):
     """
@@ -132,6 +195,7 @@ class InternalBibleBook:
     Class to create and manipulate a single internal Bible file / book.
     The load routine (which populates self._rawLines) by calling addLine must be provided by the superclass.
     """
+    _priorityErrorBuffer = None # Only used while several checks are being run together
 
     def __init__( self, parameter1, BBB ):
         """
@@ -227,6 +291,9 @@ class InternalBibleBook:
         if BibleOrgSysGlobals.debugFlag:
             assert isinstance( priority, int ) and ( 0 <= priority <= 100 )
             assert isinstance( string, str ) and string
+        if self._priorityErrorBuffer is not None: # We're in the middle of running several checks together
+            self._priorityErrorBuffer.append( (priority,C,V,string) ) # so they'll be added later in the correct order
+            return
         if not 'Priority Errors' in self.errorDictionary: self.errorDictionary['Priority Errors'] = [] # Just in case getErrors() deleted it
 
         BBB = self.BBB
@@ -260,9 +327,21 @@ class InternalBibleBook:
             This is a very simple function,
                 but having it allows us to have a single point in order to catch particular bugs or errors.
         """
+        rawLineTuple = ( marker, self.checkLineToAdd( marker, text ) )
+        self._rawLines.append( rawLineTuple )
+    # end of InternalBibleBook.addLine
+
+
+    def checkLineToAdd( self, marker, text ):
+        """
+        Does the checks for addLine (but doesn't save anything).
+            Also used by processLines when it's given the raw lines directly.
+
+        Returns the (possibly fixed) text.
+        """
         forceDebugHere = False
         if forceDebugHere or BibleOrgSysGlobals.debugFlag:
-            if forceDebugHere or debuggingThisModule: print( "InternalBibleBook.addLine( {!r}, {!r} ) for {} {!r} {}".format( marker, text, self.objectTypeString, self.workName, self.BBB ) )
+            if forceDebugHere or debuggingThisModule: print( "InternalBibleBook.checkLineToAdd( {!r}, {!r} ) for {} {!r} {}".format( marker, text, self.objectTypeString, self.workName, self.BBB ) )
             #if len(self._rawLines ) > 200: halt
             #if 'xyz' in text: halt
         if text and ( '\n' in text or '\r' in text ):
@@ -308,10 +387,8 @@ class InternalBibleBook:
                     else: # we've reached our limit
                         stripLogger( _('Additional "Possibly needed to strip" messages suppressed for {} {}').format( self.workName, self.BBB ) )
                         self.pntsCount = -1 # So we don't do this again (for this book)
-
-        rawLineTuple = ( marker, text )
-        self._rawLines.append( rawLineTuple )
-    # end of InternalBibleBook.addLine
+        return text
+    # end of InternalBibleBook.checkLineToAdd
 
 
     def appendToLastLine( self, additionalText, expectedLastMarker=None ):
@@ -1553,18 +1630,22 @@ class InternalBibleBook:
     # end of InternalBibleBook.processLines.reorderRawOsisLines
 
 
-    def processLines( self ):
+    def processLines( self, rawLines=None ):
         """
         Move notes out of the text into a separate area.
             Also, splits lines if a paragraph marker appears within a line.
 
             Uses self._rawLines and fills self._processedLines.
+
+        If rawLines is given (e.g., a generator from the file loader),
+            the (marker,text) 2-tuples are checked and processed as they come
+            instead of first being saved in self._rawLines.
         """
         #if self._processedFlag: return # Can only do it once
         if BibleOrgSysGlobals.verbosityLevel > 2:
             print( "  " + _("Processing {} ({} {!r}) {} lines…").format( self.objectNameString, self.objectTypeString, self.workName, self.BBB ) )
         if BibleOrgSysGlobals.debugFlag: assert not self._processedFlag # Can only do it once
-        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        if rawLines is None and ( BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and debuggingThisModule ):
             assert self._rawLines # or else the book was totally blank
         #print( self._rawLines[:20] ); halt # for debugging
 
@@ -1989,8 +2070,9 @@ class InternalBibleBook:
         self._processedLines = InternalBibleEntryList() # Contains more-processed tuples which contain the actual Bible text -- see below
         C, V = '-1', '-1' # So first/id line starts at -1:0
         haveWaitingC = False
-        for marker,text in self._rawLines:
+        for marker,text in self._rawLines if rawLines is None else rawLines:
             #print( "\nQQQ" )
+            if rawLines is not None: text = self.checkLineToAdd( marker, text )
             if self.objectTypeString=='USX' and text and text[-1]==' ': text = text[:-1] # Removing extra trailing space from USX files
             processLine( marker, text ) # Saves its results in self._processedLines
         del self.pntsCount, self.nfvnCount, self.owfvnCount, self.rtsCount, self.sahtCount, self.fwmifCount, self.fswncCount
@@ -2051,6 +2133,110 @@ class InternalBibleBook:
     # end of InternalBibleBook.makeIndex
 
 
+    def __getBookCacheKey( self, sourceFilepath, encoding ):
+        """
+        Returns the cache filename and a dictionary of everything that must match
+            for a cached copy of this book (processed from the given source file) to be used.
+        """
+        absoluteFilepath = os.path.abspath( sourceFilepath )
+        codeVersions = tuple( getattr( sys.modules.get( moduleName ), 'ProgVersion', None )
+                                for moduleName in (__name__, 'InternalBibleInternals', type(self).__module__) )
+        cacheFilename = '{}.{}.{}.processedBook.pickle'.format( self.BBB, type(self).__name__,
+                                hashlib.md5( absoluteFilepath.encode( 'utf-8' ) ).hexdigest()[:12] )
+        cacheKey = { 'cacheVersion':BOOK_CACHE_VERSION, 'codeVersions':codeVersions,
+                    'codeSignature':getBookCacheCodeSignature( type(self).__module__ ), 'encoding':encoding,
+                    'className':type(self).__name__, 'BBB':self.BBB, 'sourceFilepath':absoluteFilepath,
+                    'strictCheckingFlag':BibleOrgSysGlobals.strictCheckingFlag }
+        return cacheFilename, cacheKey
+    # end of InternalBibleBook.__getBookCacheKey
+
+
+    def loadFromCache( self, sourceFilepath, encoding=None ):
+        """
+        Try to load the processed and indexed book from the cache
+            (in BibleOrgSysGlobals.DEFAULT_BOOK_CACHE_FOLDER).
+
+        The cached copy is only used if it was made by the same code (and reference data)
+            from the same source file (loaded with the same encoding) with the same size
+            and either the same modification time or the same contents.
+
+        Returns True if the book was loaded.
+        """
+        if not BibleOrgSysGlobals.useBookCache: return False
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "InternalBibleBook.loadFromCache( {} ) for {}".format( sourceFilepath, self.BBB ) )
+
+        cacheFilename, cacheKey = self.__getBookCacheKey( sourceFilepath, encoding )
+        try:
+            fileStat = os.stat( sourceFilepath )
+            cachedBook = BibleOrgSysGlobals.unpickleObject( cacheFilename, BibleOrgSysGlobals.DEFAULT_BOOK_CACHE_FOLDER )
+            if cachedBook['cacheKey'] != cacheKey or cachedBook['fileSize'] != fileStat.st_size: return False
+            if cachedBook['fileMTime'] != fileStat.st_mtime_ns: # It might have been touched or copied without being changed
+                with open( sourceFilepath, 'rb' ) as sourceFile:
+                    if hashlib.md5( sourceFile.read() ).hexdigest() != cachedBook['contentHash']: return False
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, KeyError, TypeError): return False
+
+        if BibleOrgSysGlobals.verbosityLevel > 2: print( "  " + _("Loaded processed {} from cache").format( self.BBB ) )
+        self.__dict__.update( cachedBook['bookAttributes'] )
+        self._bookCacheSourceFilepath, self._bookCacheEncoding = sourceFilepath, encoding
+        self._cachedDiscoveryResults = cachedBook['discoveryResults']
+        return True
+    # end of InternalBibleBook.loadFromCache
+
+
+    def saveToCache( self, sourceFilepath, encoding=None ):
+        """
+        Save the processed and indexed book into the cache
+            (in BibleOrgSysGlobals.DEFAULT_BOOK_CACHE_FOLDER)
+            so that loadFromCache can use it next time.
+
+        Returns True if successful.
+        """
+        if not BibleOrgSysGlobals.useBookCache or not self._processedFlag: return False
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "InternalBibleBook.saveToCache( {} ) for {}".format( sourceFilepath, self.BBB ) )
+
+        cacheFilename, cacheKey = self.__getBookCacheKey( sourceFilepath, encoding )
+        try:
+            fileStat = os.stat( sourceFilepath )
+            with open( sourceFilepath, 'rb' ) as sourceFile: contentHash = hashlib.md5( sourceFile.read() ).hexdigest()
+            bookAttributes = { attributeName:attributeValue for attributeName,attributeValue in self.__dict__.items()
+                                                    if attributeName not in UNCACHED_BOOK_ATTRIBUTES }
+            if BibleOrgSysGlobals.pickleObject( { 'cacheKey':cacheKey, 'fileSize':fileStat.st_size, 'fileMTime':fileStat.st_mtime_ns,
+                                            'contentHash':contentHash, 'bookAttributes':bookAttributes,
+                                            'discoveryResults':None },
+                                        cacheFilename, BibleOrgSysGlobals.DEFAULT_BOOK_CACHE_FOLDER ):
+                self._bookCacheSourceFilepath, self._bookCacheEncoding = sourceFilepath, encoding
+                return True
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as err:
+            logging.info( "InternalBibleBook.saveToCache: Unable to cache {} from {}: {}".format( self.BBB, sourceFilepath, err ) )
+        return False
+    # end of InternalBibleBook.saveToCache
+
+
+    def saveDiscoveryResultsToCache( self, discoveryResults ):
+        """
+        If this book was loaded from or saved to the cache,
+            update the cached copy to include the results from _discover.
+        """
+        sourceFilepath = getattr( self, '_bookCacheSourceFilepath', None )
+        if sourceFilepath is None or getattr( self, '_cachedDiscoveryResults', None ) is not None: return
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "InternalBibleBook.saveDiscoveryResultsToCache() for {}".format( self.BBB ) )
+
+        cacheFilename, cacheKey = self.__getBookCacheKey( sourceFilepath, getattr( self, '_bookCacheEncoding', None ) )
+        cacheFolder = BibleOrgSysGlobals.DEFAULT_BOOK_CACHE_FOLDER
+        try:
+            cachedBook = BibleOrgSysGlobals.unpickleObject( cacheFilename, cacheFolder )
+            if cachedBook['cacheKey'] != cacheKey: return # It's been replaced by a different version
+            cachedBook['discoveryResults'] = discoveryResults
+            if BibleOrgSysGlobals.pickleObject( cachedBook, cacheFilename, cacheFolder ):
+                self._cachedDiscoveryResults = discoveryResults
+        except (OSError, EOFError, pickle.UnpicklingError, pickle.PicklingError, AttributeError, ImportError, KeyError, TypeError) as err:
+            logging.info( "InternalBibleBook.saveDiscoveryResultsToCache: Unable to cache discovery results for {}: {}".format( self.BBB, err ) )
+    # end of InternalBibleBook.saveDiscoveryResultsToCache
+
+
     def debugPrint( self ):
         """
         """
@@ -2421,6 +2607,7 @@ class InternalBibleBook:
             self.processLines()
         if BibleOrgSysGlobals.debugFlag: assert self._processedLines
         #print( "InternalBibleBook:discover", self.BBB )
+        if getattr( self, '_cachedDiscoveryResults', None ) is not None: return self._cachedDiscoveryResults
 
         bkDict = {}
         bkDict['chapterCount'] = bkDict['verseCount'] = bkDict['percentageProgress'] = None
@@ -2461,11 +2648,8 @@ class InternalBibleBook:
             ## end of stripWordPunctuation
 
             # countWords() main code
-            words = segment.replace('—',' ').replace('–',' ').split() # Treat em-dash and en-dash as word break characters
-            for j,rawWord in enumerate(words):
+            for j,(rawWord,word) in enumerate( splitWordTokens( segment, wordSplitCache ) ):
                 if marker=='c' or marker=='v' and j==1 and rawWord.isdigit(): continue # Ignore the chapter and verse numbers (except ones like 6a)
-                word = rawWord
-                for internalMarker in BibleOrgSysGlobals.internal_SFMs_to_remove: word = word.replace( internalMarker, '' )
                 word = BibleOrgSysGlobals.stripWordPunctuation( word )
                 if word and not word[0].isalnum():
                     #print( word, BibleOrgSysGlobals.stripWordPunctuation( word ) )
@@ -2500,6 +2684,7 @@ class InternalBibleBook:
 
 
         # _discover() main code
+        wordSplitCache = {}
         C, V = '-1', '-1' # So first/id line starts at -1:0
         lastMarker = None
         for entry in self._processedLines:
@@ -2894,8 +3079,10 @@ class InternalBibleBook:
     # end of InternalBibleBook.doCheckAddedUnits
 
 
-    def doCheckSFMs( self, discoveryDict ):
+    def __visitSFMs( self, discoveryDict ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of comprehensive checks on the USFM codes in this Bible book.
         """
         allAvailableNewlineMarkers = BibleOrgSysGlobals.USFMMarkers.getNewlineMarkersList( 'Numbered' )
@@ -2921,7 +3108,9 @@ class InternalBibleBook:
         C, V = '-1', '-1' # So first/id line starts at -1:0
         section, lastMarker, lastModifiedMarker = '', '', None
         lastMarkerEmpty = True
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, originalMarker, text, extras = entry.getMarker(), entry.getOriginalMarker(), entry.getText(), entry.getExtras()
             markerEmpty = not text
             # Keep track of where we are for more helpful error messages
@@ -3334,11 +3523,23 @@ class InternalBibleBook:
             self.errorDictionary['USFMs']['All Footnote and Cross-Reference Internal Marker Counts'] = noteMarkerCounts
             self.errorDictionary['USFMs']['All Footnote and Cross-Reference Internal Marker Counts']['Total'] = total
         if functionalCounts: self.errorDictionary['USFMs']['Functional Marker Counts'] = functionalCounts
+    # end of InternalBibleBook.__visitSFMs
+
+
+    def doCheckSFMs( self, discoveryDict ):
+        """
+        Runs a number of comprehensive checks on the USFM codes in this Bible book.
+        """
+        self.__runCheckVisitors( ('SFMs',), discoveryDict )
     # end of InternalBibleBook.doCheckSFMs
 
 
-    def doCheckCharacters( self ):
-        """Runs a number of checks on the characters used."""
+    def __visitCharacters( self ):
+        """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
+        Runs a number of checks on the characters used.
+        """
 
         def countCharacters( adjText ):
             """
@@ -3430,7 +3631,9 @@ class InternalBibleBook:
         simpleCharacterCounts, unicodeCharacterCounts, letterCounts, punctuationCounts = {}, {}, {}, {} # We don't care about the order in which they appeared
         characterErrors = []
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, text, cleanText = entry.getMarker(), entry.getText(), entry.getCleanText()
 
             # Keep track of where we are for more helpful error messages
@@ -3486,11 +3689,19 @@ class InternalBibleBook:
             for character in punctuationCounts: total += punctuationCounts[character]
             self.errorDictionary['Characters']['Punctuation Counts'] = punctuationCounts
             self.errorDictionary['Characters']['Punctuation Counts']['Total'] = total
+    # end of InternalBibleBook.__visitCharacters
+
+
+    def doCheckCharacters( self ):
+        """Runs a number of checks on the characters used."""
+        self.__runCheckVisitors( ('Characters',) )
     # end of InternalBibleBook.doCheckCharacters
 
 
-    def doCheckSpeechMarks( self ):
+    def __visitSpeechMarks( self ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of checks on the speech marks in the Bible book.
         """
         goodNow = False # Yes, this code needs fixing badly
@@ -3508,7 +3719,9 @@ class InternalBibleBook:
         bitMarker = ''
         startsWithOpen = endedWithClose = False
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, originalMarker, text, cleanText = entry.getMarker(), entry.getOriginalMarker(), entry.getText(), entry.getCleanText()
 
             # Keep track of where we are for more helpful error messages
@@ -3678,11 +3891,21 @@ class InternalBibleBook:
         # Add up the totals
         if (speechMarkErrors) and 'Speech Marks' not in self.errorDictionary: self.errorDictionary['Speech Marks'] = OrderedDict()
         if speechMarkErrors: self.errorDictionary['Speech Marks']['Possible Matching Errors'] = speechMarkErrors
+    # end of InternalBibleBook.__visitSpeechMarks
+
+
+    def doCheckSpeechMarks( self ):
+        """
+        Runs a number of checks on the speech marks in the Bible book.
+        """
+        self.__runCheckVisitors( ('SpeechMarks',) )
     # end of InternalBibleBook.doCheckSpeechMarks
 
 
-    def doCheckWords( self ):
+    def __visitWords( self, wordSplitCache ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of checks on the words used.
         """
 
@@ -3702,17 +3925,14 @@ class InternalBibleBook:
                 return word
             # end of stripWordPunctuation
 
-            words = segment.replace('—',' ').replace('–',' ').split() # Treat em-dash and en-dash as word break characters
             if lastWordTuple is None: ourLastWord = ourLastRawWord = '' # No need to check words repeated across segment boundaries
             else: # Check in case a word has been repeated (e.g., at the end of one verse and then again at the beginning of the next verse)
                 if BibleOrgSysGlobals.debugFlag:
                     assert isinstance( lastWordTuple, tuple )
                     assert len(lastWordTuple) == 2
                 ourLastWord, ourLastRawWord = lastWordTuple
-            for j,rawWord in enumerate(words):
+            for j,(rawWord,word) in enumerate( splitWordTokens( segment, wordSplitCache ) ):
                 if marker=='c' or marker=='v' and j==1 and rawWord.isdigit(): continue # Ignore the chapter and verse numbers (except ones like 6a)
-                word = rawWord
-                for internalMarker in BibleOrgSysGlobals.internal_SFMs_to_remove: word = word.replace( internalMarker, '' )
                 word = stripWordPunctuation( word )
                 if word and not word[0].isalnum():
                     #print( word, stripWordPunctuation( word ) )
@@ -3746,7 +3966,9 @@ class InternalBibleBook:
         wordErrors, repeatedWordErrors = [], []
         lastTextWordTuple = ('','')
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, text, cleanText = entry.getMarker(), entry.getText(), entry.getCleanText()
 
             # Keep track of where we are for more helpful error messages
@@ -3792,6 +4014,14 @@ class InternalBibleBook:
             for word in caseInsensitiveWordCounts: total += caseInsensitiveWordCounts[word]
             self.errorDictionary['Words']['Case Insensitive Word Counts'] = caseInsensitiveWordCounts
             self.errorDictionary['Words']['Case Insensitive Word Counts']['--Total--'] = total
+    # end of InternalBibleBook.__visitWords
+
+
+    def doCheckWords( self ):
+        """
+        Runs a number of checks on the words used.
+        """
+        self.__runCheckVisitors( ('Words',) )
     # end of InternalBibleBook.doCheckWords
 
 
@@ -3823,19 +4053,18 @@ class InternalBibleBook:
     # end of InternalBibleBook.doCheckFileControls
 
 
-    def doCheckHeadings( self, discoveryDict ):
+    def __visitHeadings( self, discoveryDict ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of checks on headings and section cross-references.
         """
-        if not self._processedFlag:
-            if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
-                print( "InternalBibleBook {} {!r}: processing lines called from 'doCheckHeadings'".format( self.BBB, self.workName ) )
-            self.processLines()
-        if BibleOrgSysGlobals.debugFlag: assert self._processedLines
 
         titleList, sectionHeadingList, sectionReferenceList, descriptiveTitleList, headingErrors = [], [], [], [], []
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, text = entry.getMarker(), entry.getText()
             # Keep track of where we are for more helpful error messages
             if marker=='c' and text: C, V = text.split()[0], '0'
@@ -3900,22 +4129,29 @@ class InternalBibleBook:
         if sectionHeadingList: self.errorDictionary['Headings']['Section Heading Lines'] = sectionHeadingList
         if descriptiveTitleList: self.errorDictionary['Headings']['Descriptive Heading Lines'] = descriptiveTitleList
         if sectionReferenceList: self.errorDictionary['Headings']['Section Cross-reference Lines'] = sectionReferenceList
+    # end of InternalBibleBook.__visitHeadings
+
+
+    def doCheckHeadings( self, discoveryDict ):
+        """
+        Runs a number of checks on headings and section cross-references.
+        """
+        self.__runCheckVisitors( ('Headings',), discoveryDict )
     # end of InternalBibleBook.doCheckHeadings
 
 
-    def doCheckIntroduction( self ):
+    def __visitIntroduction( self ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of checks on introductory parts.
         """
-        if not self._processedFlag:
-            if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
-                print( "InternalBibleBook {} {!r}: processing lines called from 'doCheckIntroduction'".format( self.BBB, self.workName ) )
-            self.processLines()
-        if BibleOrgSysGlobals.debugFlag: assert self._processedLines
 
         mainTitleList, headingList, titleList, outlineList, introductionErrors = [], [], [], [], []
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, text, cleanText = entry.getMarker(), entry.getText(), entry.getCleanText()
 
             # Keep track of where we are for more helpful error messages
@@ -3981,18 +4217,23 @@ class InternalBibleBook:
         if headingList: self.errorDictionary['Introduction']['Section Heading Lines'] = headingList
         if titleList: self.errorDictionary['Introduction']['Outline Title Lines'] = titleList
         if outlineList: self.errorDictionary['Introduction']['Outline Entry Lines'] = outlineList
+    # end of InternalBibleBook.__visitIntroduction
+
+
+    def doCheckIntroduction( self ):
+        """
+        Runs a number of checks on introductory parts.
+        """
+        self.__runCheckVisitors( ('Introduction',) )
     # end of InternalBibleBook.doCheckIntroduction
 
 
-    def doCheckNotes( self, discoveryDict ):
+    def __visitNotes( self, discoveryDict ):
         """
+        Generator (used by __runCheckVisitors) which is sent each processed entry in turn (then None).
+
         Runs a number of checks on footnotes and cross-references.
         """
-        if not self._processedFlag:
-            if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
-                print( "InternalBibleBook {} {!r}: processing lines called from 'doCheckNotes'".format( self.BBB, self.workName ) )
-            self.processLines()
-        if BibleOrgSysGlobals.debugFlag: assert self._processedLines
 
         allAvailableCharacterMarkers = BibleOrgSysGlobals.USFMMarkers.getCharacterMarkersList( includeBackslash=True )
 
@@ -4001,7 +4242,9 @@ class InternalBibleBook:
         footnoteErrors, xrefErrors, noteMarkerErrors = [], [], []
         leaderCounts = {}
         C, V = '-1', '-1' # So first/id line starts at -1:0
-        for entry in self._processedLines:
+        while True:
+            entry = yield
+            if entry is None: break # No more entries
             marker, text = entry.getMarker(), entry.getText()
 
             # Keep track of where we are for more helpful error messages
@@ -4258,31 +4501,87 @@ class InternalBibleBook:
             if len(footnoteLeaderList) > 1: self.addPriorityError( 26, '-', '-', _("Mutiple different footnote leader characters: {}").format( footnoteLeaderList ) )
             if len(xrefLeaderList) > 1: self.addPriorityError( 25, '-', '-', _("Mutiple different cross-reference leader characters: {}").format( xrefLeaderList ) )
             if len(CVSeparatorList) > 1: self.addPriorityError( 27, '-', '-', _("Mutiple different chapter/verse separator characters: {}").format( CVSeparatorList ) )
+    # end of InternalBibleBook.__visitNotes
+
+
+    def doCheckNotes( self, discoveryDict ):
+        """
+        Runs a number of checks on footnotes and cross-references.
+        """
+        self.__runCheckVisitors( ('Notes',), discoveryDict )
     # end of InternalBibleBook.doCheckNotes
 
 
-    def check( self, discoveryDict=None, typicalAddedUnitData=None ):
+    def __runCheckVisitors( self, checkNames, discoveryDict=None ):
         """
-        Runs a number of checks on the book and returns the error dictionary.
+        Runs the given per-entry checks (from BOOK_CHECK_NAMES) together
+            using a single pass through the processed lines.
+
+        Each check is a generator which is primed, then sent each entry in turn,
+            and finally sent None so that it can do its summary processing.
+        Priority errors are held back while more than one check is running
+            so that they're recorded in exactly the same order
+            as if each check had been run separately.
         """
         if not self._processedFlag:
             if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
-                print( "InternalBibleBook {} {!r}: processing lines called from 'check'".format( self.BBB, self.workName ) )
+                print( "InternalBibleBook {} {!r}: processing lines called from '__runCheckVisitors'".format( self.BBB, self.workName ) )
             self.processLines()
         if BibleOrgSysGlobals.debugFlag: assert self._processedLines
 
+        wordSplitCache = {} # Shared by any checks that need to split the text into words
+        visitors = []
+        for checkName in checkNames:
+            if checkName == 'SFMs': visitor = self.__visitSFMs( discoveryDict )
+            elif checkName == 'Characters': visitor = self.__visitCharacters()
+            elif checkName == 'SpeechMarks': visitor = self.__visitSpeechMarks()
+            elif checkName == 'Words': visitor = self.__visitWords( wordSplitCache )
+            elif checkName == 'Headings': visitor = self.__visitHeadings( discoveryDict )
+            elif checkName == 'Introduction': visitor = self.__visitIntroduction()
+            elif checkName == 'Notes': visitor = self.__visitNotes( discoveryDict )
+            else: continue # AddedUnits doesn't use the processed lines
+            visitors.append( visitor )
+        if not visitors: return
+
+        bufferErrors = len(visitors) > 1
+        priorityErrorBuffers = [[] for visitor in visitors]
+        try:
+            for j,visitor in enumerate( visitors ):
+                if bufferErrors: self._priorityErrorBuffer = priorityErrorBuffers[j]
+                next( visitor ) # Prime the generator (runs its setup code)
+            for entry in self._processedLines:
+                for j,visitor in enumerate( visitors ):
+                    if bufferErrors: self._priorityErrorBuffer = priorityErrorBuffers[j]
+                    visitor.send( entry )
+        finally: self._priorityErrorBuffer = None
+
+        for j,visitor in enumerate( visitors ): # Now finish each check in order
+            for priority,C,V,string in priorityErrorBuffers[j]:
+                self.addPriorityError( priority, C, V, string )
+            try: visitor.send( None ) # Tell it that there's no more entries
+            except StopIteration: pass # which is what we expect
+    # end of InternalBibleBook.__runCheckVisitors
+
+
+    def check( self, discoveryDict=None, typicalAddedUnitData=None, checkNames=None ):
+        """
+        Runs a number of checks on the book and returns the error dictionary.
+
+        checkNames can be a list of names from BOOK_CHECK_NAMES to only run those checks,
+            otherwise all of them are run (in a single pass through the processed lines).
+        """
+        if checkNames is None: checkNames = BOOK_CHECK_NAMES
+        else:
+            for checkName in checkNames:
+                if checkName not in BOOK_CHECK_NAMES:
+                    logging.error( _("Unknown {!r} check name requested for {} {!r}").format( checkName, self.BBB, self.workName ) )
+
         # Ignore the result of these next ones -- just use any errors collected
         #self.getVersification() # This checks CV ordering, etc. at the same time
         # Further checks
-        self.doCheckSFMs( discoveryDict )
-        self.doCheckCharacters()
-        self.doCheckSpeechMarks()
-        self.doCheckWords()
-        self.doCheckHeadings( discoveryDict )
-        self.doCheckIntroduction()
-        self.doCheckNotes( discoveryDict ) # footnotes and cross-references
-
-        if self.checkAddedUnitsFlag: # This code is temporary XXXXXXXXXXXXXXXXXXXXXXXX …
+        self.__runCheckVisitors( checkNames, discoveryDict ) # including footnotes and cross-references
+
+        if self.checkAddedUnitsFlag and 'AddedUnits' in checkNames: # This code is temporary XXXXXXXXXXXXXXXXXXXXXXXX …
             if typicalAddedUnitData is None: # Get our recommendations for added units
                 import pickle
                 folder = os.path.join( os.path.dirname(__file__), "DataFiles/", "ScrapedFiles/" ) # Relative to module, not cwd
@@ -70,16 +70,22 @@ Some notes about internal formats:
         Each InternalBibleExtra contains an index back to the adjusted text
             (and hence that index must be adjusted if the text string is edited).
 
+    Because a loaded Bible can contain hundreds of thousands of these objects,
+        InternalBibleExtra, InternalBibleEntry and InternalBibleCVIndexEntry use __slots__
+        (so have no per-instance __dict__ and can't be given extra attributes).
+        Pickles made before then can still be loaded.
+        Markers are interned, and identical text fields and context lists are shared.
+
     The introduction is stored as chapter '-1'. (All our chapter and verse "numbers" are stored as strings.)
         (We allow for some rare printed Roman Catholic Bibles that have an actual chapter 0.)
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-26' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "BibleInternals"
 ProgName = "Bible internals handler"
-ProgVersion = '0.76'
+ProgVersion = '0.78'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -87,7 +93,7 @@ debuggingThisModule = False
 MAX_NONCRITICAL_ERRORS_PER_BOOK = 4
 
 
-import logging, re
+import sys, logging, re
 from collections import OrderedDict
 
 import BibleOrgSysGlobals
@@ -360,6 +366,20 @@ def parseFigureAttributes( workName, BBB, C, V, figureAttributeString, errorList
 
 
 
+def setSlotsState( slottedObject, state ):
+    """
+    Restore the state of an unpickled object which uses __slots__.
+
+    Accepts the plain __dict__ state from pickles made before we used __slots__
+        as well as the (None, slotsDict) state that we pickle now.
+    """
+    if isinstance( state, tuple ): state = state[1]
+    for attributeName, attributeValue in state.items():
+        setattr( slottedObject, attributeName, attributeValue )
+# end of setSlotsState
+
+
+
 class InternalBibleExtra:
     """
     This class represents an entry in the InternalBibleExtraList.
@@ -370,6 +390,7 @@ class InternalBibleExtra:
     Each object/entry contains an index back to the adjusted text
         (and hence that index must be adjusted if the text string is edited).
     """
+    __slots__ = ( 'myType', 'index', 'noteText', 'cleanNoteText', )
 
     def __init__( self, myType, indexToAdjText, noteText, cleanNoteText, location ):
         """
@@ -391,9 +412,12 @@ class InternalBibleExtra:
             assert isinstance( cleanNoteText, str )
             if debuggingThisModule: assert cleanNoteText # Mustn't be blank
             assert '\\' not in cleanNoteText and '\n' not in cleanNoteText and '\r' not in cleanNoteText
-        self.myType, self.index, self.noteText, self.cleanNoteText = myType, indexToAdjText, noteText, cleanNoteText
+        if cleanNoteText == noteText: cleanNoteText = noteText # Share the string if it's the same
+        self.myType, self.index, self.noteText, self.cleanNoteText = sys.intern( myType ), indexToAdjText, noteText, cleanNoteText
     # end of InternalBibleExtra.__init__
 
+    def __setstate__( self, state ): setSlotsState( self, state ) # Can also load our older (non-slotted) pickles
+
 
     #def __eq__( self, other ):
         #if type( other ) is type( self ): return self.__dict__ == other.__dict__
@@ -555,7 +579,11 @@ class InternalBibleEntry:
 
     Each entry holds the original and adjusted markers (e.g., \s will be adjusted to \s1)
         plus the cleanText with notes, etc. removed and stored in the "extras" list.
+
+    There's one of these for every line of every loaded book,
+        so we use __slots__, intern the markers, and share equal text strings.
     """
+    __slots__ = ( 'marker', 'originalMarker', 'adjustedText', 'cleanText', 'extras', 'originalText', )
 
     def __init__( self, marker, originalMarker, adjustedText, cleanText, extras, originalText ):
         """
@@ -597,7 +625,13 @@ class InternalBibleEntry:
                 #assert marker in BibleOrgSysGlobals.USFMMarkers or marker in BOS_ADDED_CONTENT_MARKERS
                 if marker not in BibleOrgSysGlobals.USFMMarkers and marker not in BOS_ADDED_CONTENT_MARKERS:
                     logging.warning( "InternalBibleEntry doesn't handle {!r} marker yet.".format( marker ) )
-        self.marker, self.originalMarker, self.adjustedText, self.cleanText, self.extras, self.originalText = marker, originalMarker, adjustedText, cleanText, extras, originalText
+        # Often the three text fields are equal (e.g., no notes or character formatting)
+        #   so only keep one copy of the string
+        if adjustedText == originalText: adjustedText = originalText
+        if cleanText == adjustedText: cleanText = adjustedText
+        self.marker = sys.intern( marker )
+        self.originalMarker = None if originalMarker is None else sys.intern( originalMarker )
+        self.adjustedText, self.cleanText, self.extras, self.originalText = adjustedText, cleanText, extras, originalText
 
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule \
         and self.originalText is not None and self.getFullText() != self.originalText.strip():
@@ -606,6 +640,8 @@ class InternalBibleEntry:
             #halt # When does this happen?
     # end of InternalBibleEntry.__init__
 
+    def __setstate__( self, state ): setSlotsState( self, state ) # Can also load our older (non-slotted) pickles
+
 
     def __eq__( self, other ): # If we don't have this defined, a==b does a is b.
         #print( repr(self) )
@@ -617,7 +653,10 @@ class InternalBibleEntry:
         #for someKey, someItem in sorted( other.__dict__.items() ):
             #print( 'other', someKey, repr(someItem) )
         #halt
-        return isinstance( other, self.__class__ ) and self.__dict__ == other.__dict__
+        return isinstance( other, self.__class__ ) \
+            and self.marker == other.marker and self.originalMarker == other.originalMarker \
+            and self.adjustedText == other.adjustedText and self.cleanText == other.cleanText \
+            and self.extras == other.extras and self.originalText == other.originalText
     def __ne__( self, other ):
         return not self.__eq__( other )
 
@@ -847,7 +886,12 @@ class InternalBibleCVIndexEntry:
             indexNext: the index of the next BibleEntry (do we really need this????)
         2/ entryCount: the number of BibleEntries
         3/ context: a list containing contextual markers which still apply to this entry.
+
+    There's one of these for every verse so we use __slots__.
+    Note that the context list may be shared with other entries so must not be modified.
     """
+    __slots__ = ( 'entryIndex', 'entryCount', 'context', )
+
     def __init__( self, entryIndex, entryCount, context=None ):
         """
         """
@@ -857,6 +901,8 @@ class InternalBibleCVIndexEntry:
         #self.indexNext = self.entryIndex + entryCount
     # end of InternalBibleCVIndexEntry.__init__
 
+    def __setstate__( self, state ): setSlotsState( self, state ) # Can also load our older (non-slotted) pickles
+
     def __str__( self ):
         """
         Just display a simplified view of the index entry.
@@ -929,7 +975,7 @@ class InternalBibleCVIndex:
     # end of InternalBibleCVIndex.__str__
 
 
-    def __len__( self ): len( self.__indexData )
+    def __len__( self ): return len( self.__indexData )
     #def __getitem__( self, keyIndex ):
         #print( "IBI.gi", keyIndex, len(self.__indexData)); halt
         #if keyIndex == 0: return None
@@ -1221,13 +1267,17 @@ class InternalBibleCVIndex:
 
         # Now calculate the contextMarkerList for each CV entry and create the proper (full) InternalBibleCVIndexEntries
         contextMarkerList = []
+        sharedContexts = {} # So that verses with the same context can share one (read-only) list
         for (C,V), (indexStart,count) in self.__indexData.items():
             if debuggingThisModule:
                 print( "makeIndex for {} {} {}:{} {} {} {}".format( self.name, self.BBB, C, V, indexStart, count, contextMarkerList ) )
             # Replace the existing (temporary) index entry to include a copy of the previous contextMarkerList
             #   e.g., a typical verse might be inside a paragraph in a section
             #            thus getting the contextMarkerList: ['chapters','c','s1','p']
-            self.__indexData[(C,V)] = InternalBibleCVIndexEntry( indexStart, count, contextMarkerList[:] )
+            contextKey = tuple( contextMarkerList )
+            try: context = sharedContexts[contextKey]
+            except KeyError: context = sharedContexts[contextKey] = contextMarkerList[:]
+            self.__indexData[(C,V)] = InternalBibleCVIndexEntry( indexStart, count, context )
             for j in range( indexStart, indexStart+count ):
                 entry = self.givenBibleEntries[j]
                 marker = entry.getMarker()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# InternalBibleSearchIndex.py
+#
+# Module handling a full-text (inverted) search index for internal Bibles
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for creating and using a full-text (inverted) search index for an InternalBible
+    so that InternalBible.findText doesn't have to scan every line of every book for every search.
+
+The index maps each normalised token (a run of word characters after case-folding,
+    and optionally with accents removed) to an ordered array of the Bible lines containing it.
+It also records the C:V reference and the last paragraph marker for each line
+    so that candidate lines can be searched without walking through the whole book.
+
+NOTE: The index is only used to find the candidate lines.
+    findText still checks each candidate line with exactly the same code as before
+        so the search results are identical (including for wordMode and phrase searches).
+
+    normaliseSearchText( text, ignoreDiacriticsFlag )
+    getSearchIndexSignature( BibleObject )
+    getSearchIndexContentSignature( BibleObject )
+    class InternalBibleSearchIndex
+        __init__( self )
+        __str__( self )
+        __len__( self )
+        isCurrent( self, BibleObject, checkContents=False )
+        makeIndex( self, BibleObject )
+        getLineInfo( self, BBB, lineIndex )
+        getCandidateLines( self, findText, ignoreDiacriticsFlag, BibleObject )
+        save( self, filepath )
+    loadSearchIndex( filepath )
+"""
+
+from gettext import gettext as _
+
+LastModifiedDate = '2026-10-17' # by RJH
+ShortProgName = "InternalBibleSearchIndex"
+ProgName = "Internal Bible search index handler"
+ProgVersion = '0.02'
+ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
+ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
+
+debuggingThisModule = False
+
+
+import os, logging, re, pickle, hashlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+import BibleOrgSysGlobals
+from InternalBibleInternals import BOS_EXTRA_TYPES, BOS_EXTRA_MARKERS
+
+
+
+SEARCH_INDEX_VERSION = 2 # Increment this if the saved format changes
+SEARCH_INDEX_FILENAME = 'BibleSearchIndex.pickle' # Saved inside a PickledBible folder
+SEARCH_INDEX_FILENAME_END = '.BOSSearchIndex.pickle' # Saved next to a zipped PickledBible
+
+TOKEN_RE = re.compile( r'\w+' )
+
+
+
+def normaliseSearchText( text, ignoreDiacriticsFlag ):
+    """
+    Return the text in the form that is tokenised for the index.
+
+    We use casefold() (rather than lower()) because it works character by character,
+        so a case-sensitive or lower-cased search string found in a line
+        is always found in the normalised line as well.
+    """
+    if ignoreDiacriticsFlag: text = BibleOrgSysGlobals.removeAccents( text )
+    return text.casefold()
+# end of normaliseSearchText
+
+
+def getSearchIndexSignature( BibleObject ):
+    """
+    Returns a tuple of (BBB,numLines) 2-tuples used to check that an index still matches the Bible.
+    """
+    return tuple( (BBB,len(bookObject)) for BBB,bookObject in BibleObject.books.items() )
+# end of getSearchIndexSignature
+
+
+def getSearchIndexContentSignature( BibleObject ):
+    """
+    Returns a tuple of (BBB,md5HexDigest) 2-tuples of all the text that the index is made from.
+
+    This takes a pass through every line so is only used to check a saved index
+        (which might have been made before the Bible was regenerated with edited text).
+    """
+    result = []
+    for BBB,bookObject in BibleObject.books.items():
+        bookHash = hashlib.md5()
+        for lineEntry in bookObject:
+            lineTexts = [ lineEntry.getMarker(), lineEntry.getFullText(), lineEntry.getCleanText() ]
+            extras = lineEntry.getExtras()
+            if extras:
+                for extra in extras: lineTexts.extend( (extra.getType(), extra.getText()) )
+            bookHash.update( ( '\x1f'.join( str(text) for text in lineTexts ) + '\x1e' ).encode( 'utf-8', 'surrogatepass' ) )
+        result.append( (BBB,bookHash.hexdigest()) )
+    return tuple( result )
+# end of getSearchIndexContentSignature
+
+
+
+class InternalBibleSearchIndex:
+    """
+    Class for creating and using a full-text (inverted) search index for an InternalBible.
+
+    The lines are numbered consecutively through all the books (in the order of BibleObject.books)
+        and the tokens point to those (global) line numbers.
+
+    The token dictionaries (one without and one with diacritics removed)
+        are only made when they're first needed.
+    """
+    def __init__( self ):
+        """
+        Create an empty index.
+        """
+        self.version = SEARCH_INDEX_VERSION
+        self.signature = self.contentSignature = None
+        self.filepath = None # Set if the index should be saved when it's updated
+        self.bookCodes, self.bookOffsets = [], [] # The BBB and first global line number for each book
+        self.lineCs, self.lineVs, self.lineParagraphMarkers = [], [], [] # For each global line
+        self.tokenDicts = {} # Keyed by ignoreDiacriticsFlag, each containing token keys with array of line numbers
+    # end of InternalBibleSearchIndex.__init__
+
+
+    def __str__( self ):
+        """
+        Just display a simplified view of the index.
+        """
+        result = "InternalBibleSearchIndex object:"
+        if self.signature is None: result += "\n  Index is empty"
+        else:
+            result += "\n  {} lines indexed from {} books".format( len(self), len(self.bookCodes) )
+            for ignoreDiacriticsFlag, tokenDict in sorted( self.tokenDicts.items() ):
+                result += "\n  {} {}tokens".format( len(tokenDict), 'accentless ' if ignoreDiacriticsFlag else '' )
+        return result
+    # end of InternalBibleSearchIndex.__str__
+
+
+    def __len__( self ): return len( self.lineCs )
+
+
+    def isCurrent( self, BibleObject, checkContents=False ):
+        """
+        Returns True if the index still matches the books and lines in the Bible.
+
+        If checkContents is set, the text of every line is also checked (e.g., for a saved index).
+        """
+        return self.version == SEARCH_INDEX_VERSION and self.signature == getSearchIndexSignature( BibleObject ) \
+            and (not checkContents or self.contentSignature == getSearchIndexContentSignature( BibleObject ))
+    # end of InternalBibleSearchIndex.isCurrent
+
+
+    def makeIndex( self, BibleObject ):
+        """
+        Go through all of the (loaded) books and save the C:V reference
+            and the last paragraph marker for each line.
+
+        This follows exactly the same logic as InternalBible.findText.
+
+        The token dictionaries are made later as they're needed.
+        """
+        if BibleOrgSysGlobals.verbosityLevel > 2:
+            print( _("Making search index for {}…").format( BibleObject.getAName() ) )
+
+        self.signature = getSearchIndexSignature( BibleObject )
+        self.contentSignature = getSearchIndexContentSignature( BibleObject )
+        self.bookCodes, self.bookOffsets = [], []
+        self.lineCs, self.lineVs, self.lineParagraphMarkers = [], [], []
+        self.tokenDicts = {}
+        for BBB,bookObject in BibleObject.books.items():
+            self.bookCodes.append( BBB )
+            self.bookOffsets.append( len(self.lineCs) )
+            C, V = '-1', '-1' # So first/id line starts at -1:0
+            marker = lastParagraphMarker = None
+            for lineEntry in bookObject:
+                if marker in BibleOrgSysGlobals.USFMParagraphMarkers:
+                    lastParagraphMarker = marker
+                marker, cleanText = lineEntry.getMarker(), lineEntry.getCleanText()
+                if marker[0] != '¬' and marker not in ('intro','chapters'): # findText always ignores these added lines
+                    if marker == 'c': C, V = cleanText, '0'
+                    elif marker == 'v': V = cleanText
+                    elif C == '-1': V = str( int(V) + 1 )
+                self.lineCs.append( C )
+                self.lineVs.append( V )
+                self.lineParagraphMarkers.append( lastParagraphMarker )
+    # end of InternalBibleSearchIndex.makeIndex
+
+
+    def __makeTokenDict( self, BibleObject, ignoreDiacriticsFlag ):
+        """
+        Tokenise all the searchable text of each line
+            (i.e., the clean text, the full text, the extras, and the markers).
+        """
+        if BibleOrgSysGlobals.verbosityLevel > 2:
+            print( _("Making search index tokens for {}…").format( BibleObject.getAName() ) )
+
+        tokenDict = {}
+        for BBB, bookOffset in zip( self.bookCodes, self.bookOffsets ):
+            for lineIndex, lineEntry in enumerate( BibleObject.books[BBB] ):
+                marker = lineEntry.getMarker()
+                if marker[0] == '¬' or marker in ('intro','chapters'): continue # findText never searches these
+                # NOTE: findText formats the marker text exactly like this (so a missing full text is searched as 'None')
+                texts = [ '\\{} {}'.format( marker, lineEntry.getFullText() ), lineEntry.getCleanText() ]
+                extras = lineEntry.getExtras()
+                if extras:
+                    for extra in extras:
+                        texts.append( '\\{} {}'.format( BOS_EXTRA_MARKERS[BOS_EXTRA_TYPES.index( extra.getType() )], extra.getText() ) )
+                lineNumber = bookOffset + lineIndex
+                for token in set( TOKEN_RE.findall( normaliseSearchText( ' '.join( text for text in texts if text ), ignoreDiacriticsFlag ) ) ):
+                    try: tokenDict[token].append( lineNumber )
+                    except KeyError: tokenDict[token] = array( 'L', (lineNumber,) )
+        self.tokenDicts[ignoreDiacriticsFlag] = tokenDict
+        if self.filepath: self.save( self.filepath )
+    # end of InternalBibleSearchIndex.__makeTokenDict
+
+
+    def getLineInfo( self, BBB, lineIndex ):
+        """
+        Returns a 3-tuple with C, V, lastParagraphMarker for the given line in the given book.
+        """
+        lineNumber = self.bookOffsets[self.bookCodes.index( BBB )] + lineIndex
+        return self.lineCs[lineNumber], self.lineVs[lineNumber], self.lineParagraphMarkers[lineNumber]
+    # end of InternalBibleSearchIndex.getLineInfo
+
+
+    def getCandidateLines( self, findText, ignoreDiacriticsFlag, BibleObject ):
+        """
+        Given the search text (already converted as findText converts it),
+            find the lines which might contain it.
+
+        Each run of word characters in the (normalised) search text must be within a token in the line:
+            if there's a non-word character on both sides of the run in the search text, it must equal the token,
+            if only at the end, the token must end with it, if only at the start, the token must start with it,
+            else the token need only contain it.
+
+        Returns None if the index can't help (e.g., the search text contains no word characters),
+            else an OrderedDict with BBB keys and lists of line indexes as values.
+        """
+        if debuggingThisModule:
+            print( "InternalBibleSearchIndex.getCandidateLines( {!r}, {} )".format( findText, ignoreDiacriticsFlag ) )
+
+        normalisedText = normaliseSearchText( findText, ignoreDiacriticsFlag )
+        constraints = []
+        for match in TOKEN_RE.finditer( normalisedText ):
+            openStart, openEnd = match.start()==0, match.end()==len(normalisedText)
+            constraints.append( (openStart+openEnd, openStart, match.group()) )
+        if not constraints: return None
+        constraints.sort() # so the exact tokens (which should be quickest and most selective) are done first
+
+        if ignoreDiacriticsFlag not in self.tokenDicts: self.__makeTokenDict( BibleObject, ignoreDiacriticsFlag )
+        tokenDict = self.tokenDicts[ignoreDiacriticsFlag]
+        candidateLineNumbers = None
+        for numOpen, openStart, run in constraints:
+            if numOpen == 0: # must be a whole token
+                lineNumbers = set( tokenDict.get( run, () ) )
+            else:
+                if numOpen == 2: tokens = [token for token in tokenDict if run in token]
+                elif openStart: tokens = [token for token in tokenDict if token.endswith( run )]
+                else: tokens = [token for token in tokenDict if token.startswith( run )]
+                lineNumbers = set()
+                for token in tokens: lineNumbers.update( tokenDict[token] )
+            candidateLineNumbers = lineNumbers if candidateLineNumbers is None else candidateLineNumbers & lineNumbers
+            if not candidateLineNumbers: break
+
+        resultDict = OrderedDict( (BBB,[]) for BBB in self.bookCodes )
+        for lineNumber in sorted( candidateLineNumbers ):
+            bookIndex = bisect_right( self.bookOffsets, lineNumber ) - 1
+            resultDict[self.bookCodes[bookIndex]].append( lineNumber - self.bookOffsets[bookIndex] )
+        return resultDict
+    # end of InternalBibleSearchIndex.getCandidateLines
+
+
+    def save( self, filepath ):
+        """
+        Save the index to the given filepath (e.g., next to a PickledBible)
+            so that it doesn't need to be remade next time.
+
+        Returns True if successful.
+        """
+        if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Saving search index to {}…").format( filepath ) )
+        self.filepath = filepath
+        try:
+            with open( filepath, 'wb' ) as pickleOutputFile:
+                pickle.dump( self, pickleOutputFile, pickle.HIGHEST_PROTOCOL )
+        except OSError as err:
+            logging.warning( "InternalBibleSearchIndex.save: " + _("Unable to save search index to {}: {}").format( filepath, err ) )
+            return False
+        return True
+    # end of InternalBibleSearchIndex.save
+# end of class InternalBibleSearchIndex
+
+
+
+def loadSearchIndex( filepath ):
+    """
+    Load a previously saved search index.
+
+    Returns the InternalBibleSearchIndex object or None.
+    """
+    if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading search index from {}…").format( filepath ) )
+    try:
+        with open( filepath, 'rb' ) as pickleInputFile:
+            searchIndex = pickle.load( pickleInputFile )
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as err:
+        logging.warning( "loadSearchIndex: " + _("Unable to load search index from {}: {}").format( filepath, err ) )
+        return None
+    if not isinstance( searchIndex, InternalBibleSearchIndex ) \
+    or getattr( searchIndex, 'version', None ) != SEARCH_INDEX_VERSION:
+        logging.info( "loadSearchIndex: " + _("Ignoring out-of-date search index in {}").format( filepath ) )
+        return None
+    searchIndex.filepath = filepath
+    return searchIndex
+# end of loadSearchIndex
+
+
+
+def demo():
+    """
+    Demonstrate building and using a search index.
+    """
+    if BibleOrgSysGlobals.verbosityLevel > 0: print( ProgNameVersion )
+
+    from USFMBible import USFMBible
+    testFolder = 'Tests/DataFilesForTests/USFMTest1/'
+    iB = USFMBible( testFolder )
+    iB.load()
+    searchIndex = InternalBibleSearchIndex()
+    searchIndex.makeIndex( iB )
+    for searchString in ( "the", "Lord", "th", "and the", "junk", ):
+        candidateLines = searchIndex.getCandidateLines( searchString, False, iB )
+        if BibleOrgSysGlobals.verbosityLevel > 0:
+            print( "  {!r} candidates: {}".format( searchString, sum( len(lines) for lines in candidateLines.values() ) ) )
+    if BibleOrgSysGlobals.verbosityLevel > 0: print( searchIndex )
+# end of demo
+
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    demo()
+
+    BibleOrgSysGlobals.closedown( ProgName, ProgVersion )
+# end of InternalBibleSearchIndex.py
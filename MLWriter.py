@@ -30,17 +30,20 @@ Why write yet another module to do this?
     Better control of file layout and indentation
     It only took half a day anyway.
 
-TODO: Add buffering
+Output is collected in a list of string chunks (rather than one growing string)
+    and only joined (and optionally encoded to bytes) when it's flushed to the file.
+    The last chunk is always held back so that a final newline can still be removed.
+
 TODO: Add writeAutoDTD
 
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-05-02' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "MLWriter"
 ProgName = "ML Writer"
-ProgVersion = '0.36'
+ProgVersion = '0.37'
 ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
 
 debuggingThisModule = False
@@ -93,9 +96,11 @@ class MLWriter:
 
         self._status = 'Idle' # Not sure that we really even need this
         self._sectionName = 'None' # Else 'Header' or 'Main' (allows finer use of humanReadable control)
-        self._buffer = ''
-        self._bufferFlushSize = 1000 # Flush the buffer to the disk when it gets this many characters
-        self._bufferSaveSize = 30 # How much off the buffer to hold back for possible backtracking
+        self._bufferChunks = [] # Strings not yet written to the file (the last one is held back for possible backtracking)
+        self._bufferLength = 0 # Total number of characters in the above chunks
+        self._bufferFlushSize = 65536 # Flush the buffer to the disk when it gets this many characters
+        self._binaryOutput = False # Set by start()
+        self._indentStrings = [''] # Cached indent strings for each nesting level
         self._openStack = [] # Here we keep track of what XML markers need to be closed
         self._currentColumn = 0
         self._nl = '\n'
@@ -139,6 +144,7 @@ class MLWriter:
         assert value in ('All', 'Header', 'None', 'NLSpace',)
         self._humanReadable = value
         self._indentPerLevel = indentSize
+        self._indentStrings = ['']
         if value=='NLSpace':
             self._limitColumns = False
     # end of MLWriter.setHumanReadableFlag
@@ -153,35 +159,34 @@ class MLWriter:
 
 
     def _writeToFile( self, string ):
-        """ Writes a string to the file.
+        """ Writes a string to the file (encoding it first if we're writing binary).
             NOTE: This doesn't update self._currentColumn (because we don't know what we're writing here). """
         assert self.__outputFile is not None
-        self.__outputFile.write( string )
+        self.__outputFile.write( string.encode( 'utf-8' ) if self._binaryOutput else string )
     # end of MLWriter._writeToFile
 
 
     def _writeBuffer( self, writeAll=True ):
-        """ Writes the buffer to the file. """
+        """ Writes the buffer to the file.
+            Unless writeAll is set, the last chunk is held back (in case we need to retract a newline). """
         assert self.__outputFile is not None
-        if self._buffer:
-            #print( "Writing buffer of {} characters".format( len(self._buffer) ) )
-            if writeAll: # Write it all
-                self._writeToFile( self._buffer )
-                self._buffer = ''
-            elif len(self._buffer) > self._bufferSaveSize: # Write most of it (in case we need to retrack)
-                #print( "From {!r} writing {!r} leaving {!r}".format( self._buffer, self._buffer[:-self._bufferSaveSize], self._buffer[-self._bufferSaveSize:] ) )
-                self._writeToFile( self._buffer[:-self._bufferSaveSize] )
-                self._buffer = self._buffer[-self._bufferSaveSize:]
-            #else: pass # Write none
+        if writeAll: chunks, self._bufferChunks = self._bufferChunks, []
+        elif len(self._bufferChunks) > 1: chunks, self._bufferChunks = self._bufferChunks[:-1], self._bufferChunks[-1:]
+        else: return # Write none
+        self._bufferLength = len(self._bufferChunks[0]) if self._bufferChunks else 0
+        #print( "Writing buffer of {} chunks".format( len(chunks) ) )
+        if chunks: self._writeToFile( ''.join( chunks ) )
     # end of MLWriter._writeBuffer
 
 
     def _writeToBuffer( self, string ):
         """ Writes a string to the buffer.
             NOTE: This doesn't update self._currentColumn (because we don't know what we're writing here). """
-        if len(self._buffer) >= self._bufferFlushSize: # Our buffer is getting too big (and slow)
-            self._writeBuffer( False ) # Physically write most of it to disk
-        self._buffer += string
+        if string:
+            self._bufferChunks.append( string )
+            self._bufferLength += len( string )
+            if self._bufferLength >= self._bufferFlushSize: # Our buffer is getting big
+                self._writeBuffer( False ) # Physically write most of it to disk
     # end of MLWriter._writeToBuffer
 
 
@@ -192,17 +197,21 @@ class MLWriter:
             Append newlines if requested.
         """
         assert self.__outputFile is not None
-        chars = self._SP() + string
-        length = len( chars )
+        indent = self._SP()
+        length = len( indent ) + len( string )
         self._currentColumn += length
+        # The indent, text and newline are appended as separate chunks (rather than copying the text)
+        #   (This is _writeToBuffer inlined because it's our busiest path)
+        bufferChunks = self._bufferChunks
+        if indent: bufferChunks.append( indent )
+        if string: bufferChunks.append( string )
+        self._bufferLength += length
         if noNL: self._suppressFollowingIndent = True
         else: # normal is to append a NL character
             final = self._NL()
-            #if final != self._nl:
-            chars += final
-                #length += len( final )
-                #self._currentColumn += length
-        self._writeToBuffer( chars )
+            if final: bufferChunks.append( final ); self._bufferLength += len( final )
+        if self._bufferLength >= self._bufferFlushSize: # Our buffer is getting big
+            self._writeBuffer( False ) # Physically write most of it to disk
         return length
     # end of MLWriter._write
 
@@ -220,10 +229,12 @@ class MLWriter:
         """Returns an indent with space characters if required (else an empty string)."""
         if self._suppressFollowingIndent: self._suppressFollowingIndent = False; return ''
         if self._humanReadable == "None": return ''
-        if self._humanReadable in ("All", "NLSpace"): return ' '*len(self._openStack)*self._indentPerLevel
-        # Else, we'll assume that it's set to "Header"
-        if self._sectionName == 'Main': return ''
-        return ' '*len(self._openStack)*self._indentPerLevel # for header
+        if self._humanReadable not in ("All", "NLSpace"): # we'll assume that it's set to "Header"
+            if self._sectionName == 'Main': return ''
+        level = len( self._openStack )
+        while len(self._indentStrings) <= level: # Make (and remember) the indent strings that we haven't needed before
+            self._indentStrings.append( ' ' * len(self._indentStrings) * self._indentPerLevel )
+        return self._indentStrings[level]
     # end of MLWriter._SP
 
 
@@ -251,13 +262,11 @@ class MLWriter:
         Removes a final newline sequence from the buffer.
         """
         removed = False
-        if self._buffer:
-            if self._nl in ('\n','\r') and self._buffer[-1]==self._nl:
-                self._buffer = self._buffer[:-1]
-                removed = True
-            elif self._nl=='\r\n' and len(self._buffer)>=2 and self._buffer[-2:]=='\r\n':
-                self._buffer = self._buffer[:-2]
-                removed = True
+        if self._bufferChunks and self._bufferChunks[-1].endswith( self._nl ): # Newlines are always written whole (within one chunk)
+            lastChunk = self._bufferChunks.pop()[:-len(self._nl)]
+            if lastChunk: self._bufferChunks.append( lastChunk )
+            self._bufferLength -= len( self._nl )
+            removed = True
         if not removed:
             logging.error( "MLWriter: " + _("No newline to remove") )
             if debuggingThisModule or BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.strictCheckingFlag: halt
@@ -265,11 +274,13 @@ class MLWriter:
     # end of MLWriter.removeFinalNewline
 
 
-    def start( self, lineEndings='l', noAutoXML=False, writeBOM=False ):
+    def start( self, lineEndings='l', noAutoXML=False, writeBOM=False, binaryOutput=False ):
         """
         Opens the file and writes a header record to it.
             lineEndings: l for Linux
                          w for Windows
+            binaryOutput: if set, the buffered text is encoded to UTF-8 by us
+                            and written straight to a (buffered) binary file.
         """
         assert self._status == 'Idle'
         if lineEndings == 'l': self._nl = '\n'
@@ -278,14 +289,19 @@ class MLWriter:
             logging.error( "MLWriter: " + _("Unknown {!r} lineEndings flag").format( lineEndings ) )
             if debuggingThisModule or BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.strictCheckingFlag: halt
         if BibleOrgSysGlobals.verbosityLevel>2: print( "MLWriter: "+_("Writing {}…").format(self._outputFilePath) )
-        self.__outputFile = open( self._outputFilePath, 'wt', encoding='utf-8' ) # Just create the empty file
-        self.__outputFile.close()
-        if writeBOM:
-            #logging.error( "Haven't worked out how to write BOM yet" )
-            with open( self._outputFilePath, 'ab' ) as self.__outputFile: # Append binary bytes
-                self.__outputFile.write( b'\xef\xbb\xbf' )
-                #self.__outputFile.write( decode( codecs.BOM_UTF8 ) )
-        self.__outputFile = open( self._outputFilePath, 'at' ) # Append text mode
+        self._binaryOutput = binaryOutput
+        if binaryOutput:
+            self.__outputFile = open( self._outputFilePath, 'wb' )
+            if writeBOM: self.__outputFile.write( b'\xef\xbb\xbf' )
+        else:
+            self.__outputFile = open( self._outputFilePath, 'wt', encoding='utf-8' ) # Just create the empty file
+            self.__outputFile.close()
+            if writeBOM:
+                #logging.error( "Haven't worked out how to write BOM yet" )
+                with open( self._outputFilePath, 'ab' ) as self.__outputFile: # Append binary bytes
+                    self.__outputFile.write( b'\xef\xbb\xbf' )
+                    #self.__outputFile.write( decode( codecs.BOM_UTF8 ) )
+            self.__outputFile = open( self._outputFilePath, 'at' ) # Append text mode
         self._status = 'Open'
         self._currentColumn = 0
         if self._outputType=='XML' and not noAutoXML:
@@ -495,7 +511,7 @@ class MLWriter:
             logging.error( "MLWriter.close: " + _("have unclosed tags: {}").format(self._openStack) )
             if BibleOrgSysGlobals.debugFlag and (debuggingThisModule or BibleOrgSysGlobals.strictCheckingFlag): halt
         if writeFinalNL: self.writeNewLine()
-        if self._buffer: self._writeBuffer()
+        if self._bufferChunks: self._writeBuffer()
         if self._status != 'Buffered': pass
         self.__outputFile.close()
         self._status = 'Closed'
@@ -38,10 +38,10 @@ NOTE: We could use multiprocessing in loadBooks()
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-04' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "OSISBible"
 ProgName = "OSIS XML Bible format handler"
-ProgVersion = '0.65'
+ProgVersion = '0.67'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -49,7 +49,7 @@ debuggingThisModule = False
 
 
 import logging, os, sys
-from xml.etree.ElementTree import ElementTree, ParseError
+from xml.etree.ElementTree import iterparse, ParseError
 
 import BibleOrgSysGlobals
 from ISO_639_3_Languages import ISO_639_3_Languages
@@ -84,7 +84,7 @@ def exp( messageString ):
 
 
 
-def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for OSIS XML Bible files or folders in the folder and in the next level down.
 
@@ -100,11 +100,13 @@ def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("OSISXMLBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("OSISXMLBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
@@ -113,13 +115,13 @@ def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
     #   and we don't want to think that 66 book files are 66 different OSIS Bibles
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " OSISXMLBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles, foundBookFiles = [], [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             ignore = False
@@ -141,7 +143,7 @@ def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
     lastFilenameFound = None
     for thisFilename in sorted( foundFiles ):
         if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-            firstLines = BibleOrgSysGlobals.peekIntoFile( thisFilename, givenFolderName, numLines=3 )
+            firstLines = folderSnapshot.peekIntoFile( thisFilename, givenFolderName, numLines=3 )
             if not firstLines or len(firstLines)<2: continue
             if not ( firstLines[0].startswith( '<?xml version="1.0"' ) or firstLines[0].startswith( "<?xml version='1.0'" ) ) \
             and not ( firstLines[0].startswith( '\ufeff<?xml version="1.0"' ) or firstLines[0].startswith( "\ufeff<?xml version='1.0'" ) ): # same but with BOM
@@ -170,10 +172,10 @@ def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    OSISXMLBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles, foundSubBookFiles = [], [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 ignore = False
@@ -192,7 +194,7 @@ def OSISXMLBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
         # See if there's an OSIS project here in this folder
         for thisFilename in sorted( foundSubfiles ):
             if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
-                firstLines = BibleOrgSysGlobals.peekIntoFile( thisFilename, tryFolderName, numLines=2 )
+                firstLines = folderSnapshot.peekIntoFile( thisFilename, tryFolderName, numLines=2 )
                 if not firstLines or len(firstLines)<2: continue
                 if not ( firstLines[0].startswith( '<?xml version="1.0"' ) or firstLines[0].startswith( "<?xml version='1.0'" ) ) \
                 and not ( firstLines[0].startswith( '\ufeff<?xml version="1.0"' ) or firstLines[0].startswith( "\ufeff<?xml version='1.0'" ) ): # same but with BOM
@@ -401,13 +403,15 @@ class OSISXMLBible( Bible ):
         """
         Load the requested book into self.books if it's not already loaded.
 
+        If the whole Bible is in one file, only the requested book is extracted from it.
+
         #NOTE: You should ensure that preload() has been called first.
         """
         if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel > 2 or debuggingThisModule:
             print( "OSISXMLBible.loadBook( {}, {} )".format( BBB, filename ) )
             #assert self.preloadDone
 
-        if not self.possibleFilenames: # then the whole Bible was probably in one file
+        if not self.possibleFilenames and not os.path.isfile( self.sourceFilepath ):
             if debuggingThisModule: print( "  Unable to load OSIS by book -- returning" )
             return # nothing to do here
 
@@ -422,8 +426,9 @@ class OSISXMLBible( Bible ):
 
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag:
             print( _("  OSISXMLBible: Loading {} from {} from {}…").format( BBB, self.name, self.sourceFolder ) )
-        if filename is None and BBB in self.possibleFilenameDict: filename = self.possibleFilenameDict[BBB]
-        if filename is None: raise FileNotFoundError( "OSISXMLBible.loadBook: Unable to find file for {}".format( BBB ) )
+        if self.possibleFilenames: # then we have a file for each book
+            if filename is None and BBB in self.possibleFilenameDict: filename = self.possibleFilenameDict[BBB]
+            if filename is None: raise FileNotFoundError( "OSISXMLBible.loadBook: Unable to find file for {}".format( BBB ) )
         #BB = BibleBook( self, BBB )
         #BB.load( filename, self.sourceFolder, self.encoding )
         #if BB._rawLines:
@@ -431,8 +436,11 @@ class OSISXMLBible( Bible ):
             #self.stashBook( BB )
         #else: logging.info( "OSIS book {} was completely blank".format( BBB ) )
         self.loadErrors = []
-        pathname = os.path.join( self.sourceFolder, filename )
-        self.__loadFile( pathname, self.loadErrors )
+        if self.possibleFilenames:
+            pathname = os.path.join( self.sourceFolder, filename )
+            self.__loadFile( pathname, self.loadErrors )
+        else: # the whole Bible is in one file
+            self.__loadFile( self.sourceFilepath, self.loadErrors, wantedBBB=BBB )
         self.bookNeedsReloading[BBB] = False
         if self.loadErrors:
             if 'Load Errors' not in self.errorDictionary: self.errorDictionary['Load Errors'] = []
@@ -443,85 +451,101 @@ class OSISXMLBible( Bible ):
     # end of OSISXMLBible.loadBook
 
 
-    def __loadFile( self, OSISFilepath, loadErrors ):
+    def __loadFile( self, OSISFilepath, loadErrors, wantedBBB=None ):
         """
         Load a single source XML file and remove the header from the tree.
         Also, extracts some useful elements from the header element.
+
+        Uses iterparse so that each book div is processed as soon as it's complete
+            and then emptied, i.e., the entire XML tree is never held in memory at once
+            (self.XMLTree is only left with the outer elements).
+
+        If wantedBBB is given, only that book is loaded
+            (other book divs are discarded as they're read)
+            and we stop reading the file as soon as that book has been loaded.
         """
         if BibleOrgSysGlobals.verbosityLevel > 2 or debuggingThisModule:
-            print( _("  OSISXMLBible loading {}…").format( OSISFilepath ) )
+            print( _("  OSISXMLBible loading {}{}…").format( OSISFilepath, ' for {}'.format( wantedBBB ) if wantedBBB else '' ) )
 
-        try: self.XMLTree = ElementTree().parse( OSISFilepath )
-        except ParseError as err:
-            logging.critical( exp("Loader parse error in xml file {}: {} {}").format( OSISFilepath, sys.exc_info()[0], err ) )
-            loadErrors.append( exp("Loader parse error in xml file {}: {} {}").format( OSISFilepath, sys.exc_info()[0], err ) )
-            return
-        if BibleOrgSysGlobals.debugFlag: assert len( self.XMLTree ) # Fail here if we didn't load anything at all
+        def isDiv( element ):
+            return element.tag == OSISXMLBible.divTag or (not BibleOrgSysGlobals.strictCheckingFlag and element.tag == 'div')
+        # end of isDiv
 
-        # Find the main (osis) container
-        if self.XMLTree.tag == OSISXMLBible.treeTag:
-            location = 'OSIS file'
-            BibleOrgSysGlobals.checkXMLNoText( self.XMLTree, location, '4f6h', loadErrors )
-            BibleOrgSysGlobals.checkXMLNoTail( self.XMLTree, location, '1wk8', loadErrors )
-            # Process the attributes first
-            self.schemaLocation = None
-            for attrib,value in self.XMLTree.items():
-                if attrib.endswith("schemaLocation"):
-                    self.schemaLocation = value
+        def isUnwantedBook( element ):
+            """
+            Returns True if element is a book div but not for wantedBBB.
+            """
+            if not wantedBBB or not isDiv( element ): return False
+            divType = element.get( 'type' )
+            if divType == 'front': return wantedBBB != 'FRT'
+            if divType != 'book': return False
+            divOsisID = element.get( 'osisID' )
+            if not divOsisID: return False # Let validateAndExtractBookDiv complain about it
+            if len(divOsisID)>3 and divOsisID[-1] in ('1','2','3') and divOsisID[-2]=='.': # Allow for the Snowfall bug (see validateAndExtractBookDiv)
+                divOsisID = divOsisID[:-2]
+            try: divBBB = BibleOrgSysGlobals.BibleBooksCodes.getBBBFromOSISAbbreviation( divOsisID )
+            except KeyError: return False # Let validateAndExtractBookDiv complain about it
+            if isinstance( divBBB, list ): divBBB = divBBB[0]
+            return divBBB != wantedBBB
+        # end of isUnwantedBook
+
+        def validateOSISTextAttributes( textElement ):
+            """
+            Process the attributes of the osisText element.
+            """
+            self.osisIDWork = self.osisRefWork = canonical = None
+            for attrib,value in textElement.items():
+                if attrib=='osisIDWork':
+                    self.osisIDWork = value
+                    if not self.name: self.name = value
+                elif attrib=='osisRefWork': self.osisRefWork = value
+                elif attrib=='canonical':
+                    canonical = value
+                    assert canonical in ('true','false')
+                elif attrib==OSISXMLBible.XMLNameSpace+'lang': self.lang = value
                 else:
-                    logging.warning( "fv6g Unprocessed {} attribute ({}) in {}".format( attrib, value, location ) )
-                    loadErrors.append( "Unprocessed {} attribute ({}) in {} (fv6g)".format( attrib, value, location ) )
+                    logging.warning( "gb2d Unprocessed {} attribute ({}) in {}".format( attrib, value, sublocation ) )
+                    loadErrors.append( "Unprocessed {} attribute ({}) in {} (gb2d)".format( attrib, value, sublocation ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-
-            # Find the submain (osisText) container
-            if len(self.XMLTree)==1 and (self.XMLTree[0].tag == OSISXMLBible.textTag or (not BibleOrgSysGlobals.strictCheckingFlag and self.XMLTree[0].tag == 'osisText')):
-                sublocation = "osisText in " + location
-                textElement = self.XMLTree[0]
-                BibleOrgSysGlobals.checkXMLNoText( textElement, sublocation, '3b5g', loadErrors )
-                BibleOrgSysGlobals.checkXMLNoTail( textElement, sublocation, '7h9k', loadErrors )
-                # Process the attributes first
-                self.osisIDWork = self.osisRefWork = canonical = None
-                for attrib,value in textElement.items():
-                    if attrib=='osisIDWork':
-                        self.osisIDWork = value
-                        if not self.name: self.name = value
-                    elif attrib=='osisRefWork': self.osisRefWork = value
-                    elif attrib=='canonical':
-                        canonical = value
-                        assert canonical in ('true','false')
-                    elif attrib==OSISXMLBible.XMLNameSpace+'lang': self.lang = value
-                    else:
-                        logging.warning( "gb2d Unprocessed {} attribute ({}) in {}".format( attrib, value, sublocation ) )
-                        loadErrors.append( "Unprocessed {} attribute ({}) in {} (gb2d)".format( attrib, value, sublocation ) )
-                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                if self.osisRefWork:
-                    if self.osisRefWork not in ('bible','Bible','defaultReferenceScheme'):
-                        logging.warning( "New variety of osisRefWork: {!r}".format( self.osisRefWork ) )
-                        loadErrors.append( "New variety of osisRefWork: {!r}".format( self.osisRefWork ) )
-                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                if self.lang:
-                    if self.lang in ('en','de','he'): # Only specifically recognise these ones so far (English, German, Hebrew)
-                        if BibleOrgSysGlobals.verbosityLevel > 2: print( "    Language is {!r}".format( self.lang ) )
-                    else:
-                        logging.info( "Discovered unknown {!r} language".format( self.lang ) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "  osisIDWork is {!r}".format( self.osisIDWork ) )
-
-                # Find (and move) the header container
-                if textElement[0].tag == OSISXMLBible.headerTag:
-                    self.header = textElement[0]
-                    textElement.remove( self.header )
-                    self.validateHeader( self.header, loadErrors )
-                else:
-                    logging.warning( "Missing header element (looking for {!r} tag)".format( OSISXMLBible.headerTag ) )
-                    loadErrors.append( "Missing header element (looking for {!r} tag)".format( OSISXMLBible.headerTag ) )
+            if self.osisRefWork:
+                if self.osisRefWork not in ('bible','Bible','defaultReferenceScheme'):
+                    logging.warning( "New variety of osisRefWork: {!r}".format( self.osisRefWork ) )
+                    loadErrors.append( "New variety of osisRefWork: {!r}".format( self.osisRefWork ) )
                     if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            if self.lang:
+                if self.lang in ('en','de','he'): # Only specifically recognise these ones so far (English, German, Hebrew)
+                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "    Language is {!r}".format( self.lang ) )
+                else:
+                    logging.info( "Discovered unknown {!r} language".format( self.lang ) )
+            if BibleOrgSysGlobals.verbosityLevel > 2: print( "  osisIDWork is {!r}".format( self.osisIDWork ) )
+        # end of validateOSISTextAttributes
 
-                # Find (and move) the optional front matter (div) container
-                if textElement[0].tag == OSISXMLBible.divTag or (not BibleOrgSysGlobals.strictCheckingFlag and textElement[0].tag == 'div'):
+        def validateTextChild( element ):
+            """
+            Process a completed child element of the osisText element,
+                i.e., the header, the optional front matter, or a main div.
+
+            Returns True if the element has been finished with (and can be removed from the tree).
+            """
+            nonlocal lookingForHeader, lookingForFrontMatter
+            if lookingForHeader: # Find (and move) the header container
+                lookingForHeader = False
+                if element.tag == OSISXMLBible.headerTag:
+                    if self.header is None or not wantedBBB: # Don't repeat this for every loadBook()
+                        self.header = element
+                        self.validateHeader( self.header, loadErrors )
+                    return True
+                logging.warning( "Missing header element (looking for {!r} tag)".format( OSISXMLBible.headerTag ) )
+                loadErrors.append( "Missing header element (looking for {!r} tag)".format( OSISXMLBible.headerTag ) )
+                if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+
+            if lookingForFrontMatter: # Find (and move) the optional front matter (div) container
+                lookingForFrontMatter = False
+                if isDiv( element ):
                     sub2location = "div of " + sublocation
                     # Process the attributes first
                     div0Type = div0OsisID = canonical = None
-                    for attrib,value in textElement[0].items():
+                    for attrib,value in element.items():
                         if attrib=='type': div0Type = value
                         elif attrib=='osisID': div0OsisID = value
                         elif attrib=='canonical':
@@ -533,31 +557,110 @@ class OSISXMLBible( Bible ):
                             loadErrors.append( "Unprocessed {} attribute ({}) in {} (7j4d)".format( attrib, value, sub2location ) )
                             if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
                     if div0Type == 'front':
-                        self.frontMatter = textElement[0]
-                        textElement.remove( self.frontMatter )
+                        self.frontMatter = element
                         self.validateFrontMatter( self.frontMatter, loadErrors )
+                        return True
                     else: logging.info( "No front matter division" )
 
-                self.divs, self.divTypesString = [], None
-                for element in textElement:
-                    if element.tag == OSISXMLBible.divTag or (not BibleOrgSysGlobals.strictCheckingFlag and element.tag == 'div'):
-                        sub2location = "div in " + sublocation
-                        BibleOrgSysGlobals.checkXMLNoText( element, sub2location, '3a2s', loadErrors )
-                        BibleOrgSysGlobals.checkXMLNoTail( element, sub2location, '4k8a', loadErrors )
-                        divType = element.get( 'type' )
-                        if divType is None:
-                            logging.error( "Missing div type in OSIS file" )
-                            loadErrors.append( "Missing div type in OSIS file" )
-                            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-                        if divType != self.divTypesString:
-                            if not self.divTypesString: self.divTypesString = divType
-                            else: self.divTypesString = 'MixedTypes'
-                        self.validateAndExtractMainDiv( element, loadErrors )
-                        self.divs.append( element )
-                    else:
-                        logging.error( "Expected to find {!r} but got {!r}".format( OSISXMLBible.divTag, element.tag ) )
-                        loadErrors.append( "Expected to find {!r} but got {!r}".format( OSISXMLBible.divTag, element.tag ) )
-                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            if isDiv( element ):
+                sub2location = "div in " + sublocation
+                BibleOrgSysGlobals.checkXMLNoText( element, sub2location, '3a2s', loadErrors )
+                # NOTE: The tail isn't available yet -- it's checked at the end
+                divType = element.get( 'type' )
+                if divType is None:
+                    logging.error( "Missing div type in OSIS file" )
+                    loadErrors.append( "Missing div type in OSIS file" )
+                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+                if divType != self.divTypesString:
+                    if not self.divTypesString: self.divTypesString = divType
+                    else: self.divTypesString = 'MixedTypes'
+                self.validateAndExtractMainDiv( element, loadErrors ) # Any bookGroup books have already been done (and removed)
+                del element[:] # We don't need the XML for the book(s) any more
+                self.divs.append( element )
+            else:
+                logging.error( "Expected to find {!r} but got {!r}".format( OSISXMLBible.divTag, element.tag ) )
+                loadErrors.append( "Expected to find {!r} but got {!r}".format( OSISXMLBible.divTag, element.tag ) )
+                if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            return False
+        # end of validateTextChild
+
+
+        # Main code for OSISXMLBible.__loadFile
+        location = 'OSIS file'
+        sublocation = "osisText in " + location
+        self.XMLTree = textElement = None
+        self.divs, self.divTypesString = [], None
+        lookingForHeader = lookingForFrontMatter = True
+        elementStack = [] # The currently open elements (from the osis element down)
+        groupDiv = None # Set while we're inside a bookGroup main div
+        skipDepth = None # Set while we're inside a book div that we don't want
+        finishedEarly = False
+        try:
+            with open( OSISFilepath, 'rb' ) as OSISFile:
+                for event, element in iterparse( OSISFile, events=('start','end') ):
+                    if event == 'start':
+                        elementStack.append( element )
+                        depth = len( elementStack )
+                        if skipDepth is not None: continue
+                        if depth == 1: # the osis element
+                            self.XMLTree = element
+                            if element.tag == OSISXMLBible.treeTag:
+                                # Process the attributes first
+                                self.schemaLocation = None
+                                for attrib,value in element.items():
+                                    if attrib.endswith("schemaLocation"):
+                                        self.schemaLocation = value
+                                    else:
+                                        logging.warning( "fv6g Unprocessed {} attribute ({}) in {}".format( attrib, value, location ) )
+                                        loadErrors.append( "Unprocessed {} attribute ({}) in {} (fv6g)".format( attrib, value, location ) )
+                                        if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+                        elif depth == 2: # Should be the osisText element
+                            if textElement is None and self.XMLTree.tag == OSISXMLBible.treeTag \
+                            and (element.tag == OSISXMLBible.textTag or (not BibleOrgSysGlobals.strictCheckingFlag and element.tag == 'osisText')):
+                                textElement = element
+                                validateOSISTextAttributes( textElement )
+                        elif depth == 3 and elementStack[-2] is textElement:
+                            if isUnwantedBook( element ): skipDepth = depth
+                            elif isDiv( element ) and element.get( 'type' ) == 'bookGroup': groupDiv = element
+                        elif depth == 4 and elementStack[-2] is groupDiv and groupDiv is not None:
+                            if isUnwantedBook( element ): skipDepth = depth
+                        continue
+
+                    # Otherwise it's an end event
+                    depth = len( elementStack )
+                    elementStack.pop()
+                    if skipDepth is not None: # We're discarding this book
+                        if depth > skipDepth: element.clear()
+                        else: # depth == skipDepth -- we've come to the end of the unwanted book
+                            elementStack[-1].remove( element )
+                            skipDepth = None
+                        continue
+                    if depth == 3 and elementStack[-1] is textElement:
+                        if element is groupDiv: groupDiv = None
+                        if validateTextChild( element ): textElement.remove( element )
+                        if wantedBBB and wantedBBB in self.books:
+                            finishedEarly = True; break
+                    elif depth == 4 and elementStack[-1] is groupDiv and groupDiv is not None: # Process each book in the group as it's finished
+                        self.validateAndExtractBookGroupElement( element, 'bookGroup', loadErrors )
+                        groupDiv.remove( element )
+                        if wantedBBB and wantedBBB in self.books:
+                            finishedEarly = True; break
+        except ParseError as err:
+            logging.critical( exp("Loader parse error in xml file {}: {} {}").format( OSISFilepath, sys.exc_info()[0], err ) )
+            loadErrors.append( exp("Loader parse error in xml file {}: {} {}").format( OSISFilepath, sys.exc_info()[0], err ) )
+            return
+        if finishedEarly or self.XMLTree is None: return
+        if BibleOrgSysGlobals.debugFlag: assert len( self.XMLTree ) # Fail here if we didn't load anything at all
+
+        # Now we can check the parts of the outer elements that weren't available while we were parsing
+        if self.XMLTree.tag == OSISXMLBible.treeTag:
+            BibleOrgSysGlobals.checkXMLNoText( self.XMLTree, location, '4f6h', loadErrors )
+            BibleOrgSysGlobals.checkXMLNoTail( self.XMLTree, location, '1wk8', loadErrors )
+            if textElement is not None and len(self.XMLTree)==1:
+                BibleOrgSysGlobals.checkXMLNoText( textElement, sublocation, '3b5g', loadErrors )
+                BibleOrgSysGlobals.checkXMLNoTail( textElement, sublocation, '7h9k', loadErrors )
+                for element in self.divs:
+                    BibleOrgSysGlobals.checkXMLNoTail( element, "div in " + sublocation, '4k8a', loadErrors )
             else:
                 logging.error( "Expected to find {!r} but got {!r}".format( OSISXMLBible.textTag, self.XMLTree[0].tag ) )
                 loadErrors.append( "Expected to find {!r} but got {!r}".format( OSISXMLBible.textTag, self.XMLTree[0].tag ) )
@@ -2146,37 +2249,6 @@ class OSISXMLBible( Bible ):
         self.haveEIDs = False
         self.haveBook = False
 
-
-        def validateGroupTitle( element, locationDescription ):
-            """
-            Check/validate and process a OSIS Bible paragraph, including all subfields.
-            """
-            location = "validateGroupTitle: " + locationDescription
-            BibleOrgSysGlobals.checkXMLNoTail( element, location, 'c4vd', loadErrors )
-            titleText = element.text
-            titleType = titleSubType = titleShort = titleLevel = None
-            for attrib,value in element.items():
-                #if attrib=='type':
-                    #titleType = value
-                #elif attrib=='subType':
-                    #titleSubType = value
-                if attrib=='short':
-                    titleShort = value
-                #elif attrib=='level':
-                    #titleLevel = value # Not used anywhere yet :(
-                else:
-                    logging.warning( "vdv3 Unprocessed {!r} attribute ({}) in {} at {}".format( attrib, value, location, verseMilestone ) )
-                    loadErrors.append( "Unprocessed {!r} attribute ({}) in {} at {} (vdv3)".format( attrib, value, location, verseMilestone ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
-            #if titleSubType: assert titleSubType == 'x-preverse'
-            BibleOrgSysGlobals.checkXMLNoSubelements( element, location+" at book group", 'js21', loadErrors )
-            if BibleOrgSysGlobals.debugFlag: assert titleText
-            if titleText:
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "    Got book group title", repr(titleText) )
-                self.divisions[titleText] = []
-        # end of OSISXMLBible.validateGroupTitle
-
-
         # Process the div attributes first
         mainDivType = mainDivOsisID = mainDivCanonical = None
         BBB = USFMAbbreviation = USFMNumber = ''
@@ -2203,16 +2275,8 @@ class OSISXMLBible( Bible ):
             # We have to set BBB when we get a chapter reference
             if BibleOrgSysGlobals.verbosityLevel > 2: print( _("  Loading a book group…") )
             self.haveBook = False
-            for element in div:
-                if element.tag == OSISXMLBible.OSISNameSpace+'title':
-                    location = "title of {} div".format( mainDivType )
-                    validateGroupTitle( element, location )
-                elif element.tag == OSISXMLBible.OSISNameSpace+'div': # Assume it's a book
-                    self.validateAndExtractBookDiv( element, loadErrors )
-                else:
-                    logging.error( "hfs6 Unprocessed {!r} sub-element ({}) in {} div".format( element.tag, element.text, mainDivType ) )
-                    loadErrors.append( "Unprocessed {!r} sub-element ({}) in {} div (hfs6)".format( element.tag, element.text, mainDivType ) )
-                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            for element in div: # NOTE: __loadFile has usually already done (and removed) these as they were read
+                self.validateAndExtractBookGroupElement( element, mainDivType, loadErrors )
         elif mainDivType == 'book': # this is a single book (not in a group)
             self.validateAndExtractBookDiv( div, loadErrors )
         else:
@@ -2222,6 +2286,55 @@ class OSISXMLBible( Bible ):
     # end of OSISXMLBible.validateAndExtractMainDiv
 
 
+    def validateAndExtractBookGroupElement( self, element, mainDivType, loadErrors ):
+        """
+        Check/validate and extract data from the given element from inside a bookGroup div.
+            This should be a group title or a book division.
+        """
+
+        def validateGroupTitle( element, locationDescription ):
+            """
+            Check/validate and process a OSIS Bible paragraph, including all subfields.
+            """
+            location = "validateGroupTitle: " + locationDescription
+            BibleOrgSysGlobals.checkXMLNoTail( element, location, 'c4vd', loadErrors )
+            titleText = element.text
+            titleType = titleSubType = titleShort = titleLevel = None
+            for attrib,value in element.items():
+                #if attrib=='type':
+                    #titleType = value
+                #elif attrib=='subType':
+                    #titleSubType = value
+                if attrib=='short':
+                    titleShort = value
+                #elif attrib=='level':
+                    #titleLevel = value # Not used anywhere yet :(
+                else:
+                    logging.warning( "vdv3 Unprocessed {!r} attribute ({}) in {} at {}".format( attrib, value, location, verseMilestone ) )
+                    loadErrors.append( "Unprocessed {!r} attribute ({}) in {} at {} (vdv3)".format( attrib, value, location, verseMilestone ) )
+                    if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+            #if titleSubType: assert titleSubType == 'x-preverse'
+            BibleOrgSysGlobals.checkXMLNoSubelements( element, location+" at book group", 'js21', loadErrors )
+            if BibleOrgSysGlobals.debugFlag: assert titleText
+            if titleText:
+                if BibleOrgSysGlobals.verbosityLevel > 2: print( "    Got book group title", repr(titleText) )
+                self.divisions[titleText] = []
+        # end of OSISXMLBible.validateAndExtractBookGroupElement.validateGroupTitle
+
+
+        # Main code for validateAndExtractBookGroupElement
+        if element.tag == OSISXMLBible.OSISNameSpace+'title':
+            location = "title of {} div".format( mainDivType )
+            validateGroupTitle( element, location )
+        elif element.tag == OSISXMLBible.OSISNameSpace+'div': # Assume it's a book
+            self.validateAndExtractBookDiv( element, loadErrors )
+        else:
+            logging.error( "hfs6 Unprocessed {!r} sub-element ({}) in {} div".format( element.tag, element.text, mainDivType ) )
+            loadErrors.append( "Unprocessed {!r} sub-element ({}) in {} div (hfs6)".format( element.tag, element.text, mainDivType ) )
+            if BibleOrgSysGlobals.strictCheckingFlag or BibleOrgSysGlobals.debugFlag and BibleOrgSysGlobals.haltOnXMLWarning: halt
+    # end of OSISXMLBible.validateAndExtractBookGroupElement
+
+
     def validateAndExtractBookDiv( self, div, loadErrors ):
         """
         Check/validate and extract data from the given OSIS div record.
@@ -31,6 +31,15 @@ NOTE: Unfortunately it seems that loading a very large pickled object
     Also, the pickled files seem 10x larger than the originals.
     Ah, but we don't need all those fields, so we added a dataLevel control!
 
+Since v0.16, the processed lines and CV index for each verse are also saved
+    (uncompressed, even in the zip file) in a memory-mappable BibleVerseData.bin file
+    so that getContextVerseData can return a verse without loading the whole book.
+    The file contains a section for each book (each verse pickled separately,
+        followed by the pickled index of the verses for that book)
+    then a pickled directory of the book sections,
+    and finally the offset and length of that directory.
+    Older pickled Bibles without this file still load the whole book.
+
     PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadBooks=False )
     createPickledBible( BibleObject, outputFolder=None, metadataDict=None, dataLevel=None, zipOnly=False )
     getZippedPickledBibleDetails( zipFilepath )
@@ -38,33 +47,36 @@ NOTE: Unfortunately it seems that loading a very large pickled object
     class PickledBible( Bible )
         __init__( self, sourceFileOrFolder )
         __str__( self )
+        getSearchIndexFilepath( self )
         preload( self )
             _loadBookEssentials( self, BBB )
         loadBook( self, BBB )
             _loadBookMP( self, BBB )
         loadBooks( self )
+        getContextVerseData( self, BCVReference )
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-26' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "PickledBible"
 ProgName = "Pickle Bible handler"
-ProgVersion = '0.13'
+ProgVersion = '0.16'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
 debuggingThisModule = False
 
 
-import os, logging, pickle, zipfile
-import multiprocessing
+import os, sys, logging, pickle, zipfile
+import multiprocessing, mmap, struct
 from collections import OrderedDict
 
 import BibleOrgSysGlobals
 from Bible import Bible
 from InternalBibleBook import InternalBibleBook
 from InternalBibleInternals import InternalBibleCVIndex, InternalBibleEntryList
+from InternalBibleSearchIndex import SEARCH_INDEX_FILENAME, SEARCH_INDEX_FILENAME_END
 
 
 
@@ -74,10 +86,15 @@ DBL_FILENAME_END = 'DBL.zip'
 VERSION_FILENAME = 'BibleVersion.pickle' # Contains the object version number
 INFO_FILENAME = 'BibleInfo.pickle' # Contains the Bible metadata
 BOOK_FILENAME = '{}.pickle' # Each book is stored in a separate BBB.pickle file
+VERSE_DATA_FILENAME = 'BibleVerseData.bin' # Contains the verse data for all books (memory-mappable)
+VERSE_DATA_SIGNATURE = b'BOSVerseData v1\n'
+VERSE_DATA_TRAILER_FORMAT = '<QQ' # Directory offset and length at the end of the file
+
+openVerseDataDict = {} # Memory-mapped verse data files, keyed by absolute filepath (with file modification time and size)
 
 
 
-def PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for Pickle Bible files or folders in the folder and in the next level down.
     Or if given a zip filename, check that.
@@ -95,8 +112,10 @@ def PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, auto
     if BibleOrgSysGlobals.debugFlag: assert givenPathname and isinstance( givenPathname, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given path is readable
-    if not os.access( givenPathname, os.R_OK ):
+    if not folderSnapshot.access( givenPathname, os.R_OK ):
         logging.critical( _("PickledBibleFileCheck: Given {!r} path is unreadable").format( givenPathname ) )
         return False
 
@@ -110,20 +129,20 @@ def PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, auto
 
     # Must have been given a folder
     givenFolderName = givenPathname
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("PickledBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " PickledBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             #somethingUpper = something.upper()
             if something in (ZIPPED_PICKLE_FILENAME_END, VERSION_FILENAME):
                 foundFiles.append( something )
@@ -144,15 +163,15 @@ def PickledBibleFileCheck( givenPathname, strictCheck=True, autoLoad=False, auto
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("PickledBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    PickledBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 #somethingUpper = something.upper()
                 if something in (ZIPPED_PICKLE_FILENAME_END, VERSION_FILENAME):
                     foundSubfiles.append( something )
@@ -241,6 +260,15 @@ def createPickledBible( BibleObject, outputFolder=None, metadataDict=None, dataL
                 logging.critical( "BibleOrgSysGlobals.pickleObject: Unable to pickle book into {}".format( filename ) )
                 return False
 
+    # Now save the verse data so that single verses can be found without loading the whole book
+    filepath = os.path.join( outputFolder, VERSE_DATA_FILENAME )
+    createdFilenames.append( VERSE_DATA_FILENAME )
+    try: _writeVerseDataFile( BibleObject, filepath )
+    except pickle.PicklingError as err:
+        logging.error( "PickledBible: Unexpected error in createPickledBible: {0} {1}".format( sys.exc_info()[0], err ) )
+        logging.critical( "PickledBible.createPickledBible: Unable to save verse data into {}".format( VERSE_DATA_FILENAME ) )
+        return False
+
     # Now pickle the main Bible object attributes (less the books)
     filepath = os.path.join( outputFolder, INFO_FILENAME )
     createdFilenames.append( INFO_FILENAME )
@@ -309,7 +337,7 @@ def createPickledBible( BibleObject, outputFolder=None, metadataDict=None, dataL
     zf = zipfile.ZipFile( zipFilepath, 'w', compression=zipfile.ZIP_DEFLATED )
     for filename in createdFilenames:
         filepath = os.path.join( outputFolder, filename )
-        zf.write( filepath, filename )
+        zf.write( filepath, filename, compress_type=zipfile.ZIP_STORED if filename==VERSE_DATA_FILENAME else None ) # So it can be memory-mapped
         if zipOnly: os.remove( filepath )
     zf.close()
 
@@ -319,6 +347,87 @@ def createPickledBible( BibleObject, outputFolder=None, metadataDict=None, dataL
 # end of PickledBible.createPickledBible
 
 
+def _writeVerseDataFile( BibleObject, filepath ):
+    """
+    Write the processed lines and context for each verse in each (indexed) book
+        to the verse data file.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule: print( "_writeVerseDataFile( {} )".format( filepath ) )
+    directory = OrderedDict()
+    with open( filepath, 'wb' ) as verseDataFile:
+        verseDataFile.write( VERSE_DATA_SIGNATURE )
+        for BBB,bookObject in BibleObject.books.items():
+            if not bookObject._indexedFlag: continue
+            bookIndex = {}
+            for CVKey in bookObject._CVIndex:
+                pickledVerse = pickle.dumps( bookObject._CVIndex.getEntriesWithContext( CVKey ), pickle.HIGHEST_PROTOCOL )
+                bookIndex[CVKey] = (verseDataFile.tell(), len(pickledVerse))
+                verseDataFile.write( pickledVerse )
+            pickledBookIndex = pickle.dumps( bookIndex, pickle.HIGHEST_PROTOCOL )
+            directory[BBB] = (verseDataFile.tell(), len(pickledBookIndex))
+            verseDataFile.write( pickledBookIndex )
+        pickledDirectory = pickle.dumps( directory, pickle.HIGHEST_PROTOCOL )
+        directoryOffset = verseDataFile.tell()
+        verseDataFile.write( pickledDirectory )
+        verseDataFile.write( struct.pack( VERSE_DATA_TRAILER_FORMAT, directoryOffset, len(pickledDirectory) ) )
+# end of PickledBible._writeVerseDataFile
+
+
+def _openVerseData( sourcePathname, isZipped ):
+    """
+    Memory-map the verse data file (which then stays open)
+        from the pickle folder or from inside the zip file (where it's stored uncompressed).
+
+    Returns a 3-tuple with the mmap object, the start offset of the verse data file within it,
+        and the directory of book sections
+        or None if there's no (usable) verse data file.
+
+    The mapping is reused until the file is changed (or replaced) on disk.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule: print( "_openVerseData( {}, {} )".format( sourcePathname, isZipped ) )
+
+    mappedFilepath = os.path.abspath( sourcePathname if isZipped else os.path.join( sourcePathname, VERSE_DATA_FILENAME ) )
+    try: fileStat = os.stat( mappedFilepath )
+    except OSError: fileStat = None # No verse data file
+    fileKey = (mappedFilepath, fileStat.st_mtime_ns, fileStat.st_size) if fileStat else None
+    if fileKey in openVerseDataDict: return openVerseDataDict[fileKey]
+    for oldFileKey in [key for key in openVerseDataDict if key[0]==mappedFilepath]: # The file has changed (or gone) since we mapped it
+        openVerseDataDict.pop( oldFileKey )[0].close()
+    if fileStat is None: return None
+
+    result = None
+    try:
+        if isZipped:
+            with zipfile.ZipFile( sourcePathname ) as thisZip:
+                zipInfo = thisZip.getinfo( VERSE_DATA_FILENAME ) # KeyError if it's an older pickled Bible
+            if zipInfo.compress_type != zipfile.ZIP_STORED: raise KeyError
+            verseDataFile = open( mappedFilepath, 'rb' )
+            verseDataFile.seek( zipInfo.header_offset )
+            localHeader = verseDataFile.read( 30 )
+            filenameLength, extraLength = struct.unpack( '<HH', localHeader[26:30] )
+            dataStart = zipInfo.header_offset + 30 + filenameLength + extraLength
+            dataLength = zipInfo.file_size
+        else:
+            verseDataFile = open( mappedFilepath, 'rb' )
+            dataStart, dataLength = 0, os.fstat( verseDataFile.fileno() ).st_size
+        verseDataMap = mmap.mmap( verseDataFile.fileno(), 0, access=mmap.ACCESS_READ )
+        verseDataFile.close() # The mmap keeps its own handle
+        if verseDataMap[dataStart:dataStart+len(VERSE_DATA_SIGNATURE)] == VERSE_DATA_SIGNATURE:
+            trailerLength = struct.calcsize( VERSE_DATA_TRAILER_FORMAT )
+            directoryOffset, directoryLength = struct.unpack( VERSE_DATA_TRAILER_FORMAT,
+                                    verseDataMap[dataStart+dataLength-trailerLength:dataStart+dataLength] )
+            directory = pickle.loads( verseDataMap[dataStart+directoryOffset:dataStart+directoryOffset+directoryLength] )
+            assert isinstance( directory, OrderedDict )
+            result = verseDataMap, dataStart, directory
+        else:
+            logging.error( "PickledBible: " + _("Bad verse data file in {}").format( sourcePathname ) )
+            verseDataMap.close()
+    except (OSError, KeyError, ValueError, struct.error, zipfile.BadZipFile): pass # No usable verse data (don't remember the failure)
+    if result is not None: openVerseDataDict[fileKey] = result
+    return result
+# end of PickledBible._openVerseData
+
+
 
 def _loadObjectAttributes( pickleFileObject, BibleObject ):
     """
@@ -458,6 +567,8 @@ class PickledBible( Bible ):
 
         # Now we can set our object variables
         self.pickleVersionData = OrderedDict()
+        self.verseDataMapInUse = None # The mmap that the book indexes below were loaded from
+        self.verseDataBookIndexes = {} # The verse indexes for each book that we've used from the verse data file
 
         def loadVersionStuff( pickleFileObject ):
             """
@@ -575,6 +686,17 @@ class PickledBible( Bible ):
     # end of PickledBible.__str__
 
 
+    def getSearchIndexFilepath( self ):
+        """
+        Save the findText search index inside the pickle folder
+            or next to the zip file.
+        """
+        if self.pickleIsZipped:
+            return self.pickleFilepath[:-len(ZIPPED_PICKLE_FILENAME_END)] + SEARCH_INDEX_FILENAME_END
+        return os.path.join( self.pickleSourceFolder, SEARCH_INDEX_FILENAME )
+    # end of PickledBible.getSearchIndexFilepath
+
+
     def preload( self ):
         """
         Loads the BibleInfo file if it can be found.
@@ -729,6 +851,46 @@ class PickledBible( Bible ):
 
     def load( self ):
         self.loadBooks()
+
+
+    def getContextVerseData( self, BCVReference ):
+        """
+        Search for a Bible reference
+            and return a 2-tuple containing
+                the Bible text (in a InternalBibleEntryList)
+                along with the context.
+
+        If the book isn't already loaded, and the pickled Bible has a verse data file,
+            only the data for this verse is read (from the memory-mapped file).
+
+        Expects a SimpleVerseKey for the parameter
+            but also copes with a (B,C,V,S) tuple.
+
+        Returns None if there is no information for this book.
+        Raises a KeyError if there is no such CV reference.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "PickledBible.getContextVerseData( {} ) for {}".format( BCVReference, self.name ) )
+
+        if isinstance( BCVReference, tuple ): BBB, C, V = BCVReference[0], BCVReference[1], BCVReference[2]
+        else: BBB, (C, V) = BCVReference.getBBB(), BCVReference.getCV() # Assume it's a SimpleVerseKey object
+        if BBB in self.books: return self.books[BBB].getContextVerseData( BCVReference )
+        verseData = _openVerseData( self.pickleFilepath if self.pickleIsZipped else self.pickleSourceFolder, self.pickleIsZipped )
+        if verseData is None: return Bible.getContextVerseData( self, BCVReference ) # Older pickled Bible -- load the whole book
+        verseDataMap, dataStart, directory = verseData
+        if verseDataMap is not self.verseDataMapInUse: # First time, or the file has been rewritten since
+            self.verseDataMapInUse, self.verseDataBookIndexes = verseDataMap, {}
+
+        if BBB not in self.verseDataBookIndexes: # Load the index for this book (only)
+            if BBB not in directory: return Bible.getContextVerseData( self, BCVReference ) # Possibly an unindexed book
+            indexOffset, indexLength = directory[BBB]
+            self.verseDataBookIndexes[BBB] = pickle.loads( verseDataMap[dataStart+indexOffset:dataStart+indexOffset+indexLength] )
+            assert isinstance( self.verseDataBookIndexes[BBB], dict )
+        verseOffset, verseLength = self.verseDataBookIndexes[BBB][(C,V)] # Gives a KeyError if not found
+        verseEntries, context = pickle.loads( verseDataMap[dataStart+verseOffset:dataStart+verseOffset+verseLength] )
+        assert isinstance( verseEntries, InternalBibleEntryList )
+        return verseEntries, context
+    # end of PickledBible.getContextVerseData
 # end of class PickledBible
 
 
@@ -40,10 +40,10 @@ Note: The demo takes about 4 minutes with our Sword code,
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "SwordBible"
 ProgName = "Sword Bible format handler"
-ProgVersion = '0.36'
+ProgVersion = '0.37'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -75,7 +75,7 @@ compulsoryFiles = ( 'ot','ot.vss', 'ot.bzs','ot.bzv','ot.bzz', 'nt','nt.vss', 'n
 
 
 
-def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for Sword Bible files or folders in the folder and in the next level down.
 
@@ -91,11 +91,13 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("SwordBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("SwordBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
@@ -113,13 +115,13 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
         # See if there's any .conf files in the mods.d folder
         confFolder = os.path.join( checkFolderPath, 'mods.d/' )
         foundConfFiles = []
-        for something in os.listdir( confFolder ):
+        for something in folderSnapshot.listdir( confFolder ):
             somepath = os.path.join( confFolder, something )
-            if os.path.isdir( somepath ):
+            if folderSnapshot.isdir( somepath ):
                 if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                     continue # don't visit these directories
                 print( _("SwordBibleFileCheck: Didn't expect a subfolder in conf folder: {}").format( something ) )
-            elif os.path.isfile( somepath ):
+            elif folderSnapshot.isfile( somepath ):
                 if something.endswith( '.conf' ):
                     foundConfFiles.append( something[:-5].upper() ) # Remove the .conf bit and make it UPPERCASE
                 else:
@@ -132,24 +134,24 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
         foundTextFolders = []
         for folderType,subfolderType in ( ('texts','rawtext'), ('texts','ztext'), ('comments','zcom'), ('comments','rawcom'), ('comments','rawcom4'), ):
             mainTextFolder = os.path.join( checkFolderPath, 'modules/', folderType+'/', subfolderType+'/' )
-            if os.access( mainTextFolder, os.R_OK ): # The subfolder is readable
-                for something in os.listdir( mainTextFolder ):
+            if folderSnapshot.access( mainTextFolder, os.R_OK ): # The subfolder is readable
+                for something in folderSnapshot.listdir( mainTextFolder ):
                     somepath = os.path.join( mainTextFolder, something )
-                    if os.path.isdir( somepath ):
+                    if folderSnapshot.isdir( somepath ):
                         if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                             continue # don't visit these directories
                         potentialName = something.upper()
                         if potentialName in foundConfFiles:
                             foundTextFiles = []
                             textFolder = os.path.join( mainTextFolder, something+'/' )
-                            for something2 in os.listdir( textFolder ):
+                            for something2 in folderSnapshot.listdir( textFolder ):
                                 somepath2 = os.path.join( textFolder, something2 )
-                                if os.path.isdir( somepath2 ):
+                                if folderSnapshot.isdir( somepath2 ):
                                     if something2 in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                                         continue # don't visit these directories
                                     if something2 != 'lucene':
                                         logging.warning( _("SwordBibleFileCheck1: Didn't expect a subfolder in {} text folder: {}").format( something, something2 ) )
-                                elif os.path.isfile( somepath2 ):
+                                elif folderSnapshot.isfile( somepath2 ):
                                     if subfolderType == 'rawtext' and something2 in ( 'ot','ot.vss', 'nt','nt.vss' ):
                                         foundTextFiles.append( something2 )
                                     elif subfolderType == 'ztext' and something2 in ( 'ot.bzs','ot.bzv','ot.bzz', 'nt.bzs','nt.bzv','nt.bzz' ):
@@ -166,7 +168,7 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
                                 foundTextFolders.append( something )
                         else:
                             logging.warning( _("SwordBibleFileCheck2: Didn't expect a subfolder in {} folder: {}").format( folderType, something ) )
-                    elif os.path.isfile( somepath ):
+                    elif folderSnapshot.isfile( somepath ):
                         logging.warning( _("SwordBibleFileCheck2: Didn't expect this file in {} folder: {}").format( folderType, something ) )
         if not foundTextFolders:
             if BibleOrgSysGlobals.verbosityLevel > 2: print( "    Looked hopeful but no actual module folders or files found" )
@@ -181,15 +183,15 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
         print( " SwordBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
     numFound = foundFolderCount = foundFileCount = 0
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something ) # Save folder name in case we have to go a level down
             if something in compulsoryTopFolders:
                 foundFolderCount += 1
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             if somethingUpper in compulsoryFiles: foundFileCount += 1
     if foundFolderCount == len(compulsoryTopFolders):
@@ -211,17 +213,17 @@ def SwordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
     numFound = foundFolderCount = foundFileCount = 0
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("SwordBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    SwordBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ):
+            if folderSnapshot.isdir( somepath ):
                 foundSubfolders.append( something )
                 if something in compulsoryTopFolders: foundFolderCount += 1
-            elif os.path.isfile( somepath ):
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 if somethingUpper in compulsoryFiles: foundFileCount += 1
         if foundFolderCount == len(compulsoryTopFolders):
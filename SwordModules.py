@@ -32,12 +32,15 @@ That is in SwordInstallManager.py
 Alternatively, you can use a program like Xiphos to install the Sword modules on your system.
 Also our Biblelator provides a SwordManager (GUI) that's a front end for SwordInstallManager.
 
-Caching is not yet implemented.
+Decompressed chunks of compressed modules are kept in a byte-budgeted LRU cache
+    (sharedChunkCache) which is shared by all SwordModule objects.
 
 This implementation is a prototype and intended for machines with large memory resources --
     bo optimizations have been attempted yet!
 
-Contains four classes:
+Contains five classes:
+    0/ SwordChunkCache
+        Caches decompressed chunks (shared across modules)
     1/ SwordModuleConfiguration
         Loads a .conf file
     2/ SwordModule
@@ -54,17 +57,18 @@ TODO: I think this entire module is very messy and needs to be completely rewrit
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "SwordModules"
 ProgName = "Sword module handler"
-ProgVersion = '0.49'
+ProgVersion = '0.50'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
 debuggingThisModule = False
 
 
-import os, logging, time
+import os, sys, logging, time
+import threading
 #from singleton import singleton
 from collections import OrderedDict
 import multiprocessing
@@ -99,6 +103,224 @@ GENERIC_SWORD_MODULE_TYPE_NAMES = { 'RawText':'Biblical Texts', 'zText':'Biblica
 
 
 
+# The following decryption code is adapted from sapphire.cpp -- the Saphire II stream cipher class.
+#    Dedicated to the Public Domain the author and inventor:
+#    (Michael Paul Johnson).  This code comes with no warranty. Use it at your own risk.
+#    Ported from the Pascal implementation of the Sapphire Stream Cipher 9 December 1994.
+#    Added hash pre- and post-processing 27 December 1994.
+#    Modified initialization to make index variables key dependent,
+#    made the output function more resistant to cryptanalysis, and renamed to Sapphire II 2 January 1995
+SAPPHIRE_WRAP_TABLE = tuple( range( 256 ) ) * 3 # Lookup table to do (n & 0xFF) for 0 <= n < 768
+sapphireInitialStates = {} # Cache of initialised card states -- the key is the CipherKey bytes
+
+
+def getSapphireInitialState( key ):
+    """
+    Shuffle the cards using the given key (bytes)
+        and return a tuple containing the cards (as a tuple)
+        followed by the initial rotor, ratchet, avalanche, lastPlain, and lastCipher values.
+
+    The result is cached so that the (fixed) key setup is only done once per key
+        rather than once per decrypted chunk.
+    """
+    try: return sapphireInitialStates[key]
+    except KeyError: pass # Need to do the work
+
+    # Key size may be up to 256 bytes.
+    # Pass phrases may be used directly, with longer length compensating for the low entropy expected in such keys.
+    # Alternatively, shorter keys hashed from a pass phrase or generated randomly may be used.
+    # For random keys, lengths of from 4 to 16 bytes are recommended, depending on how secure you want this to be.
+    cards = list( range( 256 ) ) # Start with cards all in order -- one of each
+    keySize = len( key )
+    keyPos = rsum = 0
+    # Swap the card at each position with some other card
+    for limit in range( 255, -1, -1 ):
+        toSwap = 0
+        if limit: # Avoid divide by zero error
+            retryLimiter, mask = 0, 1
+            while mask < limit:
+                mask = (mask << 1) + 1
+            while True:
+                rsum = (cards[rsum] + key[keyPos]) & 0xFF
+                keyPos += 1
+                if keyPos >= keySize:
+                    keyPos = 0 # Recycle the user key
+                    rsum = (rsum + keySize) & 0xFF # key "aaaa" != key "aaaaaaaa"
+                toSwap = mask & rsum
+                retryLimiter += 1
+                if retryLimiter > 11: toSwap %= limit # Prevent very rare long loops
+                if toSwap <= limit: break
+        cards[limit], cards[toSwap] = cards[toSwap], cards[limit] # Note the limit might equal toSwap
+    # Initialise the indices and data dependencies
+    #   Indices are set to different values instead of all zero to reduce what is
+    #     known about the state of the cards when the first byte is emitted.
+    state = ( tuple(cards), cards[1], cards[3], cards[5], cards[7], cards[rsum] )
+    sapphireInitialStates[key] = state
+    return state
+# end of getSapphireInitialState
+
+
+def sapphireDecrypt( cipherBytes, key ):
+    """
+    Decrypt the given bytes using the Sapphire II stream cipher with the given key (bytes).
+
+    Everything is done with local variables in one loop (with a lookup table for the byte wrapping)
+        to avoid Python function call overhead for every byte.
+
+    Returns the decrypted bytes.
+    """
+    cards, rotor, ratchet, avalanche, lastPlain, lastCipher = getSapphireInitialState( key )
+    cards, wrap = list( cards ), SAPPHIRE_WRAP_TABLE # We need our own copy of the cards to shuffle
+    result = bytearray( len(cipherBytes) )
+    ix = 0
+    for thisByte in cipherBytes:
+        # Shuffle the deck a little more
+        ratchet = wrap[ratchet + cards[rotor]]
+        rotor = wrap[rotor + 1]
+        swapTemp = cards[lastCipher]
+        cards[lastCipher] = cards[ratchet]
+        cards[ratchet] = cards[lastPlain]
+        cards[lastPlain] = cards[rotor]
+        cards[rotor] = swapTemp
+        avalanche = wrap[avalanche + cards[swapTemp]]
+        # Output one byte from the state in such a way as to make it
+        #   very hard to figure out which one you are looking at
+        lastPlain = thisByte ^ cards[wrap[cards[ratchet]+cards[rotor]]] \
+                             ^ cards[cards[wrap[cards[lastPlain] + cards[lastCipher] + cards[avalanche]]]]
+        lastCipher = thisByte
+        result[ix] = lastPlain
+        ix += 1
+    return bytes( result )
+# end of sapphireDecrypt
+
+
+
+# The default memory budget (in bytes) for the decompressed chunk cache shared by all SwordModules
+DEFAULT_CHUNK_CACHE_BUDGET = 32 * 1024 * 1024 # 32MB
+
+
+class SwordChunkCache:
+    """
+    A byte-budgeted, least-recently-used cache for decompressed (and decoded) chunks
+        of compressed (zText, zCom, zLD) Sword modules.
+
+    One instance (sharedChunkCache below) is shared by all SwordModule objects
+        so that the total memory used is predictable no matter how many modules are open.
+
+    Keys are (dataFilepath, fileOffset) tuples so that different module objects
+        opened on the same module files can also share the entries.
+    """
+    def __init__( self, maxBytes=DEFAULT_CHUNK_CACHE_BUDGET ):
+        """
+        Create an empty cache which holds no more than (approximately) maxBytes.
+        """
+        self.maxBytes = maxBytes
+        self.__entries = OrderedDict() # key -> (value, size) with the most recently used at the end
+        self.__lock = threading.Lock()
+        self.currentBytes = 0
+        self.hits = self.misses = self.evictions = 0
+    # end of SwordChunkCache.__init__
+
+
+    def __len__( self ): return len( self.__entries )
+    def __contains__( self, key ): return key in self.__entries
+
+
+    def __str__( self ):
+        """
+        Return a short description of the cache and its statistics.
+        """
+        return "SwordChunkCache: {} entries, {:,}/{:,} bytes, hits={:,} misses={:,} evictions={:,}" \
+                    .format( len(self.__entries), self.currentBytes, self.maxBytes, self.hits, self.misses, self.evictions )
+    # end of SwordChunkCache.__str__
+
+
+    def get( self, key ):
+        """
+        Returns the cached value for the key (and marks it as recently used)
+            or None if it's not in the cache.
+        """
+        with self.__lock:
+            try: value, _size = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end( key )
+            self.hits += 1
+            return value
+    # end of SwordChunkCache.get
+
+
+    def put( self, key, value ):
+        """
+        Add (or replace) the value for the key,
+            evicting the least recently used entries as necessary to stay within our budget.
+
+        Values larger than the entire budget are not cached at all.
+        """
+        size = sys.getsizeof( value )
+        with self.__lock:
+            if key in self.__entries:
+                self.currentBytes -= self.__entries.pop( key )[1]
+            if size > self.maxBytes: return
+            self.__entries[key] = (value, size)
+            self.currentBytes += size
+            while self.currentBytes > self.maxBytes:
+                _oldKey, (_oldValue, oldSize) = self.__entries.popitem( last=False )
+                self.currentBytes -= oldSize
+                self.evictions += 1
+    # end of SwordChunkCache.put
+
+
+    def setMaxBytes( self, maxBytes ):
+        """
+        Change the memory budget (evicting entries immediately if it's reduced).
+        """
+        with self.__lock:
+            self.maxBytes = maxBytes
+            while self.currentBytes > self.maxBytes:
+                _oldKey, (_oldValue, oldSize) = self.__entries.popitem( last=False )
+                self.currentBytes -= oldSize
+                self.evictions += 1
+    # end of SwordChunkCache.setMaxBytes
+
+
+    def discard( self, dataFilepath ):
+        """
+        Remove all the entries from the given module data file
+            (e.g., after a module has been fully loaded into memory).
+        """
+        with self.__lock:
+            for key in [key for key in self.__entries if key[0]==dataFilepath]:
+                self.currentBytes -= self.__entries.pop( key )[1]
+    # end of SwordChunkCache.discard
+
+
+    def clear( self ):
+        """
+        Empty the cache and reset the statistics.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.currentBytes = 0
+            self.hits = self.misses = self.evictions = 0
+    # end of SwordChunkCache.clear
+
+
+    def getStatistics( self ):
+        """
+        Returns a dictionary containing the cache counters.
+        """
+        return { 'entries':len(self.__entries), 'bytes':self.currentBytes, 'maxBytes':self.maxBytes,
+                'hits':self.hits, 'misses':self.misses, 'evictions':self.evictions }
+    # end of SwordChunkCache.getStatistics
+# end of class SwordChunkCache
+
+
+sharedChunkCache = SwordChunkCache()
+
+
+
 class SwordModuleConfiguration:
     """
     A class that loads, processes, and stores a Sword .conf file.
@@ -279,7 +501,7 @@ class SwordModule():
         self.dataFilepath = None # Can be a string or a list of strings (indexed in self.swordIndex below)
         # For the following, key is BBB if versified, else it's an UPPER-CASE word or title
         self.swordIndex = OrderedDict() # Used only if the inMemoryFlag is False
-        self.cache = {} # Only used if the inMemoryFlag is False
+        self.cache = sharedChunkCache # Only used if the inMemoryFlag is False
         self.swordData = OrderedDict() # Used only if the inMemoryFlag is True
         self.store = None # After load(), points to either self.swordIndex or self.swordData
 
@@ -358,95 +580,8 @@ class SwordModule():
         #if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
             #print( "SwordModule.decompressChunk( … )" )
 
-
-        # The following decryption code is adapted from sapphire.cpp -- the Saphire II stream cipher class.
-        #    Dedicated to the Public Domain the author and inventor:
-        #    (Michael Paul Johnson).  This code comes with no warranty. Use it at your own risk.
-        #    Ported from the Pascal implementation of the Sapphire Stream Cipher 9 December 1994.
-        #    Added hash pre- and post-processing 27 December 1994.
-        #    Modified initialization to make index variables key dependent,
-        #    made the output function more resistant to cryptanalysis, and renamed to Sapphire II 2 January 1995
-        # Global decryption variables
-        cards = bytearray( 256 )
-        rotor = ratchet = avalanche = lastPlain = lastCipher = 0
-
-        #def hashInit():
-        #    nonlocal cards, rotor, ratchet, avalanche, lastPlain, lastCipher
-        #    rotor, ratchet, avalanche, lastPlain, lastCipher = 1, 3, 5, 7, 11
-        #    for j,k in zip( range(0,256), range(255,-1,-1) ): cards[j] = k # Start with cards all in inverse order
-        ## end of hashInit
-
-        def keyRand( limit, userKey, keySize, rsum, keyPos ):
-            #assert 0 <= keySize < 256
-            #assert 0 <= rsum < 256
-            #assert 0 <= keyPos < keySize
-            if not limit: return 0, rsum, keyPos # Avoid divide by zero error
-            retryLimiter, mask = 0, 1
-            while mask < limit:
-                mask = (mask << 1) + 1
-            while True:
-                rsum = (cards[rsum] + userKey[keyPos]) & 0xFF
-                keyPos += 1
-                if keyPos >= keySize:
-                    keyPos = 0 # Recycle the user key
-                    rsum = (rsum + keySize) & 0xFF # key "aaaa" != key "aaaaaaaa"
-                u = mask & rsum
-                retryLimiter += 1
-                if retryLimiter > 11: u %= limit # Prevent very rare long loops
-                if u <= limit: break
-            return u, rsum, keyPos
-        # end of keyRand
-
-        def initialize( key ):
-            nonlocal cards, rotor, ratchet, avalanche, lastPlain, lastCipher
-            # Key size may be up to 256 bytes.
-            # Pass phrases may be used directly, with longer length compensating for the low entropy expected in such keys.
-            # Alternatively, shorter keys hashed from a pass phrase or generated randomly may be used.
-            # For random keys, lengths of from 4 to 16 bytes are recommended, depending on how secure you want this to be.
-            if not key: hashInit(); return # If we have been given no key, assume the default hash setup
-            cards = bytearray( range( 256 ) ) # Start with cards all in order -- one of each
-            #print( len(cards), cards ); halt
-            # Swap the card at each position with some other card
-            keyPos = rsum = 0
-            for j in range( 255, -1, -1 ):
-                toSwap, rsum, keyPos = keyRand( j, key, len(key), rsum, keyPos )
-                cards[j], cards[toSwap] = cards[toSwap], cards[j] # Note the j might equal toSwap
-            # Initialise the indices and data dependencies
-            #   Indices are set to different values instead of all zero to reduce what is
-            #     known about the state of the cards when the first byte is emitted.
-            rotor, ratchet, avalanche, lastPlain, lastCipher = cards[1], cards[3], cards[5], cards[7], cards[rsum]
-        # end of initialize
-
-        def decryptByte( thisByte ):
-            nonlocal cards, rotor, ratchet, avalanche, lastPlain, lastCipher
-            # Shuffle the deck a little more
-            ratchet = (ratchet + cards[rotor]) & 0xFF
-            rotor = (rotor + 1) & 0xFF
-            swapTemp = cards[lastCipher]
-            cards[lastCipher] = cards[ratchet]
-            cards[ratchet] = cards[lastPlain]
-            cards[lastPlain] = cards[rotor]
-            cards[rotor] = swapTemp
-            avalanche = (avalanche + cards[swapTemp]) & 0xFF
-            # Output one byte from the state in such a way as to make it
-            #   very hard to figure out which one you are looking at
-            lastPlain = thisByte ^ cards[(cards[ratchet]+cards[rotor]) & 0xFF] \
-                                 ^ cards[cards[(cards[lastPlain] + cards[lastCipher] + cards[avalanche]) & 0xFF]]
-            #assert 0 <= lastPlain < 256
-            lastCipher = thisByte
-            return lastPlain
-        # end of decryptByte
-
-        def decryptBlock( thisBytes, keyStr ):
-            initialize( str.encode( keyStr ) )
-            result = bytearray()
-            for thisByte in thisBytes:
-                result.append( decryptByte( thisByte ) )
-            return result
-        # end of decryptBlock
-
         if 'CipherKey' in self.SwordModuleConfiguration.confDict and self.SwordModuleConfiguration.confDict['CipherKey']:
-            compressedChunk = decryptBlock( compressedChunk, self.SwordModuleConfiguration.confDict['CipherKey'] )
+            compressedChunk = sapphireDecrypt( compressedChunk, str.encode( self.SwordModuleConfiguration.confDict['CipherKey'] ) )
         return zlib.decompress( compressedChunk )
     # end of SwordModule.decompressChunk
 
@@ -1480,27 +1615,21 @@ class SwordModule():
                 #print( indexInfo )
                 fileOffset, compressedLength, uncompressedLength, verseOffset, verseLength = indexInfo
                 if compressedLength and verseLength:
-                    if (BBB,fileOffset) in self.cache:
-                        uncompressedChunk, cachedTime = self.cache[(BBB,fileOffset)]
-                    else: # it's not cached
+                    textChunk = self.cache.get( (filepath,fileOffset) )
+                    if textChunk is None: # it's not cached
                         with open( filepath, 'rb') as compressedTextFile: # This is the compressed verse data (in book or chapter size chunks)
                             compressedTextFile.seek( fileOffset )
                             compressedChunk = compressedTextFile.read( compressedLength )
-                        #try:
                         uncompressedChunk = self.decompressChunk( compressedChunk )
-                        self.cache[(BBB,fileOffset)] = (uncompressedChunk,time.time(),)
-                        #except:
-                        #    logging.error( "Unable to decompress {} {} chunk {}->{}".format( self.SwordModuleConfiguration.name, self.SwordModuleConfiguration.modCategory, compressedLength, uncompressedLength ) )
-                        #    uncompressedLength, uncompressedChunk = 0, b''
-                        #    halt
-                    assert len(uncompressedChunk) == uncompressedLength
-                    try:
-                        textChunk = uncompressedChunk.decode( self.SwordModuleConfiguration.encoding )
-                    except UnicodeDecodeError:
-                        logging.warning( "Unable to properly decode {} {} {} {} book chunk #{} {}->{}".format( self.SwordModuleConfiguration.encoding, self.SwordModuleConfiguration.name, self.SwordModuleConfiguration.modCategory, unit, fileOffset, compressedLength, uncompressedLength ) )
-                        if BibleOrgSysGlobals.debugFlag: print( "  ", uncompressedChunk[:40] )
-                        if BibleOrgSysGlobals.debugFlag and debuggingThisModule: halt
-                        textChunk = uncompressedChunk.decode( self.SwordModuleConfiguration.encoding, 'replace' )
+                        assert len(uncompressedChunk) == uncompressedLength
+                        try:
+                            textChunk = uncompressedChunk.decode( self.SwordModuleConfiguration.encoding )
+                        except UnicodeDecodeError:
+                            logging.warning( "Unable to properly decode {} {} {} {} book chunk #{} {}->{}".format( self.SwordModuleConfiguration.encoding, self.SwordModuleConfiguration.name, self.SwordModuleConfiguration.modCategory, unit, fileOffset, compressedLength, uncompressedLength ) )
+                            if BibleOrgSysGlobals.debugFlag: print( "  ", uncompressedChunk[:40] )
+                            if BibleOrgSysGlobals.debugFlag and debuggingThisModule: halt
+                            textChunk = uncompressedChunk.decode( self.SwordModuleConfiguration.encoding, 'replace' )
+                        self.cache.put( (filepath,fileOffset), textChunk ) # Only keep the decoded text
                     verseText = textChunk[verseOffset:verseOffset+verseLength]
                     if len(verseText)!=verseLength:
                         print( "WHY!", reference, len(verseText), verseLength )
@@ -1537,15 +1666,14 @@ class SwordModule():
                 #print( indexInfo )
                 fileOffset, compressedLength, blockNumber, blockChunkNumber = indexInfo
                 if compressedLength:
-                    if fileOffset in self.cache:
-                        uncompressedChunk, cachedTime = self.cache[fileOffset]
-                    else: # it's not cached
+                    uncompressedChunk = self.cache.get( (self.dataFilepath,fileOffset) )
+                    if uncompressedChunk is None: # it's not cached
                         with open( self.dataFilepath, 'rb') as compressedTextFile: # This is the compressed data (in book size chunks)
                             compressedTextFile.seek( fileOffset )
                             compressedChunk = compressedTextFile.read( compressedLength )
                         uncompressedChunk = self.decompressChunk( compressedChunk )
                         #print( uncompressedChunk )
-                        self.cache[fileOffset] = (uncompressedChunk,time.time(),)
+                        self.cache.put( (self.dataFilepath,fileOffset), uncompressedChunk )
                     thisCount, = struct.unpack( 'I', uncompressedChunk[0:4])
                     ix = 4
                     for c in range(0, thisCount):
@@ -1952,7 +2080,7 @@ class SwordBibleModule( SwordModule, Bible ):
                                 print( "Why doesn't {} have any text for {} {}:{}".format( self.name, BBB, C, intV ) )
                     self.books[BBB] = thisBook
             del self.store # The original module information is no longer required
-            self.cache = {}
+            for filepath,_indexData in self.swordIndex.values(): self.cache.discard( filepath )
             if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Loaded {}.".format( self.name ) )
             return True
         elif BibleOrgSysGlobals.verbosityLevel > 2: print( "  Nothing loaded for {}.".format( self.name ) )
@@ -2016,7 +2144,7 @@ class SwordBibleModule( SwordModule, Bible ):
                                 print( "Why doesn't {} have any text for {} {}:{}".format( self.name, BBB, C, intV ) )
                     self.books[BBB] = thisBook
             del self.store # The original module information is no longer required
-            self.cache = {}
+            for filepath,_indexData in self.swordIndex.values(): self.cache.discard( filepath )
             if BibleOrgSysGlobals.verbosityLevel > 2: print( "  Loaded {}.".format( self.name ) )
             return True
         elif BibleOrgSysGlobals.verbosityLevel > 2: print( "  Nothing loaded for {}.".format( self.name ) )
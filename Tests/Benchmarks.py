@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Benchmarks.py
+#
+# Module timing the main BibleOrgSys processing stages
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module timing (and measuring the peak memory use of) the main BibleOrgSys processing stages
+    using the sample data in Tests/DataFilesForTests:
+        USFMBible load, InternalBibleBook.processLines and makeCVIndex,
+        InternalBible.discover and findText,
+        each BibleWriter exporter,
+        and Sword and SQLite (e-Sword, MySword, MyBible) reads.
+
+Like the tests, it's intended to be run from the BibleOrgSys folder, e.g.,
+    Tests/Benchmarks.py --json OutputFiles/Benchmarks.json
+        then after some changes
+    Tests/Benchmarks.py --baseline OutputFiles/Benchmarks.json
+
+Each stage is timed (best and median of --repeat runs)
+    then (unless --noMemory is given) run once more with tracemalloc to find the peak memory use.
+Multiprocessing and the processed book cache are turned off so that the results are reproducible.
+
+When a baseline JSON file is given, the best times are compared
+    and the program exits with status 1 if any stage is slower than the threshold allows.
+"""
+
+from gettext import gettext as _
+
+LastModifiedDate = '2026-10-17' # by RJH
+ShortProgName = "Benchmarks"
+ProgName = "BibleOrgSys benchmarks"
+ProgVersion = '0.01'
+ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
+ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
+
+debuggingThisModule = False
+
+
+import sys, os, logging, gc, json, time, tracemalloc, platform, shutil, tempfile
+from collections import OrderedDict
+from datetime import datetime
+from statistics import median
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import BibleOrgSysGlobals
+from BibleWriter import BibleWriter
+from USFMBible import USFMBible
+from USFMBibleBook import USFMBibleBook
+
+
+DEFAULT_USFM_FOLDER = 'Tests/DataFilesForTests/USFMTest2/'
+DEFAULT_FIND_TEXT = 'Manama' # A common word in the above USFM Bible
+ESWORD_TEST_FOLDER = 'Tests/DataFilesForTests/e-SwordTest/'
+EXTERNAL_PROGRAM_EXPORTERS = ( 'toODF', 'toPhotoBible', ) # These need LibreOffice or ImageMagick, etc.
+DEFAULT_REPEATS = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.10 # i.e., 10% slower than the baseline
+
+
+
+def _findFilename( folder, filenameEnding ):
+    """
+    Return the first filename in the folder with the given ending (or None).
+    """
+    for something in sorted( os.listdir( folder ) ):
+        if something.endswith( filenameEnding ): return something
+# end of Benchmarks._findFilename
+
+
+
+class BibleOrgSysBenchmarks:
+    """
+    Class for running the benchmarks and collecting the results.
+
+    Each stage has a setup function (which isn't timed) and a stage function (which is),
+        and most stages work on the Bible which was loaded in the USFMLoad stage.
+    """
+    def __init__( self, USFMFolder=None, repeats=DEFAULT_REPEATS, measureMemory=True ):
+        """
+        Constructor: just sets up the benchmark object.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleOrgSysBenchmarks.__init__( {}, {}, {} )".format( USFMFolder, repeats, measureMemory ) )
+        self.USFMFolder = USFMFolder if USFMFolder else DEFAULT_USFM_FOLDER
+        self.repeats, self.measureMemory = max( 1, repeats ), measureMemory
+        self.findText = DEFAULT_FIND_TEXT
+        self.BibleName = os.path.basename( os.path.normpath( self.USFMFolder ) )
+        self.outputFolder = None # A temporary folder is made in runStages
+        self.Bible = None
+
+        self.stageDict = OrderedDict() # stageName -> (setupFunction, stageFunction)
+        self.stageDict['USFMLoad'] = None, self.loadUSFMBible
+        self.stageDict['processLines'] = self.setupProcessLines, self.processLines
+        self.stageDict['makeCVIndex'] = self.setupMakeCVIndex, self.makeCVIndex
+        self.stageDict['discover'] = self.setupDiscover, self.discover
+        self.stageDict['findText'] = None, lambda: self.doFindText( useSearchIndexFlag=False )
+        self.stageDict['findTextIndexed'] = None, lambda: self.doFindText( useSearchIndexFlag=True )
+        for exporterName in sorted( dir( BibleWriter ) ):
+            if exporterName.startswith( 'to' ) and exporterName not in EXTERNAL_PROGRAM_EXPORTERS \
+            and callable( getattr( BibleWriter, exporterName ) ):
+                self.stageDict['export.'+exporterName] = None, lambda exporterName=exporterName: self.doExport( exporterName )
+        self.stageDict['SwordRead'] = lambda: self.setupRead( 'toSwordModule' ), self.readSword
+        self.stageDict['ESwordRead'] = lambda: self.setupRead( 'toESword' ), lambda: self.readSQLite( 'ESwordBible', 'toESword', '.bblx' )
+        self.stageDict['ESwordTestRead'] = None, lambda: self.readSQLite( 'ESwordBible', None, '.bblx' )
+        self.stageDict['MySwordRead'] = lambda: self.setupRead( 'toMySword' ), lambda: self.readSQLite( 'MySwordBible', 'toMySword', '.bbl.mybible' )
+        self.stageDict['MyBibleRead'] = lambda: self.setupRead( 'toMyBible' ), lambda: self.readSQLite( 'MyBibleBible', 'toMyBible', '.SQLite3' )
+
+        self.results = OrderedDict()
+        self.results['ProgNameVersion'] = ProgNameVersion
+        self.results['date'] = datetime.now().isoformat( timespec='seconds' )
+        self.results['pythonVersion'] = platform.python_version()
+        self.results['platform'] = platform.platform()
+        self.results['USFMFolder'] = self.USFMFolder
+        self.results['repeats'] = self.repeats
+        self.results['stages'] = OrderedDict()
+    # end of BibleOrgSysBenchmarks.__init__
+
+
+    def getStageNames( self, wantedStages=None ):
+        """
+        Return a list of the stage names.
+
+        wantedStages can be a list of stage names or prefixes (like 'export')
+            in which case only the matching stages are returned (in the normal order).
+        """
+        if not wantedStages: return list( self.stageDict.keys() )
+        return [stageName for stageName in self.stageDict
+                    if any( stageName==wanted or stageName.startswith( wanted+'.' ) for wanted in wantedStages )]
+    # end of BibleOrgSysBenchmarks.getStageNames
+
+
+    # The stage setup and stage functions
+    def loadUSFMBible( self ):
+        self.Bible = USFMBible( self.USFMFolder, givenName=self.BibleName, givenAbbreviation=self.BibleName )
+        self.Bible.loadBooks()
+        return '{} books'.format( len(self.Bible) )
+
+    def setupProcessLines( self ):
+        self.rawBooks = []
+        for BBB,filename in self.Bible.possibleFilenameDict.items():
+            UBB = USFMBibleBook( self.Bible, BBB )
+            UBB.load( filename, self.Bible.sourceFolder, self.Bible.encoding )
+            self.rawBooks.append( UBB )
+    def processLines( self ):
+        for UBB in self.rawBooks: UBB.processLines() # Note that this also calls makeCVIndex
+        return '{} books'.format( len(self.rawBooks) )
+
+    def setupMakeCVIndex( self ):
+        for bookObject in self.Bible.books.values(): bookObject._indexedFlag = False
+    def makeCVIndex( self ):
+        for bookObject in self.Bible.books.values(): bookObject.makeCVIndex()
+        return '{} books'.format( len(self.Bible.books) )
+
+    def setupDiscover( self ):
+        try: del self.Bible.discoveryResults
+        except AttributeError: pass # Hadn't been done yet
+    def discover( self ):
+        self.Bible.discover()
+        return '{} discovery results'.format( len(self.Bible.discoveryResults) )
+
+    def doFindText( self, useSearchIndexFlag ):
+        optionsDict, resultSummaryDict, sortedResultList = self.Bible.findText(
+                        { 'findText':self.findText, 'useSearchIndexFlag':useSearchIndexFlag } )
+        return '{} found'.format( len(sortedResultList) )
+
+    def doExport( self, exporterName ):
+        result = getattr( self.Bible, exporterName )( os.path.join( self.outputFolder, exporterName ) )
+        return '{}'.format( result if isinstance( result, (bool,type(None)) ) else type(result).__name__ )
+
+    def setupRead( self, exporterName ):
+        if not os.path.isdir( os.path.join( self.outputFolder, exporterName ) ): # We need to export it first
+            self.doExport( exporterName )
+    def readSword( self ):
+        from SwordBible import SwordBible
+        SwBible = SwordBible( os.path.join( self.outputFolder, 'toSwordModule' ) )
+        SwBible.loadBooks()
+        return '{} books'.format( len(SwBible) )
+    def readSQLite( self, moduleName, exporterName, filenameEnding ):
+        BibleClass = getattr( __import__( moduleName ), moduleName )
+        folder = os.path.join( self.outputFolder, exporterName ) if exporterName else ESWORD_TEST_FOLDER
+        SQLiteBible = BibleClass( folder, _findFilename( folder, filenameEnding ) )
+        SQLiteBible.preload()
+        if moduleName == 'MyBibleBible': SQLiteBible.loadBooks()
+        else: SQLiteBible.load()
+        return '{} books'.format( len(SQLiteBible) )
+    # end of the stage functions
+
+
+    def runStage( self, stageName ):
+        """
+        Run the setup and stage functions self.repeats times, timing only the stage function,
+            then once more with tracemalloc (if self.measureMemory is set).
+
+        Returns a dictionary of results.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleOrgSysBenchmarks.runStage( {} )".format( stageName ) )
+        setupFunction, stageFunction = self.stageDict[stageName]
+        stageResults = OrderedDict()
+        if stageName != 'USFMLoad' and self.Bible is None \
+        and not stageName.startswith( 'ESwordTest' ): # Most stages need the loaded Bible
+            self.runStage( 'USFMLoad' )
+
+        times = []
+        try:
+            for j in range( self.repeats + (1 if self.measureMemory else 0) ):
+                if setupFunction is not None: setupFunction()
+                gc.collect()
+                if j < self.repeats:
+                    startTime = time.perf_counter()
+                    stageResult = stageFunction()
+                    times.append( time.perf_counter() - startTime )
+                else: # Measure the memory use (which slows things down so isn't timed)
+                    tracemalloc.start()
+                    stageFunction()
+                    stageResults['peakMemory'] = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+        except Exception as err:
+            if tracemalloc.is_tracing(): tracemalloc.stop()
+            logging.error( "Benchmarks: {} stage failed with {}: {}".format( stageName, sys.exc_info()[0].__name__, err ) )
+            stageResults['error'] = '{}: {}'.format( sys.exc_info()[0].__name__, err )
+        if times:
+            stageResults['bestTime'], stageResults['medianTime'] = min( times ), median( times )
+            stageResults['times'] = times
+            stageResults['result'] = stageResult
+        return stageResults
+    # end of BibleOrgSysBenchmarks.runStage
+
+
+    def runStages( self, wantedStages=None ):
+        """
+        Run the wanted stages (or all of them) and save the results.
+
+        Returns the results dictionary.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "BibleOrgSysBenchmarks.runStages( {} )".format( wantedStages ) )
+        savedMaxProcesses, savedUseBookCache = BibleOrgSysGlobals.maxProcesses, BibleOrgSysGlobals.useBookCache
+        BibleOrgSysGlobals.maxProcesses, BibleOrgSysGlobals.useBookCache = 1, False # For reproducible results
+        self.outputFolder = tempfile.mkdtemp( prefix='BOSBenchmarks' )
+        try:
+            for stageName in self.getStageNames( wantedStages ):
+                if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Running {} stage…").format( stageName ) )
+                self.results['stages'][stageName] = self.runStage( stageName )
+                if BibleOrgSysGlobals.verbosityLevel > 0:
+                    print( "  {}".format( formatStageResults( stageName, self.results['stages'][stageName] ) ) )
+        finally:
+            BibleOrgSysGlobals.maxProcesses, BibleOrgSysGlobals.useBookCache = savedMaxProcesses, savedUseBookCache
+            shutil.rmtree( self.outputFolder, ignore_errors=True )
+        return self.results
+    # end of BibleOrgSysBenchmarks.runStages
+# end of class BibleOrgSysBenchmarks
+
+
+
+def formatStageResults( stageName, stageResults ):
+    """
+    Return a one-line summary of the results for the stage.
+    """
+    if 'bestTime' not in stageResults:
+        return "{:<28} FAILED: {}".format( stageName, stageResults.get( 'error' ) )
+    peakMemory = stageResults.get( 'peakMemory' )
+    return "{:<28} best {:8.3f}s  median {:8.3f}s  peak {}  ({})".format( stageName,
+                stageResults['bestTime'], stageResults['medianTime'],
+                '{:7.1f}MB'.format( peakMemory/1e6 ) if peakMemory is not None else '      ?  ',
+                stageResults['result'] )
+# end of Benchmarks.formatStageResults
+
+
+def compareWithBaseline( results, baselineResults, threshold=DEFAULT_REGRESSION_THRESHOLD ):
+    """
+    Compare the best times of each stage with the baseline results
+        and print a report.
+
+    Returns a list of the stage names that are slower than the threshold allows.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( "compareWithBaseline( …, …, {} )".format( threshold ) )
+    print( _("\nComparing with baseline from {} ({})…").format( baselineResults.get( 'date' ), baselineResults.get( 'ProgNameVersion' ) ) )
+    regressedStages = []
+    for stageName,stageResults in results['stages'].items():
+        baselineStageResults = baselineResults['stages'].get( stageName )
+        if not baselineStageResults or 'bestTime' not in baselineStageResults or 'bestTime' not in stageResults:
+            print( "  {:<28} {}".format( stageName, _("no comparison available") ) )
+            continue
+        ratio = stageResults['bestTime'] / baselineStageResults['bestTime'] if baselineStageResults['bestTime'] else 1.0
+        if ratio > 1.0 + threshold:
+            verdict = _("SLOWER")
+            regressedStages.append( stageName )
+        elif ratio < 1.0 - threshold: verdict = _("faster")
+        else: verdict = _("same")
+        print( "  {:<28} {:8.3f}s -> {:8.3f}s  {:6.2f}x  {}".format( stageName,
+                    baselineStageResults['bestTime'], stageResults['bestTime'], ratio, verdict ) )
+    if regressedStages:
+        print( _("  {} stage(s) were more than {:.0%} slower: {}").format( len(regressedStages), threshold, ', '.join( regressedStages ) ) )
+    return regressedStages
+# end of Benchmarks.compareWithBaseline
+
+
+
+def main():
+    """
+    Run the benchmarks as specified on the command line.
+    """
+    if BibleOrgSysGlobals.verbosityLevel > 0: print( ProgNameVersion )
+    arguments = BibleOrgSysGlobals.commandLineArguments
+
+    benchmarks = BibleOrgSysBenchmarks( arguments.folder, arguments.repeat, measureMemory=not arguments.noMemory )
+    if arguments.findText: benchmarks.findText = arguments.findText
+    wantedStages = arguments.stages.split( ',' ) if arguments.stages else None
+    if arguments.list:
+        for stageName in benchmarks.getStageNames( wantedStages ): print( stageName )
+        return
+
+    results = benchmarks.runStages( wantedStages )
+    if arguments.json:
+        with open( arguments.json, 'wt', encoding='utf-8' ) as jsonFile:
+            json.dump( results, jsonFile, indent=2 )
+        if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Saved results to {}").format( arguments.json ) )
+    if arguments.baseline:
+        with open( arguments.baseline, 'rt', encoding='utf-8' ) as baselineFile:
+            baselineResults = json.load( baselineFile )
+        if compareWithBaseline( results, baselineResults, arguments.threshold ):
+            BibleOrgSysGlobals.closedown( ProgName, ProgVersion )
+            sys.exit( 1 )
+# end of Benchmarks.main
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    parser.add_argument( '--folder', help="USFM Bible folder to use (default {})".format( DEFAULT_USFM_FOLDER ) )
+    parser.add_argument( '--stages', help="comma-separated stage names or prefixes to run (default all)" )
+    parser.add_argument( '--list', action='store_true', default=False, help="list the stage names and exit" )
+    parser.add_argument( '--repeat', type=int, default=DEFAULT_REPEATS, help="number of timed runs of each stage (default {})".format( DEFAULT_REPEATS ) )
+    parser.add_argument( '--noMemory', action='store_true', default=False, help="don't measure the peak memory use" )
+    parser.add_argument( '--findText', help="text to search for (default {!r})".format( DEFAULT_FIND_TEXT ) )
+    parser.add_argument( '--json', help="save the results into this JSON file" )
+    parser.add_argument( '--baseline', help="compare the results with this (previously saved) JSON file" )
+    parser.add_argument( '--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                            help="fractional slowdown counted as a regression (default {})".format( DEFAULT_REGRESSION_THRESHOLD ) )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    main()
+
+    BibleOrgSysGlobals.closedown( ProgName, ProgVersion )
+# end of Benchmarks.py
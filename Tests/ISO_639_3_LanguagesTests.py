@@ -28,7 +28,7 @@ Module testing ISO_639_3_Languages.py.
 """
 
 ProgName = "ISO-639-3 language code tests"
-ProgVersion = '0.85'
+ProgVersion = '0.86'
 ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
 
 
@@ -215,6 +215,18 @@ class ISO_639_3_LanguagesTests( unittest.TestCase ):
         self.assertEqual( self.isoLgs.getNameMatches( 'stupid' ), [] )
         for badName in ('Deutschen','Francais','SomeName',):
             self.assertEqual( self.isoLgs.getNameMatches(badName), [] )
+        result = self.isoLgs.getNameMatches( 'manobo' )
+        self.assertTrue( all( name.upper().startswith('MANOBO') for name in result[:8] ) ) # Prefix matches come first
+        self.assertEqual( self.isoLgs.getNameMatches( 'English' )[0], 'English' ) # Exact match first
+        self.assertTrue( 'Manobo, Matigsalug' in self.isoLgs.getNameMatches( 'Matig', prefixOnly=True ) ) # Word prefix
+        for name in self.isoLgs.getNameMatches( 'eng', prefixOnly=True ):
+            self.assertTrue( any( word.upper().startswith('ENG') for word in name.replace(',',' ').replace('-',' ').replace('(',' ').split() ) )
+        self.assertEqual( len(self.isoLgs.getNameMatches( 'a', maxResults=10 )), 10 )
+        self.assertEqual( self.isoLgs.getNameMatches( 'NGABERE' ), self.isoLgs.getNameMatches( 'Ngäbere' ) ) # Accent-insensitive
+        allNames = self.isoLgs.getNameMatches( '' ) # Every name contains an empty string
+        self.assertTrue( len(allNames) > 7000 )
+        self.assertTrue( set(allNames) >= set(self.isoLgs.getNameMatches( 'eng' )) )
+        self.assertEqual( len(self.isoLgs.getNameMatches( '', maxResults=5 )), 5 )
     # end of test_2090_getScope
 # end of ISO_639_3_LanguagesTests class
 
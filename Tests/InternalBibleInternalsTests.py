@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# InternalBibleInternalsTests.py
+#   Last modified: 2026-10-17 by RJH (also update ProgVersion below)
+#
+# Module testing InternalBibleInternals.py
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing InternalBibleInternals.py.
+"""
+
+ProgName = "Internal Bible internals tests"
+ProgVersion = '0.01'
+ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
+
+
+import sys, unittest
+import pickle
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import BibleOrgSysGlobals
+from InternalBibleInternals import InternalBibleExtra, InternalBibleExtraList, InternalBibleEntry, InternalBibleCVIndexEntry
+
+
+class InternalBibleInternalsTests( unittest.TestCase ):
+    """ Unit tests for the InternalBibleInternals objects. """
+
+    # An (InternalBibleEntry, InternalBibleCVIndexEntry) tuple pickled (protocol 2) before these classes used __slots__
+    OLD_PICKLE = ( b'\x80\x02cInternalBibleInternals\nInternalBibleEntry\nq\x00)\x81q\x01}q\x02(X\x06\x00\x00\x00mark'
+            b'erq\x03X\x02\x00\x00\x00v~q\x04X\x0e\x00\x00\x00originalMarkerq\x05X\x01\x00\x00\x00vq\x06X\x0c'
+            b'\x00\x00\x00adjustedTextq\x07X\x06\x00\x00\x00In theq\x08X\t\x00\x00\x00cleanTextq\th\x08X\x06'
+            b'\x00\x00\x00extrasq\ncInternalBibleInternals\nInternalBibleExtraList\nq\x0b)\x81q\x0c}q\rX\x04'
+            b'\x00\x00\x00dataq\x0e]q\x0fcInternalBibleInternals\nInternalBibleExtra\nq\x10)\x81q\x11}q\x12(X'
+            b'\x06\x00\x00\x00myTypeq\x13X\x02\x00\x00\x00fnq\x14X\x05\x00\x00\x00indexq\x15K\x05X\x08\x00\x00'
+            b'\x00noteTextq\x16X\x10\x00\x00\x00\\fr 1:1 \\ft Noteq\x17X\r\x00\x00\x00cleanNoteTextq\x18X\x04'
+            b'\x00\x00\x00Noteq\x19ubasbX\x0c\x00\x00\x00originalTextq\x1aX \x00\x00\x001 In the\\f + \\fr 1:1'
+            b' \\ft Note\\f*q\x1bubcInternalBibleInternals\nInternalBibleCVIndexEntry\nq\x1c)\x81q\x1d}q\x1e(X'
+            b'\n\x00\x00\x00entryIndexq\x1fK\x03X\n\x00\x00\x00entryCountq K\x02X\x07\x00\x00\x00contextq!]q"('
+            b'X\x01\x00\x00\x00cq#X\x01\x00\x00\x00pq$eub\x86q%.' )
+
+    def checkEntries( self, entry, indexEntry ):
+        """ Check the entries that were pickled above. """
+        self.assertTrue( isinstance( entry, InternalBibleEntry ) )
+        self.assertEqual( (entry.marker,entry.originalMarker,entry.adjustedText,entry.cleanText), ('v~','v','In the','In the') )
+        self.assertEqual( entry.originalText, '1 In the\\f + \\fr 1:1 \\ft Note\\f*' )
+        self.assertEqual( len(entry.extras), 1 )
+        extra = entry.extras[0]
+        self.assertTrue( isinstance( extra, InternalBibleExtra ) )
+        self.assertEqual( (extra.myType,extra.index,extra.noteText,extra.cleanNoteText), ('fn',5,'\\fr 1:1 \\ft Note','Note') )
+        self.assertTrue( isinstance( indexEntry, InternalBibleCVIndexEntry ) )
+        self.assertEqual( (indexEntry.entryIndex,indexEntry.entryCount,indexEntry.context), (3,2,['c','p']) )
+    # end of checkEntries
+
+    def test_1010_loadOldPickle( self ):
+        """ Test that pickles made before we used __slots__ still load. """
+        entry, indexEntry = pickle.loads( self.OLD_PICKLE ) # Used to fail with "object has no attribute '__dict__'"
+        self.checkEntries( entry, indexEntry )
+        self.assertFalse( hasattr( entry, '__dict__' ) )
+    # end of test_1010_loadOldPickle
+
+    def test_1020_pickleRoundTrip( self ):
+        """ Test that our current (slotted) objects pickle and unpickle. """
+        extras = InternalBibleExtraList()
+        extras.append( InternalBibleExtra( 'fn', 5, '\\fr 1:1 \\ft Note', 'Note', 'test' ) )
+        entry = InternalBibleEntry( 'v~', 'v', 'In the', 'In the', extras, '1 In the\\f + \\fr 1:1 \\ft Note\\f*' )
+        indexEntry = InternalBibleCVIndexEntry( 3, 2, ['c','p'] )
+        for protocol in range( 2, pickle.HIGHEST_PROTOCOL+1 ):
+            self.checkEntries( *pickle.loads( pickle.dumps( (entry,indexEntry), protocol=protocol ) ) )
+    # end of test_1020_pickleRoundTrip
+# end of InternalBibleInternalsTests class
+
+
+if __name__ == '__main__':
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    if BibleOrgSysGlobals.verbosityLevel > 1: print( ProgNameVersion )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of InternalBibleInternalsTests.py
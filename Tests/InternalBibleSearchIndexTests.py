@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# InternalBibleSearchIndexTests.py
+#   Last modified: 2026-10-17 by RJH (also update ProgVersion below)
+#
+# Module testing InternalBibleSearchIndex.py
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing InternalBibleSearchIndex.py.
+"""
+
+ProgName = "Internal Bible search index tests"
+ProgVersion = '0.01'
+ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
+
+
+import sys, os, unittest
+import tempfile, shutil
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import BibleOrgSysGlobals
+from InternalBibleInternals import InternalBibleEntry
+from USFMBible import USFMBible
+from PickledBible import PickledBible, createPickledBible
+from InternalBibleSearchIndex import SEARCH_INDEX_FILENAME
+
+
+class InternalBibleSearchIndexTests( unittest.TestCase ):
+    """ Unit tests for the InternalBibleSearchIndex object. """
+
+    def setUp( self ):
+        # Load a small USFM Bible and make a temporary folder for our pickled Bible
+        self.USFMBible = USFMBible( os.path.join( sourceFolder, 'Tests/DataFilesForTests/USFMTest2/' ) )
+        self.USFMBible.load()
+        self.testFolder = tempfile.mkdtemp()
+
+    def tearDown( self ):
+        shutil.rmtree( self.testFolder )
+
+    def findCount( self, BibleObject, findText ):
+        """ Return the number of results from an indexed search. """
+        BibleObject.load()
+        optionsDict, resultSummaryDict, resultList = BibleObject.findText( { 'findText':findText, 'useSearchIndexFlag':True } )
+        return len( resultList )
+
+    def test_1010_savedIndexRemade( self ):
+        """ Test that a saved index isn't used if the Bible is regenerated with edited text (but the same number of lines). """
+        createPickledBible( self.USFMBible, self.testFolder )
+        self.assertEqual( self.findCount( PickledBible( self.testFolder ), 'zyxxy' ), 0 )
+        self.assertTrue( os.path.isfile( os.path.join( self.testFolder, SEARCH_INDEX_FILENAME ) ) )
+
+        # Edit the text of the first verse
+        for bookObject in self.USFMBible.books.values():
+            lines = bookObject._processedLines
+            for j, entry in enumerate( lines.data ):
+                if entry.getMarker() == 'v~':
+                    lines.data[j] = InternalBibleEntry( 'v~', entry.getOriginalMarker(), entry.getAdjustedText()+' zyxxy',
+                                            entry.getCleanText()+' zyxxy', entry.getExtras(), entry.getFullText()+' zyxxy' )
+                    break
+            else: continue
+            break
+        numLines = len( lines )
+        createPickledBible( self.USFMBible, self.testFolder )
+        self.assertEqual( len( lines ), numLines )
+        self.assertEqual( self.findCount( PickledBible( self.testFolder ), 'zyxxy' ), 1 ) # Used to use the old saved index
+    # end of test_1010_savedIndexRemade
+# end of InternalBibleSearchIndexTests class
+
+
+if __name__ == '__main__':
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    if BibleOrgSysGlobals.verbosityLevel > 1: print( ProgNameVersion )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of InternalBibleSearchIndexTests.py
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# theWordBibleTests.py
+#   Last modified: 2026-10-17 by RJH (also update ProgVersion below)
+#
+# Module testing theWordBible.py
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org@gmail.com>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing theWordBible.py.
+"""
+
+ProgName = "theWord Bible tests"
+ProgVersion = '0.02'
+ProgNameVersion = "{} v{}".format( ProgName, ProgVersion )
+
+
+import sys, os, unittest
+import tempfile, shutil
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import BibleOrgSysGlobals, theWordBible
+
+
+class theWordBibleTests( unittest.TestCase ):
+    """ Unit tests for the theWordBible object. """
+
+    def setUp( self ):
+        # Make a temporary folder for our test modules
+        self.testFolder = tempfile.mkdtemp()
+        self.savedMaxProcesses = BibleOrgSysGlobals.maxProcesses
+        BibleOrgSysGlobals.maxProcesses = 1
+        self.savedLineIndexCacheFolder = theWordBible.LINE_INDEX_CACHE_FOLDER
+        theWordBible.LINE_INDEX_CACHE_FOLDER = os.path.join( self.testFolder, 'LineIndexes/' ) # Don't leave them in the user's cache
+
+    def tearDown( self ):
+        BibleOrgSysGlobals.maxProcesses = self.savedMaxProcesses
+        theWordBible.LINE_INDEX_CACHE_FOLDER = self.savedLineIndexCacheFolder
+        shutil.rmtree( self.testFolder )
+
+    def makeNTModule( self, numLines ):
+        """ Write a .nt module with only the given number of verse lines (and no metadata). """
+        filename = 'Test{}.nt'.format( numLines )
+        with open( os.path.join( self.testFolder, filename ), 'wt', encoding='utf-8' ) as moduleFile:
+            for lineNumber in range( 1, numLines+1 ):
+                moduleFile.write( 'Verse line {}\n'.format( lineNumber ) )
+        return filename
+
+    def test_1010_truncatedLoad( self ):
+        """ Test that a short (truncated) module still loads the books that are there. """
+        twB = theWordBible.theWordBible( self.testFolder, self.makeNTModule( 1500 ) )
+        twB.load() # Used to raise an IndexError
+        self.assertTrue( 'MAT' in twB.books ) # MAT has 1071 verses so it's complete
+        self.assertTrue( 'MRK' in twB.books ) # Partial book
+        self.assertFalse( 'LUK' in twB.books ) # Not in the file at all
+    # end of test_1010_truncatedLoad
+
+    def test_1020_truncatedLoadBook( self ):
+        """ Test loading individual books from a short (truncated) module. """
+        twB = theWordBible.theWordBible( self.testFolder, self.makeNTModule( 1500 ) )
+        twB.loadBook( 'MRK' )
+        self.assertTrue( 'MRK' in twB.books )
+        twB.loadBook( 'REV' )
+        self.assertFalse( 'REV' in twB.books )
+        twB = theWordBible.theWordBible( self.testFolder, self.makeNTModule( 1071 ) ) # Ends exactly at the end of MAT
+        twB.loadBook( 'MAT' )
+        self.assertTrue( 'MAT' in twB.books )
+    # end of test_1020_truncatedLoadBook
+
+    def test_1030_readLines( self ):
+        """ Test reading lines past the end of a short module. """
+        twB = theWordBible.theWordBible( self.testFolder, self.makeNTModule( 10 ) )
+        self.assertEqual( twB._readLines( 8, 5 ), ['Verse line 9','Verse line 10'] )
+        self.assertEqual( twB._readLines( 10, 5 ), [] )
+        self.assertEqual( twB._readLines( 7957, 0 ), [] )
+    # end of test_1030_readLines
+
+    def test_1040_lineIndexCache( self ):
+        """ Test that saved line indexes are removed once their module has gone. """
+        firstFilepath = os.path.join( self.testFolder, self.makeNTModule( 10 ) )
+        theWordBible.theWordLoadLineIndex( firstFilepath )
+        self.assertEqual( len( os.listdir( theWordBible.LINE_INDEX_CACHE_FOLDER ) ), 1 )
+        os.remove( firstFilepath )
+        theWordBible.theWordLoadLineIndex( os.path.join( self.testFolder, self.makeNTModule( 20 ) ) )
+        self.assertEqual( len( os.listdir( theWordBible.LINE_INDEX_CACHE_FOLDER ) ), 1 ) # Only the new one
+    # end of test_1040_lineIndexCache
+# end of theWordBibleTests class
+
+
+if __name__ == '__main__':
+    # Configure basic set-up
+    parser = BibleOrgSysGlobals.setup( ProgName, ProgVersion )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    if BibleOrgSysGlobals.verbosityLevel > 1: print( ProgNameVersion )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of theWordBibleTests.py
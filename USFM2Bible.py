@@ -31,10 +31,10 @@ NOTE: If it has a .SSF file, then it should be considered a PTX7Bible.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-24' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFM2Bible"
 ProgName = "USFM2 Bible handler"
-ProgVersion = '0.77'
+ProgVersion = '0.78'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -88,7 +88,7 @@ def exp( messageString ):
 ## end of removeUnwantedTupleExtensions
 
 
-def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, discountSSF=True ):
+def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, discountSSF=True, folderSnapshot=None ):
     """
     Given a folder, search for USFM2 Bible files or folders in the folder and in the next level down.
 
@@ -108,19 +108,21 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
         assert givenFolderName and isinstance( givenFolderName, str )
         assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( exp("USFM2BibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         if debuggingThisModule: print ("  USFM2 returningA1", False )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( exp("USFM2BibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         if debuggingThisModule: print ("  USFM2 returningA2", False )
         return False
 
     # See if there's an USFM2Bible project here in this given folder
     numFound = 0
-    UFns = USFMFilenames( givenFolderName ) # Assuming they have standard Paratext style filenames
+    UFns = USFMFilenames( givenFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
     if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
     filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
     if BibleOrgSysGlobals.verbosityLevel > 3: print( "  Maximum:", len(filenameTuples), filenameTuples )
@@ -129,7 +131,7 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
     badIndexList = []
     for n,(BBB,filename) in enumerate(filenameTuples):
         try:
-            for line in BibleOrgSysGlobals.peekIntoFile( filename, givenFolderName, numLines=4 ):
+            for line in folderSnapshot.peekIntoFile( filename, givenFolderName, numLines=4 ):
                 if line.lower().startswith('\\usfm 3') or line.lower().startswith('\\usfm3'):
                     badIndexList.append(n); break # Can't delete it yet
         except TypeError: pass # If file is empty peekIntoFile returns None
@@ -165,9 +167,9 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " USFM2BibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
@@ -193,7 +195,7 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("USFM2BibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         #if 0:
@@ -222,7 +224,7 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
                     #foundSubfiles.append( something )
 
         # See if there's an USFM2 Bible here in this folder
-        UFns = USFMFilenames( tryFolderName ) # Assuming they have standard Paratext style filenames
+        UFns = USFMFilenames( tryFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
         if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
         filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "  Maximum:", len(filenameTuples), filenameTuples )
@@ -231,7 +233,7 @@ def USFM2BibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, auto
         badIndexList = []
         for n,(BBB,filename) in enumerate(filenameTuples):
             try:
-                for line in BibleOrgSysGlobals.peekIntoFile( filename, tryFolderName, numLines=4 ):
+                for line in folderSnapshot.peekIntoFile( filename, tryFolderName, numLines=4 ):
                     if line.lower().startswith('\\usfm 3') or line.lower().startswith('\\usfm3'):
                         badIndexList.append(n); break # Can't delete it yet
             except TypeError: pass # If file is empty peekIntoFile returns None
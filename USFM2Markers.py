@@ -36,10 +36,10 @@ Contains the singleton class: USFM2Markers
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFM2Markers"
 ProgName = "USFM2 Markers handler"
-ProgVersion = '0.74'
+ProgVersion = '0.75'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -303,10 +303,9 @@ class USFM2Markers:
             and os.access( standardPickleFilepath, os.R_OK ) \
             and os.stat(standardPickleFilepath).st_mtime > os.stat(standardXMLFilepath).st_mtime \
             and os.stat(standardPickleFilepath).st_ctime > os.stat(standardXMLFilepath).st_ctime: # There's a newer pickle file
-                import pickle
                 if BibleOrgSysGlobals.verbosityLevel > 2: print( "Loading pickle file {}…".format( standardPickleFilepath ) )
                 with open( standardPickleFilepath, 'rb') as pickleFile:
-                    self.__DataDict = pickle.load( pickleFile ) # The protocol version used is detected automatically, so we do not have to specify it
+                    self.__DataDict = BibleOrgSysGlobals.unpickleTables( pickleFile ) # Each dictionary is only unpickled when first used
             else: # We have to load the XML (much slower)
                 from USFM2MarkersConverter import USFM2MarkersConverter
                 if XMLFilepath is not None: logging.warning( _("USFM markers are already loaded -- your given filepath of {!r} was ignored").format(XMLFilepath) )
@@ -28,10 +28,10 @@ Module handling USFM2Markers.xml and to export to JSON, C, and Python data table
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-12-03' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFM2MarkersConverter"
 ProgName = "USFM2 Markers converter"
-ProgVersion = '0.64'
+ProgVersion = '0.65'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -346,8 +346,6 @@ class USFM2MarkersConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
@@ -358,7 +356,7 @@ class USFM2MarkersConverter:
             filepath = os.path.join( folder, self._filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
-            pickle.dump( self.__DataDicts, myFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataDicts, myFile ) # So each dictionary can be loaded separately
     # end of pickle
 
     def exportDataToPython( self, filepath=None ):
@@ -28,10 +28,10 @@ Module handling USFM3Markers.xml and to export to JSON, C, and Python data table
 
 from gettext import gettext as _
 
-LastModifiedDate = '2018-12-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFM3MarkersConverter"
 ProgName = "USFM3 Markers converter"
-ProgVersion = '0.03'
+ProgVersion = '0.04'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -347,8 +347,6 @@ class USFM3MarkersConverter:
         """
         Writes the information tables to a .pickle file that can be easily loaded into a Python3 program.
         """
-        import pickle
-
         assert self._XMLtree
         self.importDataToPython()
         assert self.__DataDicts
@@ -359,7 +357,7 @@ class USFM3MarkersConverter:
             filepath = os.path.join( folder, self._filenameBase + "_Tables.pickle" )
         if BibleOrgSysGlobals.verbosityLevel > 1: print( _("Exporting to {}…").format( filepath ) )
         with open( filepath, 'wb' ) as myFile:
-            pickle.dump( self.__DataDicts, myFile )
+            BibleOrgSysGlobals.pickleDictPartially( self.__DataDicts, myFile ) # So each dictionary can be loaded separately
     # end of pickle
 
     def exportDataToPython( self, filepath=None ):
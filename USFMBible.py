@@ -31,10 +31,10 @@ NOTE: If it has a .SSF file, then it should be considered a PTX7Bible.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-02-24' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFMBible"
 ProgName = "USFM Bible handler"
-ProgVersion = '0.78'
+ProgVersion = '0.81'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -58,7 +58,7 @@ extensionsToIgnore = ( 'ASC', 'BAK', 'BAK2', 'BAK3', 'BAK4', 'BBLX', 'BC', 'CCT'
 
 
 
-def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, discountSSF=True ):
+def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, discountSSF=True, folderSnapshot=None ):
     """
     Given a folder, search for USFM Bible files or folders in the folder and in the next level down.
 
@@ -78,12 +78,14 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
         assert givenFolderName and isinstance( givenFolderName, str )
         assert autoLoad in (True,False,) and autoLoadBooks in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("USFMBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         if debuggingThisModule: print ("  USFM returningA1", False )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("USFMBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         if debuggingThisModule: print ("  USFM returningA2", False )
         return False
@@ -91,9 +93,9 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " USFMBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
@@ -118,7 +120,7 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
 
     # See if there's an USFMBible project here in this given folder
     numFound = 0
-    UFns = USFMFilenames( givenFolderName ) # Assuming they have standard Paratext style filenames
+    UFns = USFMFilenames( givenFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
     if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
     filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
     if BibleOrgSysGlobals.verbosityLevel > 3: print( "  Maximum:", len(filenameTuples), filenameTuples )
@@ -126,7 +128,7 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
     goodIndexList = []
     for n,(BBB,filename) in enumerate(filenameTuples):
         try:
-            for line in BibleOrgSysGlobals.peekIntoFile( filename, givenFolderName, numLines=4 ):
+            for line in folderSnapshot.peekIntoFile( filename, givenFolderName, numLines=4 ):
                 if line.lower().startswith('\\usfm 3') or line.lower().startswith('\\usfm3'):
                     goodIndexList.append(n); break # Can't delete it yet
         except TypeError: pass # If file is empty peekIntoFile returns None
@@ -157,7 +159,7 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("USFMBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         #if 0:
@@ -186,7 +188,7 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
                     #foundSubfiles.append( something )
 
         # See if there's an USFM Bible here in this folder
-        UFns = USFMFilenames( tryFolderName ) # Assuming they have standard Paratext style filenames
+        UFns = USFMFilenames( tryFolderName, folderSnapshot=folderSnapshot ) # Assuming they have standard Paratext style filenames
         if BibleOrgSysGlobals.verbosityLevel > 2: print( UFns )
         filenameTuples = UFns.getMaximumPossibleFilenameTuples( strictCheck=strictCheck ) # Returns (BBB,filename) 2-tuples
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "  Maximum:", len(filenameTuples), filenameTuples )
@@ -194,7 +196,7 @@ def USFMBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoL
         goodIndexList = []
         for n,(BBB,filename) in enumerate(filenameTuples):
             try:
-                for line in BibleOrgSysGlobals.peekIntoFile( filename, tryFolderName, numLines=4 ):
+                for line in folderSnapshot.peekIntoFile( filename, tryFolderName, numLines=4 ):
                     if line.lower().startswith('\\usfm 3') or line.lower().startswith('\\usfm3'):
                         goodIndexList.append(n); break # Can't delete it yet
             except TypeError: pass # If file is empty peekIntoFile returns None
@@ -596,11 +598,15 @@ class USFMBible( Bible ):
             raise e
         if filename is None: raise FileNotFoundError( "USFMBible.loadBook: Unable to find file for {}".format( BBB ) )
         UBB = USFMBibleBook( self, BBB )
-        UBB.load( filename, self.sourceFolder, self.encoding )
-        if UBB._rawLines:
-            UBB.validateMarkers() # Usually activates InternalBibleBook.processLines()
-            self.stashBook( UBB )
-        else: logging.info( "USFM book {} was completely blank".format( BBB ) )
+        sourceFilepath = os.path.join( self.sourceFolder, filename )
+        if UBB.loadFromCache( sourceFilepath, self.encoding ): self.stashBook( UBB )
+        else:
+            UBB.streamLoad( filename, self.sourceFolder, self.encoding ) # Also does InternalBibleBook.processLines()
+            if UBB._processedFlag:
+                UBB.validateMarkers()
+                UBB.saveToCache( sourceFilepath, self.encoding )
+                self.stashBook( UBB )
+            else: logging.info( "USFM book {} was completely blank".format( BBB ) )
         self.bookNeedsReloading[BBB] = False
     # end of USFMBible.loadBook
 
@@ -629,8 +635,11 @@ class USFMBible( Bible ):
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag:
             print( '  ' + _("Loading {} from {} from {}…").format( BBB, self.name, self.sourceFolder ) )
         UBB = USFMBibleBook( self, BBB )
-        UBB.load( self.possibleFilenameDict[BBB], self.sourceFolder, self.encoding )
-        UBB.validateMarkers() # Usually activates InternalBibleBook.processLines()
+        sourceFilepath = os.path.join( self.sourceFolder, self.possibleFilenameDict[BBB] )
+        if not UBB.loadFromCache( sourceFilepath, self.encoding ):
+            UBB.streamLoad( self.possibleFilenameDict[BBB], self.sourceFolder, self.encoding ) # Also does InternalBibleBook.processLines()
+            UBB.validateMarkers() # Activates InternalBibleBook.processLines() if the book was blank
+            UBB.saveToCache( sourceFilepath, self.encoding )
         if BibleOrgSysGlobals.verbosityLevel > 2 or BibleOrgSysGlobals.debugFlag: print( _("    Finishing loading USFM book {}.").format( BBB ) )
         return UBB
     # end of USFMBible.loadBookMP
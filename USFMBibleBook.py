@@ -28,17 +28,17 @@ Module for defining and manipulating USFM Bible books.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-06' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFMBibleBook"
 ProgName = "USFM Bible book handler"
-ProgVersion = '0.52'
+ProgVersion = '0.53'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
 debuggingThisModule = False
 
 
-import os, logging
+import os, logging, itertools
 
 import BibleOrgSysGlobals
 from USFMFile import USFMFile
@@ -80,14 +80,43 @@ class USFMBibleBook( BibleBook ):
         Note: the base class later on will try to break apart lines with a paragraph marker in the middle --
                 we don't need to worry about that here.
         """
+        for marker,text in self.__iterLogicalLines( filename, folder, encoding ):
+            self.addLine( marker, text )
+    # end of USFMBibleBook.load
+
+
+    def streamLoad( self, filename, folder=None, encoding=None ):
+        """
+        Load and process the USFM Bible book from a file in a single pass.
+
+        Does the same as load() followed by processLines(),
+            but the lines go straight from the file through to the processed (and then indexed) lines
+            without being saved in a USFMFile or in self._rawLines on the way.
+
+        If the file had no USFM lines, nothing is processed (and self._rawLines is left empty).
+        """
+        lineGenerator = self.__iterLogicalLines( filename, folder, encoding )
+        try: firstLine = next( lineGenerator )
+        except StopIteration: return # The book was completely blank
+        self.processLines( itertools.chain( (firstLine,), lineGenerator ) )
+    # end of USFMBibleBook.streamLoad
 
-        def doaddLine( originalMarker, originalText ):
+
+    def __iterLogicalLines( self, filename, folder, encoding ):
+        """
+        Generator which reads the USFM file and yields the (marker,text) 2-tuples
+            for the logical lines, i.e., all beginning with a USFM paragraph marker.
+
+        Used by load() and streamLoad().
+        """
+
+        def splitLine( originalMarker, originalText ):
             """
-            Check for newLine markers within the line (if so, break the line) and save the information in our database.
+            Check for newLine markers within the line (if so, break the line) and yield the line(s).
 
             Also convert ~ to a proper non-break space.
             """
-            #print( "doaddLine( {!r}, {!r} )".format( originalMarker, originalText ) )
+            #print( "splitLine( {!r}, {!r} )".format( originalMarker, originalText ) )
             marker, text = originalMarker, originalText.replace( '~', ' ' )
             if '\\' in text: # Check markers inside the lines
                 markerList = BibleOrgSysGlobals.USFMMarkers.getMarkerListFromText( text )
@@ -103,32 +132,32 @@ class USFMBibleBook( BibleBook ):
                             logging.error( _("NewLine marker {!r} shouldn't appear within line after {} {}:{} in \\{}: {!r}").format( insideMarker, self.BBB, C, V, marker, text ) ) # Only log the first error in the line
                             self.addPriorityError( 96, C, V, _("NewLine marker \\{} shouldn't be inside a line").format( insideMarker ) )
                         thisText = text[ix:iMIndex].rstrip()
-                        self.addLine( marker, thisText )
+                        yield marker, thisText
                         ix = iMIndex + 1 + len(insideMarker) + len(nextSignificantChar) # Get the start of the next text -- the 1 is for the backslash
                         #print( "Did a split from {}:{!r} to {}:{!r} leaving {}:{!r}".format( originalMarker, originalText, marker, thisText, insideMarker, text[ix:] ) )
                         marker = insideMarker # setup for the next line
                 if ix != 0: # We must have separated multiple lines
                     text = text[ix:] # Get the final bit of the line
-            self.addLine( marker, text ) # Call the function in the base class to save the line (or the remainder of the line if we split it above)
-        # end of doaddLine
+            yield marker, text # The line (or the remainder of the line if we split it above)
+        # end of splitLine
 
 
-        # Main code for USFMBibleBook.load()
+        # Main code for USFMBibleBook.__iterLogicalLines()
         if BibleOrgSysGlobals.verbosityLevel > 2: print( "  " + _("Loading {}…").format( filename ) )
         #self.BBB = BBB
         #self.isSingleChapterBook = BibleOrgSysGlobals.BibleBooksCodes.isSingleChapterBook( BBB )
         self.sourceFilename = filename
         self.sourceFolder = folder
         self.sourceFilepath = os.path.join( folder, filename ) if folder else filename
-        originalBook = USFMFile()
         if encoding is None: encoding = 'utf-8'
-        originalBook.read( self.sourceFilepath, encoding=encoding )
 
         # Do some important cleaning up before we save the data
         C, V = '-1', '-1' # So first/id line starts at -1:0
         lastMarker = lastText = ''
         loadErrors = []
-        for marker,text in originalBook.lines: # Always process a line behind in case we have to combine lines
+        haveLines = False
+        for marker,text in USFMFile().iterRead( self.sourceFilepath, encoding=encoding ): # Always process a line behind in case we have to combine lines
+            haveLines = True
             #print( "After {} {}:{} \\{} {!r}".format( self.BBB, C, V, marker, text ) )
 
             # Keep track of where we are for more helpful error messages
@@ -157,7 +186,7 @@ class USFMBibleBook( BibleBook ):
 
             # Now load the actual Bible book data
             if BibleOrgSysGlobals.USFMMarkers.isNewlineMarker( marker ):
-                if lastMarker: doaddLine( lastMarker, lastText )
+                if lastMarker: yield from splitLine( lastMarker, lastText )
                 lastMarker, lastText = marker, text
             elif BibleOrgSysGlobals.USFMMarkers.isInternalMarker( marker ) \
             or marker.endswith('*') and BibleOrgSysGlobals.USFMMarkers.isInternalMarker( marker[:-1] ): # the line begins with an internal marker -- append it to the previous line
@@ -216,7 +245,7 @@ class USFMBibleBook( BibleBook ):
                     self.addPriorityError( 100, C, V, _("Found \\{} unknown marker on new line in file").format( marker ) )
                     for tryMarker in sortedNLMarkers: # Try to do something intelligent here -- it might be just a missing space
                         if marker.startswith( tryMarker ): # Let's try changing it
-                            if lastMarker: doaddLine( lastMarker, lastText )
+                            if lastMarker: yield from splitLine( lastMarker, lastText )
                             #if marker=='s5' and not text:
                                 ## Door43 projects use empty s5 fields as some kind of division markers
                                 #lastMarker, lastText = 's', '---'
@@ -231,16 +260,16 @@ class USFMBibleBook( BibleBook ):
                                 logging.warning( _("Changed '\\{}' unknown marker to {!r} after {} {}:{} at beginning of otherwise empty line").format( marker, tryMarker, self.BBB, C, V ) )
                             break
                     # Otherwise, don't bother processing this line -- it'll just cause more problems later on
-        if lastMarker: doaddLine( lastMarker, lastText ) # Process the final line
+        if lastMarker: yield from splitLine( lastMarker, lastText ) # Process the final line
 
-        if not originalBook.lines: # There were no lines!!!
+        if not haveLines: # There were no lines!!!
             loadErrors.append( _("{} This USFM file was totally empty: {}").format( self.BBB, self.sourceFilename ) )
             logging.error( _("USFM file for {} was totally empty: {}").format( self.BBB, self.sourceFilename ) )
             lastMarker, lastText = 'rem', 'This (USFM) file was completely empty' # Save something since we had a file at least
 
         if loadErrors: self.errorDictionary['Load Errors'] = loadErrors
         #if debugging: print( self._rawLines ); halt
-    # end of USFMBibleBook.load
+    # end of USFMBibleBook.__iterLogicalLines
 # end of class USFMBibleBook
 
 
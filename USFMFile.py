@@ -25,7 +25,8 @@
 """
 Module for reading UTF-8 USFM (Unified Standard Format Marker) Bible file.
 
-  USFMFile: A "flat" text file, read line by line into a list.
+  USFMFile: A "flat" text file, read line by line into a list
+                (or yielded line by line by iterRead).
 
   The USFM and its data field are read into a 2-tuple and saved (in order) in the list.
 
@@ -34,10 +35,10 @@ Module for reading UTF-8 USFM (Unified Standard Format Marker) Bible file.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2016-05-09' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFMFile"
 ProgName = "USFM File loader"
-ProgVersion = '0.85'
+ProgVersion = '0.86'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -131,12 +132,26 @@ class USFMFile:
         Puts the result into self.lines
         """
         #print( "USFMFile.read( {!r}, {!r}, {!r} )".format( USFMFilepath, ignoreSFMs, encoding ) )
+        self.lines = list( self.iterRead( USFMFilepath, ignoreSFMs, encoding ) )
+    # end of USFMFile.read
+
+
+    def iterRead( self, USFMFilepath, ignoreSFMs=None, encoding=None ):
+        """
+        Generator which reads a simple USFM (Unified Standard Format Marker) file
+            and yields the (SFMMarker, SFMValue) tuples one at a time
+            (with any continuation lines already joined on).
+
+        Doesn't save anything in self.lines,
+            so the caller can process a large file without a list of all the lines.
+        """
+        #print( "USFMFile.iterRead( {!r}, {!r}, {!r} )".format( USFMFilepath, ignoreSFMs, encoding ) )
 
         # Check/handle parameters
         if ignoreSFMs is None: ignoreSFMs = ()
         if encoding is None: encoding = 'utf-8'
 
-        lastLine, lineCount, result = '', 0, []
+        lastLine, lineCount, waitingLine = '', 0, None # waitingLine is held back in case a continuation line follows
         with open( USFMFilepath, encoding=encoding ) as ourFile: # Automatically closes the file when done
             try:
                 for line in ourFile:
@@ -152,19 +167,14 @@ class USFMFile:
                     if line[0]=='#': continue # Just discard comment lines
 
                     if line[0]!='\\': # Not a SFM line
-                        if len(result)==0: # We don't have any SFM data lines yet
+                        if waitingLine is None: # We don't have any SFM data lines yet
                             if BibleOrgSysGlobals.verbosityLevel > 2:
                                 logging.error( "Non-USFM line in " + USFMFilepath + " -- line ignored at #" + str(lineCount) )
-                            #print( "SFMFile.py: XXZXResult is", result, len(line) )
-                            #for x in range(0, min(6,len(line))):
-                                #print( x, "'" + str(ord(line[x])) + "'" )
-                            #raise IOError('Oops: Line break on last line ??? not handled here "' + line + '"')
                         else: # Append this continuation line
                             if marker not in ignoreSFMs:
-                                oldmarker, oldtext = result.pop()
-                                #print ("Popped",oldmarker,oldtext)
+                                oldmarker, oldtext = waitingLine
                                 #print ("Adding", line, "to", oldmarker, oldtext)
-                                result.append( (oldmarker, oldtext+' '+line) )
+                                waitingLine = (oldmarker, oldtext+' '+line)
                             continue
 
                     lineAfterBackslash = line[1:]
@@ -192,7 +202,8 @@ class USFMFile:
 
                     #print( " ", repr(marker), repr(text) )
                     if marker not in ignoreSFMs:
-                        result.append( (marker, text) )
+                        if waitingLine is not None: yield waitingLine
+                        waitingLine = (marker, text)
 
             except UnicodeError as err:
                 print( "Unicode error:", sys.exc_info()[0], err )
@@ -201,8 +212,8 @@ class USFMFile:
                 #print( line )
                 #raise
 
-            self.lines = result
-    # end of USFMFile.read
+        if waitingLine is not None: yield waitingLine # The final line
+    # end of USFMFile.iterRead
 # end of class USFMFile
 
 
@@ -28,10 +28,10 @@ Module for creating and manipulating USFM filenames.
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "USFMFilenames"
 ProgName = "USFM Bible filenames handler"
-ProgVersion = '0.68'
+ProgVersion = '0.69'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -100,24 +100,27 @@ class USFMFilenames:
     Always returns lists of USFM filenames in the default rough sequence order from the BibleBooksCodes module.
     """
 
-    def __init__( self, givenFolderName ):
+    def __init__( self, givenFolderName, folderSnapshot=None ):
         """
         Create the object by inspecting files in the given folder.
 
+            If a BibleOrgSysGlobals.FolderSnapshot is given (e.g., by a FileCheck function),
+                it's used for the folder listings and file peeks.
+
             Creates a self.pattern (Paratext template) for USFM filenames where
                 nnn = language code (lower case) or NNN = language code (UPPER CASE)
                 bbb = book code (lower case) or BBB = book code (UPPER CASE)
                 dd = digits
         """
         if BibleOrgSysGlobals.debugFlag and debuggingThisModule: print( "USFMFilenames( {} )".format( givenFolderName ) )
-        self.givenFolderName = givenFolderName
+        self.givenFolderName, self.folderSnapshot = givenFolderName, folderSnapshot
         self.pattern, self.fileExtension = '', ''
         self.fileList = [] # A list of all files in our folder (excluding folder names and backup filenames)
         self._fileDictionary = {} # The keys are 2-tuples of folder, filename, the values are all valid BBB values
         self._BBBDictionary = {} # The keys are valid BBB values, the values are all 2-tuples of folder, filename
 
         # Check that the given folder is readable
-        if not os.access( self.givenFolderName, os.R_OK ):
+        if not (folderSnapshot or os).access( self.givenFolderName, os.R_OK ):
             logging.critical( _("USFMFilenames: Given {!r} folder is unreadable").format( self.givenFolderName ) )
             return
 
@@ -129,7 +132,7 @@ class USFMFilenames:
 
         # Find how many files are in our folder
         self.lastTupleList = None
-        for possibleFilename in os.listdir( self.givenFolderName ):
+        for possibleFilename in (folderSnapshot or os).listdir( self.givenFolderName ):
             pFUpper = possibleFilename.upper()
             if pFUpper in FILENAMES_TO_IGNORE: continue
             pFUpperProper, pFUpperExt = os.path.splitext( pFUpper )
@@ -139,7 +142,7 @@ class USFMFilenames:
             if ignore: continue
             if pFUpper[-1]!='~' and not pFUpperExt[1:] in EXTENSIONS_TO_IGNORE: # Compare without the first dot
                 filepath = os.path.join( self.givenFolderName, possibleFilename )
-                if os.path.isfile( filepath ): # It's a file not a folder
+                if (folderSnapshot or os.path).isfile( filepath ): # It's a file not a folder
                     self.fileList.append( possibleFilename )
         #print( "fL", self.fileList )
         #if not self.fileList: logging.error( _("No files at all in given folder: {!r}").format( self.givenFolderName) ); return
@@ -329,7 +332,7 @@ class USFMFilenames:
         self._fileDictionary = {} # The keys are 2-tuples of folder, filename, the values are all valid BBB values
         self._BBBDictionary = {} # The keys are valid BBB values, the values are all 2-tuples of folder, filename
 
-        folderFilenames = os.listdir( givenFolder )
+        folderFilenames = (self.folderSnapshot or os).listdir( givenFolder )
         for possibleFilename in folderFilenames:
             pFUpper = possibleFilename.upper()
             if pFUpper in FILENAMES_TO_IGNORE: continue
@@ -340,7 +343,7 @@ class USFMFilenames:
             if ignore: continue
             if pFUpper[-1]!='~' and not pFUpperExt[1:] in EXTENSIONS_TO_IGNORE: # Compare without the first dot
                 filepath = os.path.join( givenFolder, possibleFilename )
-                if os.path.isfile( filepath ): # It's a file not a folder
+                if (self.folderSnapshot or os.path).isfile( filepath ): # It's a file not a folder
                     USFMId = self.getUSFMIDFromFile( givenFolder, possibleFilename, filepath )
                     if USFMId:
                         assert filepath not in self._fileDictionary
@@ -441,7 +444,7 @@ class USFMFilenames:
         for BBB,derivedFilename in self.getDerivedFilenameTuples():
             derivedFilepath = os.path.join( self.givenFolderName, derivedFilename )
             if BibleOrgSysGlobals.debugFlag and debuggingThisModule: print( '  getConfirmedFilenameTuples: Checking for existence of: ' + derivedFilename )
-            if os.access( derivedFilepath, os.R_OK ):
+            if (self.folderSnapshot or os).access( derivedFilepath, os.R_OK ):
                 if strictCheck:
                     USFMId = self.getUSFMIDFromFile( self.givenFolderName, derivedFilename, derivedFilepath )
                     if USFMId is None:
@@ -522,7 +525,7 @@ class USFMFilenames:
         if strictCheck or BibleOrgSysGlobals.strictCheckingFlag:
             #if BibleOrgSysGlobals.debugFlag: print( "  getMaximumPossibleFilenameTuples doing strictCheck…" )
             for BBB,filename in resultList[:]:
-                firstLine = BibleOrgSysGlobals.peekIntoFile( filename, self.givenFolderName )
+                firstLine = (self.folderSnapshot or BibleOrgSysGlobals).peekIntoFile( filename, self.givenFolderName )
                 #print( 'UFN', repr(firstLine) )
                 if firstLine is None: resultList.remove( (BBB,filename) ); continue # seems we couldn't decode the file
                 if firstLine and firstLine[0]==chr(65279): #U+FEFF or \ufeff
@@ -565,7 +568,7 @@ class USFMFilenames:
         """
         def getSSFFilenamesHelper( folder ):
             resultPathlist = []
-            files = os.listdir( folder )
+            files = (self.folderSnapshot or os).listdir( folder )
             for foundFilename in files:
                 if not foundFilename.endswith('~'): # Ignore backup files
                     foundFileBit, foundExtBit = os.path.splitext( foundFilename )
@@ -34,14 +34,18 @@ Currently aware of the following Bible types:
     OSIS, USX, USFX, OpenSong, Zefania, Haggai, VerseView (all XML)
     Digital Bible Library (DB) which is USX (XML) plus XML metadata
     Sword modules (binary).
+
+The format checks all share one BibleOrgSysGlobals.FolderSnapshot
+    so that the folder tree is only listed (and each file only peeked into) once,
+    and they're run in threads if we're allowed more than one process.
 """
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-09-19' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "UnknownBible"
 ProgName = "Unknown Bible object handler"
-ProgVersion = '0.35'
+ProgVersion = '0.36'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
@@ -49,6 +53,7 @@ debuggingThisModule = False
 
 
 import logging, os.path
+from concurrent.futures import ThreadPoolExecutor
 
 import BibleOrgSysGlobals
 from ESFMBible import ESFMBibleFileCheck
@@ -84,6 +89,53 @@ from VPLBible import VPLBibleFileCheck
 #from SwordResources import SwordInterface # What about these?
 
 
+# These are tried in this order (which is also the order of the types found list)
+#   Each entry is a 4-tuple: key, label for the types found list, foundType string, FileCheck function
+#   NOTE: Only the first one (pickled Bibles) can also be given a (zip) file name rather than a folder
+BIBLE_FILE_CHECKS = (
+    ('PickledBible', 'Pickled', 'pickled Bible', PickledBibleFileCheck),
+    ('theWordBible', 'theWord', 'theWord Bible', theWordBibleFileCheck),
+    ('MySwordBible', 'MySword', 'MySword Bible', MySwordBibleFileCheck),
+    ('ESwordBible', 'e-Sword-Bible', 'e-Sword Bible', ESwordBibleFileCheck), # e-Sword Bibles and commentaries
+    ('ESwordCommentary', 'e-Sword-Commentary', 'e-Sword Commentary', ESwordCommentaryFileCheck),
+    ('MyBibleBible', 'MyBible', 'MyBible Bible', MyBibleBibleFileCheck),
+    ('PDBBible', 'PalmDB', 'PalmDB Bible', PalmDBBibleFileCheck),
+    ('GoBible', 'GoBible', 'GoBible Bible', GoBibleFileCheck),
+    ('PierceOnlineBible', 'PierceOnline', 'Pierce Online Bible', PierceOnlineBibleFileCheck),
+    ('EasyWorshipBible', 'EasyWorship', 'EasyWorship Bible', EasyWorshipBibleFileCheck),
+    ('SwordBible', 'Sword', 'Sword Bible', SwordBibleFileCheck),
+    ('UnboundBible', 'Unbound', 'Unbound Bible', UnboundBibleFileCheck),
+    ('DrupalBible', 'Drupal', 'Drupal Bible', DrupalBibleFileCheck),
+    ('YETBible', 'YET', 'YET Bible', YETBibleFileCheck),
+    ('ESFMBible', 'ESFM', 'ESFM Bible', ESFMBibleFileCheck), # put BEFORE USFM
+    ('PTX8Bible', 'PTX8', 'PTX8 Bible', PTX8BibleFileCheck), # put BEFORE USFM
+    ('PTX7Bible', 'PTX7', 'PTX7 Bible', PTX7BibleFileCheck), # put BEFORE USFM
+    ('USFM2Bible', 'USFM2', 'USFM2 Bible', USFM2BibleFileCheck),
+    ('USFMBible', 'USFM', 'USFM Bible', USFMBibleFileCheck),
+    ('DBLBible', 'DBL', 'DBL Bible', DBLBibleFileCheck), # put BEFORE USX
+    ('USXBible', 'USX', 'USX XML Bible', USXXMLBibleFileCheck),
+    ('USFXBible', 'USFX', 'USFX XML Bible', USFXXMLBibleFileCheck),
+    ('OSISBible', 'OSIS', 'OSIS XML Bible', OSISXMLBibleFileCheck),
+    ('OpenSongBible', 'OpenSong', 'OpenSong XML Bible', OpenSongXMLBibleFileCheck),
+    ('ZefaniaBible', 'Zefania', 'Zefania XML Bible', ZefaniaXMLBibleFileCheck),
+    ('HaggaiBible', 'Haggai', 'Haggai XML Bible', HaggaiXMLBibleFileCheck),
+    ('VerseViewBible', 'VerseView', 'VerseView XML Bible', VerseViewXMLBibleFileCheck),
+    ('CSVBible', 'CSV', 'CSV Bible', CSVBibleFileCheck),
+    ('F4SSBible', 'Forge', 'Forge Bible', ForgeForSwordSearcherBibleFileCheck), # Forge for SwordSearcher VPL
+    ('VPLBible', 'VPL', 'VPL Bible', VPLBibleFileCheck),
+    )
+BIBLE_FILE_CHECKS_DICT = { fileCheckEntry[0]:fileCheckEntry for fileCheckEntry in BIBLE_FILE_CHECKS }
+
+# If only one of a type was found, this is the order of preference for loading it:
+#   the binary formats first because they can be detected more reliably,
+#   then the plain text formats (ESFM and PTX ahead of USFM, and DBL ahead of USX), then the XML ones
+AUTOLOAD_ORDER = ( 'PickledBible', 'theWordBible', 'MySwordBible', 'ESwordBible', 'ESwordCommentary',
+                'MyBibleBible', 'PDBBible', 'GoBible', 'PierceOnlineBible', 'EasyWorshipBible', 'SwordBible',
+                'UnboundBible', 'DrupalBible', 'YETBible', 'ESFMBible', 'PTX8Bible', 'PTX7Bible',
+                'USFM2Bible', 'USFMBible', 'DBLBible', 'CSVBible', 'F4SSBible', 'VPLBible',
+                'USXBible', 'USFXBible', 'OSISBible', 'OpenSongBible', 'ZefaniaBible', 'HaggaiBible', 'VerseViewBible' )
+
+
 
 class UnknownBible:
     """
@@ -122,6 +174,40 @@ class UnknownBible:
     # end of UnknownBible.__str__
 
 
+    def _runFileChecks( self, strictCheck, folderSnapshot ):
+        """
+        Runs each of the BIBLE_FILE_CHECKS on our folder (or file),
+            sharing the one folderSnapshot between them
+            so that nothing is listed or peeked at more than once.
+
+        If we're allowed more than one process, the checks are run concurrently in threads
+            (since they're mostly waiting on the filesystem).
+
+        Returns a dict with the BIBLE_FILE_CHECKS keys and the counts that the checks returned.
+        """
+        if debuggingThisModule:
+            print( "UnknownBible._runFileChecks( {}, {} )".format( strictCheck, folderSnapshot ) )
+
+        if folderSnapshot.isdir( self.givenFolderName ): fileChecks = BIBLE_FILE_CHECKS
+        else: fileChecks = BIBLE_FILE_CHECKS[:1] # Only pickled Bibles can be given a (zip) file name
+
+        def runFileCheck( fileCheckEntry ):
+            return fileCheckEntry[3]( self.givenFolderName, strictCheck=strictCheck, folderSnapshot=folderSnapshot )
+        # end of runFileCheck
+
+        if BibleOrgSysGlobals.maxProcesses > 1 and len(fileChecks) > 1:
+            BibleOrgSysGlobals.BibleBooksCodes # Make sure this table is loaded before the threads start using it
+            with ThreadPoolExecutor( max_workers=BibleOrgSysGlobals.maxProcesses ) as executor:
+                results = list( executor.map( runFileCheck, fileChecks ) )
+        else: results = [runFileCheck( fileCheckEntry ) for fileCheckEntry in fileChecks]
+
+        counts = { fileCheckEntry[0]:0 for fileCheckEntry in BIBLE_FILE_CHECKS }
+        for fileCheckEntry, count in zip( fileChecks, results ):
+            counts[fileCheckEntry[0]] = count
+        return counts
+    # end of UnknownBible._runFileChecks
+
+
     def search( self, strictCheck=True, autoLoad=False, autoLoadAlways=False, autoLoadBooks=False ):
         """
         Search our folder to found what if any Bible versions can be found.
@@ -145,7 +231,24 @@ class UnknownBible:
         if not self.folderReadable: return None
         if autoLoadAlways or autoLoadBooks: autoLoad = True
 
-        def recheckStrict( folderName, oppositeStrictFlag ):
+        # All the checks (including any recheck below) share the one listing of our folder tree
+        folderSnapshot = BibleOrgSysGlobals.FolderSnapshot()
+
+        def totalCounts( counts ):
+            """
+            Returns the three counters (total Bibles, number of types, and list of types found).
+            """
+            totalCount, totalTypes, typesFoundList = 0, 0, []
+            for key, typeLabel, foundType, fileCheckFunction in BIBLE_FILE_CHECKS:
+                if counts[key]:
+                    totalCount += counts[key]
+                    totalTypes += 1
+                    typesFoundList.append( typeLabel + ':' + str(counts[key]) )
+                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: {}Count".format( key ), counts[key] )
+            return totalCount, totalTypes, typesFoundList
+        # end of totalCounts
+
+        def recheckStrict( oppositeStrictFlag ):
             """
             If we didn't check with the strict flag the first time,
                 try it again with the strict mode set.
@@ -154,503 +257,16 @@ class UnknownBible:
             Returns the three counters.
             """
             if BibleOrgSysGlobals.debugFlag or debuggingThisModule:
-                print( "UnknownBible.recheckStrict( {}, {} )".format( folderName, oppositeStrictFlag ) )
-
-            totalBibleStrictCount, totalBibleStrictTypes, typesStrictlyFound = 0, 0, []
-
-            # Search for pickled Bibles -- can be given a folder, or a zip file name
-            PickledBibleStrictCount = PickledBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-            if PickledBibleStrictCount:
-                totalBibleStrictCount += PickledBibleStrictCount
-                totalBibleStrictTypes += 1
-                typesStrictlyFound.append( 'Pickled:' + str(PickledBibleStrictCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "PickledBible.recheckStrict: PickledBibleStrictCount", PickledBibleStrictCount )
-
-            if os.path.isdir( self.givenFolderName ):
-                # Search for theWord Bibles
-                theWordBibleStrictCount = theWordBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if theWordBibleStrictCount:
-                    totalBibleStrictCount += theWordBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'theWord:' + str(theWordBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "theWordBible.recheckStrict: theWordBibleStrictCount", theWordBibleStrictCount )
-
-                # Search for MySword Bibles
-                MySwordBibleStrictCount = MySwordBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if MySwordBibleStrictCount:
-                    totalBibleStrictCount += MySwordBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'MySword:' + str(MySwordBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "MySwordBible.recheckStrict: MySwordBibleStrictCount", MySwordBibleStrictCount )
-
-                # Search for e-Sword Bibles and commentaries
-                ESwordBibleStrictCount = ESwordBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if ESwordBibleStrictCount:
-                    totalBibleStrictCount += ESwordBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'e-Sword-Bible:' + str(ESwordBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "ESwordBible.recheckStrict: ESwordBibleStrictCount", ESwordBibleStrictCount )
-                ESwordCommentaryStrictCount = ESwordCommentaryFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if ESwordCommentaryStrictCount:
-                    totalBibleStrictCount += ESwordCommentaryStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'e-Sword-Commentary:' + str(ESwordCommentaryStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "ESwordCommentary.recheckStrict: ESwordCommentaryStrictCount", ESwordCommentaryStrictCount )
-
-                # Search for MyBible Bibles
-                MyBibleBibleStrictCount = MyBibleBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if MyBibleBibleStrictCount:
-                    totalBibleStrictCount += MyBibleBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'MyBible:' + str(MyBibleBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "MyBibleBible.recheckStrict: MyBibleBibleStrictCount", MyBibleBibleStrictCount )
-
-                # Search for PalmDB Bibles
-                PDBBibleStrictCount = PalmDBBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if PDBBibleStrictCount:
-                    totalBibleStrictCount += PDBBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'PalmDB:' + str(PDBBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: PDBBibleStrictCount", PDBBibleStrictCount )
-
-                # Search for GoBibles
-                GoBibleStrictCount = GoBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if GoBibleStrictCount:
-                    totalBibleStrictCount += GoBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'GoBible:' + str(GoBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: GoBibleStrictCount", GoBibleStrictCount )
-
-                # Search for Online Bibles
-                PierceOnlineBibleStrictCount = PierceOnlineBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if PierceOnlineBibleStrictCount:
-                    totalBibleStrictCount += PierceOnlineBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'PierceOnline:' + str(PierceOnlineBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: PierceOnlineBibleStrictCount", PierceOnlineBibleStrictCount )
-
-                # Search for EasyWorship Bibles
-                EasyWorshipBibleStrictCount = EasyWorshipBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if EasyWorshipBibleStrictCount:
-                    totalBibleStrictCount += EasyWorshipBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'EasyWorship:' + str(EasyWorshipBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: EasyWorshipBibleStrictCount", EasyWorshipBibleStrictCount )
-
-                # Search for Sword Bibles
-                SwordBibleStrictCount = SwordBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if SwordBibleStrictCount:
-                    totalBibleStrictCount += SwordBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Sword:' + str(SwordBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: SwordBibleStrictCount", SwordBibleStrictCount )
-
-                # Search for Unbound Bibles
-                UnboundBibleStrictCount = UnboundBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if UnboundBibleStrictCount:
-                    totalBibleStrictCount += UnboundBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Unbound:' + str(UnboundBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: UnboundBibleStrictCount", UnboundBibleStrictCount )
-
-                # Search for Drupal Bibles
-                DrupalBibleStrictCount = DrupalBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if DrupalBibleStrictCount:
-                    totalBibleStrictCount += DrupalBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Drupal:' + str(DrupalBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: DrupalBibleStrictCount", DrupalBibleStrictCount )
-
-                # Search for YET Bibles
-                YETBibleStrictCount = YETBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if YETBibleStrictCount:
-                    totalBibleStrictCount += YETBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'YET:' + str(YETBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: YETBibleStrictCount", YETBibleStrictCount )
-
-                # Search for ESFM Bibles -- put BEFORE USFM
-                ESFMBibleStrictCount = ESFMBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if ESFMBibleStrictCount:
-                    totalBibleStrictCount += ESFMBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'ESFM:' + str(ESFMBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: ESFMBibleStrictCount", ESFMBibleStrictCount )
-
-                # Search for Paratext (PTX) Bibles -- put BEFORE USFM
-                PTX8BibleStrictCount = PTX8BibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if PTX8BibleStrictCount:
-                    totalBibleStrictCount += PTX8BibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'PTX8:' + str(PTX8BibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: PTX8BibleStrictCount", PTX8BibleStrictCount )
-                PTX7BibleStrictCount = PTX7BibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if PTX7BibleStrictCount:
-                    totalBibleStrictCount += PTX7BibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'PTX7:' + str(PTX7BibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: PTX7BibleStrictCount", PTX7BibleStrictCount )
-
-                # Search for USFM Bibles
-                USFM2BibleStrictCount = USFM2BibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if USFM2BibleStrictCount:
-                    totalBibleStrictCount += USFM2BibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'USFM:' + str(USFM2BibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: USFM2BibleStrictCount", USFM2BibleStrictCount )
-                USFMBibleStrictCount = USFMBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if USFMBibleStrictCount:
-                    totalBibleStrictCount += USFMBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'USFM:' + str(USFMBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: USFMBibleStrictCount", USFMBibleStrictCount )
-
-                # Search for DBL Bibles -- put BEFORE USX
-                DBLBibleStrictCount = DBLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if DBLBibleStrictCount:
-                    totalBibleStrictCount += DBLBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'DBL:' + str(DBLBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: DBLBibleStrictCount", DBLBibleStrictCount )
-
-                # Search for USX XML Bibles
-                USXBibleStrictCount = USXXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if USXBibleStrictCount:
-                    totalBibleStrictCount += USXBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'USX:' + str(USXBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: USXBibleStrictCount", USXBibleStrictCount )
-
-                # Search for USFX XML Bibles
-                USFXBibleStrictCount = USFXXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if USFXBibleStrictCount:
-                    totalBibleStrictCount += USFXBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'USFX:' + str(USFXBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: USFXBibleStrictCount", USFXBibleStrictCount )
-
-                # Search for OSIS XML Bibles
-                OSISBibleStrictCount = OSISXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if OSISBibleStrictCount:
-                    totalBibleStrictCount += OSISBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'OSIS:' + str(OSISBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: OSISBibleStrictCount", OSISBibleStrictCount )
-
-                # Search for OpenSong XML Bibles
-                OpenSongBibleStrictCount = OpenSongXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if OpenSongBibleStrictCount:
-                    totalBibleStrictCount += OpenSongBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'OpenSong:' + str(OpenSongBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: OpenSongBibleStrictCount", OpenSongBibleStrictCount )
-
-                # Search for Zefania XML Bibles
-                ZefaniaBibleStrictCount = ZefaniaXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if ZefaniaBibleStrictCount:
-                    totalBibleStrictCount += ZefaniaBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Zefania:' + str(ZefaniaBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: ZefaniaBibleStrictCount", ZefaniaBibleStrictCount )
-
-                # Search for Haggai XML Bibles
-                HaggaiBibleStrictCount = HaggaiXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if HaggaiBibleStrictCount:
-                    totalBibleStrictCount += HaggaiBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Haggai:' + str(HaggaiBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: HaggaiBibleStrictCount", HaggaiBibleStrictCount )
-
-                # Search for VerseView XML Bibles
-                VerseViewBibleStrictCount = VerseViewXMLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if VerseViewBibleStrictCount:
-                    totalBibleStrictCount += VerseViewBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'VerseView:' + str(VerseViewBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: VerseViewBibleStrictCount", VerseViewBibleStrictCount )
-
-                # Search for CSV text Bibles
-                CSVBibleStrictCount = CSVBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if CSVBibleStrictCount:
-                    totalBibleStrictCount += CSVBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'CSV:' + str(CSVBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: CSVBibleStrictCount", CSVBibleStrictCount )
-
-                # Search for Forge for SwordSearcher VPL text Bibles
-                F4SSBibleStrictCount = ForgeForSwordSearcherBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if F4SSBibleStrictCount:
-                    totalBibleStrictCount += F4SSBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'Forge:' + str(F4SSBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: F4SSBibleStrictCount", F4SSBibleStrictCount )
-
-                # Search for VPL text Bibles
-                VPLBibleStrictCount = VPLBibleFileCheck( folderName, strictCheck=oppositeStrictFlag )
-                if VPLBibleStrictCount:
-                    totalBibleStrictCount += VPLBibleStrictCount
-                    totalBibleStrictTypes += 1
-                    typesStrictlyFound.append( 'VPL:' + str(VPLBibleStrictCount) )
-                    if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.recheckStrict: VPLBibleStrictCount", VPLBibleStrictCount )
-            else:
-                theWordBibleStrictCount = MySwordBibleStrictCount = ESwordBibleStrictCount = ESwordCommentaryStrictCount = 0
-                MyBibleBibleStrictCount = PDBBibleStrictCount = PierceOnlineBibleStrictCount = EasyWorshipBibleStrictCount = 0
-                SwordBibleStrictCount = UnboundBibleStrictCount = DrupalBibleStrictCount = YETBibleStrictCount = 0
-                ESFMBibleStrictCount = PTX8BibleStrictCount = PTX7BibleStrictCount = USFM2BibleStrictCount = USFMBibleStrictCount = 0
-                DBLBibleStrictCount = USXBibleStrictCount = USFXBibleStrictCount = OSISBibleStrictCount = 0
-                OpenSongBibleStrictCount = ZefaniaBibleStrictCount = HaggaiBibleStrictCount = VerseViewBibleStrictCount = 0
-                GoBibleStrictCount = CSVBibleStrictCount = F4SSBibleStrictCount = VPLBibleStrictCount = 0
-
-            return totalBibleStrictCount, totalBibleStrictTypes, typesStrictlyFound
+                print( "UnknownBible.recheckStrict( {}, {} )".format( self.givenFolderName, oppositeStrictFlag ) )
+
+            return totalCounts( self._runFileChecks( oppositeStrictFlag, folderSnapshot ) )
         # end of recheckStrict
 
 
         # Main code for UnknownBible.search()
         # We first do a normal (non-strict) check (unless strict was requested by the caller)
-        totalBibleCount, totalBibleTypes, typesFound = 0, 0, []
-
-        # Search for pickled Bibles -- can be given a folder, or a zip file name
-        PickledBibleCount = PickledBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-        if PickledBibleCount:
-            totalBibleCount += PickledBibleCount
-            totalBibleTypes += 1
-            typesFound.append( 'Pickled:' + str(PickledBibleCount) )
-            if BibleOrgSysGlobals.verbosityLevel > 2: print( "PickledBible.search: PickledBibleCount", PickledBibleCount )
-
-        if os.path.isdir( self.givenFolderName ):
-            # Search for theWord Bibles
-            theWordBibleCount = theWordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if theWordBibleCount:
-                totalBibleCount += theWordBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'theWord:' + str(theWordBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "theWordBible.search: theWordBibleCount", theWordBibleCount )
-
-            # Search for MySword Bibles
-            MySwordBibleCount = MySwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if MySwordBibleCount:
-                totalBibleCount += MySwordBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'MySword:' + str(MySwordBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "MySwordBible.search: MySwordBibleCount", MySwordBibleCount )
-
-            # Search for e-Sword Bibles and Commentaries
-            ESwordBibleCount = ESwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if ESwordBibleCount:
-                totalBibleCount += ESwordBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'e-Sword-Bible:' + str(ESwordBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "ESwordBible.search: ESwordBibleCount", ESwordBibleCount )
-            ESwordCommentaryCount = ESwordCommentaryFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if ESwordCommentaryCount:
-                totalBibleCount += ESwordCommentaryCount
-                totalBibleTypes += 1
-                typesFound.append( 'e-Sword-Commentary:' + str(ESwordCommentaryCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "ESwordCommentary.search: ESwordCommentaryCount", ESwordCommentaryCount )
-
-            # Search for MyBible Bibles
-            MyBibleBibleCount = MyBibleBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if MyBibleBibleCount:
-                totalBibleCount += MyBibleBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'MyBible:' + str(MyBibleBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "MyBibleBible.search: MyBibleBibleCount", MyBibleBibleCount )
-
-            # Search for PalmDB Bibles
-            PDBBibleCount = PalmDBBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if PDBBibleCount:
-                totalBibleCount += PDBBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'PalmDB:' + str(PDBBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: PDBBibleCount", PDBBibleCount )
-
-            # Search for GoBibles
-            GoBibleCount = GoBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if GoBibleCount:
-                totalBibleCount += GoBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'GoBible:' + str(GoBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: GoBibleCount", GoBibleCount )
-
-            # Search for Online Bibles
-            PierceOnlineBibleCount = PierceOnlineBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if PierceOnlineBibleCount:
-                totalBibleCount += PierceOnlineBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'PierceOnline:' + str(PierceOnlineBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: PierceOnlineBibleCount", PierceOnlineBibleCount )
-
-            # Search for EasyWorship Bibles
-            EasyWorshipBibleCount = EasyWorshipBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if EasyWorshipBibleCount:
-                totalBibleCount += EasyWorshipBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'EasyWorship:' + str(EasyWorshipBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: EasyWorshipBibleCount", EasyWorshipBibleCount )
-
-            # Search for Sword Bibles
-            SwordBibleCount = SwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if SwordBibleCount:
-                totalBibleCount += SwordBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Sword:' + str(SwordBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: SwordBibleCount", SwordBibleCount )
-
-            # Search for Unbound Bibles
-            UnboundBibleCount = UnboundBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if UnboundBibleCount:
-                totalBibleCount += UnboundBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Unbound:' + str(UnboundBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: UnboundBibleCount", UnboundBibleCount )
-
-            # Search for Drupal Bibles
-            DrupalBibleCount = DrupalBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if DrupalBibleCount:
-                totalBibleCount += DrupalBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Drupal:' + str(DrupalBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: DrupalBibleCount", DrupalBibleCount )
-
-            # Search for YET Bibles
-            YETBibleCount = YETBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if YETBibleCount:
-                totalBibleCount += YETBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'YET:' + str(YETBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: YETBibleCount", YETBibleCount )
-
-            # Search for ESFM Bibles -- put BEFORE USFM
-            ESFMBibleCount = ESFMBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if ESFMBibleCount:
-                totalBibleCount += ESFMBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'ESFM:' + str(ESFMBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: ESFMBibleCount", ESFMBibleCount )
-
-            # Search for Paratext (PTX) Bibles -- put BEFORE USFM
-            PTX8BibleCount = PTX8BibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if PTX8BibleCount:
-                totalBibleCount += PTX8BibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'PTX8:' + str(PTX8BibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: PTX8BibleCount", PTX8BibleCount )
-            PTX7BibleCount = PTX7BibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if PTX7BibleCount:
-                totalBibleCount += PTX7BibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'PTX7:' + str(PTX7BibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: PTX7BibleCount", PTX7BibleCount )
-
-            # Search for USFM Bibles
-            USFM2BibleCount = USFM2BibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if USFM2BibleCount:
-                totalBibleCount += USFM2BibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'USFM2:' + str(USFM2BibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: USFM2BibleCount", USFM2BibleCount )
-            USFMBibleCount = USFMBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if USFMBibleCount:
-                totalBibleCount += USFMBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'USFM:' + str(USFMBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: USFMBibleCount", USFMBibleCount )
-
-            # Search for DBL Bibles -- put BEFORE USX
-            DBLBibleCount = DBLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if DBLBibleCount:
-                totalBibleCount += DBLBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'DBL:' + str(DBLBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: DBLBibleCount", DBLBibleCount )
-
-            # Search for USX XML Bibles
-            USXBibleCount = USXXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if USXBibleCount:
-                totalBibleCount += USXBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'USX:' + str(USXBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: USXBibleCount", USXBibleCount )
-
-            # Search for USFX XML Bibles
-            USFXBibleCount = USFXXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if USFXBibleCount:
-                totalBibleCount += USFXBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'USFX:' + str(USFXBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: USFXBibleCount", USFXBibleCount )
-
-            # Search for OSIS XML Bibles
-            OSISBibleCount = OSISXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if OSISBibleCount:
-                totalBibleCount += OSISBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'OSIS:' + str(OSISBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: OSISBibleCount", OSISBibleCount )
-
-            # Search for OpenSong XML Bibles
-            OpenSongBibleCount = OpenSongXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if OpenSongBibleCount:
-                totalBibleCount += OpenSongBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'OpenSong:' + str(OpenSongBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: OpenSongBibleCount", OpenSongBibleCount )
-
-            # Search for Zefania XML Bibles
-            ZefaniaBibleCount = ZefaniaXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if ZefaniaBibleCount:
-                totalBibleCount += ZefaniaBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Zefania:' + str(ZefaniaBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: ZefaniaBibleCount", ZefaniaBibleCount )
-
-            # Search for Haggai XML Bibles
-            HaggaiBibleCount = HaggaiXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if HaggaiBibleCount:
-                totalBibleCount += HaggaiBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Haggai:' + str(HaggaiBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: HaggaiBibleCount", HaggaiBibleCount )
-
-            # Search for VerseView XML Bibles
-            VerseViewBibleCount = VerseViewXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if VerseViewBibleCount:
-                totalBibleCount += VerseViewBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'VerseView:' + str(VerseViewBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: VerseViewBibleCount", VerseViewBibleCount )
-
-            # Search for CSV text Bibles
-            CSVBibleCount = CSVBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if CSVBibleCount:
-                totalBibleCount += CSVBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'CSV:' + str(CSVBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: CSVBibleCount", CSVBibleCount )
-
-            # Search for Forge for SwordSearcher text Bibles
-            F4SSBibleCount = ForgeForSwordSearcherBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if F4SSBibleCount:
-                totalBibleCount += F4SSBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'Forge:' + str(F4SSBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: F4SSBibleCount", F4SSBibleCount )
-
-            # Search for VPL text Bibles
-            VPLBibleCount = VPLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck )
-            if VPLBibleCount:
-                totalBibleCount += VPLBibleCount
-                totalBibleTypes += 1
-                typesFound.append( 'VPL:' + str(VPLBibleCount) )
-                if BibleOrgSysGlobals.verbosityLevel > 2: print( "UnknownBible.search: VPLBibleCount", VPLBibleCount )
-        else: # we weren't given a folder to look in
-            theWordBibleCount = MySwordBibleCount = ESwordBibleCount = ESwordCommentaryCount = 0
-            MyBibleBibleCount = PDBBibleCount = PierceOnlineBibleCount = EasyWorshipBibleCount = 0
-            SwordBibleCount = UnboundBibleCount = DrupalBibleCount = YETBibleCount = 0
-            ESFMBibleCount = PTX8BibleCount = PTX7BibleCount = USFM2BibleCount = USFMBibleCount = 0
-            DBLBibleCount = USXBibleCount = USFXBibleCount = OSISBibleCount = 0
-            OpenSongBibleCount = ZefaniaBibleCount = HaggaiBibleCount = VerseViewBibleCount = 0
-            GoBibleCount = CSVBibleCount = F4SSBibleCount = VPLBibleCount = 0
+        counts = self._runFileChecks( strictCheck, folderSnapshot )
+        totalBibleCount, totalBibleTypes, typesFound = totalCounts( counts )
 
         assert len(typesFound) == totalBibleTypes
         if totalBibleCount == 0:
@@ -661,7 +277,7 @@ class UnknownBible:
                 #   so let's try again without the strict check
                 if debuggingThisModule or BibleOrgSysGlobals.verbosityLevel > 2:
                     print( "UnknownBible.search: retrying without strict checking criteria" )
-                totalBibleUnstrictCount, totalBibleStrictTypes, typesUnstrictlyFound = recheckStrict( self.givenFolderName, oppositeStrictFlag=False )
+                totalBibleUnstrictCount, totalBibleStrictTypes, typesUnstrictlyFound = recheckStrict( oppositeStrictFlag=False )
                 if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel > 2:
                     print ( "  UnknownBible.recheck: After {} {} {}".format( totalBibleCount, totalBibleTypes, typesFound ) )
                     print ( "  UnknownBible.recheck: Found {} {} {}".format( totalBibleUnstrictCount, totalBibleStrictTypes, typesUnstrictlyFound ) )
@@ -685,7 +301,7 @@ class UnknownBible:
                     # We didn't do a strict check the first time, so let's try that to try to reduce our found Bibles
                     if BibleOrgSysGlobals.verbosityLevel > 0:
                         print( "UnknownBible.search: retrying with strict checking criteria" )
-                    totalBibleStrictCount, totalBibleStrictTypes, typesStrictlyFound = recheckStrict( self.givenFolderName, oppositeStrictFlag=True )
+                    totalBibleStrictCount, totalBibleStrictTypes, typesStrictlyFound = recheckStrict( oppositeStrictFlag=True )
                     if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel > 2:
                         print ( "  UnknownBible.recheck: After {} {} {}".format( totalBibleCount, totalBibleTypes, typesFound ) )
                         print ( "  UnknownBible.recheck: Found {} {} {}".format( totalBibleStrictCount, totalBibleStrictTypes, typesStrictlyFound ) )
@@ -698,149 +314,12 @@ class UnknownBible:
                 if haveSingle and BibleOrgSysGlobals.verbosityLevel > 0:
                     print( "UnknownBible.search: Will try to find one Bible to autoload anyway!" )
 
-        #if 1 or debuggingThisModule:
-            #print( 'pB={} tW={} MSw={} ESw={} EswC={} MyB={} PDB={} Onl={} EW={} Sw={}' \
-                #.format( PickledBibleCount, theWordBibleCount, MySwordBibleCount, ESwordBibleCount, ESwordCommentaryCount, MyBibleBibleCount, PDBBibleCount, PierceOnlineBibleCount, EasyWorshipBibleCount, SwordBibleCount ) )
-            #print( '  Unb={} Dr={} YET={} ESFM={} PTX8={} PTX7={} USFM2={} USFM={}' \
-                #.format( UnboundBibleCount, DrupalBibleCount, YETBibleCount, ESFMBibleCount, PTX8BibleCount, PTX7BibleCount, DBLBibleCount ) )
-            #print( '  GB={} CSV={} F4SS={} VPL={}' \
-                #.format( GoBibleCount, CSVBibleCount, F4SSBibleCount, VPLBibleCount ) )
-            #print( '  USX={} USFX={} OSIS={} OSng={} Zef={} Hag={} VsVw={}' \
-                #.format( USXBibleCount, USFXBibleCount, OSISBibleCount, OpenSongBibleCount, ZefaniaBibleCount, HaggaiBibleCount, VerseViewBibleCount ) )
-        #if 0 and debuggingThisModule:
-            #print( 'pB={} tW={} MSw={} ESw={} EswC={} MyB={} PDB={} Onl={} EW={} Sw={}' \
-                #.format( PickledBibleStrictCount, theWordBibleStrictCount, MySwordBibleStrictCount, ESwordBibleStrictCount, ESwordCommentaryStrictCount, MyBibleBibleStrictCount, PDBBibleStrictCount, PierceOnlineBibleStrictCount, EasyWorshipBibleStrictCount, SwordBibleStrictCount ) )
-            #print( '  Unb={} Dr={} YET={} ESFM={} PTX8={} PTX7={} USFM2={} USFM={}' \
-                #.format( UnboundBibleStrictCount, DrupalBibleStrictCount, YETBibleStrictCount, ESFMBibleStrictCount, PTX8BibleStrictCount, PTX7BibleStrictCount, DBLBibleStrictCount ) )
-            #print( '  GB={} CSV={} F4SS={} VPL={}' \
-                #.format( GoBibleStrictCount, CSVBibleStrictCount, F4SSBibleStrictCount, VPLBibleStrictCount ) )
-            #print( '  USX={} USFX={} OSIS={} OSng={} Zef={} Hag={} VsVw={}' \
-                #.format( USXBibleStrictCount, USFXBibleStrictCount, OSISBibleStrictCount, OpenSongBibleStrictCount, ZefaniaBibleStrictCount, HaggaiBibleStrictCount, VerseViewBibleStrictCount ) )
-
         if autoLoadAlways or totalBibleCount == 1:
-            # Put the binary formats first here because they can be detected more reliably
-            if PickledBibleCount == 1:
-                self.foundType = 'pickled Bible'
-                if autoLoad: return PickledBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif theWordBibleCount == 1:
-                self.foundType = 'theWord Bible'
-                if autoLoad: return theWordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif MySwordBibleCount == 1:
-                self.foundType = 'MySword Bible'
-                if autoLoad: return MySwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif ESwordBibleCount == 1:
-                self.foundType = 'e-Sword Bible'
-                if autoLoad: return ESwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif ESwordCommentaryCount == 1:
-                self.foundType = 'e-Sword Commentary'
-                if autoLoad: return ESwordCommentaryFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif MyBibleBibleCount == 1:
-                self.foundType = 'MyBible Bible'
-                if autoLoad: return MyBibleBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif PDBBibleCount == 1:
-                self.foundType = 'PalmDB Bible'
-                if autoLoad: return PalmDBBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif GoBibleCount == 1:
-                self.foundType = 'GoBible Bible'
-                if autoLoad: return GoBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif PierceOnlineBibleCount == 1:
-                self.foundType = 'Pierce Online Bible'
-                if autoLoad: return PierceOnlineBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif EasyWorshipBibleCount == 1:
-                self.foundType = 'EasyWorship Bible'
-                if autoLoad: return EasyWorshipBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif SwordBibleCount == 1:
-                self.foundType = 'Sword Bible'
-                if autoLoad: return SwordBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            # And now plain text formats
-            elif UnboundBibleCount == 1:
-                self.foundType = 'Unbound Bible'
-                if autoLoad: return UnboundBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif DrupalBibleCount == 1:
-                self.foundType = 'Drupal Bible'
-                if autoLoad: return DrupalBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif YETBibleCount == 1:
-                self.foundType = 'YET Bible'
-                if autoLoad: return YETBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif ESFMBibleCount == 1: # Must be ahead of USFM
-                self.foundType = 'ESFM Bible'
-                if autoLoad: return ESFMBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif PTX8BibleCount == 1: # Must be ahead of USFM
-                self.foundType = 'PTX8 Bible'
-                if autoLoad: return PTX8BibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif PTX7BibleCount == 1: # Must be ahead of USFM
-                self.foundType = 'PTX7 Bible'
-                if autoLoad: return PTX7BibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif USFM2BibleCount == 1:
-                self.foundType = 'USFM2 Bible'
-                if autoLoad: return USFM2BibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif USFMBibleCount == 1:
-                self.foundType = 'USFM Bible'
-                if autoLoad: return USFMBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif DBLBibleCount == 1: # Must be ahead of USX
-                self.foundType = 'DBL Bible'
-                if autoLoad: return DBLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif CSVBibleCount == 1:
-                self.foundType = 'CSV Bible'
-                if autoLoad: return CSVBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif F4SSBibleCount == 1:
-                self.foundType = 'Forge Bible'
-                if autoLoad: return ForgeForSwordSearcherBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif VPLBibleCount == 1:
-                self.foundType = 'VPL Bible'
-                if autoLoad: return VPLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            # And now XML text formats
-            elif USXBibleCount == 1:
-                self.foundType = 'USX XML Bible'
-                if autoLoad: return USXXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif USFXBibleCount == 1:
-                self.foundType = 'USFX XML Bible'
-                if autoLoad: return USFXXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif OSISBibleCount == 1:
-                self.foundType = 'OSIS XML Bible'
-                if autoLoad: return OSISXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif OpenSongBibleCount == 1:
-                self.foundType = 'OpenSong XML Bible'
-                if autoLoad: return OpenSongXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif ZefaniaBibleCount == 1:
-                self.foundType = 'Zefania XML Bible'
-                if autoLoad: return ZefaniaXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif HaggaiBibleCount == 1:
-                self.foundType = 'Haggai XML Bible'
-                if autoLoad: return HaggaiXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
-            elif VerseViewBibleCount == 1:
-                self.foundType = 'VerseView XML Bible'
-                if autoLoad: return VerseViewXMLBibleFileCheck( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks )
-                else: return self.foundType
+            for key in AUTOLOAD_ORDER: # which puts the binary formats first because they can be detected more reliably
+                if counts[key] == 1:
+                    key, typeLabel, self.foundType, fileCheckFunction = BIBLE_FILE_CHECKS_DICT[key]
+                    if autoLoad: return fileCheckFunction( self.givenFolderName, strictCheck=strictCheck, autoLoad=autoLoad, autoLoadBooks=autoLoadBooks, folderSnapshot=folderSnapshot )
+                    else: return self.foundType
         return self.foundType
     # end of UnknownBible.search
 # end of class UnknownBible
@@ -51,18 +51,19 @@ e.g.,
 
 from gettext import gettext as _
 
-LastModifiedDate = '2019-05-12' # by RJH
+LastModifiedDate = '2026-10-17' # by RJH
 ShortProgName = "theWordBible"
 ProgName = "theWord Bible format handler"
-ProgVersion = '0.55'
+ProgVersion = '0.58'
 ProgNameVersion = '{} v{}'.format( ShortProgName, ProgVersion )
 ProgNameVersionDate = '{} {} {}'.format( ProgNameVersion, _("last modified"), LastModifiedDate )
 
 debuggingThisModule = False
 
 
-import logging, os, re
+import logging, os, re, hashlib, pickle
 import multiprocessing
+from array import array
 
 import BibleOrgSysGlobals
 from InternalBible import OT39_BOOKLIST, NT27_BOOKLIST
@@ -126,7 +127,7 @@ def exp( messageString ):
 
 
 
-def theWordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False ):
+def theWordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, autoLoadBooks=False, folderSnapshot=None ):
     """
     Given a folder, search for theWord Bible files or folders in the folder and in the next level down.
 
@@ -142,24 +143,26 @@ def theWordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
     if BibleOrgSysGlobals.debugFlag: assert givenFolderName and isinstance( givenFolderName, str )
     if BibleOrgSysGlobals.debugFlag: assert autoLoad in (True,False,)
 
+    if folderSnapshot is None: folderSnapshot = BibleOrgSysGlobals.FolderSnapshot() # Just for this check
+
     # Check that the given folder is readable
-    if not os.access( givenFolderName, os.R_OK ):
+    if not folderSnapshot.access( givenFolderName, os.R_OK ):
         logging.critical( _("theWordBibleFileCheck: Given {!r} folder is unreadable").format( givenFolderName ) )
         return False
-    if not os.path.isdir( givenFolderName ):
+    if not folderSnapshot.isdir( givenFolderName ):
         logging.critical( _("theWordBibleFileCheck: Given {!r} path is not a folder").format( givenFolderName ) )
         return False
 
     # Find all the files and folders in this folder
     if BibleOrgSysGlobals.verbosityLevel > 3: print( " theWordBibleFileCheck: Looking for files in given {}".format( givenFolderName ) )
     foundFolders, foundFiles = [], []
-    for something in os.listdir( givenFolderName ):
+    for something in folderSnapshot.listdir( givenFolderName ):
         somepath = os.path.join( givenFolderName, something )
-        if os.path.isdir( somepath ):
+        if folderSnapshot.isdir( somepath ):
             if something in BibleOrgSysGlobals.COMMONLY_IGNORED_FOLDERS:
                 continue # don't visit these directories
             foundFolders.append( something )
-        elif os.path.isfile( somepath ):
+        elif folderSnapshot.isfile( somepath ):
             somethingUpper = something.upper()
             somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
             #ignore = False
@@ -191,15 +194,15 @@ def theWordBibleFileCheck( givenFolderName, strictCheck=True, autoLoad=False, au
     foundProjects = []
     for thisFolderName in sorted( foundFolders ):
         tryFolderName = os.path.join( givenFolderName, thisFolderName+'/' )
-        if not os.access( tryFolderName, os.R_OK ): # The subfolder is not readable
+        if not folderSnapshot.access( tryFolderName, os.R_OK ): # The subfolder is not readable
             logging.warning( _("theWordBibleFileCheck: {!r} subfolder is unreadable").format( tryFolderName ) )
             continue
         if BibleOrgSysGlobals.verbosityLevel > 3: print( "    theWordBibleFileCheck: Looking for files in {}".format( tryFolderName ) )
         foundSubfolders, foundSubfiles = [], []
-        for something in os.listdir( tryFolderName ):
+        for something in folderSnapshot.listdir( tryFolderName ):
             somepath = os.path.join( givenFolderName, thisFolderName, something )
-            if os.path.isdir( somepath ): foundSubfolders.append( something )
-            elif os.path.isfile( somepath ):
+            if folderSnapshot.isdir( somepath ): foundSubfolders.append( something )
+            elif folderSnapshot.isfile( somepath ):
                 somethingUpper = something.upper()
                 somethingUpperProper, somethingUpperExt = os.path.splitext( somethingUpper )
                 #ignore = False
@@ -267,6 +270,124 @@ def theWordGetBBBCV( lineNumber, volumeType='BOTH' ):
 # end of theWordGetBBBCV
 
 
+def theWordGetBookLineRange( BBB, volumeType='BOTH' ):
+    """
+    Given a book code,
+        return the line number (0… ) of the first line of that book
+        and the number of lines (verses) in that book as a 2-tuple.
+
+    volumeType is 'OT', 'NT', or 'Both'.
+
+    Returns None if the book isn't in that volume.
+    """
+    assert volumeType in ('OT','NT','BOTH',)
+
+    if volumeType == 'OT': books, bookLines = theWordOTBooks, theWordOTBookLines
+    elif volumeType == 'NT': books, bookLines = theWordNTBooks, theWordNTBookLines
+    elif volumeType == 'BOTH': books, bookLines = theWordBooks, theWordBookLines
+
+    runningTotal = 0
+    for thisBBB, lines in zip( books, bookLines ):
+        if thisBBB == BBB: return runningTotal, lines
+        runningTotal += lines
+# end of theWordGetBookLineRange
+
+
+def theWordGetLineNumber( BBB, C, V, volumeType='BOTH' ):
+    """
+    Given a Bible reference,
+        return the line number (0… ) of that verse in a theWord file
+        (the reverse of theWordGetBBBCV).
+
+    volumeType is 'OT', 'NT', or 'Both'.
+
+    Returns None if there's no line for that verse.
+    """
+    bookLineRange = theWordGetBookLineRange( BBB, volumeType )
+    if bookLineRange is None: return
+    try: intC, intV = int( C ), int( V )
+    except ValueError: return
+
+    global BOS
+    if BOS is None: BOS = BibleOrganisationalSystem( 'GENERIC-KJV-66-ENG' )
+
+    verseList = BOS.getNumVersesList( BBB )
+    if not 1 <= intC <= len(verseList) or not 1 <= intV <= verseList[intC-1]: return
+    return bookLineRange[0] + sum( verseList[:intC-1] ) + intV - 1
+# end of theWordGetLineNumber
+
+
+theWordLineIndexCache = {} # Holds the line indexes that we've already loaded (with the absolute filepath as the key)
+LINE_INDEX_CACHE_FOLDER = os.path.join( BibleOrgSysGlobals.DEFAULT_USER_CACHE_FOLDER, 'theWordLineIndexes/' )
+LINE_INDEX_FILENAME_END = '.lineIndex.pickle'
+
+def theWordLoadLineIndex( filepath ):
+    """
+    Return an array of the byte offsets of the start of each line in the theWord module file
+        with a final entry for the end of the file,
+        so that line n (0… ) is found at offsets[n]:offsets[n+1].
+
+    Line endings are found the same way as reading in text mode,
+        i.e., CRLF, CR, and LF are all accepted.
+
+    The index is only built once for each file,
+        and is then kept in memory and in a pickle file in LINE_INDEX_CACHE_FOLDER.
+    It is rebuilt if the size or modification time of the file changes.
+    Saved indexes for files which no longer exist are removed whenever a new index is saved.
+    """
+    if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+        print( "theWordLoadLineIndex( {} )".format( filepath ) )
+
+    absoluteFilepath = os.path.abspath( filepath )
+    fileStat = os.stat( absoluteFilepath )
+    fileSignature = fileStat.st_size, fileStat.st_mtime_ns
+
+    # See if we already have it
+    try:
+        lineIndex = theWordLineIndexCache[absoluteFilepath]
+        if lineIndex['fileSignature'] == fileSignature: return lineIndex['offsets']
+    except KeyError: pass
+    pickleFilename = '{}.{}{}'.format( os.path.basename( absoluteFilepath ),
+                                hashlib.md5( absoluteFilepath.encode( 'utf-8' ) ).hexdigest()[:12], LINE_INDEX_FILENAME_END )
+    try:
+        lineIndex = BibleOrgSysGlobals.unpickleObject( pickleFilename, LINE_INDEX_CACHE_FOLDER )
+        if lineIndex['fileSignature'] == fileSignature:
+            theWordLineIndexCache[absoluteFilepath] = lineIndex
+            return lineIndex['offsets']
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError): pass
+
+    # Have to build it
+    if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Indexing lines in {}…").format( filepath ) )
+    with open( absoluteFilepath, 'rb' ) as myFile: fileData = myFile.read()
+    offsets = array( 'Q', [0] )
+    offsets.extend( match.end() for match in re.finditer( b'\r\n|\r|\n', fileData ) )
+    if offsets[-1] != len(fileData): offsets.append( len(fileData) ) # No newline at end of file
+    lineIndex = { 'fileSignature':fileSignature, 'offsets':offsets, 'sourceFilepath':absoluteFilepath }
+    theWordLineIndexCache[absoluteFilepath] = lineIndex
+    _pruneLineIndexCache()
+    try: BibleOrgSysGlobals.pickleObject( lineIndex, pickleFilename, LINE_INDEX_CACHE_FOLDER )
+    except OSError as err: logging.info( "theWordLoadLineIndex: Unable to save line index for {}: {}".format( filepath, err ) )
+    return offsets
+# end of theWordLoadLineIndex
+
+
+def _pruneLineIndexCache():
+    """
+    Remove any saved line indexes whose theWord module file no longer exists
+        (e.g., from modules in temporary folders).
+    """
+    try: pickleFilenames = [filename for filename in os.listdir( LINE_INDEX_CACHE_FOLDER ) if filename.endswith( LINE_INDEX_FILENAME_END )]
+    except OSError: return # No cache folder yet
+    for pickleFilename in pickleFilenames:
+        try:
+            lineIndex = BibleOrgSysGlobals.unpickleObject( pickleFilename, LINE_INDEX_CACHE_FOLDER )
+            if os.path.isfile( lineIndex['sourceFilepath'] ): continue
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError): pass # Remove unreadable ones too
+        try: os.remove( os.path.join( LINE_INDEX_CACHE_FOLDER, pickleFilename ) )
+        except OSError: pass
+# end of _pruneLineIndexCache
+
+
 
 def theWordFileCompare( filename1, filename2, folder1=None, folder2=None, printFlag=True, exitCount=10 ):
     """
@@ -828,140 +949,244 @@ class theWordBible( Bible ):
 
         if self.fileExtension.upper().endswith('X'):
             logging.warning( _("theWordBible: File {!r} is encrypted").format( self.sourceFilepath ) )
+
+        fileExtensionUpper = self.fileExtension.upper()
+        if fileExtensionUpper in ('.ONT','.ONTX',): self.testament = 'BOTH'
+        elif fileExtensionUpper in ('.OT','.OTX',): self.testament = 'OT'
+        elif fileExtensionUpper in ('.NT','.NTX',): self.testament = 'NT'
+        else: self.testament = None
+        self.lineIndex = None # Gets loaded when we first need it
     # end of theWordBible.__init__
 
 
-    def load( self ):
+    def _getLineIndex( self ):
         """
-        Load a single source file and load book elements.
+        Returns the byte offsets of the lines in our file (loading them if necessary).
         """
-        if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading {}…").format( self.sourceFilepath ) )
+        if self.lineIndex is None: self.lineIndex = theWordLoadLineIndex( self.sourceFilepath )
+        return self.lineIndex
+    # end of theWordBible._getLineIndex
+
+
+    def _readLines( self, firstLineNumber, numLines ):
+        """
+        Seek straight to the given line number (0… ) in our file
+            and return a list of the decoded lines (without the line endings).
+
+        If the file is too short, only the lines that exist are returned
+            (so the list is empty if the first line is past the end of the file).
+        """
+        lineIndex = self._getLineIndex()
+        if firstLineNumber >= len(lineIndex) - 1: return [] # Past the end of a short file
+        numLines = min( numLines, len(lineIndex) - 1 - firstLineNumber )
+        startOffset = lineIndex[firstLineNumber]
+        with open( self.sourceFilepath, 'rb' ) as myFile: # Automatically closes the file when done
+            myFile.seek( startOffset )
+            fileData = myFile.read( lineIndex[firstLineNumber+numLines] - startOffset )
+
+        encodings = ['utf-8', 'ISO-8859-1', 'ISO-8859-15']
+        if self.encoding in encodings: encodings.remove( self.encoding ) # Remove the given encoding if included
+        if self.encoding: encodings.insert( 0, self.encoding ) # Put the given encoding back in in the first position
+        for encoding in encodings: # Start by trying the given encoding
+            try:
+                lines = [fileData[lineIndex[n]-startOffset:lineIndex[n+1]-startOffset].rstrip( b'\r\n' ).decode( encoding )
+                                                    for n in range( firstLineNumber, firstLineNumber+numLines )]
+                if firstLineNumber==0 and lines and lines[0] and encoding.lower()=='utf-8' and lines[0][0]==chr(65279): #U+FEFF
+                    logging.info( "      theWordBible._readLines: Detected Unicode Byte Order Marker (BOM)" )
+                    lines[0] = lines[0][1:] # Remove the Unicode Byte Order Marker (BOM)
+                self.encoding = encoding
+                return lines
+            except UnicodeDecodeError:
+                logging.critical( _("theWord Bible module file fails with encoding: {} {}").format( self.sourceFilename, encoding ) )
+        return []
+    # end of theWordBible._readLines
+
+
+    def _makeBook( self, BBB ):
+        """
+        Use the line index to read and process only the lines for the given book.
+
+        Returns the new BibleBook (unstashed and unprocessed)
+            or None if the book isn't there or was blank.
+        """
+        if BibleOrgSysGlobals.debugFlag and debuggingThisModule:
+            print( "theWordBible._makeBook( {} )".format( BBB ) )
 
         global BOS
         if BOS is None: BOS = BibleOrganisationalSystem( 'GENERIC-KJV-66-ENG' )
 
-        if self.suppliedMetadata is None: self.suppliedMetadata = {}
-        self.suppliedMetadata['theWord'] = {}
+        bookLineRange = theWordGetBookLineRange( BBB, self.testament )
+        if bookLineRange is None: return # Not in this module
+        firstLineNumber, numLines = bookLineRange
+        numLinesPresent = len( self._getLineIndex() ) - 1 - firstLineNumber
+        if numLinesPresent <= 0: return # Not in this (short) file
+        if numLinesPresent < numLines:
+            logging.error( _("theWordBible: Only {} of {} lines for {} are in {}").format( numLinesPresent, numLines, BBB, self.sourceFilename ) )
+            numLines = numLinesPresent # Load what we've got
 
-        fileExtensionUpper = self.fileExtension.upper()
-        assert fileExtensionUpper in filenameEndingsToAccept
-        if fileExtensionUpper.endswith('X'):
-            logging.error( _("theWordBible: File {!r} is encrypted").format( self.sourceFilepath ) )
-            return
+        ourGlobals = {}
+        ourGlobals['haveParagraph'] = False
+        if firstLineNumber > 0: # We need to know if the previous book ended with a paragraph marker
+            previousLine, = self._readLines( firstLineNumber-1, 1 )
+            previousBBB, previousC, previousV = theWordGetBBBCV( firstLineNumber-1, self.testament )
+            previousBook = BibleBook( self, previousBBB ) # Just a scratch book to find out how that line ended
+            previousBook.objectNameString, previousBook.objectTypeString = 'theWord Bible Book object', 'theWord'
+            handleRTFLine( self.name, previousBBB, previousC, previousV, previousLine, previousBook, ourGlobals )
 
-        if fileExtensionUpper in ('.ONT','.ONTX',):
-            testament, BBB = 'BOTH', 'GEN'
-            booksExpected, textLineCountExpected = theWordBookCount, theWordTotalLines
-        elif fileExtensionUpper in ('.OT','.OTX',):
-            testament, BBB = 'OT', 'GEN'
-            booksExpected, textLineCountExpected = theWordOTBookCount, theWordOTTotalLines
-        elif fileExtensionUpper in ('.NT','.NTX',):
-            testament, BBB = 'NT', 'MAT'
-            booksExpected, textLineCountExpected = theWordNTBookCount, theWordOTTotalLines
-
-        # Create the first book
         thisBook = BibleBook( self, BBB )
         thisBook.objectNameString = 'theWord Bible Book object'
         thisBook.objectTypeString = 'theWord'
         consecutiveBlankLineCount, hadText = 0, False
 
+        lines = self._readLines( firstLineNumber, numLines )
+        if not lines: return # Couldn't decode them
         verseList = BOS.getNumVersesList( BBB )
-        numC, numV = len(verseList), verseList[0]
-        C = V = 1
+        lineNumber = firstLineNumber
+        for C,numV in enumerate( verseList, start=1 ):
+            for V in range( 1, numV+1 ):
+                if lineNumber-firstLineNumber >= len(lines): break # Partial book in a short file
+                line = lines[lineNumber-firstLineNumber]
+                lineNumber += 1
+                if line:
+                    hadText = True
+                    consecutiveBlankLineCount = 0
+                else:
+                    if consecutiveBlankLineCount < 5:
+                        logging.warning( "theWordBible.load: Found blank verse line at {} {} {}:{}".format( lineNumber, BBB, C, V ) )
+                    elif consecutiveBlankLineCount == 5:
+                        logging.warning( 'theWordBible.load: Additional {} "Found blank verse line" messages suppressed…'.format( BBB ) )
+                    consecutiveBlankLineCount += 1
+                handleRTFLine( self.name, BBB, C, V, line, thisBook, ourGlobals )
 
-        lastLine, lineCount, bookCount = '', 0, 0
-        ourGlobals = {}
-        continued = ourGlobals['haveParagraph'] = False
-        encodings = ['utf-8', 'ISO-8859-1', 'ISO-8859-15']
-        encodings.remove( self.encoding ) # Remove the given encoding if included
-        if self.encoding: encodings.insert( 0, self.encoding ) # Put the given encoding back in in the first position
-        for encoding in encodings: # Start by trying the given encoding
-            try:
-                with open( self.sourceFilepath, 'rt', encoding=encoding ) as myFile: # Automatically closes the file when done
-                    for sourceLine in myFile:
-                        originalLine = sourceLine
-                        lineCount += 1
-                        if lineCount==1 and self.encoding.lower()=='utf-8' and originalLine[0]==chr(65279): #U+FEFF
-                            logging.info( "      theWordBible.load: Detected Unicode Byte Order Marker (BOM)" )
-                            originalLine = originalLine[1:] # Remove the Unicode Byte Order Marker (BOM)
-                        if originalLine and originalLine[-1]=='\n': originalLine=originalLine[:-1] # Removing trailing newline character
-                        line = originalLine
-                        #lastLine = line
-
-                        if lineCount <= textLineCountExpected: # assume it's verse text
-                            #print ( lineCount, BBB, C, V, 'tW file line is "' + line + '"' )
-                            if line:
-                                hadText = True
-                                consecutiveBlankLineCount = 0
-                            else:
-                                if consecutiveBlankLineCount < 5:
-                                    logging.warning( "theWordBible.load: Found blank verse line at {} {} {}:{}".format( lineCount, BBB, C, V ) )
-                                elif consecutiveBlankLineCount == 5:
-                                    logging.warning( 'theWordBible.load: Additional {} "Found blank verse line" messages suppressed…'.format( BBB ) )
-                                consecutiveBlankLineCount += 1
-
-                            handleRTFLine( self.name, BBB, C, V, line, thisBook, ourGlobals )
-                            V += 1
-                            if V > numV:
-                                C += 1
-                                if C > numC: # Save this book now
-                                    if hadText:
-                                        if BibleOrgSysGlobals.verbosityLevel > 3: print( "Saving", BBB, bookCount+1 )
-                                        self.stashBook( thisBook )
-                                    else: logging.warning( "theWordBible.load: Didn't save {} because it was blank".format( BBB ) )
-
-                                    bookCount += 1
-                                    if bookCount >= booksExpected: break
-                                    BBB = BOS.getNextBookCode( BBB )
-                                    # Create the next book
-                                    thisBook = BibleBook( self, BBB )
-                                    thisBook.objectNameString = 'theWord Bible Book object'
-                                    thisBook.objectTypeString = 'theWord'
-
-                                    verseList = BOS.getNumVersesList( BBB )
-                                    numC, numV = len(verseList), verseList[0]
-                                    C = V = 1
-                                    # Don't append c 1 yet, because there might be a book heading to precede it
-                                    consecutiveBlankLineCount, hadText = 0, False
-                                else: # next chapter only
-                                    #thisBook.addLine( 'c', str(C) )
-                                    numV = verseList[C-1]
-                                    V = 1
-                                #thisBook.addLine( 'cc', str(C) ) # All chapter numbers except the first
-
-                            #if ourGlobals['haveParagraph']:
-                                #thisBook.addLine( 'p', '' )
-                                #ourGlobals['haveParagraph'] = False
-
-                        else: # Should be module info at end of file (after all of the verse lines)
-                            #print ( lineCount, 'tW file line is "' + line + '"' )
-                            if not line: continue # Just discard additional blank lines
-                            if line[0] == '#': continue # Just discard comment lines
-                            if not continued:
-                                if '=' not in line:
-                                    logging.warning( "Missing equals sign from info line (ignored): {} {!r}".format( lineCount, line ) )
-                                else: # Seems like a field=something type line
-                                    bits = line.split( '=', 1 )
-                                    assert len(bits) == 2
-                                    fieldName = bits[0]
-                                    fieldContents = bits[1]
-                                    if line.endswith( '\\' ): continued = True
-                                    else: self.suppliedMetadata['theWord'][fieldName] = fieldContents
-                            else: # continued
-                                fieldContents += line
-                                if not line.endswith( '\\' ):
-                                    self.suppliedMetadata['theWord'][fieldName] = fieldContents
-                                    continued = False
-                        #if lineCount > 3:
-                            #self.stashBook( thisBook )
-                            #break
-
-                if lineCount < textLineCountExpected:
-                    logging.error( _("theWord Bible module file seems too short: {}").format( self.sourceFilename ) )
-                self.encoding = encoding
-                break # Get out of decoding loop because we were successful
-            except UnicodeDecodeError:
-                logging.critical( _("theWord Bible module file fails with encoding: {} {}").format( self.sourceFilename, self.encoding ) )
+        if hadText: return thisBook
+        logging.warning( "theWordBible.load: Didn't save {} because it was blank".format( BBB ) )
+    # end of theWordBible._makeBook
+
+
+    def loadBook( self, BBB ):
+        """
+        Load the requested book into self.books if it's not already loaded.
+
+        Uses the line index to go directly to the lines for that book
+            (rather than reading the whole file).
+        """
+        if BibleOrgSysGlobals.debugFlag or BibleOrgSysGlobals.verbosityLevel > 2:
+            print( "theWordBible.loadBook( {} )".format( BBB ) )
+
+        if BBB in self.books:
+            if BibleOrgSysGlobals.debugFlag: print( "  {} is already loaded -- returning".format( BBB ) )
+            return # Already loaded
+        if BBB in self.triedLoadingBook:
+            logging.warning( "We had already tried loading theWord {} for {}".format( BBB, self.name ) )
+            return # We've already attempted to load this book
+        self.triedLoadingBook[BBB] = True
+        if self.fileExtension.upper().endswith('X'):
+            logging.error( _("theWordBible: File {!r} is encrypted").format( self.sourceFilepath ) )
+            return
+
+        thisBook = self._makeBook( BBB )
+        if thisBook is not None: self.stashBook( thisBook )
+    # end of theWordBible.loadBook
+
+
+    def _loadBookMP( self, BBB ):
+        """
+        Multiprocessing version!
+        Load the requested book (but doesn't save it as that is not safe for multiprocessing)
+
+        Returns the processed book or None.
+        """
+        if BibleOrgSysGlobals.verbosityLevel > 3:
+            print( _("loadBookMP( {} )").format( BBB ) )
+
+        thisBook = self._makeBook( BBB )
+        if thisBook is not None: thisBook.processLines()
+        return thisBook
+    # end of theWordBible._loadBookMP
+
+
+    def getVerseLine( self, BBB, C, V ):
+        """
+        Return the original (unprocessed) theWord line for the given verse,
+            going directly to that line in the file.
+
+        Returns None if the verse isn't in this module.
+        """
+        lineNumber = theWordGetLineNumber( BBB, C, V, self.testament )
+        if lineNumber is None or lineNumber+1 >= len( self._getLineIndex() ): return
+        return self._readLines( lineNumber, 1 )[0]
+    # end of theWordBible.getVerseLine
+
+
+    def load( self ):
+        """
+        Load a single source file and load book elements.
+
+        Uses the line index to process the books in parallel if we can.
+        """
+        if BibleOrgSysGlobals.verbosityLevel > 2: print( _("Loading {}…").format( self.sourceFilepath ) )
+
+        if self.suppliedMetadata is None: self.suppliedMetadata = {}
+        self.suppliedMetadata['theWord'] = {}
+
+        fileExtensionUpper = self.fileExtension.upper()
+        assert fileExtensionUpper in filenameEndingsToAccept
+        if fileExtensionUpper.endswith('X'):
+            logging.error( _("theWordBible: File {!r} is encrypted").format( self.sourceFilepath ) )
+            return
+
+        if self.testament == 'BOTH': books, textLineCountExpected = theWordBooks, theWordTotalLines
+        elif self.testament == 'OT': books, textLineCountExpected = theWordOTBooks, theWordOTTotalLines
+        elif self.testament == 'NT': books, textLineCountExpected = theWordNTBooks, theWordNTTotalLines
+
+        lineCount = len( self._getLineIndex() ) - 1
+        if lineCount < textLineCountExpected:
+            logging.error( _("theWord Bible module file seems too short: {}").format( self.sourceFilename ) )
+        BBBsToLoad = [BBB for BBB in books if BBB not in self.books]
+
+        if BibleOrgSysGlobals.maxProcesses > 1 \
+        and not BibleOrgSysGlobals.alreadyMultiprocessing: # Get our subprocesses ready and waiting for work
+            if BibleOrgSysGlobals.verbosityLevel > 1:
+                print( _("Loading {} {} books using {} processes…").format( len(BBBsToLoad), 'theWord', BibleOrgSysGlobals.maxProcesses ) )
+                print( _("  NOTE: Outputs (including error and warning messages) from loading various books may be interspersed.") )
+            BibleOrgSysGlobals.alreadyMultiprocessing = True
+            with multiprocessing.Pool( processes=BibleOrgSysGlobals.maxProcesses ) as pool: # start worker processes
+                results = pool.map( self._loadBookMP, BBBsToLoad ) # have the pool do our loads
+                assert len(results) == len(BBBsToLoad)
+                for thisBook in results: # Saves them in the correct order
+                    if thisBook is not None:
+                        thisBook.containerBibleObject = self # Otherwise it's a copy of us
+                        self.stashBook( thisBook )
+            BibleOrgSysGlobals.alreadyMultiprocessing = False
+        else: # Just single threaded
+            for BBB in BBBsToLoad:
+                thisBook = self._makeBook( BBB )
+                if thisBook is not None:
+                    if BibleOrgSysGlobals.verbosityLevel > 3: print( "Saving", BBB )
+                    self.stashBook( thisBook )
+
+        # Now handle the module info at the end of the file (after all of the verse lines)
+        continued = False
+        metadataLines = self._readLines( textLineCountExpected, lineCount-textLineCountExpected ) if lineCount > textLineCountExpected else []
+        for lineNumber,line in enumerate( metadataLines, start=textLineCountExpected+1 ):
+            #print ( lineNumber, 'tW file line is "' + line + '"' )
+            if not line: continue # Just discard additional blank lines
+            if line[0] == '#': continue # Just discard comment lines
+            if not continued:
+                if '=' not in line:
+                    logging.warning( "Missing equals sign from info line (ignored): {} {!r}".format( lineNumber, line ) )
+                else: # Seems like a field=something type line
+                    bits = line.split( '=', 1 )
+                    assert len(bits) == 2
+                    fieldName = bits[0]
+                    fieldContents = bits[1]
+                    if line.endswith( '\\' ): continued = True
+                    else: self.suppliedMetadata['theWord'][fieldName] = fieldContents
+            else: # continued
+                fieldContents += line
+                if not line.endswith( '\\' ):
+                    self.suppliedMetadata['theWord'][fieldName] = fieldContents
+                    continued = False
 
         #print( self.suppliedMetadata['theWord'] ); halt
         #if 'description' in self.suppliedMetadata['theWord'] and len(self.suppliedMetadata['theWord']['description'])<40: self.name = self.suppliedMetadata['theWord']['description']